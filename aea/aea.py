@@ -79,6 +79,7 @@ class AEA(Agent):
         connection_exception_policy: ExceptionPolicyEnum = ExceptionPolicyEnum.propagate,
         loop_mode: Optional[str] = None,
         runtime_mode: Optional[str] = None,
+        decision_maker_mode: Optional[str] = None,
         default_ledger: Optional[str] = None,
         currency_denominations: Optional[Dict[str, str]] = None,
         default_connection: Optional[PublicId] = None,
@@ -101,6 +102,7 @@ class AEA(Agent):
         :param skill_exception_policy: the skill exception policy enum
         :param loop_mode: loop_mode to choose agent run loop.
         :param runtime_mode: runtime mode (async, threaded) to run AEA in.
+        :param decision_maker_mode: decision maker mode (threaded, async) to run the decision maker in.
         :param default_ledger: default ledger id
         :param currency_denominations: mapping from ledger id to currency denomination
         :param default_connection: public id to the default connection
@@ -140,7 +142,7 @@ class AEA(Agent):
         decision_maker_handler = decision_maker_handler_class(
             identity=identity, wallet=wallet
         )
-        self.runtime.set_decision_maker(decision_maker_handler)
+        self.runtime.set_decision_maker(decision_maker_handler, decision_maker_mode)
 
         default_ledger_id = (
             default_ledger
@@ -296,6 +296,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
     DEFAULT_CONNECTION_EXCEPTION_POLICY = ExceptionPolicyEnum.propagate
     DEFAULT_LOOP_MODE = "async"
     DEFAULT_RUNTIME_MODE = "threaded"
+    DEFAULT_DECISION_MAKER_MODE = "threaded"
     DEFAULT_SEARCH_SERVICE_ADDRESS = _DEFAULT_SEARCH_SERVICE_ADDRESS
 
     loader = ConfigLoader.from_configuration_type(PackageType.AGENT)
@@ -370,6 +371,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._default_routing: Dict[PublicId, PublicId] = {}
         self._loop_mode: Optional[str] = None
         self._runtime_mode: Optional[str] = None
+        self._decision_maker_mode: Optional[str] = None
         self._search_service_address: Optional[str] = None
 
         self._package_dependency_manager = _DependenciesManager()
@@ -509,6 +511,18 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._runtime_mode = runtime_mode
         return self
 
+    def set_decision_maker_mode(
+        self, decision_maker_mode: Optional[str]
+    ) -> "AEABuilder":  # pragma: nocover
+        """
+        Set the decision maker mode.
+
+        :param decision_maker_mode: the decision maker mode
+        :return: self
+        """
+        self._decision_maker_mode = decision_maker_mode
+        return self
+
     def set_search_service_address(
         self, search_service_address: str
     ) -> "AEABuilder":  # pragma: nocover
@@ -952,6 +966,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             default_connection=self._get_default_connection(),
             loop_mode=self._get_loop_mode(),
             runtime_mode=self._get_runtime_mode(),
+            decision_maker_mode=self._get_decision_maker_mode(),
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
             **deepcopy(self._context_namespace),
@@ -1086,6 +1101,18 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             else self.DEFAULT_RUNTIME_MODE
         )
 
+    def _get_decision_maker_mode(self) -> str:
+        """
+        Return the decision maker mode name.
+
+        :return: the decision maker mode name
+        """
+        return (
+            self._decision_maker_mode
+            if self._decision_maker_mode is not None
+            else self.DEFAULT_DECISION_MAKER_MODE
+        )
+
     def _get_search_service_address(self) -> str:
         """
         Return the search service address.
@@ -1246,6 +1273,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_default_routing(agent_configuration.default_routing)
         self.set_loop_mode(agent_configuration.loop_mode)
         self.set_runtime_mode(agent_configuration.runtime_mode)
+        self.set_decision_maker_mode(agent_configuration.decision_maker_mode)
 
         # load private keys
         for (
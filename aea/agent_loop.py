@@ -35,8 +35,8 @@ from aea.exceptions import AEAException
 from aea.helpers.async_utils import (
     AsyncState,
     HandlerItemGetter,
-    PeriodicCaller,
     Runnable,
+    TimerWheelScheduler,
 )
 from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
 from aea.helpers.logging import WithLogger, get_logger
@@ -153,6 +153,7 @@ class AsyncAgentLoop(BaseAgentLoop):
     """Asyncio based agent loop suitable only for AEA."""
 
     NEW_BEHAVIOURS_PROCESS_SLEEP = 1  # check new behaviours registered every second.
+    BEHAVIOURS_COALESCING_WINDOW = 0.01  # call behaviours due within 10ms together.
 
     def __init__(
         self, agent: AbstractAgent, loop: AbstractEventLoop = None, threaded=False
@@ -166,7 +167,8 @@ class AsyncAgentLoop(BaseAgentLoop):
         super().__init__(agent=agent, loop=loop, threaded=threaded)
         self._agent: AbstractAgent = self._agent
 
-        self._periodic_tasks: Dict[Callable, PeriodicCaller] = {}
+        self._periodic_tasks: Dict[Callable, Callable] = {}
+        self._scheduler: Optional[TimerWheelScheduler] = None
 
     def _periodic_task_exception_callback(  # pylint: disable=unused-argument
         self, task_callable: Callable, exc: Exception
@@ -238,15 +240,15 @@ class AsyncAgentLoop(BaseAgentLoop):
             # already registered
             return
 
-        periodic_caller = PeriodicCaller(
-            partial(self._execution_control, task_callable),
-            period=period,
-            start_at=start_at,
-            exception_callback=self._periodic_task_exception_callback,
-            loop=self._loop,
-        )
-        self._periodic_tasks[task_callable] = periodic_caller
-        periodic_caller.start()
+        if self._scheduler is None:
+            self._scheduler = TimerWheelScheduler(
+                resolution=self.BEHAVIOURS_COALESCING_WINDOW,
+                exception_callback=self._periodic_task_exception_callback,
+                loop=self._loop,
+            )
+        callback = partial(self._execution_control, task_callable)
+        self._periodic_tasks[task_callable] = callback
+        self._scheduler.add(callback, period=period, start_at=start_at)
         self.logger.debug(f"Periodic task {task_callable} registered.")
 
     def _register_periodic_tasks(self) -> None:
@@ -264,15 +266,18 @@ class AsyncAgentLoop(BaseAgentLoop):
         :param task_callable: function to be called periodically.
         :return: None
         """
-        periodic_caller = self._periodic_tasks.pop(task_callable, None)
-        if periodic_caller is None:  # pragma: nocover
+        callback = self._periodic_tasks.pop(task_callable, None)
+        if callback is None or self._scheduler is None:  # pragma: nocover
             return
-        periodic_caller.stop()
+        self._scheduler.remove(callback)
 
     def _stop_all_behaviours(self) -> None:
         """Unregister periodic execution of all registered behaviours."""
         for task_callable in list(self._periodic_tasks.keys()):
             self._unregister_periodic_task(task_callable)
+        if self._scheduler is not None:
+            self._scheduler.stop()
+            self._scheduler = None
 
     async def _task_wait_for_error(self) -> None:
         """Wait for error and raise first."""
@@ -1185,7 +1185,9 @@ class ConnectionConfig(ComponentConfiguration):
     default_configuration_filename = DEFAULT_CONNECTION_CONFIG_FILE
     package_type = PackageType.CONNECTION
 
-    FIELDS_ALLOWED_TO_UPDATE: FrozenSet[str] = frozenset(["config", "is_abstract"])
+    FIELDS_ALLOWED_TO_UPDATE: FrozenSet[str] = frozenset(
+        ["config", "is_abstract", "connect_timeout"]
+    )
 
     def __init__(
         self,
@@ -1205,6 +1207,8 @@ class ConnectionConfig(ComponentConfiguration):
         description: str = "",
         connection_id: Optional[PublicId] = None,
         is_abstract: bool = False,
+        connect_after: Optional[Set[PublicId]] = None,
+        connect_timeout: Optional[float] = None,
         **config,
     ):
         """Initialize a connection configuration object."""
@@ -1251,6 +1255,8 @@ class ConnectionConfig(ComponentConfiguration):
         self.description = description
         self.config = config if len(config) > 0 else {}
         self.is_abstract = is_abstract
+        self.connect_after = connect_after if connect_after is not None else set()
+        self.connect_timeout = connect_timeout
 
     @property
     def package_dependencies(self) -> Set[ComponentId]:
@@ -1273,7 +1279,7 @@ class ConnectionConfig(ComponentConfiguration):
     @property
     def json(self) -> Dict:
         """Return the JSON representation."""
-        return OrderedDict(
+        result = OrderedDict(
             {
                 "name": self.name,
                 "author": self.author,
@@ -1296,6 +1302,11 @@ class ConnectionConfig(ComponentConfiguration):
                 "is_abstract": self.is_abstract,
             }
         )
+        if len(self.connect_after) > 0:
+            result["connect_after"] = sorted(map(str, self.connect_after))
+        if self.connect_timeout is not None:
+            result["connect_timeout"] = self.connect_timeout
+        return result
 
     @classmethod
     def from_json(cls, obj: Dict):
@@ -1309,6 +1320,9 @@ class ConnectionConfig(ComponentConfiguration):
         dependencies = dependencies_from_json(obj.get("dependencies", {}))
         protocols = {PublicId.from_str(id_) for id_ in obj.get(PROTOCOLS, set())}
         connections = {PublicId.from_str(id_) for id_ in obj.get(CONNECTIONS, set())}
+        connect_after = {
+            PublicId.from_str(id_) for id_ in obj.get("connect_after", set())
+        }
         return ConnectionConfig(
             name=cast(str, obj.get("name")),
             author=cast(str, obj.get("author")),
@@ -1327,6 +1341,8 @@ class ConnectionConfig(ComponentConfiguration):
             dependencies=cast(Dependencies, dependencies),
             description=cast(str, obj.get("description", "")),
             is_abstract=obj.get("is_abstract", False),
+            connect_after=cast(Set[PublicId], connect_after),
+            connect_timeout=obj.get("connect_timeout"),
             **cast(dict, obj.get("config", {})),
         )
 
@@ -1342,6 +1358,7 @@ class ConnectionConfig(ComponentConfiguration):
         new_config = data.get("config", {})
         recursive_update(self.config, new_config)
         self.is_abstract = data.get("is_abstract", self.is_abstract)
+        self.connect_timeout = data.get("connect_timeout", self.connect_timeout)
 
 
 class ProtocolConfig(ComponentConfiguration):
@@ -1664,6 +1681,7 @@ class AgentConfig(PackageConfiguration):
             "connection_private_key_paths",
             "loop_mode",
             "runtime_mode",
+            "decision_maker_mode",
             "execution_timeout",
             "timeout",
             "period",
@@ -1700,6 +1718,7 @@ class AgentConfig(PackageConfiguration):
         default_routing: Optional[Dict[str, str]] = None,
         loop_mode: Optional[str] = None,
         runtime_mode: Optional[str] = None,
+        decision_maker_mode: Optional[str] = None,
         component_configurations: Optional[Dict[ComponentId, Dict]] = None,
     ):
         """Instantiate the agent configuration object."""
@@ -1758,6 +1777,7 @@ class AgentConfig(PackageConfiguration):
         )  # type: Dict[PublicId, PublicId]
         self.loop_mode = loop_mode
         self.runtime_mode = runtime_mode
+        self.decision_maker_mode = decision_maker_mode
         # this attribute will be set through the setter below
         self._component_configurations: Dict[ComponentId, Dict] = {}
         self.component_configurations = (
@@ -1891,6 +1911,8 @@ class AgentConfig(PackageConfiguration):
             config["loop_mode"] = self.loop_mode
         if self.runtime_mode is not None:
             config["runtime_mode"] = self.runtime_mode
+        if self.decision_maker_mode is not None:
+            config["decision_maker_mode"] = self.decision_maker_mode
         if self.currency_denominations != {}:
             config["currency_denominations"] = self.currency_denominations
 
@@ -1926,6 +1948,7 @@ class AgentConfig(PackageConfiguration):
             default_routing=cast(Dict, obj.get("default_routing", {})),
             loop_mode=cast(str, obj.get("loop_mode")),
             runtime_mode=cast(str, obj.get("runtime_mode")),
+            decision_maker_mode=cast(str, obj.get("decision_maker_mode")),
             component_configurations=None,
         )
 
@@ -19,15 +19,38 @@
 
 """Abstract module wrapping the public and private key cryptography and ledger api."""
 
+import atexit
+import hashlib
+import multiprocessing
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Generic, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from aea.common import Address
 
 
 EntityClass = TypeVar("EntityClass")
 
+RECOVERED_ADDRESSES_CACHE_SIZE = 2 ** 16
+PROCESS_POOL_MIN_BATCH_SIZE = 64
+PROCESS_POOL_START_METHOD = "spawn"
+
 
 class Crypto(Generic[EntityClass], ABC):
     """Base class for a crypto object."""
@@ -203,6 +226,46 @@ class Helper(ABC):
         :return: the recovered addresses
         """
 
+    @classmethod
+    def recover_messages(
+        cls,
+        signed_messages: Sequence[Tuple[bytes, str]],
+        is_deprecated_mode: bool = False,
+    ) -> List[Tuple[Address, ...]]:
+        """
+        Recover the addresses of many signed messages.
+
+        Recovered addresses are cached per message hash and signature. Large batches
+        of signatures which are not cached are recovered in a pool of processes.
+
+        :param signed_messages: the messages and their signatures.
+        :param is_deprecated_mode: if the deprecated signing was used
+        :return: the recovered addresses of each message, empty if its signature is invalid
+        """
+        return _recover_messages(cls, signed_messages, is_deprecated_mode)
+
+    @classmethod
+    def verify_batch(
+        cls,
+        signed_messages: Sequence[Tuple[bytes, str, Address]],
+        is_deprecated_mode: bool = False,
+    ) -> List[bool]:
+        """
+        Verify many signed messages.
+
+        :param signed_messages: the messages, their signatures and the addresses expected to have signed them.
+        :param is_deprecated_mode: if the deprecated signing was used
+        :return: whether each message is signed by its expected address
+        """
+        recovered_addresses = cls.recover_messages(
+            [(message, signature) for message, signature, _ in signed_messages],
+            is_deprecated_mode,
+        )
+        return [
+            address in addresses
+            for (_, _, address), addresses in zip(signed_messages, recovered_addresses)
+        ]
+
     @staticmethod
     @abstractmethod
     def get_hash(message: bytes) -> str:
@@ -233,6 +296,159 @@ class Helper(ABC):
         """
 
 
+_RecoveryKey = Tuple[Type[Helper], bytes, str, bool]
+_recovered_addresses = (
+    OrderedDict()
+)  # type: OrderedDict[_RecoveryKey, Tuple[Address, ...]]
+_process_pool = None  # type: Optional[ProcessPoolExecutor]
+_shared_lock = threading.Lock()
+
+
+def _recover_each(
+    helper: Type[Helper],
+    signed_messages: Sequence[Tuple[bytes, str]],
+    is_deprecated_mode: bool,
+) -> List[Tuple[Address, ...]]:
+    """
+    Recover the addresses of signed messages one by one.
+
+    :param helper: the ledger helper class.
+    :param signed_messages: the messages and their signatures.
+    :param is_deprecated_mode: if the deprecated signing was used
+    :return: the recovered addresses of each message, empty if its signature is invalid
+    """
+    result = []  # type: List[Tuple[Address, ...]]
+    for message, signature in signed_messages:
+        try:
+            addresses = helper.recover_message(message, signature, is_deprecated_mode)
+        except Exception:  # pylint: disable=broad-except
+            addresses = ()
+        result.append(addresses)
+    return result
+
+
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the process pool shared by the batch recoveries, or None if processes cannot help.
+
+    The workers are spawned rather than forked, so they do not inherit the threads,
+    locks and connections of the agent.
+
+    :return: the process pool, if any
+    """
+    global _process_pool  # pylint: disable=global-statement
+    nb_cpus = os.cpu_count() or 1
+    if nb_cpus < 2 or multiprocessing.current_process().daemon:
+        # daemonic processes, like the workers of a pool, cannot have children
+        return None
+    with _shared_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=nb_cpus,
+                mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD),
+            )
+        return _process_pool
+
+
+def close_process_pool() -> None:
+    """
+    Shut down the process pool shared by the batch recoveries, if it is running.
+
+    The pool is started again by the next large batch.
+
+    :return: None
+    """
+    global _process_pool  # pylint: disable=global-statement
+    with _shared_lock:
+        process_pool, _process_pool = _process_pool, None
+    if process_pool is not None:
+        process_pool.shutdown()
+
+
+atexit.register(close_process_pool)
+
+
+def _recover_uncached(
+    helper: Type[Helper],
+    signed_messages: List[Tuple[bytes, str]],
+    is_deprecated_mode: bool,
+) -> List[Tuple[Address, ...]]:
+    """
+    Recover the addresses of signed messages, in the process pool if there are many.
+
+    :param helper: the ledger helper class.
+    :param signed_messages: the messages and their signatures.
+    :param is_deprecated_mode: if the deprecated signing was used
+    :return: the recovered addresses of each message
+    """
+    global _process_pool  # pylint: disable=global-statement
+    pool = (
+        _get_process_pool()
+        if len(signed_messages) >= PROCESS_POOL_MIN_BATCH_SIZE
+        else None
+    )
+    if pool is None:
+        return _recover_each(helper, signed_messages, is_deprecated_mode)
+    nb_chunks = (os.cpu_count() or 1) * 4
+    chunk_size = -(-len(signed_messages) // nb_chunks)
+    chunks = [
+        signed_messages[i : i + chunk_size]
+        for i in range(0, len(signed_messages), chunk_size)
+    ]
+    try:
+        results = pool.map(
+            _recover_each,
+            [helper] * len(chunks),
+            chunks,
+            [is_deprecated_mode] * len(chunks),
+        )
+        return [addresses for chunk in results for addresses in chunk]
+    except BrokenProcessPool:  # pragma: nocover
+        with _shared_lock:
+            _process_pool = None
+        return _recover_each(helper, signed_messages, is_deprecated_mode)
+
+
+def _recover_messages(
+    helper: Type[Helper],
+    signed_messages: Sequence[Tuple[bytes, str]],
+    is_deprecated_mode: bool,
+) -> List[Tuple[Address, ...]]:
+    """
+    Recover the addresses of signed messages, from the cache when possible.
+
+    :param helper: the ledger helper class.
+    :param signed_messages: the messages and their signatures.
+    :param is_deprecated_mode: if the deprecated signing was used
+    :return: the recovered addresses of each message
+    """
+    keys = [
+        (helper, hashlib.sha256(message).digest(), signature, is_deprecated_mode)
+        for message, signature in signed_messages
+    ]
+    result = [
+        _recovered_addresses.get(key) for key in keys
+    ]  # type: List[Optional[Tuple[Address, ...]]]
+    missing = {}  # type: Dict[_RecoveryKey, int]
+    for i, addresses in enumerate(result):
+        if addresses is None:
+            missing.setdefault(keys[i], i)
+    if len(missing) > 0:
+        recovered = _recover_uncached(
+            helper, [signed_messages[i] for i in missing.values()], is_deprecated_mode
+        )
+        recovered_by_key = dict(zip(missing.keys(), recovered))
+        with _shared_lock:
+            _recovered_addresses.update(recovered_by_key)
+            while len(_recovered_addresses) > RECOVERED_ADDRESSES_CACHE_SIZE:
+                _recovered_addresses.popitem(last=False)
+        result = [
+            recovered_by_key[key] if addresses is None else addresses
+            for key, addresses in zip(keys, result)
+        ]
+    return cast(List[Tuple[Address, ...]], result)
+
+
 class LedgerApi(Helper, ABC):
     """Interface for ledger APIs."""
 
@@ -27,20 +27,23 @@ import logging
 import os
 import subprocess  # nosec
 import tempfile
+import threading
 import time
 from collections import namedtuple
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, cast
 
 import requests
 from bech32 import bech32_decode, bech32_encode, convertbits
 from ecdsa import SECP256k1, SigningKey, VerifyingKey
 from ecdsa.util import sigencode_string_canonize
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from aea.common import Address
 from aea.crypto.base import Crypto, FaucetApi, Helper, LedgerApi
 from aea.exceptions import AEAEnforceError
-from aea.helpers.base import try_decorator
+from aea.helpers.base import freeze, load_file_cached, try_decorator
 
 
 _default_logger = logging.getLogger(__name__)
@@ -52,6 +55,124 @@ DEFAULT_ADDRESS = "INVALID_URL"
 DEFAULT_CURRENCY_DENOM = "INVALID_CURRENCY_DENOM"
 DEFAULT_CHAIN_ID = "INVALID_CHAIN_ID"
 _BYTECODE = "wasm_byte_code"
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.1
+DEFAULT_POOL_SIZE = 10
+RETRY_STATUSES = (502, 503, 504)
+DEFAULT_CLI_COMMAND = "wasmcli"
+DEFAULT_CLI_MAX_PROCESSES = 4
+DEFAULT_CLI_TIMEOUT = 60.0
+WASM_QUERY_MODES = ("rest", "cli")
+DEFAULT_WASM_QUERY_MODE = "cli"
+
+_sessions = {}  # type: Dict[Tuple[int, float, int], requests.Session]
+_shared_lock = threading.Lock()
+
+
+def get_session(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> requests.Session:
+    """
+    Get the shared HTTP session for a retry and pooling configuration.
+
+    Connections are kept alive and reused across requests and api instances.
+    Idempotent requests are retried, with exponential backoff, on connection
+    errors and on the statuses in RETRY_STATUSES; POST requests are never retried.
+
+    :param max_retries: the maximum number of retries per request.
+    :param backoff_factor: the backoff factor between retries, in seconds.
+    :param pool_size: the maximum number of connections kept alive per host.
+    :return: the session.
+    """
+    key = (max_retries, backoff_factor, pool_size)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _shared_lock:
+        session = _sessions.get(key)
+        if session is None:
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+    return session
+
+
+class CliRunner:
+    """Run commands of a command line tool, with a bounded number of processes."""
+
+    def __init__(
+        self,
+        max_processes: int = DEFAULT_CLI_MAX_PROCESSES,
+        timeout: float = DEFAULT_CLI_TIMEOUT,
+    ):
+        """
+        Initialize the runner.
+
+        :param max_processes: the maximum number of processes running at once.
+        :param timeout: the time, in seconds, after which a process is killed.
+        """
+        if max_processes < 1:
+            raise ValueError("The maximum number of processes must be positive.")
+        self.max_processes = max_processes
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(max_processes)
+
+    def run(self, command: List[str]) -> str:
+        """
+        Run a command and get its output.
+
+        It waits for a free slot when max_processes commands are already running.
+
+        :param command: the command, including the executable.
+        :return: the stdout and stderr of the command.
+        :raises subprocess.TimeoutExpired: if the command does not complete within the timeout.
+        """
+        with self._semaphore:
+            process = subprocess.Popen(  # nosec
+                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            )
+            try:
+                stdout, _ = process.communicate(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        return stdout.decode("ascii")
+
+
+_cli_runners = {}  # type: Dict[Tuple[int, float], CliRunner]
+
+
+def get_cli_runner(
+    max_processes: int = DEFAULT_CLI_MAX_PROCESSES,
+    timeout: float = DEFAULT_CLI_TIMEOUT,
+) -> CliRunner:
+    """
+    Get the shared command line runner for a configuration.
+
+    :param max_processes: the maximum number of processes running at once.
+    :param timeout: the time, in seconds, after which a process is killed.
+    :return: the runner.
+    """
+    key = (max_processes, timeout)
+    with _shared_lock:
+        runner = _cli_runners.get(key)
+        if runner is None:
+            runner = CliRunner(max_processes, timeout)
+            _cli_runners[key] = runner
+    return runner
 
 
 class CosmosHelper(Helper):
@@ -184,18 +305,32 @@ class CosmosHelper(Helper):
         """
         Load contract interface.
 
+        Interfaces are cached until their file changes, and are read-only.
+
         :param file_path: the file path to the interface
         :return: the interface
         """
-        with open(file_path, "rb") as interface_file_cosmos:
-            contract_interface = {
-                _BYTECODE: str(
-                    base64.b64encode(
-                        gzip.compress(interface_file_cosmos.read(), 6)
-                    ).decode()
-                )
-            }
-        return contract_interface
+        return cast(
+            Dict[str, str], load_file_cached(file_path, _read_contract_interface)
+        )
+
+
+def _read_contract_interface(file_path: Path) -> Any:
+    """
+    Read a contract interface.
+
+    :param file_path: the file path to the interface
+    :return: the read-only interface
+    """
+    with open(file_path, "rb") as interface_file_cosmos:
+        contract_interface = {
+            _BYTECODE: str(
+                base64.b64encode(
+                    gzip.compress(interface_file_cosmos.read(), 6)
+                ).decode()
+            )
+        }
+    return freeze(contract_interface)
 
 
 class CosmosCrypto(Crypto[SigningKey]):
@@ -389,6 +524,26 @@ class _CosmosApi(LedgerApi):
         self.network_address = kwargs.pop("address", DEFAULT_ADDRESS)
         self.denom = kwargs.pop("denom", DEFAULT_CURRENCY_DENOM)
         self.chain_id = kwargs.pop("chain_id", DEFAULT_CHAIN_ID)
+        self.max_retries = int(kwargs.pop("max_retries", DEFAULT_MAX_RETRIES))
+        self.backoff_factor = float(
+            kwargs.pop("backoff_factor", DEFAULT_BACKOFF_FACTOR)
+        )
+        self.pool_size = int(kwargs.pop("pool_size", DEFAULT_POOL_SIZE))
+        self._session = get_session(
+            self.max_retries, self.backoff_factor, self.pool_size
+        )
+        self.cli_command = kwargs.pop("cli_command", DEFAULT_CLI_COMMAND)
+        self._cli_runner = get_cli_runner(
+            int(kwargs.pop("cli_max_processes", DEFAULT_CLI_MAX_PROCESSES)),
+            float(kwargs.pop("cli_timeout", DEFAULT_CLI_TIMEOUT)),
+        )
+        self.wasm_query_mode = kwargs.pop("wasm_query_mode", DEFAULT_WASM_QUERY_MODE)
+        if self.wasm_query_mode not in WASM_QUERY_MODES:
+            raise ValueError(
+                "Unknown wasm query mode '{}', expected one of {}.".format(
+                    self.wasm_query_mode, WASM_QUERY_MODES
+                )
+            )
 
     @property
     def api(self) -> None:
@@ -408,7 +563,7 @@ class _CosmosApi(LedgerApi):
         """Try get the balance of a given account."""
         balance = None  # type: Optional[int]
         url = self.network_address + f"/bank/balances/{address}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = response.json()["result"]
             if len(result) == 0:
@@ -567,13 +722,12 @@ class _CosmosApi(LedgerApi):
         )
         return tx
 
-    @staticmethod
     @try_decorator(
         "Encountered exception when trying to execute wasm transaction: {}",
         logger_method=_default_logger.warning,
     )
     def try_execute_wasm_transaction(
-        tx_signed: Any, signed_tx_filename: str = "tx.signed"
+        self, tx_signed: Any, signed_tx_filename: str = "tx.signed"
     ) -> Optional[str]:
         """
         Execute a CosmWasm Transaction. QueryMsg doesn't require signing.
@@ -586,25 +740,20 @@ class _CosmosApi(LedgerApi):
                 f.write(json.dumps(tx_signed))
 
             command = [
-                "wasmcli",
+                self.cli_command,
                 "tx",
                 "broadcast",
                 os.path.join(tmpdirname, signed_tx_filename),
             ]
 
-            stdout, _ = subprocess.Popen(  # nosec
-                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-            ).communicate()
-
-        return stdout.decode("ascii")
+            return self._cli_runner.run(command)
 
-    @staticmethod
     @try_decorator(
         "Encountered exception when trying to execute wasm query: {}",
         logger_method=_default_logger.warning,
     )
     def try_execute_wasm_query(
-        contract_address: Address, query_msg: Any
+        self, contract_address: Address, query_msg: Any
     ) -> Optional[str]:
         """
         Execute a CosmWasm QueryMsg. QueryMsg doesn't require signing.
@@ -613,8 +762,15 @@ class _CosmosApi(LedgerApi):
         :param query_msg: QueryMsg in JSON format.
         :return: the message receipt
         """
+        if self.wasm_query_mode == "rest":
+            query = json.dumps(query_msg).encode("utf-8").hex()
+            result = self._get_wasm_rest_result(
+                f"/wasm/contract/{contract_address}/smart/{query}?encoding=hex"
+            )
+            return json.dumps(result)
+
         command = [
-            "wasmcli",
+            self.cli_command,
             "query",
             "wasm",
             "contract-state",
@@ -622,12 +778,23 @@ class _CosmosApi(LedgerApi):
             str(contract_address),
             json.dumps(query_msg),
         ]
+        return self._cli_runner.run(command)
 
-        stdout, _ = subprocess.Popen(  # nosec
-            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-        ).communicate()
+    def _get_wasm_rest_result(self, path: str) -> Any:
+        """
+        Get the result of a query to the wasm module over the REST API of the node.
 
-        return stdout.decode("ascii")
+        :param path: the path of the query.
+        :return: the result, which is the output of the equivalent CLI query.
+        """
+        response = self._session.get(url=self.network_address + path)
+        if response.status_code != 200:
+            raise ValueError(
+                "Wasm query failed with status {}: {}".format(
+                    response.status_code, response.text
+                )
+            )
+        return response.json()["result"]
 
     def get_transfer_transaction(  # pylint: disable=arguments-differ
         self,
@@ -733,7 +900,7 @@ class _CosmosApi(LedgerApi):
         """
         result: Tuple[Optional[int], Optional[int]] = (None, None)
         url = self.network_address + f"/auth/accounts/{address}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = (
                 int(response.json()["result"]["value"]["account_number"]),
@@ -794,7 +961,7 @@ class _CosmosApi(LedgerApi):
         """
         tx_digest = None  # type: Optional[str]
         url = self.network_address + "/txs"
-        response = requests.post(url=url, json=tx_signed)
+        response = self._session.post(url=url, json=tx_signed)
         if response.status_code == 200:
             tx_digest = response.json()["txhash"]
         else:  # pragma: nocover
@@ -824,7 +991,7 @@ class _CosmosApi(LedgerApi):
         """
         result = None  # type: Optional[Any]
         url = self.network_address + f"/txs/{tx_digest}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = response.json()
         return result
@@ -853,19 +1020,14 @@ class _CosmosApi(LedgerApi):
         # Instance object not available for cosmwasm
         return None
 
-    @staticmethod
-    def _execute_shell_command(command: List[str]) -> List[Dict[str, str]]:
+    def _execute_shell_command(self, command: List[str]) -> List[Dict[str, str]]:
         """
         Execute command using subprocess and get result as JSON dict.
 
         :param command: the shell command to be executed
         :return: the stdout result converted to JSON dict
         """
-        stdout, _ = subprocess.Popen(  # nosec
-            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-        ).communicate()
-
-        return json.loads(stdout.decode("ascii"))
+        return json.loads(self._cli_runner.run(command))
 
     def get_last_code_id(self) -> int:
         """
@@ -873,9 +1035,11 @@ class _CosmosApi(LedgerApi):
 
         :return: code id of last deployed .wasm bytecode
         """
-
-        command = ["wasmcli", "query", "wasm", "list-code"]
-        res = self._execute_shell_command(command)
+        if self.wasm_query_mode == "rest":
+            res = self._get_wasm_rest_result("/wasm/code")
+        else:
+            command = [self.cli_command, "query", "wasm", "list-code"]
+            res = self._execute_shell_command(command)
 
         return int(res[-1]["id"])
 
@@ -886,9 +1050,17 @@ class _CosmosApi(LedgerApi):
         :param code_id: id of deployed CosmWasm bytecode
         :return: contract address of last initialised contract
         """
-
-        command = ["wasmcli", "query", "wasm", "list-contract-by-code", str(code_id)]
-        res = self._execute_shell_command(command)
+        if self.wasm_query_mode == "rest":
+            res = self._get_wasm_rest_result(f"/wasm/code/{code_id}/contracts")
+        else:
+            command = [
+                self.cli_command,
+                "query",
+                "wasm",
+                "list-contract-by-code",
+                str(code_id),
+            ]
+            res = self._execute_shell_command(command)
 
         return res[-1]["address"]
 
@@ -19,25 +19,30 @@
 
 """Ethereum module wrapping the public and private key cryptography and ledger api."""
 
+import heapq
 import json
 import logging
+import threading
 import time
 import warnings
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Optional, Tuple, Union, cast
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union, cast
 
 import requests
 from eth_account import Account
 from eth_account.datastructures import SignedTransaction
 from eth_account.messages import encode_defunct
 from eth_keys import keys
+from hexbytes import HexBytes
 from web3 import HTTPProvider, Web3
+from web3.datastructures import AttributeDict
 from web3.types import TxParams
 
 from aea.common import Address
 from aea.crypto.base import Crypto, FaucetApi, Helper, LedgerApi
 from aea.exceptions import enforce
-from aea.helpers.base import try_decorator
+from aea.helpers.base import freeze, load_file_cached, try_decorator
 
 
 _default_logger = logging.getLogger(__name__)
@@ -52,6 +57,10 @@ DEFAULT_GAS_PRICE = "50"
 DEFAULT_CURRENCY_DENOM = "wei"
 _ABI = "abi"
 _BYTECODE = "bytecode"
+DEFAULT_LOCAL_NONCES = False
+DEFAULT_CACHE_GAS_ESTIMATES = False
+JSON_RPC_TIMEOUT = 10
+CONTRACT_INSTANCES_CACHE_SIZE = 256
 
 
 class EthereumCrypto(Crypto[Account]):
@@ -269,15 +278,197 @@ class EthereumHelper(Helper):
         """
         Load contract interface.
 
+        Interfaces are cached until their file changes, and are read-only.
+
         :param file_path: the file path to the interface
         :return: the interface
         """
-        with open(file_path, "r") as interface_file_ethereum:
-            contract_interface = json.load(interface_file_ethereum)
-        for key in [_ABI, _BYTECODE]:
-            if key not in contract_interface:  # pragma: nocover
-                raise ValueError(f"Contract {file_path} missing key {key}.")
-        return contract_interface
+        return cast(
+            Dict[str, str], load_file_cached(file_path, _read_contract_interface)
+        )
+
+
+def _read_contract_interface(file_path: Path) -> Any:
+    """
+    Read a contract interface.
+
+    :param file_path: the file path to the interface
+    :return: the read-only interface
+    """
+    with open(file_path, "r") as interface_file_ethereum:
+        contract_interface = json.load(interface_file_ethereum)
+    for key in [_ABI, _BYTECODE]:
+        if key not in contract_interface:  # pragma: nocover
+            raise ValueError(f"Contract {file_path} missing key {key}.")
+    return freeze(contract_interface)
+
+
+_QUANTITY_FIELDS = frozenset(
+    [
+        "blockNumber",
+        "chainId",
+        "cumulativeGasUsed",
+        "gas",
+        "gasPrice",
+        "gasUsed",
+        "logIndex",
+        "nonce",
+        "status",
+        "transactionIndex",
+        "v",
+        "value",
+    ]
+)
+_BYTES_FIELDS = frozenset(
+    [
+        "blockHash",
+        "data",
+        "hash",
+        "input",
+        "logsBloom",
+        "r",
+        "root",
+        "s",
+        "transactionHash",
+    ]
+)
+_ADDRESS_FIELDS = frozenset(["address", "contractAddress", "from", "to"])
+
+
+def _format_json_rpc_object(json_rpc_object: Dict[str, Any]) -> AttributeDict:
+    """
+    Format a receipt, a transaction or a log returned by the node, like the web3 methods do.
+
+    Quantities are decoded to integers, hashes and data to bytes, and addresses are checksummed.
+
+    :param json_rpc_object: the object, as returned in the JSON-RPC response.
+    :return: the formatted object.
+    """
+    formatted = {}  # type: Dict[str, Any]
+    for key, value in json_rpc_object.items():
+        if value is None:
+            formatted[key] = None
+        elif key in _QUANTITY_FIELDS:
+            formatted[key] = int(value, 16)
+        elif key in _BYTES_FIELDS:
+            formatted[key] = HexBytes(value)
+        elif key in _ADDRESS_FIELDS:
+            formatted[key] = Web3.toChecksumAddress(value)
+        elif key == "topics":
+            formatted[key] = [HexBytes(topic) for topic in value]
+        elif key == "logs":
+            formatted[key] = [_format_json_rpc_object(log) for log in value]
+        else:
+            formatted[key] = value
+    return AttributeDict(formatted)
+
+
+class NonceManager:
+    """
+    Track the next nonce of addresses locally.
+
+    Nonces are reserved atomically, so concurrent transactions from one
+    address get distinct nonces without a round trip to the node each.
+    Addresses are tracked by their checksum address, whatever their case.
+    """
+
+    def __init__(self):
+        """Initialize the nonce manager."""
+        self._lock = threading.Lock()
+        self._next_nonces = {}  # type: Dict[Address, int]
+        self._released_nonces = {}  # type: Dict[Address, List[int]]
+
+    def is_synced(self, address: Address) -> bool:
+        """Check whether the nonces of an address are tracked."""
+        address = Web3.toChecksumAddress(address)
+        with self._lock:
+            return address in self._next_nonces
+
+    def sync(self, address: Address, transaction_count: int) -> None:
+        """
+        Sync the nonces of an address with its transaction count on the chain.
+
+        Nonces which are already reserved locally are never handed out again.
+
+        :param address: the address.
+        :param transaction_count: the pending transaction count of the address.
+        :return: None
+        """
+        address = Web3.toChecksumAddress(address)
+        with self._lock:
+            next_nonce = max(self._next_nonces.get(address, 0), transaction_count)
+            self._next_nonces[address] = next_nonce
+            released = [
+                nonce
+                for nonce in self._released_nonces.pop(address, [])
+                if nonce >= transaction_count
+            ]
+            if released:
+                heapq.heapify(released)
+                self._released_nonces[address] = released
+
+    def reserve(self, address: Address) -> int:
+        """
+        Reserve the next nonce of an address.
+
+        Released nonces are reserved first, lowest first, to fill the gaps.
+
+        :param address: the address, which must be synced.
+        :return: the nonce.
+        """
+        address = Web3.toChecksumAddress(address)
+        with self._lock:
+            if address not in self._next_nonces:
+                raise ValueError("Nonces of address {} not synced.".format(address))
+            released = self._released_nonces.get(address)
+            if released:
+                return heapq.heappop(released)
+            nonce = self._next_nonces[address]
+            self._next_nonces[address] = nonce + 1
+            return nonce
+
+    def release(self, address: Address, nonce: int) -> None:
+        """
+        Release a reserved nonce whose transaction will not be sent.
+
+        :param address: the address.
+        :param nonce: the nonce.
+        :return: None
+        """
+        address = Web3.toChecksumAddress(address)
+        with self._lock:
+            next_nonce = self._next_nonces.get(address)
+            if next_nonce is None or nonce >= next_nonce:
+                return
+            if nonce == next_nonce - 1:
+                self._next_nonces[address] = nonce
+            else:
+                heapq.heappush(self._released_nonces.setdefault(address, []), nonce)
+
+    def reset(self, address: Optional[Address] = None) -> None:
+        """
+        Forget the nonces of an address, or of all of them, so that they are synced again.
+
+        :param address: the address, or None for all addresses.
+        :return: None
+        """
+        if address is not None:
+            address = Web3.toChecksumAddress(address)
+        with self._lock:
+            if address is None:
+                self._next_nonces.clear()
+                self._released_nonces.clear()
+            else:
+                self._next_nonces.pop(address, None)
+                self._released_nonces.pop(address, None)
+
+
+_nonce_managers = {}  # type: Dict[str, NonceManager]
+_gas_estimates = {}  # type: Dict[str, Dict[Tuple[Optional[str], int], int]]
+_contract_instances = (
+    OrderedDict()
+)  # type: OrderedDict[Tuple[str, Optional[str], int], Tuple[Dict[str, str], Any]]
+_shared_lock = threading.Lock()
 
 
 class EthereumApi(LedgerApi, EthereumHelper):
@@ -290,12 +481,24 @@ class EthereumApi(LedgerApi, EthereumHelper):
         Initialize the Ethereum ledger APIs.
 
         :param address: the endpoint for Web3 APIs.
+        :param local_nonces: whether to reserve nonces locally, instead of getting them from the node for every transaction.
+        :param cache_gas_estimates: whether to cache the gas estimates of transfer transactions, per destination and data size.
         """
-        self._api = Web3(
-            HTTPProvider(endpoint_uri=kwargs.pop("address", DEFAULT_ADDRESS))
-        )
+        self._address = kwargs.pop("address", DEFAULT_ADDRESS)
+        self._api = Web3(HTTPProvider(endpoint_uri=self._address))
         self._gas_price = kwargs.pop("gas_price", DEFAULT_GAS_PRICE)
         self._chain_id = kwargs.pop("chain_id", DEFAULT_CHAIN_ID)
+        self._nonce_manager = None  # type: Optional[NonceManager]
+        self._gas_estimates = (
+            None
+        )  # type: Optional[Dict[Tuple[Optional[str], int], int]]
+        with _shared_lock:
+            if kwargs.pop("local_nonces", DEFAULT_LOCAL_NONCES):
+                self._nonce_manager = _nonce_managers.setdefault(
+                    self._address, NonceManager()
+                )
+            if kwargs.pop("cache_gas_estimates", DEFAULT_CACHE_GAS_ESTIMATES):
+                self._gas_estimates = _gas_estimates.setdefault(self._address, {})
 
     @property
     def api(self) -> Web3:
@@ -336,19 +539,38 @@ class EthereumApi(LedgerApi, EthereumHelper):
         """
         chain_id = chain_id if chain_id is not None else self._chain_id
         gas_price = gas_price if gas_price is not None else self._gas_price
-        nonce = self._try_get_transaction_count(sender_address)
 
         transaction = {
-            "nonce": nonce,
             "chainId": chain_id,
             "to": destination_address,
             "value": amount,
             "gas": tx_fee,
             "gasPrice": self._api.toWei(gas_price, GAS_ID),
             "data": tx_nonce,
-        }
+        }  # type: Dict[str, Union[str, int, None]]
 
-        gas_estimate = self._try_get_gas_estimate(transaction)
+        gas_estimate_key = (destination_address, len(tx_nonce))
+        gas_estimate = None  # type: Optional[int]
+        if self._gas_estimates is not None:
+            gas_estimate = self._gas_estimates.get(gas_estimate_key)
+
+        if self._nonce_manager is None:
+            transaction["nonce"] = self._try_get_transaction_count(sender_address)
+            if gas_estimate is None:
+                gas_estimate = self._try_get_gas_estimate(transaction)
+        else:
+            if not self._nonce_manager.is_synced(sender_address):
+                gas_estimate = self._try_sync_nonces(
+                    sender_address,
+                    transaction if gas_estimate is None else None,
+                    gas_estimate,
+                )
+            transaction["nonce"] = self._try_reserve_nonce(sender_address)
+            if gas_estimate is None:
+                gas_estimate = self._try_get_gas_estimate(transaction)
+
+        if gas_estimate is not None and self._gas_estimates is not None:
+            self._gas_estimates[gas_estimate_key] = gas_estimate
         if gas_estimate is not None and tx_fee <= gas_estimate:  # pragma: no cover
             _default_logger.warning(
                 "Needed to increase tx_fee to cover the gas consumption of the transaction. Estimated gas consumption is: {}.".format(
@@ -377,6 +599,109 @@ class EthereumApi(LedgerApi, EthereumHelper):
         )
         return gas_estimate
 
+    @try_decorator("Unable to sync nonces: {}", logger_method="warning")
+    def _try_sync_nonces(
+        self,
+        address: Address,
+        transaction: Optional[Dict[str, Union[str, int, None]]],
+        gas_estimate: Optional[int],
+    ) -> Optional[int]:
+        """
+        Try sync the nonces of an address, getting a gas estimate in the same request.
+
+        :param address: the address.
+        :param transaction: the transaction to estimate the gas of, or None.
+        :param gas_estimate: the gas estimate to return when there is no transaction.
+        :return: the gas estimate.
+        """
+        checksum_address = self._api.toChecksumAddress(address)
+        calls = [
+            ("eth_getTransactionCount", [checksum_address, "pending"])
+        ]  # type: List[Tuple[str, List[Any]]]
+        if transaction is not None:
+            estimate_params = {
+                key: value
+                for key, value in transaction.items()
+                if key in ("to", "value", "data")
+            }
+            estimate_params["from"] = checksum_address
+            estimate_params["value"] = hex(cast(int, estimate_params["value"]))
+            calls.append(("eth_estimateGas", [estimate_params]))
+        results = self.batch_request(calls)
+        self.nonce_manager.sync(address, int(results[0], 16))
+        if transaction is not None:
+            gas_estimate = int(results[1], 16)
+        return gas_estimate
+
+    @try_decorator("Unable to reserve nonce: {}", logger_method="warning")
+    def _try_reserve_nonce(self, address: Address) -> Optional[int]:
+        """Try reserve the next nonce of an address."""
+        return self.reserve_nonce(address)
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        """Get the nonce manager, when nonces are reserved locally."""
+        if self._nonce_manager is None:
+            raise ValueError("Local nonces are not enabled.")
+        return self._nonce_manager
+
+    def reserve_nonce(self, address: Address) -> int:
+        """
+        Reserve the nonce for the next transaction from an address.
+
+        With local nonces, concurrent callers get distinct nonces and only the
+        first call per address goes to the node. Otherwise, it is the
+        transaction count of the address.
+
+        :param address: the address.
+        :return: the nonce.
+        """
+        checksum_address = self._api.toChecksumAddress(address)
+        if self._nonce_manager is None:
+            return self._api.eth.getTransactionCount(  # pylint: disable=no-member
+                checksum_address
+            )
+        if not self._nonce_manager.is_synced(address):
+            self._nonce_manager.sync(
+                address,
+                self._api.eth.getTransactionCount(  # pylint: disable=no-member
+                    checksum_address, "pending"
+                ),
+            )
+        return self._nonce_manager.reserve(address)
+
+    def release_nonce(self, address: Address, nonce: int) -> None:
+        """
+        Release a reserved nonce, when its transaction is not going to be sent.
+
+        :param address: the address.
+        :param nonce: the nonce.
+        :return: None
+        """
+        if self._nonce_manager is not None:
+            self._nonce_manager.release(address, nonce)
+
+    def batch_request(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Send JSON-RPC requests to the node in a single batch.
+
+        :param calls: the method and the parameters of each request.
+        :return: the results, in the order of the requests.
+        :raises ValueError: if any of the requests fails.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = requests.post(self._address, json=payload, timeout=JSON_RPC_TIMEOUT)
+        response.raise_for_status()
+        results_by_id = {}  # type: Dict[int, Any]
+        for result in response.json():
+            if "error" in result:
+                raise ValueError("JSON-RPC request failed: {}".format(result["error"]))
+            results_by_id[result["id"]] = result["result"]
+        return [results_by_id[i] for i in range(len(calls))]
+
     def send_signed_transaction(self, tx_signed: Any) -> Optional[str]:
         """
         Send a signed transaction and wait for confirmation.
@@ -385,6 +710,12 @@ class EthereumApi(LedgerApi, EthereumHelper):
         :return: tx_digest, if present
         """
         tx_digest = self._try_send_signed_transaction(tx_signed)
+        if tx_digest is None and self._nonce_manager is not None:
+            # the local nonces of the sender are out of sync if the node rejected it
+            sender = Account.recover_transaction(  # pylint: disable=no-value-for-parameter
+                cast(SignedTransaction, tx_signed).rawTransaction
+            )
+            self._nonce_manager.reset(sender)
         return tx_digest
 
     @try_decorator("Unable to send transaction: {}", logger_method="warning")
@@ -430,6 +761,32 @@ class EthereumApi(LedgerApi, EthereumHelper):
         )
         return tx_receipt
 
+    def batch_get_transaction_receipts(
+        self, tx_digests: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[Any]]]:
+        """
+        Get the receipts and the transactions of several transactions in a single batch request.
+
+        :param tx_digests: the digests associated to the transactions.
+        :return: the tx receipt and the tx of each digest, each None if not present.
+        """
+        calls = []  # type: List[Tuple[str, List[Any]]]
+        for tx_digest in tx_digests:
+            calls.append(("eth_getTransactionReceipt", [tx_digest]))
+            calls.append(("eth_getTransactionByHash", [tx_digest]))
+        results = self.batch_request(calls)
+        receipts_and_transactions = (
+            []
+        )  # type: List[Tuple[Optional[Any], Optional[Any]]]
+        for tx_receipt, tx in zip(results[::2], results[1::2]):
+            receipts_and_transactions.append(
+                (
+                    None if tx_receipt is None else _format_json_rpc_object(tx_receipt),
+                    None if tx is None else _format_json_rpc_object(tx),
+                )
+            )
+        return receipts_and_transactions
+
     def get_transaction(self, tx_digest: str) -> Optional[Any]:
         """
         Get the transaction for a transaction digest.
@@ -457,21 +814,41 @@ class EthereumApi(LedgerApi, EthereumHelper):
         """
         Get the instance of a contract.
 
+        Instances are cached per node, contract address and contract interface
+        object. The least recently used ones are evicted when more than
+        CONTRACT_INSTANCES_CACHE_SIZE instances are cached.
+
         :param contract_interface: the contract interface.
         :param contract_address: the contract address.
         :return: the contract instance
         """
-        if contract_address is None:
+        _contract_address = (
+            None
+            if contract_address is None
+            else self.api.toChecksumAddress(contract_address)
+        )
+        key = (self._address, _contract_address, id(contract_interface))
+        with _shared_lock:
+            cached = _contract_instances.get(key)
+            # the interface is kept in the cache, so its id is not reused while cached
+            if cached is not None and cached[0] is contract_interface:
+                _contract_instances.move_to_end(key)
+                return cached[1]
+        if _contract_address is None:
             instance = self.api.eth.contract(
                 abi=contract_interface[_ABI], bytecode=contract_interface[_BYTECODE],
             )
         else:
-            _contract_address = self.api.toChecksumAddress(contract_address)
             instance = self.api.eth.contract(
                 address=_contract_address,
                 abi=contract_interface[_ABI],
                 bytecode=contract_interface[_BYTECODE],
             )
+        with _shared_lock:
+            _contract_instances[key] = (contract_interface, instance)
+            _contract_instances.move_to_end(key)
+            while len(_contract_instances) > CONTRACT_INSTANCES_CACHE_SIZE:
+                _contract_instances.popitem(last=False)
         return instance
 
     def get_deploy_transaction(  # pylint: disable=arguments-differ
@@ -492,8 +869,7 @@ class EthereumApi(LedgerApi, EthereumHelper):
         :returns tx: the transaction dictionary.
         """
         # create the transaction dict
-        _deployer_address = self.api.toChecksumAddress(deployer_address)
-        nonce = self.api.eth.getTransactionCount(_deployer_address)
+        nonce = self.reserve_nonce(deployer_address)
         instance = self.get_contract_instance(contract_interface)
         data = instance.constructor(**kwargs).buildTransaction().get("data", "0x")
         tx = {
@@ -18,11 +18,13 @@
 # ------------------------------------------------------------------------------
 
 """Module wrapping all the public and private keys cryptography."""
-from typing import Any, Dict, Optional, Tuple, Union
+import threading
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from aea.common import Address
 from aea.configurations.constants import DEFAULT_LEDGER
-from aea.crypto.base import LedgerApi
+from aea.crypto.base import LedgerApi, close_process_pool
 from aea.crypto.cosmos import CosmosApi
 from aea.crypto.cosmos import DEFAULT_ADDRESS as COSMOS_DEFAULT_ADDRESS
 from aea.crypto.cosmos import DEFAULT_CHAIN_ID as COSMOS_DEFAULT_CHAIN_ID
@@ -74,20 +76,73 @@ class LedgerApis:
 
     ledger_api_configs: Dict[str, Dict[str, Union[str, int]]] = DEFAULT_LEDGER_CONFIGS
 
+    # ledger api instances, with a copy of the configuration they were made with, by identifier
+    _apis: Dict[str, Tuple[Dict[str, Union[str, int]], LedgerApi]] = {}
+    # ledger api classes by identifier; an identifier cannot be registered twice, so they never change
+    _api_classes: Dict[str, Type[LedgerApi]] = {}
+    _lock = threading.Lock()
+
     @staticmethod
     def has_ledger(identifier: str) -> bool:
         """Check if it has the api."""
-        return identifier in ledger_apis_registry.supported_ids
+        return (
+            identifier in LedgerApis._api_classes
+            or identifier in ledger_apis_registry.supported_ids
+        )
 
     @classmethod
     def get_api(cls, identifier: str) -> LedgerApi:
-        """Get the ledger API."""
+        """
+        Get the ledger API.
+
+        The instance is shared: it is made once per identifier and remade only when its entry in
+        ledger_api_configs changes. It is safe to call from several threads.
+
+        :param identifier: the identifier of the ledger
+        :return: the ledger API
+        """
+        enforce(
+            cls.has_ledger(identifier), "Not a registered ledger api identifier.",
+        )
+        config = cls.ledger_api_configs[identifier]
+        cached = cls._apis.get(identifier)
+        if cached is not None and cached[0] == config:
+            return cached[1]
+        with cls._lock:
+            cached = cls._apis.get(identifier)
+            if cached is not None and cached[0] == config:  # pragma: nocover
+                return cached[1]
+            api = make_ledger_api(identifier, **config)
+            cls._apis[identifier] = (deepcopy(config), api)
+        return api
+
+    @staticmethod
+    def _get_api_class(identifier: str) -> Type[LedgerApi]:
+        """
+        Get the cached ledger API class, resolving it from the registry the first time.
+
+        :param identifier: the identifier of the ledger
+        :return: the ledger API class
+        """
+        api_class = LedgerApis._api_classes.get(identifier)
+        if api_class is not None:
+            return api_class
         enforce(
             identifier in ledger_apis_registry.supported_ids,
             "Not a registered ledger api identifier.",
         )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
-        return api
+        with LedgerApis._lock:
+            api_class = make_ledger_api_cls(identifier)
+            LedgerApis._api_classes[identifier] = api_class
+        return api_class
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear the cached ledger API instances and classes, and stop the signature recovery processes."""
+        with cls._lock:
+            cls._apis.clear()
+            cls._api_classes.clear()
+        close_process_pool()
 
     @classmethod
     def get_balance(cls, identifier: str, address: str) -> Optional[int]:
@@ -98,11 +153,7 @@ class LedgerApis:
         :param address: the address to check for
         :return: the token balance
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
+        api = cls.get_api(identifier)
         balance = api.get_balance(address)
         return balance
 
@@ -129,11 +180,7 @@ class LedgerApis:
 
         :return: tx
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
+        api = cls.get_api(identifier)
         tx = api.get_transfer_transaction(
             sender_address, destination_address, amount, tx_fee, tx_nonce, **kwargs,
         )
@@ -148,11 +195,7 @@ class LedgerApis:
         :param tx_signed: the signed transaction
         :return: the tx_digest, if present
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
+        api = cls.get_api(identifier)
         tx_digest = api.send_signed_transaction(tx_signed)
         return tx_digest
 
@@ -165,11 +208,7 @@ class LedgerApis:
         :param tx_digest: the digest associated to the transaction.
         :return: the tx receipt, if present
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
+        api = cls.get_api(identifier)
         tx_receipt = api.get_transaction_receipt(tx_digest)
         return tx_receipt
 
@@ -182,11 +221,7 @@ class LedgerApis:
         :param tx_digest: the digest associated to the transaction.
         :return: the tx, if present
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api = make_ledger_api(identifier, **cls.ledger_api_configs[identifier])
+        api = cls.get_api(identifier)
         tx = api.get_transaction(tx_digest)
         return tx
 
@@ -199,11 +234,7 @@ class LedgerApis:
         :param tx_receipt: the transaction digest
         :return: True if correctly settled, False otherwise
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api_class = make_ledger_api_cls(identifier)
+        api_class = LedgerApis._get_api_class(identifier)
         is_settled = api_class.is_transaction_settled(tx_receipt)
         return is_settled
 
@@ -227,11 +258,7 @@ class LedgerApis:
         :param amount: the amount we expect to get from the transaction.
         :return: True if is valid , False otherwise
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api_class = make_ledger_api_cls(identifier)
+        api_class = LedgerApis._get_api_class(identifier)
         is_valid = api_class.is_transaction_valid(tx, seller, client, tx_nonce, amount)
         return is_valid
 
@@ -245,11 +272,7 @@ class LedgerApis:
         :param client: the address of the client.
         :return: return the hash in hex.
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api_class = make_ledger_api_cls(identifier)
+        api_class = LedgerApis._get_api_class(identifier)
         tx_nonce = api_class.generate_tx_nonce(seller=seller, client=client)
         return tx_nonce
 
@@ -269,16 +292,50 @@ class LedgerApis:
         :param is_deprecated_mode: if the deprecated signing was used
         :return: the recovered addresses
         """
-        enforce(
-            identifier in ledger_apis_registry.supported_ids,
-            "Not a registered ledger api identifier.",
-        )
-        api_class = make_ledger_api_cls(identifier)
+        api_class = LedgerApis._get_api_class(identifier)
         addresses = api_class.recover_message(
             message=message, signature=signature, is_deprecated_mode=is_deprecated_mode
         )
         return addresses
 
+    @staticmethod
+    def recover_messages(
+        identifier: str,
+        signed_messages: Sequence[Tuple[bytes, str]],
+        is_deprecated_mode: bool = False,
+    ) -> List[Tuple[Address, ...]]:
+        """
+        Recover the addresses of many signed messages.
+
+        :param identifier: ledger identifier.
+        :param signed_messages: the messages and their signatures.
+        :param is_deprecated_mode: if the deprecated signing was used
+        :return: the recovered addresses of each message, empty if its signature is invalid
+        """
+        api_class = LedgerApis._get_api_class(identifier)
+        return api_class.recover_messages(
+            signed_messages, is_deprecated_mode=is_deprecated_mode
+        )
+
+    @staticmethod
+    def verify_batch(
+        identifier: str,
+        signed_messages: Sequence[Tuple[bytes, str, Address]],
+        is_deprecated_mode: bool = False,
+    ) -> List[bool]:
+        """
+        Verify many signed messages.
+
+        :param identifier: ledger identifier.
+        :param signed_messages: the messages, their signatures and the addresses expected to have signed them.
+        :param is_deprecated_mode: if the deprecated signing was used
+        :return: whether each message is signed by its expected address
+        """
+        api_class = LedgerApis._get_api_class(identifier)
+        return api_class.verify_batch(
+            signed_messages, is_deprecated_mode=is_deprecated_mode
+        )
+
     @staticmethod
     def get_hash(identifier: str, message: bytes) -> str:
         """
@@ -288,12 +345,8 @@ class LedgerApis:
         :param message: the message to be hashed.
         :return: the hash of the message.
         """
-        identifier = (
-            identifier
-            if identifier in ledger_apis_registry.supported_ids
-            else DEFAULT_LEDGER
-        )
-        api_class = make_ledger_api_cls(identifier)
+        identifier = identifier if LedgerApis.has_ledger(identifier) else DEFAULT_LEDGER
+        api_class = LedgerApis._get_api_class(identifier)
         digest = api_class.get_hash(message=message)
         return digest
 
@@ -304,11 +357,7 @@ class LedgerApis:
 
         :param address: the address to validate
         """
-        identifier = (
-            identifier
-            if identifier in ledger_apis_registry.supported_ids
-            else DEFAULT_LEDGER
-        )
-        api_class = make_ledger_api_cls(identifier)
+        identifier = identifier if LedgerApis.has_ledger(identifier) else DEFAULT_LEDGER
+        api_class = LedgerApis._get_api_class(identifier)
         result = api_class.is_valid_address(address=address)
         return result
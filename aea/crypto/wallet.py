@@ -20,7 +20,8 @@
 """Module wrapping all the public and private keys cryptography."""
 
 import logging
-from typing import Any, Dict, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, cast
 
 from aea.crypto.base import Crypto
 from aea.crypto.registries import make_crypto
@@ -29,6 +30,26 @@ from aea.crypto.registries import make_crypto
 _default_logger = logging.getLogger(__name__)
 
 
+def _make_cryptos(crypto_id_to_path: Dict[str, Optional[str]]) -> List[Crypto]:
+    """
+    Make the crypto objects, loading their private keys concurrently when there are several.
+
+    :param crypto_id_to_path: dictionary from crypto id to an (optional) path to the private key.
+    :return: the crypto objects, in the order of the dictionary.
+    """
+    items = list(crypto_id_to_path.items())
+    if len(items) < 2:
+        return [
+            make_crypto(identifier, private_key_path=path) for identifier, path in items
+        ]
+    with ThreadPoolExecutor(max_workers=len(items)) as executor:
+        futures = [
+            executor.submit(make_crypto, identifier, private_key_path=path)
+            for identifier, path in items
+        ]
+        return [future.result() for future in futures]
+
+
 class CryptoStore:
     """Utility class to store and retrieve crypto objects."""
 
@@ -48,8 +69,9 @@ class CryptoStore:
         addresses = {}  # type: Dict[str, str]
         private_keys = {}  # type: Dict[str, str]
 
-        for identifier, path in crypto_id_to_path.items():
-            crypto = make_crypto(identifier, private_key_path=path)
+        for identifier, crypto in zip(
+            crypto_id_to_path.keys(), _make_cryptos(crypto_id_to_path)
+        ):
             crypto_objects[identifier] = crypto
             public_keys[identifier] = cast(str, crypto.public_key)
             addresses[identifier] = cast(str, crypto.address)
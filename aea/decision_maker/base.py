@@ -18,10 +18,13 @@
 # ------------------------------------------------------------------------------
 """This module contains the decision maker class."""
 
+import asyncio
 import hashlib
+import queue
 import threading
 from abc import ABC, abstractmethod
-from queue import Queue
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
 from threading import Thread
 from types import SimpleNamespace
 from typing import List, Optional
@@ -144,7 +147,7 @@ class Preferences(ABC):
         """Copy the object."""
 
 
-class ProtectedQueue(Queue):
+class ProtectedQueue(AsyncFriendlyQueue):
     """A wrapper of a queue to protect which object can read from it."""
 
     def __init__(self, access_code: str):
@@ -156,7 +159,7 @@ class ProtectedQueue(Queue):
         super().__init__()
         self._access_code_hash = _hash(access_code)
 
-    def put(  # pylint: disable=arguments-differ
+    def put(  # type: ignore # pylint: disable=arguments-differ
         self, internal_message: Optional[Message], block=True, timeout=None
     ) -> None:
         """
@@ -194,7 +197,7 @@ class ProtectedQueue(Queue):
             raise ValueError("Only messages are allowed!")
         super().put_nowait(internal_message)
 
-    def get(self, block=True, timeout=None) -> None:
+    def get(self, block=True, timeout=None) -> None:  # type: ignore
         """
         Inaccessible get method.
 
@@ -231,6 +234,22 @@ class ProtectedQueue(Queue):
         )  # type: Optional[Message]
         return internal_message
 
+    async def async_protected_get(self, access_code: str) -> Optional[Message]:
+        """
+        Access protected get method, waiting asynchronously for an item.
+
+        :param access_code: the access code
+        :raises: ValueError, if caller is not permitted
+        :return: internal message
+        """
+        if self._access_code_hash != _hash(access_code):
+            raise ValueError("Wrong code, access not permitted!")
+        while True:
+            await self.async_wait()
+            with suppress(queue.Empty):
+                internal_message = super().get(block=False)  # type: Optional[Message]
+                return internal_message
+
 
 class DecisionMakerHandler(WithLogger, ABC):
     """This class implements the decision maker."""
@@ -287,19 +306,52 @@ class DecisionMakerHandler(WithLogger, ABC):
         :return: None
         """
 
+    def is_cpu_bound(  # pylint: disable=no-self-use,unused-argument
+        self, message: Message
+    ) -> bool:
+        """
+        Check whether handling an internal message is CPU-heavy.
+
+        The asynchronous decision maker handles such messages in its executor rather than in the event loop.
+
+        :param message: the internal message
+        :return: True if the message should be handled off the event loop
+        """
+        return False
+
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills, in the order they were received.
+
+        Handlers which can process several messages at once (e.g. sign them in parallel) should override this.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        for message in messages:
+            self.handle(message)
+
 
 class DecisionMaker(WithLogger):
     """This class implements the decision maker."""
 
+    DEFAULT_MAX_BATCH_SIZE = 64
+
     def __init__(
-        self, decision_maker_handler: DecisionMakerHandler,
+        self,
+        decision_maker_handler: DecisionMakerHandler,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
     ):
         """
         Initialize the decision maker.
 
         :param agent_name: the agent name
         :param decision_maker_handler: the decision maker handler
+        :param max_batch_size: the maximum number of pending messages handed to the handler at once
         """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer.")
+        self._max_batch_size = max_batch_size
         WithLogger.__init__(self, logger=decision_maker_handler.logger)
         self._agent_name = decision_maker_handler.identity.name
         self._queue_access_code = uuid4().hex
@@ -356,7 +408,7 @@ class DecisionMaker(WithLogger):
 
         Performs the following while not stopped:
 
-        - gets internal messages from the in queue and calls handle() on them
+        - gets internal messages from the in queue and calls handle_batch() on them
 
         :return: None
         """
@@ -365,7 +417,8 @@ class DecisionMaker(WithLogger):
                 self._queue_access_code, block=True
             )  # type: Optional[Message]
 
-            if message is None:
+            messages = self._drain(message)
+            if not messages:
                 self.logger.debug(
                     "[{}]: Received empty message. Quitting the processing loop...".format(
                         self._agent_name
@@ -373,7 +426,29 @@ class DecisionMaker(WithLogger):
                 )
                 continue
 
-            self.handle(message)
+            self.handle_batch(messages)
+
+    def _drain(self, message: Optional[Message]) -> List[Message]:
+        """
+        Collect a batch of pending messages, starting with the one already read.
+
+        Draining stops at the first empty message, as it is only sent on stop.
+
+        :param message: the message already read from the in queue
+        :return: the batch of messages
+        """
+        messages = []  # type: List[Message]
+        while message is not None:
+            messages.append(message)
+            if len(messages) >= self._max_batch_size:
+                break
+            try:
+                message = self.message_in_queue.protected_get(
+                    self._queue_access_code, block=False
+                )
+            except queue.Empty:
+                break
+        return messages
 
     def handle(self, message: Message) -> None:
         """
@@ -383,3 +458,116 @@ class DecisionMaker(WithLogger):
         :return: None
         """
         self.decision_maker_handler.handle(message)
+
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        self.decision_maker_handler.handle_batch(messages)
+
+
+class AsyncDecisionMaker(DecisionMaker):
+    """
+    This class implements a decision maker running as a task in the event loop of the agent.
+
+    Internal messages are handled in batches and in order. Batches with a message the handler reports
+    as CPU-bound are handled in an executor, all the others directly in the event loop.
+    """
+
+    def __init__(
+        self,
+        decision_maker_handler: DecisionMakerHandler,
+        executor: Optional[Executor] = None,
+        max_batch_size: int = DecisionMaker.DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the decision maker.
+
+        :param decision_maker_handler: the decision maker handler
+        :param executor: the executor for CPU-bound messages. If None, a single thread executor is used.
+        :param max_batch_size: the maximum number of pending messages handed to the handler at once
+        """
+        super().__init__(decision_maker_handler, max_batch_size)
+        self._executor = executor
+        self._default_executor = None  # type: Optional[ThreadPoolExecutor]
+        self._task = None  # type: Optional[asyncio.Future]
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """Get the executor for CPU-bound messages."""
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Optional[Executor]) -> None:
+        """Set the executor for CPU-bound messages."""
+        if not self._stopped:
+            raise ValueError("Cannot set the executor of a running decision maker.")
+        self._executor = executor
+
+    def start(self) -> None:
+        """Start the decision maker in the running event loop."""
+        with self._lock:
+            if not self._stopped:  # pragma: no cover
+                self.logger.debug(
+                    "[{}]: Decision maker already started.".format(self._agent_name)
+                )
+                return
+
+            self._stopped = False
+            if self._executor is None:
+                self._default_executor = ThreadPoolExecutor(
+                    1, thread_name_prefix=self.__class__.__name__
+                )
+            self._task = asyncio.ensure_future(self.async_execute())
+
+    def stop(self) -> None:
+        """Stop the decision maker."""
+        with self._lock:
+            self._stopped = True
+            self.message_in_queue.put(None)
+            self._task = None
+            if self._default_executor is not None:
+                self._default_executor.shutdown(wait=False)
+                self._default_executor = None
+            self.logger.debug("[{}]: Decision Maker stopped.".format(self._agent_name))
+
+    async def async_execute(self) -> None:
+        """
+        Execute the decision maker.
+
+        Performs the following while not stopped:
+
+        - gets internal messages from the in queue and calls handle_batch() on them
+
+        :return: None
+        """
+        executor = self._executor or self._default_executor
+        loop = asyncio.get_event_loop()
+        while not self._stopped:
+            message = await self.message_in_queue.async_protected_get(
+                self._queue_access_code
+            )  # type: Optional[Message]
+
+            messages = self._drain(message)
+            if not messages:
+                self.logger.debug(
+                    "[{}]: Received empty message. Quitting the processing loop...".format(
+                        self._agent_name
+                    )
+                )
+                continue
+
+            try:
+                if any(map(self.decision_maker_handler.is_cpu_bound, messages)):
+                    await loop.run_in_executor(executor, self.handle_batch, messages)
+                else:
+                    self.handle_batch(messages)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    "[{}]: Error while handling messages={}".format(
+                        self._agent_name, messages
+                    )
+                )
@@ -21,8 +21,10 @@
 
 import copy
 import logging
+import threading
+from concurrent.futures import Executor
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple, cast
 
 from aea.common import Address
 from aea.crypto.wallet import Wallet
@@ -63,6 +65,9 @@ CurrencyHoldings = Dict[str, int]  # a map from identifier to quantity
 GoodHoldings = Dict[str, int]  # a map from identifier to quantity
 UtilityParams = Dict[str, float]  # a map from identifier to quantity
 ExchangeParams = Dict[str, float]  # a map from identifier to quantity
+HoldingsCallback = Callable[
+    [CurrencyHoldings, GoodHoldings], None
+]  # called with the non-zero changes of the holdings
 
 QUANTITY_SHIFT = 100
 
@@ -105,7 +110,17 @@ class GoalPursuitReadiness:
 
 
 class OwnershipState(BaseOwnershipState):
-    """Represent the ownership state of an agent (can proxy a ledger)."""
+    """
+    Represent the ownership state of an agent (can proxy a ledger).
+
+    Holdings are kept in lists against a fixed index of the currency and good ids, set on initialization
+    and shared by all copies of the state, so updating or copying a state does not rebuild dictionaries.
+
+    The version of the state increases whenever the holdings are updated, so readers can check cheaply
+    whether a state they derived from it is stale. Subscribers are called with the non-zero changes
+    of the holdings, in the thread which changes them, after the update and outside of the lock of
+    the state, so concurrent changes may be notified out of order.
+    """
 
     def __init__(self):
         """
@@ -113,8 +128,15 @@ class OwnershipState(BaseOwnershipState):
 
         :param decision_maker: the decision maker
         """
-        self._amount_by_currency_id = None  # type: Optional[CurrencyHoldings]
-        self._quantities_by_good_id = None  # type: Optional[GoodHoldings]
+        self._currency_ids = ()  # type: Tuple[str, ...]
+        self._currency_index = {}  # type: Dict[str, int]
+        self._amounts = None  # type: Optional[List[int]]
+        self._good_ids = ()  # type: Tuple[str, ...]
+        self._good_index = {}  # type: Dict[str, int]
+        self._quantities = None  # type: Optional[List[int]]
+        self._version = 0
+        self._subscribers = []  # type: List[HoldingsCallback]
+        self._lock = threading.Lock()
 
     def set(  # pylint: disable=arguments-differ
         self,
@@ -132,13 +154,19 @@ class OwnershipState(BaseOwnershipState):
             raise ValueError("Must provide amount_by_currency_id.")
         if quantities_by_good_id is None:  # pragma: nocover
             raise ValueError("Must provide quantities_by_good_id.")
-        enforce(
-            not self.is_initialized,
-            "Cannot apply state update, current state is already initialized!",
-        )
+        with self._lock:
+            enforce(
+                not self.is_initialized,
+                "Cannot apply state update, current state is already initialized!",
+            )
 
-        self._amount_by_currency_id = copy.copy(amount_by_currency_id)
-        self._quantities_by_good_id = copy.copy(quantities_by_good_id)
+            self._currency_ids, self._currency_index = _make_index(
+                amount_by_currency_id
+            )
+            self._amounts = list(amount_by_currency_id.values())
+            self._good_ids, self._good_index = _make_index(quantities_by_good_id)
+            self._quantities = list(quantities_by_good_id.values())
+            self._version += 1
 
     def apply_delta(  # pylint: disable=arguments-differ
         self,
@@ -159,14 +187,14 @@ class OwnershipState(BaseOwnershipState):
             raise ValueError("Must provide delta_amount_by_currency_id.")
         if delta_quantities_by_good_id is None:  # pragma: nocover
             raise ValueError("Must provide delta_quantities_by_good_id.")
-        if self._amount_by_currency_id is None or self._quantities_by_good_id is None:
+        if self._amounts is None or self._quantities is None:
             raise ValueError(  # pragma: nocover
                 "Cannot apply state update, current state is not initialized!"
             )
         enforce(
             all(
                 [
-                    key in self._amount_by_currency_id
+                    key in self._currency_index
                     for key in delta_amount_by_currency_id.keys()
                 ]
             ),
@@ -174,41 +202,57 @@ class OwnershipState(BaseOwnershipState):
         )
         enforce(
             all(
-                [
-                    key in self._quantities_by_good_id
-                    for key in delta_quantities_by_good_id.keys()
-                ]
+                [key in self._good_index for key in delta_quantities_by_good_id.keys()]
             ),
             "Invalid keys present in delta_quantities_by_good_id.",
         )
 
-        for currency_id, amount_delta in delta_amount_by_currency_id.items():
-            self._amount_by_currency_id[currency_id] += amount_delta
-
-        for good_id, quantity_delta in delta_quantities_by_good_id.items():
-            self._quantities_by_good_id[good_id] += quantity_delta
+        self._add(delta_amount_by_currency_id, delta_quantities_by_good_id)
 
     @property
     def is_initialized(self) -> bool:
         """Get the initialization status."""
-        return (
-            self._amount_by_currency_id is not None
-            and self._quantities_by_good_id is not None
-        )
+        return self._amounts is not None and self._quantities is not None
+
+    @property
+    def version(self) -> int:
+        """Get the version of the state, which increases whenever the holdings are updated."""
+        return self._version
+
+    def subscribe(self, callback: HoldingsCallback) -> "OwnershipState":
+        """
+        Subscribe to the changes of the holdings.
+
+        :param callback: the callable called with the non-zero changes of the currency amounts and of the good quantities.
+        :return: a copy of the state, to which exactly the changes notified afterwards have to be applied.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+            return copy.copy(self)
+
+    def unsubscribe(self, callback: HoldingsCallback) -> None:
+        """
+        Unsubscribe from the changes of the holdings.
+
+        :param callback: the subscribed callable.
+        :return: None
+        """
+        with self._lock:
+            self._subscribers.remove(callback)
 
     @property
     def amount_by_currency_id(self) -> CurrencyHoldings:
         """Get currency holdings in this state."""
-        if self._amount_by_currency_id is None:
+        if self._amounts is None:
             raise ValueError("amount_by_currency_id is not set!")
-        return copy.copy(self._amount_by_currency_id)
+        return dict(zip(self._currency_ids, self._amounts))
 
     @property
     def quantities_by_good_id(self) -> GoodHoldings:
         """Get good holdings in this state."""
-        if self._quantities_by_good_id is None:
+        if self._quantities is None:
             raise ValueError("quantities_by_good_id is not set!")
-        return copy.copy(self._quantities_by_good_id)
+        return dict(zip(self._good_ids, self._quantities))
 
     def is_affordable_transaction(self, terms: Terms) -> bool:
         """
@@ -220,6 +264,8 @@ class OwnershipState(BaseOwnershipState):
         :param terms: the transaction terms
         :return: True if the transaction is legal wrt the current state, false otherwise.
         """
+        if self._amounts is None or self._quantities is None:
+            raise ValueError("Ownership state is not set!")
         if all(amount == 0 for amount in terms.amount_by_currency_id.values()) and all(
             quantity == 0 for quantity in terms.quantities_by_good_id.values()
         ):
@@ -230,7 +276,7 @@ class OwnershipState(BaseOwnershipState):
         ) and all(quantity >= 0 for quantity in terms.quantities_by_good_id.values()):
             # check if the agent has the money to cover the sender_amount (the agent=sender is the buyer)
             result = all(
-                self.amount_by_currency_id[currency_id] >= -amount
+                self._amounts[self._currency_index[currency_id]] >= -amount
                 for currency_id, amount in terms.amount_by_currency_id.items()
             )
         elif all(
@@ -238,7 +284,7 @@ class OwnershipState(BaseOwnershipState):
         ) and all(quantity <= 0 for quantity in terms.quantities_by_good_id.values()):
             # check if the agent has the goods (the agent=sender is the seller).
             result = all(
-                self.quantities_by_good_id[good_id] >= -quantity
+                self._quantities[self._good_index[good_id]] >= -quantity
                 for good_id, quantity in terms.quantities_by_good_id.items()
             )
         else:
@@ -268,15 +314,11 @@ class OwnershipState(BaseOwnershipState):
         :param terms: the transaction terms
         :return: None
         """
-        if self._amount_by_currency_id is None or self._quantities_by_good_id is None:
+        if self._amounts is None or self._quantities is None:
             raise ValueError(  # pragma: nocover
                 "Cannot apply state update, current state is not initialized!"
             )
-        for currency_id, amount_delta in terms.amount_by_currency_id.items():
-            self._amount_by_currency_id[currency_id] += amount_delta
-
-        for good_id, quantity_delta in terms.quantities_by_good_id.items():
-            self._quantities_by_good_id[good_id] += quantity_delta
+        self._add(terms.amount_by_currency_id, terms.quantities_by_good_id)
 
     def apply_transactions(self, list_of_terms: List[Terms]) -> "OwnershipState":
         """
@@ -291,23 +333,73 @@ class OwnershipState(BaseOwnershipState):
 
         return new_state
 
+    def _add(
+        self,
+        delta_amount_by_currency_id: Dict[str, int],
+        delta_quantities_by_good_id: Dict[str, int],
+    ) -> None:
+        """Add deltas to the holdings, in O(number of deltas), and notify the subscribers of the non-zero ones."""
+        amounts = cast(List[int], self._amounts)
+        quantities = cast(List[int], self._quantities)
+        with self._lock:
+            for currency_id, amount_delta in delta_amount_by_currency_id.items():
+                amounts[self._currency_index[currency_id]] += amount_delta
+            for good_id, quantity_delta in delta_quantities_by_good_id.items():
+                quantities[self._good_index[good_id]] += quantity_delta
+            self._version += 1
+            # exactly the subscribers whose snapshots do not include the change
+            subscribers = tuple(self._subscribers)
+        if len(subscribers) == 0:
+            return
+        changed_amounts = {
+            currency_id: amount_delta
+            for currency_id, amount_delta in delta_amount_by_currency_id.items()
+            if amount_delta != 0
+        }
+        changed_quantities = {
+            good_id: quantity_delta
+            for good_id, quantity_delta in delta_quantities_by_good_id.items()
+            if quantity_delta != 0
+        }
+        if len(changed_amounts) == 0 and len(changed_quantities) == 0:
+            return
+        for callback in subscribers:
+            try:
+                callback(changed_amounts, changed_quantities)
+            except Exception:  # pylint: disable=broad-except
+                _default_logger.exception(
+                    "Error while notifying a subscriber of the ownership state changes."
+                )
+
     def __copy__(self) -> "OwnershipState":
         """Copy the object."""
         state = OwnershipState()
-        if self.is_initialized:
-            state._amount_by_currency_id = self.amount_by_currency_id
-            state._quantities_by_good_id = self.quantities_by_good_id
+        if self._amounts is not None and self._quantities is not None:
+            # the indices are never mutated, so they are shared
+            state._currency_ids = self._currency_ids
+            state._currency_index = self._currency_index
+            state._amounts = list(self._amounts)
+            state._good_ids = self._good_ids
+            state._good_index = self._good_index
+            state._quantities = list(self._quantities)
+            state._version = self._version
         return state
 
 
 class Preferences(BasePreferences):
-    """Class to represent the preferences."""
+    """
+    Class to represent the preferences.
+
+    Utility differences are computed only over the goods and currencies a change touches, with the
+    logarithmic terms of the goods cached by quantity.
+    """
 
     def __init__(self):
         """Instantiate an agent preference object."""
         self._exchange_params_by_currency_id = None  # type: Optional[ExchangeParams]
         self._utility_params_by_good_id = None  # type: Optional[UtilityParams]
         self._quantity_shift = QUANTITY_SHIFT
+        self._log_terms = {}  # type: Dict[Tuple[str, int], float]
 
     def set(  # pylint: disable=arguments-differ
         self,
@@ -419,33 +511,30 @@ class Preferences(BasePreferences):
         """
         enforce(self.is_initialized, "Preferences params not set!")
         ownership_state = cast(OwnershipState, ownership_state)
-        current_goods_score = self.logarithmic_utility(
-            ownership_state.quantities_by_good_id
-        )
-        current_currency_score = self.linear_utility(
-            ownership_state.amount_by_currency_id
-        )
-        new_goods_score = current_goods_score
-        new_currency_score = current_currency_score
-        if delta_quantities_by_good_id is not None:
-            new_quantities_by_good_id = {
-                good_id: quantity + delta_quantities_by_good_id[good_id]
-                for good_id, quantity in ownership_state.quantities_by_good_id.items()
-            }
-            new_goods_score = self.logarithmic_utility(new_quantities_by_good_id)
-        if delta_amount_by_currency_id is not None:
-            new_amount_by_currency_id = {
-                currency: amount + delta_amount_by_currency_id[currency]
-                for currency, amount in ownership_state.amount_by_currency_id.items()
-            }
-            new_currency_score = self.linear_utility(new_amount_by_currency_id)
-        marginal_utility = (
-            new_goods_score
-            + new_currency_score
-            - current_goods_score
-            - current_currency_score
+        # changes to goods or currencies not held are ignored, as they are not part of the utility
+        return self._utility_delta(
+            ownership_state,
+            delta_quantities_by_good_id or {},
+            delta_amount_by_currency_id or {},
+            held_only=True,
         )
-        return marginal_utility
+
+    def marginal_utilities_of_goods(
+        self, quantities_by_good_id: GoodHoldings, quantity_delta: int
+    ) -> Dict[str, float]:
+        """
+        Compute the marginal utility of the same change in the quantity of every good, each on its own.
+
+        :param quantities_by_good_id: the good holdings
+        :param quantity_delta: the change in the quantity of each good
+        :return: the marginal utility by good id
+        """
+        enforce(self.is_initialized, "Preferences params not set!")
+        return {
+            good_id: self._log_term(good_id, quantity + quantity_delta)
+            - self._log_term(good_id, quantity)
+            for good_id, quantity in quantities_by_good_id.items()
+        }
 
     def utility_diff_from_transaction(
         self, ownership_state: BaseOwnershipState, terms: Terms
@@ -458,18 +547,95 @@ class Preferences(BasePreferences):
         :return: the score.
         """
         enforce(self.is_initialized, "Preferences params not set!")
-        ownership_state = cast(OwnershipState, ownership_state)
-        current_score = self.utility(
-            quantities_by_good_id=ownership_state.quantities_by_good_id,
-            amount_by_currency_id=ownership_state.amount_by_currency_id,
+        return self._utility_delta(
+            cast(OwnershipState, ownership_state),
+            terms.quantities_by_good_id,
+            terms.amount_by_currency_id,
         )
-        new_ownership_state = ownership_state.apply_transactions([terms])
-        new_score = self.utility(
-            quantities_by_good_id=new_ownership_state.quantities_by_good_id,
-            amount_by_currency_id=new_ownership_state.amount_by_currency_id,
-        )
-        score_difference = new_score - current_score
-        return score_difference
+
+    def utility_diffs_from_transactions(
+        self, ownership_state: BaseOwnershipState, list_of_terms: List[Terms]
+    ) -> List[float]:
+        """
+        Get the utility difference of each of many candidate transactions, applied on their own to the same state.
+
+        :param ownership_state: the ownership state against which to apply the transactions.
+        :param list_of_terms: the candidate transaction terms.
+        :return: the scores, in the same order.
+        """
+        enforce(self.is_initialized, "Preferences params not set!")
+        ownership_state = cast(OwnershipState, ownership_state)
+        return [
+            self._utility_delta(
+                ownership_state,
+                terms.quantities_by_good_id,
+                terms.amount_by_currency_id,
+            )
+            for terms in list_of_terms
+        ]
+
+    def _utility_delta(
+        self,
+        ownership_state: OwnershipState,
+        delta_quantities_by_good_id: GoodHoldings,
+        delta_amount_by_currency_id: CurrencyHoldings,
+        held_only: bool = False,
+    ) -> float:
+        """
+        Compute the utility difference of a change in holdings, in O(number of goods and currencies changed).
+
+        :param ownership_state: the ownership state the change applies to.
+        :param delta_quantities_by_good_id: the change in good holdings
+        :param delta_amount_by_currency_id: the change in currency holdings
+        :param held_only: whether to ignore changes to goods and currencies not held, rather than raise a KeyError
+        :return: the utility difference
+        """
+        # pylint: disable=protected-access
+        if ownership_state._quantities is None:
+            raise ValueError(  # pragma: nocover
+                "Cannot compute utility difference, ownership state is not initialized!"
+            )
+        quantities = ownership_state._quantities
+        good_index = ownership_state._good_index
+        currency_index = ownership_state._currency_index
+        exchange_params = self.exchange_params_by_currency_id
+        goods_delta = 0.0
+        for good_id, quantity_delta in delta_quantities_by_good_id.items():
+            if held_only and good_id not in good_index:
+                continue
+            quantity = quantities[good_index[good_id]]
+            if quantity_delta == 0:
+                continue
+            goods_delta += self._log_term(
+                good_id, quantity + quantity_delta
+            ) - self._log_term(good_id, quantity)
+        currency_delta = 0.0
+        for currency_id, amount_delta in delta_amount_by_currency_id.items():
+            if currency_id not in currency_index:
+                if held_only:
+                    continue
+                raise KeyError(currency_id)
+            currency_delta += exchange_params[currency_id] * amount_delta
+        return goods_delta + currency_delta
+
+    def _log_term(self, good_id: str, quantity: int) -> float:
+        """
+        Get the term of a good in the logarithmic utility, cached by good and quantity.
+
+        :param good_id: the good
+        :param quantity: the quantity of the good held
+        :return: the term of the good in the utility
+        """
+        key = (good_id, quantity)
+        term = self._log_terms.get(key)
+        if term is None:
+            term = logarithmic_utility(
+                self.utility_params_by_good_id,
+                {good_id: quantity},
+                self._quantity_shift,
+            )
+            self._log_terms[key] = term
+        return term
 
     def is_utility_enhancing(
         self, ownership_state: BaseOwnershipState, terms: Terms
@@ -500,9 +666,22 @@ class Preferences(BasePreferences):
                 self.exchange_params_by_currency_id
             )
             preferences._utility_params_by_good_id = self.utility_params_by_good_id
+            # the parameters are shared, so are the terms computed from them
+            preferences._log_terms = self._log_terms
         return preferences
 
 
+def _make_index(values_by_id: Dict[str, Any]) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """
+    Make a fixed index of identifiers.
+
+    :param values_by_id: a dictionary keyed by the identifiers
+    :return: the identifiers, and a map from identifier to position
+    """
+    ids = tuple(values_by_id.keys())
+    return ids, {id_: position for position, id_ in enumerate(ids)}
+
+
 class DecisionMakerHandler(BaseDecisionMakerHandler):
     """This class implements the decision maker."""
 
@@ -597,12 +776,18 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 **kwargs,
             )
 
-    def __init__(self, identity: Identity, wallet: Wallet):
+    def __init__(
+        self,
+        identity: Identity,
+        wallet: Wallet,
+        signing_executor: Optional[Executor] = None,
+    ):
         """
         Initialize the decision maker.
 
         :param identity: the identity
         :param wallet: the wallet
+        :param signing_executor: the thread pool executor to sign batches of requests in parallel. If None, they are signed sequentially.
         """
         kwargs = {
             "goal_pursuit_readiness": GoalPursuitReadiness(),
@@ -618,6 +803,7 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
         self.state_update_dialogues = DecisionMakerHandler.StateUpdateDialogues(
             self.self_address
         )
+        self.signing_executor = signing_executor
 
     def handle(self, message: Message) -> None:
         """
@@ -640,6 +826,44 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 )
             )
 
+    def is_cpu_bound(self, message: Message) -> bool:
+        """
+        Check whether handling an internal message is CPU-heavy.
+
+        Signing requests are, as they involve cryptographic operations.
+
+        :param message: the internal message
+        :return: True if the message should be handled off the event loop
+        """
+        from packages.fetchai.protocols.signing.message import SigningMessage
+
+        return isinstance(message, SigningMessage)
+
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills, in the order they were received.
+
+        Runs of consecutive signing messages are handled together: they are all checked against
+        the same ownership state and signed on the signing executor, if one is set. Any other message
+        ends the run, so a state update never takes effect in the middle of one.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        from packages.fetchai.protocols.signing.message import SigningMessage
+
+        signing_msgs = []  # type: List[SigningMessage]
+        for message in messages:
+            if isinstance(message, SigningMessage):
+                signing_msgs.append(message)
+                continue
+            if signing_msgs:
+                self._handle_signing_messages(signing_msgs)
+                signing_msgs = []
+            self.handle(message)
+        if signing_msgs:
+            self._handle_signing_messages(signing_msgs)
+
     def _handle_signing_message(self, signing_msg: SigningMessage) -> None:
         """
         Handle a signing message.
@@ -647,6 +871,15 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
         :param signing_msg: the transaction message
         :return: None
         """
+        self._handle_signing_messages([signing_msg])
+
+    def _handle_signing_messages(self, signing_msgs: List[SigningMessage]) -> None:
+        """
+        Handle signing messages.
+
+        :param signing_msgs: the signing messages
+        :return: None
+        """
         if not self.context.goal_pursuit_readiness.is_ready:
             self.logger.debug(
                 "[{}]: Preferences and ownership state not initialized!".format(
@@ -655,92 +888,119 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
             )
 
         from packages.fetchai.protocols.signing.dialogues import SigningDialogue
+        from packages.fetchai.protocols.signing.message import SigningMessage
 
-        signing_dialogue = cast(
-            Optional[SigningDialogue], self.signing_dialogues.update(signing_msg)
-        )
-        if signing_dialogue is None:  # pragma: no cover
-            self.logger.error(
-                "[{}]: Could not construct signing dialogue. Aborting!".format(
-                    self.agent_name
+        requests = []  # type: List[Tuple[SigningMessage, SigningDialogue]]
+        for signing_msg in signing_msgs:
+            signing_dialogue = cast(
+                Optional[SigningDialogue], self.signing_dialogues.update(signing_msg)
+            )
+            if signing_dialogue is None:  # pragma: no cover
+                self.logger.error(
+                    "[{}]: Could not construct signing dialogue. Aborting!".format(
+                        self.agent_name
+                    )
                 )
+                continue
+            if signing_msg.performative not in (
+                SigningMessage.Performative.SIGN_MESSAGE,
+                SigningMessage.Performative.SIGN_TRANSACTION,
+            ):  # pragma: no cover
+                self.logger.error(
+                    "[{}]: Unexpected transaction message performative".format(
+                        self.agent_name
+                    )
+                )
+                continue
+            requests.append((signing_msg, signing_dialogue))
+
+        # check if the transactions are acceptable and sign those which are
+        is_acceptable = [
+            self._is_acceptable_for_signing(signing_msg) for signing_msg, _ in requests
+        ]
+        signatures = iter(
+            self._sign_all(
+                [
+                    signing_msg
+                    for (signing_msg, _), acceptable in zip(requests, is_acceptable)
+                    if acceptable
+                ]
             )
-            return
+        )
+        for (signing_msg, signing_dialogue), acceptable in zip(requests, is_acceptable):
+            signature = next(signatures) if acceptable else None
+            self._reply_to_signing(signing_msg, signing_dialogue, signature)
 
-        from packages.fetchai.protocols.signing.message import SigningMessage
+    def _sign_all(self, signing_msgs: List[SigningMessage]) -> List[Optional[Any]]:
+        """
+        Sign the raw messages or transactions of signing messages.
 
-        # check if the transaction is acceptable and process it accordingly
-        if signing_msg.performative == SigningMessage.Performative.SIGN_MESSAGE:
-            self._handle_message_signing(signing_msg, signing_dialogue)
-        elif signing_msg.performative == SigningMessage.Performative.SIGN_TRANSACTION:
-            self._handle_transaction_signing(signing_msg, signing_dialogue)
-        else:  # pragma: no cover
-            self.logger.error(
-                "[{}]: Unexpected transaction message performative".format(
-                    self.agent_name
-                )
-            )
+        :param signing_msgs: the signing messages
+        :return: the signed messages or transactions, in the same order
+        """
+        if self.signing_executor is None or len(signing_msgs) < 2:
+            return [self._sign(signing_msg) for signing_msg in signing_msgs]
+        return list(self.signing_executor.map(self._sign, signing_msgs))
 
-    def _handle_message_signing(
-        self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
-    ) -> None:
+    def _sign(self, signing_msg: SigningMessage) -> Optional[Any]:
         """
-        Handle a message for signing.
+        Sign the raw message or transaction of a signing message.
 
         :param signing_msg: the signing message
-        :param signing_dialogue: the signing dialogue
-        :return: None
+        :return: the signed message or transaction, or None if it could not be signed
         """
         from packages.fetchai.protocols.signing.message import SigningMessage
 
-        performative = SigningMessage.Performative.ERROR
-        kwargs = {
-            "error_code": SigningMessage.ErrorCode.UNSUCCESSFUL_MESSAGE_SIGNING,
-        }  # type: Dict[str, Any]
-        if self._is_acceptable_for_signing(signing_msg):
-            signed_message = self.wallet.sign_message(
+        if signing_msg.performative == SigningMessage.Performative.SIGN_MESSAGE:
+            return self.wallet.sign_message(
                 signing_msg.raw_message.ledger_id,
                 signing_msg.raw_message.body,
                 signing_msg.raw_message.is_deprecated_mode,
             )
-            if signed_message is not None:
-                performative = SigningMessage.Performative.SIGNED_MESSAGE
-                kwargs.pop("error_code")
-                kwargs["signed_message"] = SignedMessage(
-                    signing_msg.raw_message.ledger_id,
-                    signed_message,
-                    signing_msg.raw_message.is_deprecated_mode,
-                )
-        signing_msg_response = signing_dialogue.reply(
-            performative=performative, target_message=signing_msg, **kwargs,
+        return self.wallet.sign_transaction(
+            signing_msg.raw_transaction.ledger_id, signing_msg.raw_transaction.body
         )
-        self.message_out_queue.put(signing_msg_response)
 
-    def _handle_transaction_signing(
-        self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
+    def _reply_to_signing(
+        self,
+        signing_msg: SigningMessage,
+        signing_dialogue: SigningDialogue,
+        signature: Optional[Any],
     ) -> None:
         """
-        Handle a transaction for signing.
+        Reply to a signing message.
 
         :param signing_msg: the signing message
         :param signing_dialogue: the signing dialogue
+        :param signature: the signed message or transaction, or None if it was not signed
         :return: None
         """
         from packages.fetchai.protocols.signing.message import SigningMessage
 
-        performative = SigningMessage.Performative.ERROR
-        kwargs = {
-            "error_code": SigningMessage.ErrorCode.UNSUCCESSFUL_TRANSACTION_SIGNING,
-        }  # type: Dict[str, Any]
-        if self._is_acceptable_for_signing(signing_msg):
-            signed_tx = self.wallet.sign_transaction(
-                signing_msg.raw_transaction.ledger_id, signing_msg.raw_transaction.body
-            )
-            if signed_tx is not None:
+        kwargs = {}  # type: Dict[str, Any]
+        if signing_msg.performative == SigningMessage.Performative.SIGN_MESSAGE:
+            if signature is None:
+                performative = SigningMessage.Performative.ERROR
+                kwargs[
+                    "error_code"
+                ] = SigningMessage.ErrorCode.UNSUCCESSFUL_MESSAGE_SIGNING
+            else:
+                performative = SigningMessage.Performative.SIGNED_MESSAGE
+                kwargs["signed_message"] = SignedMessage(
+                    signing_msg.raw_message.ledger_id,
+                    signature,
+                    signing_msg.raw_message.is_deprecated_mode,
+                )
+        else:
+            if signature is None:
+                performative = SigningMessage.Performative.ERROR
+                kwargs[
+                    "error_code"
+                ] = SigningMessage.ErrorCode.UNSUCCESSFUL_TRANSACTION_SIGNING
+            else:
                 performative = SigningMessage.Performative.SIGNED_TRANSACTION
-                kwargs.pop("error_code")
                 kwargs["signed_transaction"] = SignedTransaction(
-                    signing_msg.raw_transaction.ledger_id, signed_tx
+                    signing_msg.raw_transaction.ledger_id, signature
                 )
         signing_msg_response = signing_dialogue.reply(
             performative=performative, target_message=signing_msg, **kwargs,
@@ -45,9 +45,15 @@ class AsyncFriendlyQueue(queue.Queue):
         super().put(item, *args, **kwargs)
         if self._non_empty_waiters:
             waiter = self._non_empty_waiters.popleft()
-            waiter._loop.call_soon_threadsafe(  # pylint: disable=protected-access
-                self._set_waiter, waiter
+            waiter_loop = waiter._loop  # pylint: disable=protected-access
+            running_loop = (
+                asyncio.events._get_running_loop()  # pylint: disable=protected-access
             )
+            if running_loop is waiter_loop:
+                # already in the thread of the waiter, no need for a thread handoff
+                self._set_waiter(waiter)
+            else:
+                waiter_loop.call_soon_threadsafe(self._set_waiter, waiter)
 
     @staticmethod
     def _set_waiter(waiter) -> None:
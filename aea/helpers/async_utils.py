@@ -21,6 +21,7 @@ import asyncio
 import collections
 import datetime
 import logging
+import math
 import subprocess  # nosec
 import time
 from abc import ABC, abstractmethod
@@ -36,6 +37,7 @@ from typing import (
     Awaitable,
     Callable,
     Container,
+    Dict,
     Generator,
     List,
     Optional,
@@ -261,6 +263,281 @@ class PeriodicCaller:
         self._timerhandle = None
 
 
+class PeriodicTaskStats:
+    """
+    Drift and overrun statistics of a task called by the timer wheel scheduler.
+
+    The drift of a call is how late it starts after its due time. An overrun is a
+    due call which is skipped, because the previous call or the event loop was
+    still busy after its due time.
+    """
+
+    def __init__(self) -> None:
+        """Init statistics."""
+        self.nb_calls = 0
+        self.total_drift = 0.0
+        self.max_drift = 0.0
+        self.nb_overruns = 0
+
+    @property
+    def mean_drift(self) -> float:
+        """Get the mean drift of the calls, in seconds."""
+        return self.total_drift / self.nb_calls if self.nb_calls else 0.0
+
+    def add_call(self, drift: float) -> None:
+        """
+        Account for a call.
+
+        :param drift: the drift of the call, in seconds.
+        :return: None
+        """
+        self.nb_calls += 1
+        self.total_drift += drift
+        self.max_drift = max(self.max_drift, drift)
+
+
+class _ScheduledTask:  # pylint: disable=too-few-public-methods
+    """A callable called periodically by the timer wheel scheduler."""
+
+    __slots__ = ("callback", "period", "due_time", "due_tick", "cancelled", "stats")
+
+    def __init__(self, callback: Callable, period: float, due_time: float) -> None:
+        """
+        Init the scheduled task.
+
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param due_time: the event loop time of the first call.
+        """
+        self.callback = callback
+        self.period = period
+        self.due_time = due_time
+        self.due_tick = 0
+        self.cancelled = False
+        self.stats = PeriodicTaskStats()
+
+
+class TimerWheelScheduler:
+    """
+    Schedule the periodic calls of many callables with a single timer of the event loop.
+
+    Due times are kept in a hierarchical timer wheel. The first level has one slot per
+    tick of `resolution` seconds, and each slot of a higher level spans a full turn of
+    the level below, into which its tasks are cascaded when that turn comes. All the
+    tasks due in the same tick are called in one wake-up of the event loop, so the
+    resolution is the window within which calls are coalesced: a call starts up to one
+    resolution after its due time. Calls are kept at a fixed rate, the ones missed while
+    a call or the event loop was busy are skipped and counted as overruns.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.01,
+        exception_callback: Optional[Callable[[Callable, Exception], None]] = None,
+        loop: Optional[AbstractEventLoop] = None,
+        slot_bits: int = 8,
+        nb_levels: int = 4,
+    ):
+        """
+        Init timer wheel scheduler.
+
+        :param resolution: the duration of a tick, in seconds.
+        :param exception_callback: optional handler to call on exception raised.
+        :param loop: optional asyncio event loop
+        :param slot_bits: the number of slots of each level is 2 ** slot_bits.
+        :param nb_levels: the number of levels of the wheel.
+        """
+        self._loop = loop or asyncio.get_event_loop()
+        self._resolution = resolution
+        self._exception_callback = exception_callback
+        self._slot_bits = slot_bits
+        self._slot_mask = (1 << slot_bits) - 1
+        self._levels: List[List[List[_ScheduledTask]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(nb_levels)
+        ]
+        self._overflow: List[_ScheduledTask] = []
+        self._tasks: Dict[Callable, _ScheduledTask] = {}
+        self._origin = self._loop.time()
+        self._tick = 0
+        self._timerhandle: Optional[TimerHandle] = None
+        self._wakeup_tick = 0
+
+    def __contains__(self, callback: Callable) -> bool:
+        """Check whether a callable is scheduled."""
+        return callback in self._tasks
+
+    def __len__(self) -> int:
+        """Get the number of callables scheduled."""
+        return len(self._tasks)
+
+    def add(
+        self,
+        callback: Callable,
+        period: float,
+        start_at: Optional[datetime.datetime] = None,
+    ) -> None:
+        """
+        Schedule periodic calls of a callable.
+
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param start_at: optional first call datetime
+        :return: None
+        """
+        if callback in self._tasks:  # pragma: nocover
+            return
+
+        delay = 0.0
+        if start_at is not None:
+            delay = max(0, time.mktime(start_at.timetuple()) - time.time())
+        task = _ScheduledTask(callback, period, self._loop.time() + delay)
+        self._tasks[callback] = task
+        self._insert(task)
+        self._schedule_wakeup()
+
+    def remove(self, callback: Callable) -> None:
+        """
+        Stop the periodic calls of a callable.
+
+        The task is dropped from the wheel when its slot comes.
+
+        :param callback: function called periodically
+        :return: None
+        """
+        task = self._tasks.pop(callback, None)
+        if task is not None:
+            task.cancelled = True
+
+    def get_stats(self, callback: Callable) -> PeriodicTaskStats:
+        """
+        Get the drift and overrun statistics of a scheduled callable.
+
+        :param callback: function called periodically
+        :return: the statistics
+        """
+        return self._tasks[callback].stats
+
+    def stop(self) -> None:
+        """Remove all the callables from schedule."""
+        if self._timerhandle is not None:
+            self._timerhandle.cancel()
+            self._timerhandle = None
+        for task in self._tasks.values():
+            task.cancelled = True
+        self._tasks = {}
+        for slots in self._levels:
+            for slot in slots:
+                slot.clear()
+        self._overflow = []
+
+    def _insert(self, task: _ScheduledTask) -> None:
+        """Put a task in the slot of its due time, on the lowest level reaching it."""
+        tick = max(
+            int(math.ceil((task.due_time - self._origin) / self._resolution)),
+            self._tick + 1,
+        )
+        task.due_tick = tick
+        self._place(task)
+
+    def _place(self, task: _ScheduledTask) -> None:
+        """Put a task on the lowest level which turn contains its due tick."""
+        tick = task.due_tick
+        for level, slots in enumerate(self._levels):
+            shift = self._slot_bits * (level + 1)
+            if tick >> shift == self._tick >> shift:
+                slots[(tick >> (shift - self._slot_bits)) & self._slot_mask].append(
+                    task
+                )
+                return
+        self._overflow.append(task)
+
+    def _cascade(self) -> None:
+        """Move the tasks of the slots starting at the current tick to the levels below."""
+        nb_levels = len(self._levels)
+        if self._tick & ((1 << (self._slot_bits * nb_levels)) - 1) == 0:
+            overflow, self._overflow = self._overflow, []
+            for task in overflow:
+                if not task.cancelled:
+                    self._place(task)
+        for level in range(nb_levels - 1, 0, -1):
+            shift = self._slot_bits * level
+            if self._tick & ((1 << shift) - 1) != 0:
+                continue
+            slots = self._levels[level]
+            index = (self._tick >> shift) & self._slot_mask
+            slot, slots[index] = slots[index], []
+            for task in slot:
+                if not task.cancelled:
+                    self._place(task)
+
+    def _next_wakeup_tick(self) -> int:
+        """Get the next tick with tasks on the first level, or the start of its next turn."""
+        slots = self._levels[0]
+        for index in range((self._tick & self._slot_mask) + 1, self._slot_mask + 1):
+            if slots[index]:
+                return (self._tick & ~self._slot_mask) + index
+        return (self._tick | self._slot_mask) + 1
+
+    def _schedule_wakeup(self) -> None:
+        """Set the timer of the event loop to the next tick to process."""
+        if not self._tasks:
+            return
+        tick = self._next_wakeup_tick()
+        if self._timerhandle is not None:
+            if self._wakeup_tick <= tick:
+                return
+            self._timerhandle.cancel()
+        self._wakeup_tick = tick
+        self._timerhandle = self._loop.call_at(
+            self._origin + tick * self._resolution, self._wakeup
+        )
+
+    def _wakeup(self) -> None:
+        """Call the tasks of all the ticks elapsed."""
+        self._timerhandle = None
+        current_tick = int((self._loop.time() - self._origin) / self._resolution)
+        current_tick = max(current_tick, self._wakeup_tick)
+        while self._tick < current_tick:
+            self._tick += 1
+            if self._tick & self._slot_mask == 0:
+                self._cascade()
+            slots = self._levels[0]
+            index = self._tick & self._slot_mask
+            if slots[index]:
+                slot, slots[index] = slots[index], []
+                self._call(slot)
+        self._schedule_wakeup()
+
+    def _call(self, slot: List[_ScheduledTask]) -> None:
+        """Call the tasks of a slot and schedule their next calls."""
+        for task in slot:
+            if task.cancelled:
+                continue
+            now = self._loop.time()
+            task.stats.add_call(now - task.due_time)
+            try:
+                task.callback()
+            except Exception as exception:  # pylint: disable=broad-except
+                self.remove(task.callback)
+                if not self._exception_callback:  # pragma: nocover
+                    self._loop.call_exception_handler(
+                        {"message": "Scheduled task failed", "exception": exception}
+                    )
+                else:
+                    self._exception_callback(task.callback, exception)
+                continue
+            if task.cancelled:
+                continue
+            task.due_time += task.period
+            if task.period > 0:
+                now = self._loop.time()
+                if task.due_time <= now:
+                    nb_missed = int((now - task.due_time) / task.period) + 1
+                    task.stats.nb_overruns += nb_missed
+                    task.due_time += nb_missed * task.period
+            self._insert(task)
+
+
 class AnotherThreadTask:
     """
     Schedule a task to run on the loop in another thread.
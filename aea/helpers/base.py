@@ -29,13 +29,14 @@ import re
 import signal
 import subprocess  # nosec
 import sys
+import threading
 import time
 import types
 from collections import OrderedDict, UserString, defaultdict, deque
 from copy import copy
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Deque, Dict, List, Set, TypeVar, Union
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple, TypeVar, Union
 
 from dotenv import load_dotenv
 
@@ -499,3 +500,53 @@ def reachable_nodes(
         queue.extendleft(successors)
         visited.add(current)
     return result
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Get a read-only copy of a JSON-like object.
+
+    Dictionaries become read-only mappings and lists become tuples, recursively,
+    so the result can be shared between threads.
+
+    >>> frozen = freeze({"a": [1, {"b": 2}]})
+    >>> frozen["a"]
+    (1, mappingproxy({'b': 2}))
+
+    :param obj: the object to freeze.
+    :return: the read-only copy.
+    """
+    if isinstance(obj, dict):
+        return types.MappingProxyType(
+            {key: freeze(value) for key, value in obj.items()}
+        )
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(value) for value in obj)
+    return obj
+
+
+_loaded_files = {}  # type: Dict[Tuple[Callable[[Path], Any], str], Tuple[int, Any]]
+_loaded_files_lock = threading.Lock()
+
+
+def load_file_cached(file_path: Path, loader: Callable[[Path], Any]) -> Any:
+    """
+    Load a file, reusing the result of a previous load while the file is unchanged.
+
+    Results are cached process-wide by loader, resolved path and modification
+    time, so the loader should return read-only data (see 'freeze').
+
+    :param file_path: the path to the file.
+    :param loader: the function that loads the file.
+    :return: the loaded data.
+    """
+    path = str(Path(file_path).resolve())
+    mtime = os.stat(path).st_mtime_ns
+    key = (loader, path)
+    cached = _loaded_files.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = loader(Path(path))
+    with _loaded_files_lock:
+        _loaded_files[key] = (mtime, data)
+    return data
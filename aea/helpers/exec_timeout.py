@@ -17,18 +17,16 @@
 #
 # ------------------------------------------------------------------------------
 """Python code execution time limit tools."""
-import asyncio
-import concurrent
 import ctypes
 import logging
 import signal
 import threading
+import time
 from abc import ABC, abstractmethod
-from asyncio import Future
-from asyncio.events import AbstractEventLoop
+from collections import deque
 from threading import Lock
 from types import TracebackType
-from typing import Optional, Type
+from typing import Deque, List, Optional, Tuple, Type, cast
 
 
 _default_logger = logging.getLogger(__file__)
@@ -168,11 +166,24 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
     Support threads.
     Requires supervisor thread start/stop to control execution time control.
     Possible will be not accurate in case of long c functions used inside code controlled.
+
+    Deadlines are kept in a hashed timer wheel: a ring of slots, one per tick of
+    `resolution` seconds, shared by all the threads. Arming a deadline appends the
+    guard to the slot of its deadline tick with a new token and disarming it clears
+    the token, so neither wakes the supervisor up. The supervisor thread scans the
+    slots of the elapsed ticks at a fixed resolution, drops the guards whose token
+    is no longer armed and interrupts the threads of the expired ones.
+
+    The token is compared and cleared under the lock of the guard before the
+    thread is interrupted, so once a guard is disarmed no timeout is raised for it.
     """
 
+    resolution: float = 0.01
+    wheel_size: int = 1024
+
     _supervisor_thread: Optional[threading.Thread] = None
-    _loop: Optional[AbstractEventLoop] = None
-    _stopped_future: Optional[Future] = None
+    _stopped: Optional[threading.Event] = None
+    _wheel: List[Deque[Tuple[int, "ExecTimeoutThreadGuard", object]]] = []
     _start_count: int = 0
     _lock: Lock = Lock()
 
@@ -184,8 +195,10 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
         """
         super().__init__(timeout=timeout)
 
-        self._future_guard_task: Optional[concurrent.futures._base.Future[None]] = None
+        self._token: Optional[object] = None
+        self._fired = False
         self._thread_id: Optional[int] = None
+        self._token_lock = Lock()
 
     @classmethod
     def start(cls) -> None:
@@ -202,10 +215,13 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
             if cls._supervisor_thread:  # pragma: nocover
                 return
 
-            cls._loop = asyncio.new_event_loop()
-            cls._stopped_future = Future(loop=cls._loop)
+            cls._wheel = [deque() for _ in range(cls.wheel_size)]
+            cls._stopped = threading.Event()
             cls._supervisor_thread = threading.Thread(
-                target=cls._supervisor_event_loop, daemon=True, name="ExecTimeout"
+                target=cls._supervisor_loop,
+                args=(cls._stopped,),
+                daemon=True,
+                name="ExecTimeout",
             )
             cls._supervisor_thread.start()
 
@@ -226,39 +242,74 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
             cls._start_count -= 1
 
             if cls._start_count <= 0 or force:
-                cls._loop.call_soon_threadsafe(cls._set_stopped_future)  # type: ignore
+                cls._stopped.set()  # type: ignore
                 if cls._supervisor_thread and cls._supervisor_thread.is_alive():
                     cls._supervisor_thread.join()
                 cls._supervisor_thread = None
                 cls._start_count = 0
 
     @classmethod
-    def _set_stopped_future(cls) -> None:
-        """Set stopped future result."""
-        if not cls._stopped_future or cls._stopped_future.done():  # pragma: nocover
-            return
-        cls._stopped_future.set_result(True)
+    def _current_tick(cls) -> int:
+        """Get the number of ticks elapsed on the monotonic clock."""
+        return int(time.monotonic() / cls.resolution)
+
+    @classmethod
+    def _supervisor_loop(cls, stopped: threading.Event) -> None:
+        """
+        Scan the timer wheel every tick until stopped.
+
+        :param stopped: the event set to stop the supervisor.
+        :return: None
+        """
+        next_tick = cls._current_tick()
+        while not stopped.wait(cls.resolution):
+            current_tick = cls._current_tick()
+            # after a long pause every slot is due, no need to scan them more than once
+            next_tick = max(next_tick, current_tick - cls.wheel_size + 1)
+            while next_tick <= current_tick:
+                cls._expire_slot(next_tick, current_tick)
+                next_tick += 1
 
     @classmethod
-    def _supervisor_event_loop(cls) -> None:
-        """Start supervisor thread to execute asyncio task controlling execution time."""
-        # pydocstyle: noqa # cause black reformats with pydocstyle conflict # noqa: E800
-        async def wait_stopped() -> None:
-            await cls._stopped_future  # type: ignore
+    def _expire_slot(cls, tick: int, current_tick: int) -> None:
+        """
+        Interrupt the threads of the expired guards of a slot.
+
+        Disarmed guards are dropped, guards due in a later turn of the wheel are kept.
 
-        cls._loop.run_until_complete(wait_stopped())  # type: ignore
+        :param tick: the tick of the slot to scan.
+        :param current_tick: the current tick.
+        :return: None
+        """
+        slot = cls._wheel[tick % cls.wheel_size]
+        for _ in range(len(slot)):
+            entry = slot.popleft()
+            deadline_tick, guard, token = entry
+            if guard._token is not token:  # pylint: disable=protected-access
+                continue
+            if deadline_tick > current_tick:
+                slot.append(entry)
+                continue
+            guard._expire(token)  # pylint: disable=protected-access
 
-    async def _guard_task(self) -> None:
+    def _expire(self, token: object) -> None:
         """
-        Task to terminate thread on timeout.
+        Interrupt the thread of the guard if it is still armed with the token.
 
+        :param token: the token the guard was armed with.
         :return: None
         """
-        await asyncio.sleep(self.timeout)
-        self._set_thread_exception(self._thread_id, self.exception_class)  # type: ignore
+        with self._token_lock:
+            if self._token is not token:
+                return
+            self._token = None
+            self._fired = True
+            self._set_thread_exception(cast(int, self._thread_id), self.exception_class)
 
     @staticmethod
-    def _set_thread_exception(thread_id: int, exception_class: Type[Exception]) -> None:
+    def _set_thread_exception(
+        thread_id: int, exception_class: Type[BaseException]
+    ) -> None:
         """
         Terminate code execution in specific thread by setting exception.
 
@@ -272,7 +323,7 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
         """
         Start control over execution time.
 
-        Set task checking code execution time.
+        Put the guard in the slot of its deadline on the timer wheel.
         ExecTimeoutThreadGuard.start is required at least once in project before usage!
 
         :return: None
@@ -283,19 +334,32 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
             )
             return
 
-        self._thread_id = threading.current_thread().ident
-        self._future_guard_task = asyncio.run_coroutine_threadsafe(
-            self._guard_task(), self._loop  # type: ignore
+        self._thread_id = threading.get_ident()
+        # rounded up to the next tick, so the timeout never fires early
+        # and the slot is never one the supervisor is done with
+        deadline_tick = int((time.monotonic() + self.timeout) / self.resolution) + 1
+        token = object()
+        with self._token_lock:
+            self._token = token
+            self._fired = False
+        self._wheel[deadline_tick % self.wheel_size].append(
+            (deadline_tick, self, token)
         )
 
     def _remove_timeout_watch(self) -> None:
         """
         Stop control over execution time.
 
-        Cancel task checking code execution time.
+        Disarm the guard, the supervisor drops it from the wheel when scanning its slot.
+        If the timeout fired but the exception was not raised in the thread yet, it is discarded.
 
         :return: None
         """
-        if self._future_guard_task and not self._future_guard_task.done():
-            self._future_guard_task.cancel()
-            self._future_guard_task = None
+        with self._token_lock:
+            self._token = None
+            if self._fired:
+                self._fired = False
+                # clears the exception set by the supervisor, if still pending
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_long(cast(int, self._thread_id)), None
+                )
@@ -20,6 +20,7 @@
 import asyncio
 import queue
 import threading
+import time
 from asyncio.events import AbstractEventLoop
 from concurrent.futures._base import CancelledError
 from concurrent.futures._base import TimeoutError as FuturesTimeoutError
@@ -45,6 +46,28 @@ class MultiplexerStatus(AsyncState):
         super().__init__(
             initial_state=ConnectionStates.disconnected, states_enum=ConnectionStates
         )
+        self._connection_startup_times = {}  # type: Dict[PublicId, float]
+
+    @property
+    def connection_startup_times(self) -> Dict[PublicId, float]:
+        """Get the time, in seconds, each connection took to connect during the last multiplexer connect."""
+        return dict(self._connection_startup_times)
+
+    def set_connection_startup_time(
+        self, connection_id: PublicId, startup_time: float
+    ) -> None:
+        """
+        Record the start-up time of a connection.
+
+        :param connection_id: the id of the connection.
+        :param startup_time: the time, in seconds, the connection took to connect.
+        :return: None
+        """
+        self._connection_startup_times[connection_id] = startup_time
+
+    def reset_connection_startup_times(self) -> None:
+        """Clear the recorded start-up times."""
+        self._connection_startup_times = {}
 
     @property
     def is_connected(self) -> bool:  # pragma: nocover
@@ -70,6 +93,7 @@ class MultiplexerStatus(AsyncState):
 class AsyncMultiplexer(Runnable, WithLogger):
     """This class can handle multiple connections at once."""
 
+    CONNECT_TIMEOUT = None  # type: Optional[float]
     DISCONNECT_TIMEOUT = 5
 
     def __init__(
@@ -202,6 +226,51 @@ class AsyncMultiplexer(Runnable, WithLogger):
             "Connection names must be unique.",
         )
 
+        self._get_connection_layers()
+
+    def _get_connection_layers(self) -> List[List[PublicId]]:
+        """
+        Group the connections in layers, following their `connect_after` ordering.
+
+        A connection only comes after the connections it lists in `connect_after`
+        which are part of the multiplexer, matched by author and name; the others
+        are ignored. Connections in the same layer do not depend on each other.
+
+        :return: the connection ids, layer by layer.
+        :raise AEAEnforceError: if the ordering has a cycle.
+        """
+        prefix_to_id = {
+            (connection_id.author, connection_id.name): connection_id
+            for connection_id in self._id_to_connection
+        }
+        remaining = {}  # type: Dict[PublicId, set]
+        for connection_id, connection in self._id_to_connection.items():
+            remaining[connection_id] = {
+                prefix_to_id[(dependency.author, dependency.name)]
+                for dependency in connection.configuration.connect_after
+                if (dependency.author, dependency.name) in prefix_to_id
+            }
+
+        layers = []  # type: List[List[PublicId]]
+        while len(remaining) > 0:
+            layer = [
+                connection_id
+                for connection_id, dependencies in remaining.items()
+                if len(dependencies) == 0
+            ]
+            enforce(
+                len(layer) > 0,
+                "Cyclic connect_after ordering between connections: {}".format(
+                    sorted(map(str, remaining))
+                ),
+            )
+            for connection_id in layer:
+                remaining.pop(connection_id)
+            for dependencies in remaining.values():
+                dependencies.difference_update(layer)
+            layers.append(layer)
+        return layers
+
     def _set_default_connection_if_none(self):
         """Set the default connection if it is none."""
         if self._default_connection is None:
@@ -340,23 +409,91 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self.logger.debug("Multiplexer stopped.")
 
     async def _connect_all(self) -> None:
-        """Set all the connection up."""
+        """
+        Set all the connection up.
+
+        The connections are connected concurrently, layer by layer following
+        their `connect_after` ordering. If one of them fails, the others are
+        cancelled, the ones already connected are disconnected again and the
+        error is re-raised.
+        """
         self.logger.debug("Starting multiplexer connections.")
+        self.connection_status.reset_connection_startup_times()
         connected = []  # type: List[PublicId]
-        for connection_id, connection in self._id_to_connection.items():
-            try:
-                await self._connect_one(connection_id)
-                connected.append(connection_id)
-            except Exception as e:  # pylint: disable=broad-except
-                if not isinstance(e, (asyncio.CancelledError, CancelledError)):
-                    self.logger.exception(
-                        "Error while connecting {}: {}".format(
-                            str(type(connection)), repr(e)
-                        )
-                    )
-                raise
+        try:
+            for layer in self._get_connection_layers():
+                await self._connect_layer(layer, connected)
+        except BaseException:
+            await self._disconnect_many(connected)
+            raise
         self.logger.debug("Multiplexer connections are set.")
 
+    async def _connect_layer(
+        self, layer: List[PublicId], connected: List[PublicId]
+    ) -> None:
+        """
+        Set a layer of connections up concurrently.
+
+        :param layer: the ids of the connections to connect.
+        :param connected: the list to append the ids of the connections set up to.
+        :return: None
+        """
+        tasks = {
+            asyncio.ensure_future(self._connect_one_timed(connection_id)): connection_id
+            for connection_id in layer
+        }
+        try:
+            # raises as soon as one of the connections fails
+            await asyncio.gather(*tasks.keys())
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks.keys(), return_exceptions=True)
+            connected.extend(
+                connection_id
+                for task, connection_id in tasks.items()
+                if not task.cancelled() and task.exception() is None
+            )
+
+    async def _connect_one_timed(self, connection_id: PublicId) -> None:
+        """
+        Set a connection up within its timeout and record its start-up time.
+
+        :param connection_id: the id of the connection.
+        :return: None
+        """
+        connection = self._id_to_connection[connection_id]
+        timeout = connection.configuration.connect_timeout
+        if timeout is None:
+            timeout = self.CONNECT_TIMEOUT
+        start_time = time.time()
+        try:
+            await asyncio.wait_for(self._connect_one(connection_id), timeout=timeout)
+        except (asyncio.TimeoutError, FuturesTimeoutError):
+            self.logger.error(
+                "Connection {} did not connect within {} seconds.".format(
+                    connection_id, timeout
+                )
+            )
+            raise AEAConnectionError(
+                "Connection {} timed out while connecting.".format(connection_id)
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            if not isinstance(e, (asyncio.CancelledError, CancelledError)):
+                self.logger.exception(
+                    "Error while connecting {}: {}".format(
+                        str(type(connection)), repr(e)
+                    )
+                )
+            raise
+        startup_time = time.time() - start_time
+        self.connection_status.set_connection_startup_time(connection_id, startup_time)
+        self.logger.debug(
+            "Connection {} connected in {:.3f} seconds.".format(
+                connection_id, startup_time
+            )
+        )
+
     async def _connect_one(self, connection_id: PublicId) -> None:
         """
         Set a connection up.
@@ -379,23 +516,51 @@ class AsyncMultiplexer(Runnable, WithLogger):
             )
 
     async def _disconnect_all(self) -> None:
-        """Tear all the connections down."""
+        """
+        Tear all the connections down.
+
+        The connections are disconnected concurrently, layer by layer in the
+        reverse order of their `connect_after` ordering.
+        """
         self.logger.debug("Tear the multiplexer connections down.")
-        for connection_id, connection in self._id_to_connection.items():
-            try:
-                await asyncio.wait_for(
-                    self._disconnect_one(connection_id), timeout=self.DISCONNECT_TIMEOUT
-                )
-            except FuturesTimeoutError:
-                self.logger.debug(  # pragma: nocover
-                    f"Disconnection of `{connection_id}` timed out."
-                )
-            except Exception as e:  # pylint: disable=broad-except
-                self.logger.exception(
-                    "Error while disconnecting {}: {}".format(
-                        str(type(connection)), str(e)
-                    )
+        for layer in reversed(self._get_connection_layers()):
+            await self._disconnect_many(layer)
+
+    async def _disconnect_many(self, connection_ids: List[PublicId]) -> None:
+        """
+        Tear some connections down concurrently, logging the failures.
+
+        :param connection_ids: the ids of the connections.
+        :return: None
+        """
+        await asyncio.gather(
+            *[
+                self._disconnect_one_timed(connection_id)
+                for connection_id in connection_ids
+            ]
+        )
+
+    async def _disconnect_one_timed(self, connection_id: PublicId) -> None:
+        """
+        Tear a connection down within the disconnect timeout, logging the failures.
+
+        :param connection_id: the id of the connection.
+        :return: None
+        """
+        try:
+            await asyncio.wait_for(
+                self._disconnect_one(connection_id), timeout=self.DISCONNECT_TIMEOUT
+            )
+        except FuturesTimeoutError:
+            self.logger.debug(  # pragma: nocover
+                f"Disconnection of `{connection_id}` timed out."
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.exception(
+                "Error while disconnecting {}: {}".format(
+                    str(type(self._id_to_connection[connection_id])), str(e)
                 )
+            )
 
     async def _disconnect_one(self, connection_id: PublicId) -> None:
         """
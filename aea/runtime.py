@@ -28,7 +28,11 @@ from typing import Dict, Optional, Type, cast
 from aea.abstract_agent import AbstractAgent
 from aea.agent_loop import AsyncAgentLoop, AsyncState, BaseAgentLoop, SyncAgentLoop
 from aea.connections.base import ConnectionStates
-from aea.decision_maker.base import DecisionMaker, DecisionMakerHandler
+from aea.decision_maker.base import (
+    AsyncDecisionMaker,
+    DecisionMaker,
+    DecisionMakerHandler,
+)
 from aea.exceptions import _StopRuntime
 from aea.helpers.async_utils import Runnable
 from aea.helpers.exception_policy import ExceptionPolicyEnum
@@ -55,6 +59,11 @@ class BaseRuntime(Runnable, WithLogger):
         "sync": SyncAgentLoop,
     }
     DEFAULT_RUN_LOOP: str = "async"
+    DECISION_MAKERS: Dict[str, Type[DecisionMaker]] = {
+        "threaded": DecisionMaker,
+        "async": AsyncDecisionMaker,
+    }
+    DEFAULT_DECISION_MAKER: str = "threaded"
 
     def __init__(
         self,
@@ -147,9 +156,25 @@ class BaseRuntime(Runnable, WithLogger):
             raise ValueError("call `set_decision_maker` first!")
         return self._decision_maker
 
-    def set_decision_maker(self, decision_maker_handler: DecisionMakerHandler) -> None:
-        """Set decision maker with handler provided."""
-        self._decision_maker = DecisionMaker(
+    def set_decision_maker(
+        self,
+        decision_maker_handler: DecisionMakerHandler,
+        decision_maker_mode: Optional[str] = None,
+    ) -> None:
+        """
+        Set decision maker with handler provided.
+
+        :param decision_maker_handler: the decision maker handler.
+        :param decision_maker_mode: decision maker mode (threaded, async) to run it in.
+        :return: None
+        """
+        decision_maker_mode = decision_maker_mode or self.DEFAULT_DECISION_MAKER
+        if decision_maker_mode not in self.DECISION_MAKERS:
+            raise ValueError(
+                f"Decision maker `{decision_maker_mode}` is not supported. valid are: `{list(self.DECISION_MAKERS.keys())}`"
+            )
+        decision_maker_cls = self.DECISION_MAKERS[decision_maker_mode]
+        self._decision_maker = decision_maker_cls(
             decision_maker_handler=decision_maker_handler
         )
 
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Cost of calling many behaviours periodically, one timer per behaviour against a timer wheel.
+
+No-op behaviours with periods spread over [period, 2 * period) are scheduled on a
+fresh event loop, which then runs for the given duration.
+"""
+import asyncio
+import time
+from statistics import mean
+from typing import Callable, List
+
+import click
+
+from aea.helpers.async_utils import PeriodicCaller, TimerWheelScheduler
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+
+def _make_behaviours(nb_behaviours: int) -> List[Callable]:
+    """Make no-op behaviours counting their calls."""
+    calls = [0] * nb_behaviours
+
+    def make_behaviour(i: int) -> Callable:
+        def act() -> None:
+            calls[i] += 1
+
+        return act
+
+    behaviours = [make_behaviour(i) for i in range(nb_behaviours)]
+    behaviours.append(lambda: sum(calls))
+    return behaviours
+
+
+def _period(i: int, nb_behaviours: int, period: float) -> float:
+    return period * (1 + i / nb_behaviours)
+
+
+def _run_periodic_callers(nb_behaviours: int, duration: float, period: float) -> List:
+    """Run one periodic caller per behaviour."""
+    loop = asyncio.new_event_loop()
+    *behaviours, count_calls = _make_behaviours(nb_behaviours)
+    periodic_callers = []
+    for i, behaviour in enumerate(behaviours):
+        periodic_caller = PeriodicCaller(
+            behaviour, period=_period(i, nb_behaviours, period), loop=loop
+        )
+        periodic_caller.start()
+        periodic_callers.append(periodic_caller)
+
+    start_time = time.process_time()
+    loop.run_until_complete(asyncio.sleep(duration, loop=loop))
+    cpu_time = time.process_time() - start_time
+    timers = len(loop._scheduled)  # type: ignore # pylint: disable=protected-access
+
+    for periodic_caller in periodic_callers:
+        periodic_caller.stop()
+    loop.close()
+    return [
+        ("periodic caller cpu(us/call)", cpu_time / count_calls() * 10 ** 6),
+        ("periodic caller timers", timers),
+    ]
+
+
+def _run_timer_wheel(
+    nb_behaviours: int, duration: float, period: float, resolution: float
+) -> List:
+    """Run all the behaviours from a timer wheel scheduler."""
+    loop = asyncio.new_event_loop()
+    *behaviours, count_calls = _make_behaviours(nb_behaviours)
+    scheduler = TimerWheelScheduler(resolution=resolution, loop=loop)
+    for i, behaviour in enumerate(behaviours):
+        scheduler.add(behaviour, period=_period(i, nb_behaviours, period))
+
+    start_time = time.process_time()
+    loop.run_until_complete(asyncio.sleep(duration, loop=loop))
+    cpu_time = time.process_time() - start_time
+    timers = len(loop._scheduled)  # type: ignore # pylint: disable=protected-access
+    stats = [scheduler.get_stats(behaviour) for behaviour in behaviours]
+
+    scheduler.stop()
+    loop.close()
+    return [
+        ("timer wheel cpu(us/call)", cpu_time / count_calls() * 10 ** 6),
+        ("timer wheel timers", timers),
+        ("timer wheel drift(ms)", mean(s.mean_drift for s in stats) * 1000),
+        ("timer wheel overruns", sum(s.nb_overruns for s in stats)),
+    ]
+
+
+def run(nb_behaviours: int, duration: float, period: float, resolution: float) -> List:
+    """Check the cost of scheduling the behaviours, with both schedulers."""
+    return _run_periodic_callers(nb_behaviours, duration, period) + _run_timer_wheel(
+        nb_behaviours, duration, period, resolution
+    )
+
+
+@click.command()
+@click.option("--nb_behaviours", default=1000, help="Number of behaviours.")
+@click.option("--duration", default=5.0, help="Run duration in seconds.")
+@click.option("--period", default=1.0, help="Shortest behaviour period in seconds.")
+@click.option(
+    "--resolution", default=0.01, help="Coalescing window of the timer wheel."
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(nb_behaviours, duration, period, resolution, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Behaviours: {nb_behaviours}")
+    click.echo(f"* Duration: {duration}")
+    click.echo(f"* Period: {period}")
+    click.echo(f"* Resolution: {resolution}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs), run, (nb_behaviours, duration, period, resolution)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Signing requests handled by the decision maker per second, issued from a skill."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
+import click
+
+from aea.helpers.transaction.base import RawMessage, Terms
+from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import Dialogue
+from aea.skills.base import Behaviour, Handler
+from benchmark.checks.utils import SyncedGeneratorConnection  # noqa: I100
+from benchmark.checks.utils import (
+    make_agent,
+    make_skill,
+    multi_run,
+    print_results,
+    wait_for_condition,
+)
+
+from packages.fetchai.protocols.signing.dialogues import SigningDialogue
+from packages.fetchai.protocols.signing.dialogues import (
+    SigningDialogues as BaseSigningDialogues,
+)
+from packages.fetchai.protocols.signing.message import SigningMessage
+
+
+RAW_MESSAGE = b"0x11f3f9487724404e3a1fb7252a322656b90ba0455a2ca5fcdcbe6eeee5f8126d"
+
+
+class SigningDialogues(BaseSigningDialogues):
+    """The signing dialogues of the test skill."""
+
+    def __init__(self, self_address: Address) -> None:
+        """Initialize dialogues."""
+
+        def role_from_first_message(  # pylint: disable=unused-argument
+            message: Message, receiver_address: Address
+        ) -> Dialogue.Role:
+            return SigningDialogue.Role.SKILL
+
+        BaseSigningDialogues.__init__(
+            self,
+            self_address=self_address,
+            role_from_first_message=role_from_first_message,
+        )
+
+
+class SigningClient:
+    """Issue signing requests to the decision maker, keeping a window of them in flight."""
+
+    def __init__(self, skill_id: str, terms, raw_message, in_flight: int) -> None:
+        """Initialize the client."""
+        self.dialogues = SigningDialogues(skill_id)
+        self.terms = terms
+        self.raw_message = raw_message
+        self.in_flight = in_flight
+        self.count = 0
+
+    def send(self, skill_context) -> None:
+        """Send a message signing request to the decision maker."""
+        signing_msg, _ = self.dialogues.create(
+            counterparty="decision_maker",
+            performative=SigningMessage.Performative.SIGN_MESSAGE,
+            terms=self.terms,
+            raw_message=self.raw_message,
+        )
+        skill_context.decision_maker_message_queue.put_nowait(signing_msg)
+
+
+class TestBehaviour(Behaviour):
+    """Issue the first window of signing requests."""
+
+    _tick_interval = 1
+
+    def setup(self) -> None:
+        """Set up behaviour."""
+        self.started = False  # pylint: disable=attribute-defined-outside-init
+
+    def teardown(self) -> None:
+        """Tear up behaviour."""
+
+    def act(self) -> None:
+        """Fill the window of in-flight signing requests once."""
+        if self.started:
+            return
+        self.started = True  # pylint: disable=attribute-defined-outside-init
+        client = self.context.namespace.signing_client
+        for _ in range(client.in_flight):
+            client.send(self.context)
+
+
+class TestHandler(Handler):
+    """Count signed messages and keep the window of requests full."""
+
+    SUPPORTED_PROTOCOL = SigningMessage.protocol_id
+
+    def setup(self) -> None:
+        """Set up handler."""
+
+    def teardown(self) -> None:
+        """Tear up handler."""
+
+    def handle(self, message: Message) -> None:
+        """Handle a signing response and issue the next request."""
+        client = self.context.namespace.signing_client
+        if message.performative == SigningMessage.Performative.SIGNED_MESSAGE:
+            client.count += 1
+        client.send(self.context)
+
+
+def run(duration, runtime_mode, decision_maker_mode, in_flight, signing_threads):
+    """Test signing requests throughput."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    # import manually due to some lazy imports in decision_maker
+    import aea.decision_maker.default  # noqa: F401
+
+    agent = make_agent(
+        runtime_mode=runtime_mode, decision_maker_mode=decision_maker_mode
+    )
+    connection = SyncedGeneratorConnection.make()
+    agent.resources.add_connection(connection)
+    ledger_id = agent.context.default_ledger_id
+    skill = make_skill(
+        agent, handlers={"test": TestHandler}, behaviours={"test": TestBehaviour}
+    )
+    terms = Terms(
+        ledger_id=ledger_id,
+        sender_address=agent.identity.address,
+        counterparty_address=agent.identity.address,
+        amount_by_currency_id={"FET": -1},
+        quantities_by_good_id={"good_id": 10},
+        nonce="transaction nonce",
+    )
+    client = SigningClient(
+        str(skill.public_id), terms, RawMessage(ledger_id, RAW_MESSAGE), in_flight
+    )
+    skill.skill_context.namespace.signing_client = client
+    agent.resources.add_skill(skill)
+    executor = ThreadPoolExecutor(signing_threads) if signing_threads > 0 else None
+    agent.runtime.decision_maker.decision_maker_handler.signing_executor = executor
+    t = Thread(target=agent.start, daemon=True)
+    t.start()
+    wait_for_condition(lambda: agent.is_running, timeout=5)
+
+    time.sleep(duration)
+    agent.stop()
+    t.join(5)
+    if executor is not None:
+        executor.shutdown()
+
+    return [
+        ("signed messages", client.count),
+        ("rate(signatures/second)", client.count / duration),
+    ]
+
+
+@click.command()
+@click.option("--duration", default=3, help="Run time in seconds.")
+@click.option(
+    "--runtime_mode", default="async", help="Runtime mode: async or threaded."
+)
+@click.option(
+    "--decision_maker_mode",
+    default="threaded",
+    help="Decision maker mode: threaded or async.",
+)
+@click.option(
+    "--in_flight", default=16, help="Number of signing requests kept in flight."
+)
+@click.option(
+    "--signing_threads",
+    default=0,
+    help="Number of threads signing batches of requests, 0 to sign sequentially.",
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(
+    duration,
+    runtime_mode,
+    decision_maker_mode,
+    in_flight,
+    signing_threads,
+    number_of_runs,
+):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Runtime mode: {runtime_mode}")
+    click.echo(f"* Decision maker mode: {decision_maker_mode}")
+    click.echo(f"* Requests in flight: {in_flight}")
+    click.echo(f"* Signing threads: {signing_threads}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs),
+            run,
+            (duration, runtime_mode, decision_maker_mode, in_flight, signing_threads),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
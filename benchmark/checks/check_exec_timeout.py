@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Overhead of the execution control of the agent loop, per handler call or behaviour tick.
+
+The agent loop calls a trivial function through its execution control, with the
+execution timeout off, and on with the timeout supervisor running.
+"""
+import time
+from types import SimpleNamespace
+from typing import List, cast
+
+import click
+
+from aea.agent import AbstractAgent
+from aea.agent_loop import AsyncAgentLoop
+from aea.helpers.exec_timeout import ExecTimeoutThreadGuard
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+
+def _noop() -> None:
+    """Do nothing, like a very fast handler."""
+
+
+def _overhead_per_call(execution_timeout: float, calls: int) -> float:
+    """Get the time spent by the execution control on each call, in microseconds."""
+    agent = SimpleNamespace(name="agent", _execution_timeout=execution_timeout)
+    agent_loop = AsyncAgentLoop(cast(AbstractAgent, agent))
+    # pylint: disable=protected-access
+    execution_control = agent_loop._execution_control
+
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        _noop()
+    baseline = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        execution_control(_noop)
+    controlled = time.perf_counter() - start_time
+    return (controlled - baseline) / calls * 10 ** 6
+
+
+def run(timeout: float, calls: int) -> List:
+    """Check the overhead of the execution control, with and without timeout."""
+    timeout_off = _overhead_per_call(0, calls)
+    ExecTimeoutThreadGuard.start()
+    try:
+        timeout_on = _overhead_per_call(timeout, calls)
+    finally:
+        ExecTimeoutThreadGuard.stop()
+    return [
+        ("timeout off overhead(us/call)", timeout_off),
+        ("timeout on overhead(us/call)", timeout_on),
+    ]
+
+
+@click.command()
+@click.option("--timeout", default=0.1, help="Execution timeout in seconds.")
+@click.option("--calls", default=100000, help="Number of controlled calls.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(timeout, calls, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Timeout: {timeout}")
+    click.echo(f"* Calls: {calls}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (timeout, calls)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Environment steps per second through the gym connection, plain and vectorized."""
+import asyncio
+import os
+import time
+from typing import Optional, cast
+
+import click
+
+from aea.common import Address
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+from benchmark.checks.utils import ROOT_DIR, multi_run, print_results  # noqa: I100
+
+from packages.fetchai.connections.gym.connection import GymConnection
+from packages.fetchai.protocols.gym.dialogues import GymDialogue
+from packages.fetchai.protocols.gym.dialogues import GymDialogues as BaseGymDialogues
+from packages.fetchai.protocols.gym.message import GymMessage
+
+
+AGENT_ADDRESS = "agent"
+GYM_EX_DIR = os.path.join(ROOT_DIR, "..", "..", "examples", "gym_ex")
+BANDIT_ENV = "gyms.env.BanditNArmedRandom"
+
+
+class GymDialogues(BaseGymDialogues):
+    """Gym dialogues on the agent side."""
+
+    def __init__(self) -> None:
+        """Initialize dialogues."""
+
+        def role_from_first_message(  # pylint: disable=unused-argument
+            message: Message, receiver_address: Address
+        ) -> BaseDialogue.Role:
+            """Infer the role of the agent from an incoming/outgoing first message."""
+            return GymDialogue.Role.AGENT
+
+        BaseGymDialogues.__init__(
+            self,
+            self_address=AGENT_ADDRESS,
+            role_from_first_message=role_from_first_message,
+        )
+
+
+async def _round_trip(connection: GymConnection, msg: GymMessage) -> GymMessage:
+    """Send a message to the connection and wait for its reply."""
+    await connection.send(
+        Envelope(to=msg.to, sender=msg.sender, protocol_id=msg.protocol_id, message=msg)
+    )
+    envelope = cast(Envelope, await connection.receive())
+    return cast(GymMessage, envelope.message)
+
+
+async def _run(duration: float, nb_envs: Optional[int]) -> int:
+    """Step the bandit for the given duration and return the number of round trips."""
+    configuration = ConnectionConfig(
+        connection_id=GymConnection.connection_id, env=BANDIT_ENV, nb_envs=nb_envs
+    )
+    connection = GymConnection(
+        identity=Identity("name", address=AGENT_ADDRESS), configuration=configuration,
+    )
+    dialogues = GymDialogues()
+    await connection.connect()
+
+    msg, dialogue = dialogues.create(
+        counterparty=str(GymConnection.connection_id),
+        performative=GymMessage.Performative.RESET,
+    )
+    dialogues.update(await _round_trip(connection, cast(GymMessage, msg)))
+    action = [0, 50]
+    actions = [action] * nb_envs if nb_envs is not None else action
+
+    round_trips = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        round_trips += 1
+        msg = dialogue.reply(
+            performative=GymMessage.Performative.ACT,
+            action=GymMessage.AnyObject(actions),
+            step_id=round_trips,
+        )
+        dialogues.update(await _round_trip(connection, cast(GymMessage, msg)))
+
+    await connection.disconnect()
+    return round_trips
+
+
+def run(duration, nb_envs):
+    """Check environment step rate."""
+    # the gym connection locates the environment relative to the working directory
+    os.chdir(GYM_EX_DIR)
+    round_trips = asyncio.new_event_loop().run_until_complete(_run(duration, nb_envs))
+    env_steps = round_trips * (nb_envs or 1)
+    return [
+        ("round trips", round_trips),
+        ("env steps", env_steps),
+        ("rate(env steps/second)", env_steps / duration),
+    ]
+
+
+@click.command()
+@click.option("--duration", default=3, help="Run time in seconds.")
+@click.option(
+    "--nb_envs",
+    default=None,
+    type=int,
+    help="Number of environment copies; not set to step a single environment.",
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(duration, nb_envs, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Number of environments: {nb_envs or 'not vectorized'}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (duration, nb_envs),))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
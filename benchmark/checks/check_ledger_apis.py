@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Per-call overhead of LedgerApis against a local JSON-RPC stub, with and without cached ledger apis."""
+import json
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from typing import Callable, List
+
+import click
+
+from aea.crypto.ethereum import EthereumApi
+from aea.crypto.ledger_apis import LedgerApis
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+
+ADDRESS = "0x3D6D7B4e51B5E1D5Cc4B4cD3c9D0C9Dd8bBd5B5e"
+
+
+class JSONRPCStub(BaseHTTPRequestHandler):
+    """Answer every JSON-RPC request with a constant result."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Handle a JSON-RPC request."""
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(
+            {"jsonrpc": "2.0", "id": request["id"], "result": "0x2a"}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+def _rate(fn: Callable, duration: float) -> float:
+    """Get the number of calls of a function per second."""
+    count = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        fn()
+        count += 1
+    return count / duration
+
+
+def _uncached_get_balance() -> None:
+    """Get a balance with a new ledger api, as every call did before caching."""
+    LedgerApis.clear_caches()
+    LedgerApis.get_balance(EthereumApi.identifier, ADDRESS)
+
+
+def run(duration: float) -> List:
+    """Check get_balance rates."""
+    server = HTTPServer(("127.0.0.1", 0), JSONRPCStub)
+    Thread(target=server.serve_forever, daemon=True).start()
+    LedgerApis.ledger_api_configs[EthereumApi.identifier][
+        "address"
+    ] = "http://{}:{}".format(*server.server_address)
+    try:
+        return [
+            ("uncached rate(calls/second)", _rate(_uncached_get_balance, duration),),
+            (
+                "cached rate(calls/second)",
+                _rate(
+                    lambda: LedgerApis.get_balance(EthereumApi.identifier, ADDRESS),
+                    duration,
+                ),
+            ),
+        ]
+    finally:
+        server.shutdown()
+
+
+@click.command()
+@click.option("--duration", default=3, help="Run time in seconds, per case.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(duration, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (duration,)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
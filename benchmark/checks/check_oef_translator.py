@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Translation speed of descriptions and queries to OEF SDK objects, with and without caching."""
+import time
+from typing import Any, Callable, Dict, List
+
+import click
+
+from aea.helpers.search.models import (
+    And,
+    Attribute,
+    Constraint,
+    ConstraintExpr,
+    ConstraintType,
+    DataModel,
+    Description,
+    Location,
+    Or,
+    Query,
+)
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.connections.oef.object_translator import OEFObjectTranslator
+
+
+LOCATION = Location(52.2057092, 2.1183431)
+
+
+def _attribute_names(nb_attributes: int) -> List[str]:
+    """Get the names of the integer attributes."""
+    return ["attr_{}".format(i) for i in range(nb_attributes)]
+
+
+def make_data_model(nb_attributes: int) -> DataModel:
+    """Make a data model with a location and some integer attributes."""
+    attributes = [Attribute("location", Location, True)] + [
+        Attribute(name, int, True) for name in _attribute_names(nb_attributes)
+    ]
+    return DataModel("benchmark_model", attributes)
+
+
+def make_description(data_model: DataModel, nb_attributes: int) -> Description:
+    """Make a description of the data model."""
+    values = {
+        name: i for i, name in enumerate(_attribute_names(nb_attributes))
+    }  # type: Dict[str, Any]
+    values["location"] = LOCATION
+    return Description(values, data_model=data_model)
+
+
+def make_query(data_model: DataModel, nb_attributes: int) -> Query:
+    """Make a nested query over the data model."""
+    constraints = [
+        Or(
+            [
+                Constraint(name, ConstraintType(">", i)),
+                Constraint(name, ConstraintType("in", [i, i + 1, i + 2])),
+            ]
+        )
+        for i, name in enumerate(_attribute_names(nb_attributes))
+    ]  # type: List[ConstraintExpr]
+    constraints.append(
+        Constraint("location", ConstraintType("distance", (LOCATION, 5.0)))
+    )
+    return Query([And(constraints)], model=data_model)
+
+
+def _rate(fn: Callable, duration: float) -> float:
+    """Get the number of calls of a function per second."""
+    count = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        fn()
+        count += 1
+    return count / duration
+
+
+def run(duration: float, nb_attributes: int) -> List:
+    """Check translation rates."""
+    data_model = make_data_model(nb_attributes)
+    description = make_description(data_model, nb_attributes)
+    query = make_query(data_model, nb_attributes)
+    # pylint: disable=protected-access
+    return [
+        (
+            "uncached description rate(translations/second)",
+            _rate(
+                lambda: OEFObjectTranslator._to_oef_description(description), duration
+            ),
+        ),
+        (
+            "cached description rate(translations/second)",
+            _rate(
+                lambda: OEFObjectTranslator.to_oef_description(description), duration
+            ),
+        ),
+        (
+            "uncached query rate(translations/second)",
+            _rate(lambda: OEFObjectTranslator._to_oef_query(query), duration),
+        ),
+        (
+            "cached query rate(translations/second)",
+            _rate(lambda: OEFObjectTranslator.to_oef_query(query), duration),
+        ),
+    ]
+
+
+@click.command()
+@click.option("--duration", default=1, help="Run time in seconds, per case.")
+@click.option(
+    "--nb_attributes", default=10, help="Number of attributes of the data model."
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(duration, nb_attributes, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Number of attributes: {nb_attributes}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (duration, nb_attributes),))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Rate of signature verification, one call per signature and in batches.
+
+Each run happens in a daemonic pool worker, which cannot start the process pool
+of the batch verification, so the cold batch rate measures the calling process
+alone; the cached batch rate measures the cache of recovered addresses.
+"""
+import time
+from typing import Callable, List, Tuple
+
+import click
+
+from aea.crypto import base
+from aea.crypto.ledger_apis import LedgerApis
+from aea.crypto.registries import make_crypto
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+
+NB_SIGNERS = 10
+
+
+def _rate(fn: Callable, nb_signatures: int) -> float:
+    """Get the number of signatures verified per second by a function."""
+    start_time = time.time()
+    fn()
+    return nb_signatures / (time.time() - start_time)
+
+
+def _verify_each(ledger_id: str, signed_messages: List[Tuple[bytes, str, str]]) -> None:
+    """Verify signatures one by one."""
+    for message, signature, address in signed_messages:
+        assert address in LedgerApis.recover_message(ledger_id, message, signature)
+
+
+def _verify_batch(
+    ledger_id: str, signed_messages: List[Tuple[bytes, str, str]]
+) -> None:
+    """Verify signatures in a batch."""
+    assert all(LedgerApis.verify_batch(ledger_id, signed_messages))
+
+
+def run(ledger_id: str, nb_signatures: int) -> List:
+    """Check verification rates."""
+    cryptos = [make_crypto(ledger_id) for _ in range(NB_SIGNERS)]
+    signed_messages = []
+    for i in range(nb_signatures):
+        crypto = cryptos[i % NB_SIGNERS]
+        message = "message {}".format(i).encode("utf-8")
+        signed_messages.append((message, crypto.sign_message(message), crypto.address))
+
+    base._recovered_addresses.clear()  # pylint: disable=protected-access
+    return [
+        (
+            "one by one rate(signatures/second)",
+            _rate(lambda: _verify_each(ledger_id, signed_messages), nb_signatures),
+        ),
+        (
+            "batch rate(signatures/second)",
+            _rate(lambda: _verify_batch(ledger_id, signed_messages), nb_signatures),
+        ),
+        (
+            "cached batch rate(signatures/second)",
+            _rate(lambda: _verify_batch(ledger_id, signed_messages), nb_signatures),
+        ),
+    ]
+
+
+@click.command()
+@click.option("--ledger_id", default="ethereum", help="Ledger of the signatures.")
+@click.option("--signatures", default=10000, help="Number of signatures to verify.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(ledger_id, signatures, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Ledger: {ledger_id}")
+    click.echo(f"* Signatures: {signatures}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (ledger_id, signatures)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Time and memory taken by the TAC controller to generate the endowments, preferences and equilibrium of a game."""
+import time
+from types import SimpleNamespace
+from typing import List, cast
+
+import click
+import numpy as np
+
+from aea.skills.base import SkillContext
+from benchmark.checks.utils import (  # noqa: I100
+    get_mem_usage_in_mb,
+    multi_run,
+    print_results,
+)
+
+from packages.fetchai.skills.tac_control.game import Game
+from packages.fetchai.skills.tac_control.helpers import (
+    compute_equilibrium,
+    determine_scaling_factor,
+    generate_currency_id_to_name,
+    generate_good_endowments_array,
+    generate_good_id_to_name,
+    generate_utility_params_array,
+)
+
+
+MONEY_ENDOWMENT = 2000000
+
+
+def _make_game(nb_agents: int, nb_goods: int) -> Game:
+    """Make a game with registered agents, ready for generation."""
+    parameters = SimpleNamespace(
+        version_id="v1",
+        tx_fee=1,
+        currency_id_to_name=generate_currency_id_to_name(1, [0]),
+        good_id_to_name=generate_good_id_to_name(
+            nb_goods, list(range(1, nb_goods + 1))
+        ),
+        money_endowment=MONEY_ENDOWMENT,
+        base_good_endowment=2,
+        lower_bound_factor=1,
+        upper_bound_factor=1,
+        seed=0,
+    )
+    game = Game(
+        name="game",
+        skill_context=cast(SkillContext, SimpleNamespace(parameters=parameters)),
+    )
+    for i in range(nb_agents):
+        game.registration.register_agent("agent_address_{}".format(i), str(i))
+    return game
+
+
+def run(nb_agents: int, nb_goods: int) -> List:
+    """Check the generation time and memory."""
+    rng = np.random.default_rng(0)
+    scaling_factor = determine_scaling_factor(MONEY_ENDOWMENT)
+    start_time = time.time()
+    endowments = generate_good_endowments_array(nb_agents, nb_goods, 2, 1, 1, rng)
+    utility_params = generate_utility_params_array(
+        nb_agents, nb_goods, scaling_factor, rng
+    )
+    compute_equilibrium(
+        endowments, utility_params, np.full(nb_agents, MONEY_ENDOWMENT), scaling_factor,
+    )
+    arrays_time = time.time() - start_time
+
+    game = _make_game(nb_agents, nb_goods)
+    mem_usage = get_mem_usage_in_mb()
+    start_time = time.time()
+    game._generate()  # pylint: disable=protected-access
+    game_time = time.time() - start_time
+
+    return [
+        ("arrays and equilibrium time(seconds)", arrays_time),
+        ("game generation time(seconds)", game_time),
+        ("game generation mem usage(Mb)", get_mem_usage_in_mb() - mem_usage),
+    ]
+
+
+@click.command()
+@click.option("--agents", default=1000, help="Number of agents.")
+@click.option("--goods", default=100, help="Number of goods.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(agents, goods, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Agents: {agents}")
+    click.echo(f"* Goods: {goods}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (agents, goods)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
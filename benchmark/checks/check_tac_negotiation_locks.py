@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Rate of post-lock ownership state lookups of the tac negotiation skill, with many open negotiations.
+
+Each step replaces one locked transaction by a new one, and then gets the
+seller side and buyer side ownership states after the locks, like the handling
+of a negotiation message does.
+"""
+import time
+from types import SimpleNamespace
+from typing import Callable, List, cast
+
+import click
+
+from aea.decision_maker.default import OwnershipState
+from aea.helpers.transaction.base import Terms
+from aea.skills.base import SkillContext
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.skills.tac_negotiation.dialogues import FipaDialogue
+from packages.fetchai.skills.tac_negotiation.transactions import Transactions
+
+
+NB_GOODS = 10
+LEDGER_ID = "fetchai"
+
+
+def _make_terms(i: int) -> Terms:
+    """Make the terms of the i-th negotiation, alternately as seller and as buyer."""
+    good_id = str(i % NB_GOODS)
+    is_seller = i % 2 == 0
+    return Terms(
+        ledger_id=LEDGER_ID,
+        sender_address="sender",
+        counterparty_address="counterparty_{}".format(i),
+        amount_by_currency_id={"FET": 5 if is_seller else -5},
+        quantities_by_good_id={good_id: -1 if is_seller else 1},
+        is_sender_payable_tx_fee=True,
+        nonce=str(i),
+    )
+
+
+def _make_transactions() -> Transactions:
+    """Make the transactions model, against an initialized ownership state."""
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 10 ** 6},
+        quantities_by_good_id={str(i): 10 ** 3 for i in range(NB_GOODS)},
+    )
+    skill_context = SimpleNamespace(
+        decision_maker_handler_context=SimpleNamespace(ownership_state=ownership_state),
+        shared_state={},
+    )
+    return Transactions(
+        name="transactions", skill_context=cast(SkillContext, skill_context)
+    )
+
+
+def _role(i: int) -> FipaDialogue.Role:
+    return FipaDialogue.Role.SELLER if i % 2 == 0 else FipaDialogue.Role.BUYER
+
+
+def _recompute(transactions: Transactions, is_seller: bool) -> OwnershipState:
+    """Apply all the locks to a copy of the ownership state, as done before the incremental states."""
+    locked_txs = (
+        transactions._locked_txs_as_seller  # pylint: disable=protected-access
+        if is_seller
+        else transactions._locked_txs_as_buyer  # pylint: disable=protected-access
+    )
+    ownership_state = cast(
+        OwnershipState,
+        transactions.context.decision_maker_handler_context.ownership_state,
+    )
+    return ownership_state.apply_transactions(list(locked_txs.values()))
+
+
+def _steps_rate(
+    negotiations: int,
+    steps: int,
+    get_state: Callable[[Transactions, bool], OwnershipState],
+) -> float:
+    """Get the number of negotiation steps per second."""
+    transactions = _make_transactions()
+    for i in range(negotiations):
+        transactions.add_locked_tx(_make_terms(i), _role(i))
+    start_time = time.time()
+    for step in range(steps):
+        transactions.pop_locked_tx(_make_terms(step))
+        i = negotiations + step
+        transactions.add_locked_tx(_make_terms(i), _role(i))
+        get_state(transactions, True)
+        get_state(transactions, False)
+    return steps / (time.time() - start_time)
+
+
+def run(negotiations: int, steps: int) -> List:
+    """Check the rates of negotiation steps."""
+    return [
+        ("recompute rate(steps/second)", _steps_rate(negotiations, steps, _recompute),),
+        (
+            "incremental rate(steps/second)",
+            _steps_rate(
+                negotiations,
+                steps,
+                lambda transactions, is_seller: transactions.ownership_state_after_locks(
+                    is_seller
+                ),
+            ),
+        ),
+    ]
+
+
+@click.command()
+@click.option("--negotiations", default=200, help="Number of concurrent negotiations.")
+@click.option("--steps", default=10000, help="Number of negotiation steps.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(negotiations, steps, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Negotiations: {negotiations}")
+    click.echo(f"* Steps: {steps}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (negotiations, steps)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Rate of settlement of synthetic transactions by the TAC controller game, one by one and in batches.
+
+Unless --verify_signatures is given, the signatures are not checked, so that the rates
+measure the validation and the application of the transactions on the agent states;
+the signature verification is measured by check_signature_verification.py.
+"""
+import random
+import time
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import Dict, List, cast
+from unittest.mock import patch
+
+import click
+
+from aea.crypto.base import Crypto
+from aea.crypto.ledger_apis import LedgerApis
+from aea.crypto.registries import make_crypto
+from aea.skills.base import SkillContext
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.skills.tac_control.game import AgentState, Game, Transaction
+
+
+LEDGER_ID = "ethereum"
+CURRENCY_ID = "FET"
+NB_AGENTS = 50
+NB_GOODS = 10
+MONEY_ENDOWMENT = 10 ** 6
+GOOD_ENDOWMENT = 100
+
+
+def _make_transactions(
+    cryptos: List[Crypto], nb_transactions: int, is_signed: bool
+) -> List[Transaction]:
+    """Make random transactions of one good between two agents, with the sender as buyer or seller."""
+    rng = random.Random(0)  # nosec
+    transactions = []
+    for i in range(nb_transactions):
+        sender, counterparty = rng.sample(cryptos, 2)
+        quantity = rng.randint(1, 3)
+        price = rng.randint(1, 100) * quantity
+        is_sender_buyer = rng.random() < 0.5
+        args = [
+            LEDGER_ID,
+            sender.address,
+            counterparty.address,
+            {CURRENCY_ID: -price if is_sender_buyer else price},
+            {
+                "G{}".format(rng.randrange(NB_GOODS)): quantity
+                if is_sender_buyer
+                else -quantity
+            },
+            is_sender_buyer,
+            str(i),
+            {CURRENCY_ID: 1},
+        ]
+        tx = Transaction(*args, "", "")  # type: ignore
+        if is_signed:
+            tx = Transaction(
+                *args,  # type: ignore
+                sender.sign_message(tx.sender_hash.encode("utf-8")),
+                counterparty.sign_message(tx.counterparty_hash.encode("utf-8")),
+            )
+        transactions.append(tx)
+    return transactions
+
+
+def _make_game(cryptos: List[Crypto]) -> Game:
+    """Make a game in which every agent has the same endowments."""
+    game = Game(
+        name="game", skill_context=cast(SkillContext, SimpleNamespace(logger=None)),
+    )
+    good_ids = ["G{}".format(i) for i in range(NB_GOODS)]
+    game._current_agent_states = {  # pylint: disable=protected-access
+        crypto.address: AgentState(
+            crypto.address,
+            {CURRENCY_ID: MONEY_ENDOWMENT},
+            {CURRENCY_ID: 1.0},
+            {good_id: GOOD_ENDOWMENT for good_id in good_ids},
+            {good_id: 1.0 for good_id in good_ids},
+        )
+        for crypto in cryptos
+    }
+    return game
+
+
+def _settle_each(game: Game, transactions: List[Transaction]) -> int:
+    """Settle transactions one by one, like the handler of the controller does."""
+    nb_settled = 0
+    for tx in transactions:
+        if game.is_transaction_valid(tx):
+            game.settle_transaction(tx)
+            nb_settled += 1
+    return nb_settled
+
+
+def _settle_batches(
+    game: Game, transactions: List[Transaction], batch_size: int
+) -> int:
+    """Settle transactions in batches."""
+    nb_settled = 0
+    for start in range(0, len(transactions), batch_size):
+        nb_settled += sum(
+            game.settle_transactions(transactions[start : start + batch_size])
+        )
+    return nb_settled
+
+
+def run(nb_transactions: int, batch_size: int, verify_signatures: bool) -> List:
+    """Check the settlement rates."""
+    cryptos = [make_crypto(LEDGER_ID) for _ in range(NB_AGENTS)]
+    transactions = _make_transactions(cryptos, nb_transactions, verify_signatures)
+
+    results = []
+    with ExitStack() as stack:
+        if not verify_signatures:
+            stack.enter_context(
+                patch.object(Transaction, "has_matching_signatures", return_value=True)
+            )
+            stack.enter_context(
+                patch.object(
+                    LedgerApis,
+                    "verify_batch",
+                    side_effect=lambda _, signed_messages: [True]
+                    * len(signed_messages),
+                )
+            )
+        nb_settled = {}  # type: Dict[str, int]
+        for name, settle in [
+            ("one by one", _settle_each),
+            ("batch", lambda game, txs: _settle_batches(game, txs, batch_size)),
+        ]:
+            game = _make_game(cryptos)
+            start_time = time.time()
+            nb_settled[name] = settle(game, transactions)
+            results.append(
+                (
+                    "{} rate(transactions/second)".format(name),
+                    nb_transactions / (time.time() - start_time),
+                )
+            )
+    results.append(("settled transactions", nb_settled["batch"]))
+    return results
+
+
+@click.command()
+@click.option("--transactions", default=100000, help="Number of transactions.")
+@click.option("--batch_size", default=1000, help="Number of transactions per batch.")
+@click.option(
+    "--verify_signatures",
+    is_flag=True,
+    default=False,
+    help="Sign the transactions and verify the signatures.",
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(transactions, batch_size, verify_signatures, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Transactions: {transactions}")
+    click.echo(f"* Batch size: {batch_size}")
+    click.echo(f"* Verify signatures: {verify_signatures}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs), run, (transactions, batch_size, verify_signatures)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Throughput of a full TAC game, with the controller and all the traders in one process.
+
+The agents talk over an in-memory local node, which registers and searches the
+agents like the SOEF does. The phases of the controller follow a virtual clock,
+which is moved forward as soon as all the traders have registered, so that a
+run only takes the time of the trading. The keys of the agents, the game and
+the proposals are all seeded.
+"""
+import datetime
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from statistics import mean
+from types import FunctionType, SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+import click
+import numpy as np
+
+from aea.aea import AEA
+from aea.common import Address
+from aea.configurations.base import ComponentType, SkillConfig
+from aea.configurations.loader import load_component_configuration
+from aea.crypto.fetchai import FetchAICrypto
+from aea.crypto.wallet import Wallet
+from aea.decision_maker.default import DecisionMakerHandler
+from aea.helpers.search.generic import (
+    AGENT_LOCATION_MODEL,
+    AGENT_PERSONALITY_MODEL,
+    AGENT_REMOVE_SERVICE_MODEL,
+    AGENT_SET_SERVICE_MODEL,
+)
+from aea.helpers.search.models import Description
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.protocols.base import Message, Protocol
+from aea.registries.resources import Resources
+from aea.runner import AEARunner
+from aea.skills.base import Skill
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    print_results,
+    wait_for_condition,
+)
+
+from packages.fetchai.connections.local.connection import (
+    LocalNode,
+    OEFLocalConnection,
+    OefSearchDialogue,
+)
+
+# the contract is imported before the skills are loaded, as loading a package replaces the
+# 'packages' namespace, and the skills import the contract without loading its package
+from packages.fetchai.contracts.erc1155.contract import (  # noqa: F401  # pylint: disable=unused-import
+    ERC1155Contract,
+)
+from packages.fetchai.protocols.fipa.message import FipaMessage
+from packages.fetchai.protocols.oef_search.custom_types import AgentsInfo
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+from packages.fetchai.protocols.tac.message import TacMessage
+from packages.fetchai.skills.tac_control.game import Game, Phase
+from packages.fetchai.skills.tac_control.parameters import Parameters
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+PACKAGES_DIR = Path(__file__).parent.parent.parent / "packages" / "fetchai"
+LEDGER_ID = FetchAICrypto.identifier
+PROTOCOLS = [
+    "contract_api",
+    "default",
+    "fipa",
+    "ledger_api",
+    "oef_search",
+    "signing",
+    "state_update",
+    "tac",
+]
+TICK_INTERVAL = 0.1
+
+
+class SoefLocalNode(LocalNode):
+    """
+    A local node which registers and searches the agents like the SOEF does.
+
+    An agent is registered with a single set of attributes, its location and its
+    service keys, and a search returns the agents whose attributes satisfy all the
+    constraints of the query. The node also counts the negotiations and times the
+    settlements of the transactions it forwards.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the node."""
+        super().__init__(*args, **kwargs)
+        self.agent_attributes = defaultdict(dict)  # type: Dict[Address, Dict[str, Any]]
+        self.agent_descriptions = {}  # type: Dict[Address, Description]
+        self.nb_negotiations = 0
+        self.nb_agreements = 0
+        self.settlement_latencies = []  # type: List[float]
+        self._sent_at = {}  # type: Dict[str, float]
+
+    @staticmethod
+    def _agent_address(address: Address) -> Address:
+        """Get the address of the agent, from an address which may name one of its skills."""
+        return address.split("_", 1)[0]
+
+    def _update_description(self, address: Address) -> None:
+        """Rebuild the description searched for an agent, after its attributes change."""
+        attributes = self.agent_attributes.get(address, {})
+        if len(attributes) == 0:
+            self.agent_attributes.pop(address, None)
+            self.agent_descriptions.pop(address, None)
+        else:
+            self.agent_descriptions[address] = Description(attributes)
+
+    async def _register_service(
+        self, address: Address, service_description: Description
+    ):
+        """
+        Register the location or a service key of an agent.
+
+        :param address: the address of the agent.
+        :param service_description: the description of the location, the service key or the personality piece.
+        :return: None
+        """
+        address = self._agent_address(address)
+        values = service_description.values
+        data_model_name = service_description.data_model.name
+        async with self._lock:
+            attributes = self.agent_attributes[address]
+            if data_model_name == AGENT_LOCATION_MODEL.name:
+                attributes["location"] = values["location"]
+            elif data_model_name == AGENT_SET_SERVICE_MODEL.name:
+                attributes[values["key"]] = values["value"]
+            elif data_model_name == AGENT_PERSONALITY_MODEL.name:
+                attributes[values["piece"]] = values["value"]
+            self._update_description(address)
+
+    async def _unregister_service(
+        self, oef_search_msg: OefSearchMessage, dialogue: OefSearchDialogue,
+    ) -> None:
+        """
+        Unregister an agent, or one of its service keys.
+
+        :param oef_search_msg: the incoming message.
+        :param dialogue: the dialogue.
+        :return: None
+        """
+        service_description = oef_search_msg.service_description
+        data_model_name = service_description.data_model.name
+        address = self._agent_address(oef_search_msg.sender)
+        async with self._lock:
+            if data_model_name == AGENT_LOCATION_MODEL.name:
+                self.agent_attributes.pop(address, None)
+            elif data_model_name == AGENT_REMOVE_SERVICE_MODEL.name:
+                self.agent_attributes.get(address, {}).pop(
+                    service_description.values["key"], None
+                )
+            self._update_description(address)
+
+    async def _search_services(
+        self, oef_search_msg: OefSearchMessage, dialogue: OefSearchDialogue,
+    ) -> None:
+        """
+        Search the agents which satisfy the query, and send back the result.
+
+        :param oef_search_msg: the message.
+        :param dialogue: the dialogue.
+        :return: None
+        """
+        async with self._lock:
+            query = oef_search_msg.query
+            agents = tuple(
+                sorted(
+                    address
+                    for address, description in self.agent_descriptions.items()
+                    if query.check(description)
+                )
+            )
+            msg = dialogue.reply(
+                performative=OefSearchMessage.Performative.SEARCH_RESULT,
+                target_message=oef_search_msg,
+                agents=agents,
+                agents_info=AgentsInfo({agent: {} for agent in agents}),
+            )
+            envelope = Envelope(
+                to=msg.to,
+                sender=msg.sender,
+                protocol_id=msg.protocol_id,
+                message=msg,
+                context=dialogue.envelope_context,
+            )
+            await self._send(envelope)
+
+    async def _handle_agent_message(self, envelope: Envelope) -> None:
+        """
+        Count the negotiations and time the settlements, then forward the envelope.
+
+        :param envelope: the envelope
+        :return: None
+        """
+        message = envelope.message
+        if isinstance(message, FipaMessage):
+            if message.performative == FipaMessage.Performative.CFP:
+                self.nb_negotiations += 1
+            elif message.performative == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
+                self.nb_agreements += 1
+        elif isinstance(message, TacMessage):
+            if message.performative == TacMessage.Performative.TRANSACTION:
+                self._sent_at[message.transaction_id] = time.perf_counter()
+            elif (
+                message.performative == TacMessage.Performative.TRANSACTION_CONFIRMATION
+            ):
+                sent_at = self._sent_at.pop(message.transaction_id, None)
+                if sent_at is not None:
+                    self.settlement_latencies.append(time.perf_counter() - sent_at)
+        await super()._handle_agent_message(envelope)
+
+    async def _send(self, envelope: Envelope):
+        """Send an envelope to an agent, also when it is addressed to one of its skills."""
+        destination = self._agent_address(envelope.to)
+        destination_queue = self._out_queues[destination]
+        destination_queue._loop.call_soon_threadsafe(destination_queue.put_nowait, envelope)  # type: ignore  # pylint: disable=protected-access
+
+    async def disconnect(self, address: Address) -> None:
+        """
+        Disconnect an agent, and unregister it.
+
+        :param address: the address of the agent
+        :return: None
+        """
+        await super().disconnect(address)
+        async with self._lock:
+            self.agent_attributes.pop(address, None)
+            self.agent_descriptions.pop(address, None)
+
+
+class VirtualClock:
+    """A clock for the phases of the TAC controller, which only moves when it is set."""
+
+    def __init__(self, now: datetime.datetime):
+        """
+        Initialize the clock.
+
+        :param now: the initial time.
+        """
+        self.now = now
+
+    def install(  # pylint: disable=no-self-use
+        self, module_globals: Dict[str, Any]
+    ) -> None:
+        """
+        Make a module read the time of the clock, instead of the system time.
+
+        :param module_globals: the globals of a module which imports the datetime module.
+        :return: None
+        """
+        clock = self
+
+        class _Datetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz=None):  # pylint: disable=unused-argument
+                return clock.now
+
+        module_globals["datetime"] = SimpleNamespace(
+            datetime=_Datetime, timedelta=datetime.timedelta
+        )
+
+
+class MeteredDecisionMakerHandler(DecisionMakerHandler):
+    """The default decision maker handler, which also counts its CPU time."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the decision maker handler."""
+        super().__init__(*args, **kwargs)
+        self.cpu_time = 0.0
+
+    def handle_batch(self, messages: List[Message]) -> None:
+        """Handle a batch of internal messages, and count the CPU time."""
+        start_time = time.thread_time()
+        try:
+            super().handle_batch(messages)
+        finally:
+            self.cpu_time += time.thread_time() - start_time
+
+
+class MeteredAEA(AEA):
+    """An AEA which counts the CPU time of its handlers, behaviours and decision maker."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the AEA."""
+        super().__init__(
+            *args, decision_maker_handler_class=MeteredDecisionMakerHandler, **kwargs
+        )
+        self._skills_cpu_time = 0.0
+        self._metered_tasks = {}  # type: Dict[Callable, Callable]
+
+    @property
+    def cpu_time(self) -> float:
+        """Get the CPU time of the agent, in seconds."""
+        decision_maker_handler = cast(
+            MeteredDecisionMakerHandler,
+            self.runtime.decision_maker.decision_maker_handler,
+        )
+        return self._skills_cpu_time + decision_maker_handler.cpu_time
+
+    def _metered(self, fn: Callable) -> Callable:
+        """Wrap a function to count its CPU time."""
+
+        def metered_fn(*args, **kwargs):
+            start_time = time.thread_time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._skills_cpu_time += time.thread_time() - start_time
+
+        return metered_fn
+
+    def handle_envelope(self, envelope: Envelope) -> None:
+        """Handle an envelope, and count the CPU time."""
+        self._metered(super().handle_envelope)(envelope)
+
+    def _get_behaviours_tasks(
+        self,
+    ) -> Dict[Callable, Tuple[float, Optional[datetime.datetime]]]:
+        """Get the periodic tasks of the behaviours, wrapped to count their CPU time."""
+        tasks = {}
+        for task_callable, timing in super()._get_behaviours_tasks().items():
+            # the tasks are registered again and again, so the wrappers must be stable
+            if task_callable not in self._metered_tasks:
+                self._metered_tasks[task_callable] = self._metered(task_callable)
+            tasks[self._metered_tasks[task_callable]] = timing
+        return tasks
+
+
+def _make_aea(
+    name: str, key_dir: str, rng: random.Random, local_node: LocalNode
+) -> MeteredAEA:
+    """Make an agent with a seeded key, the TAC protocols and a connection to the local node."""
+    private_key_path = os.path.join(key_dir, "{}_private_key.txt".format(name))
+    with open(private_key_path, "w") as f:
+        f.write("{:064x}".format(rng.getrandbits(256)))
+    wallet = Wallet({LEDGER_ID: private_key_path})
+    identity = Identity(
+        name, address=wallet.addresses[LEDGER_ID], default_address_key=LEDGER_ID
+    )
+    resources = Resources()
+    for protocol_name in PROTOCOLS:
+        resources.add_protocol(
+            Protocol.from_dir(str(PACKAGES_DIR / "protocols" / protocol_name))
+        )
+    agent = MeteredAEA(
+        identity,
+        wallet,
+        resources,
+        runtime_mode="async",
+        default_ledger=LEDGER_ID,
+        default_connection=OEFLocalConnection.connection_id,
+        search_service_address=str(OEFLocalConnection.connection_id),
+    )
+    agent.resources.add_connection(
+        OEFLocalConnection(
+            local_node,
+            configuration=load_component_configuration(
+                ComponentType.CONNECTION, PACKAGES_DIR / "connections" / "local"
+            ),
+            identity=identity,
+        )
+    )
+    return agent
+
+
+def _add_skill(agent: AEA, skill_name: str, args: Dict[str, Dict[str, Any]]) -> Skill:
+    """
+    Add a skill to an agent, with some of the arguments of its components replaced.
+
+    :param agent: the agent.
+    :param skill_name: the name of the skill package.
+    :param args: the arguments to replace, by component name.
+    :return: the skill.
+    """
+    directory = PACKAGES_DIR / "skills" / skill_name
+    configuration = cast(
+        SkillConfig, load_component_configuration(ComponentType.SKILL, directory),
+    )
+    configuration.directory = directory
+    components = dict(
+        list(configuration.behaviours.read_all())
+        + list(configuration.handlers.read_all())
+        + list(configuration.models.read_all())
+    )
+    for component_name, component_args in args.items():
+        components[component_name].args.update(component_args)
+    skill = Skill.from_config(configuration, agent_context=agent.context)
+    agent.resources.add_skill(skill)
+    return skill
+
+
+def _agents_cpu(agents: List[MeteredAEA]) -> List[float]:
+    return [agent.cpu_time for agent in agents]
+
+
+def run(
+    nb_agents: int,
+    nb_goods: int,
+    duration: int,
+    search_interval: float,
+    seed: int,
+    runner_mode: str,
+):
+    """Run a TAC game and measure the trading."""
+    # the agents of large games log too much, and too many warnings about each other
+    logging.getLogger("aea").setLevel(logging.ERROR)
+    random.seed(seed)
+    np.random.seed(seed)
+    rng = random.Random(seed)
+    key_dir = tempfile.mkdtemp()
+    local_node = SoefLocalNode()
+    local_node.start()
+
+    # the registration opens in the future for the controller, and at once for the virtual clock
+    clock = VirtualClock(datetime.datetime.now())
+    registration_start_time = (clock.now + datetime.timedelta(minutes=2)).replace(
+        second=0, microsecond=0
+    )
+    controller = _make_aea("tac_controller", key_dir, rng, local_node)
+    controller_skill = _add_skill(
+        controller,
+        "tac_control",
+        {
+            "parameters": {
+                "ledger_id": LEDGER_ID,
+                "min_nb_agents": nb_agents,
+                "nb_goods": nb_goods,
+                "seed": seed,
+                "registration_start_time": registration_start_time.strftime(
+                    "%d %m %Y %H:%M"
+                ),
+            },
+        },
+    )
+    clock.install(
+        cast(FunctionType, type(controller_skill.behaviours["tac"]).act).__globals__
+    )
+
+    traders = []
+    for i in range(nb_agents):
+        trader = _make_aea("trader_{}".format(i), key_dir, rng, local_node)
+        _add_skill(
+            trader,
+            "tac_participation",
+            {
+                "tac_search": {"tick_interval": TICK_INTERVAL},
+                "transaction_processing": {"tick_interval": TICK_INTERVAL},
+                "game": {"ledger_id": LEDGER_ID},
+            },
+        )
+        _add_skill(
+            trader,
+            "tac_negotiation",
+            {
+                "tac_negotiation": {"search_interval": search_interval},
+                "strategy": {"ledger_id": LEDGER_ID},
+            },
+        )
+        traders.append(trader)
+
+    runner = AEARunner([controller, *traders], runner_mode)
+    runner.start(threaded=True)
+    wait_for_condition(lambda: runner.is_running, timeout=5)
+
+    game = cast(Game, controller_skill.models["game"])
+    parameters = cast(Parameters, controller_skill.models["parameters"])
+    setup_timeout = 10 + nb_agents * 0.2
+    clock.now = registration_start_time + datetime.timedelta(seconds=1)
+    wait_for_condition(
+        lambda: game.registration.nb_agents == nb_agents,
+        timeout=setup_timeout,
+        error_msg="Traders not registered.",
+    )
+    clock.now = parameters.start_time + datetime.timedelta(seconds=1)
+    wait_for_condition(
+        lambda: game.phase.value == Phase.GAME.value,
+        timeout=setup_timeout,
+        error_msg="Game not started.",
+    )
+
+    start_time = time.perf_counter()
+    start_negotiations = local_node.nb_negotiations
+    start_agreements = local_node.nb_agreements
+    start_settlements = len(local_node.settlement_latencies)
+    start_cpu = _agents_cpu([controller, *traders])
+    start_process_cpu = time.process_time()
+    time.sleep(duration)
+    elapsed = time.perf_counter() - start_time
+    process_cpu = (time.process_time() - start_process_cpu) / elapsed
+    nb_negotiations = local_node.nb_negotiations - start_negotiations
+    nb_agreements = local_node.nb_agreements - start_agreements
+    latencies = local_node.settlement_latencies[start_settlements:]
+    cpu = [
+        (end - start) / elapsed
+        for start, end in zip(start_cpu, _agents_cpu([controller, *traders]))
+    ]
+
+    clock.now = parameters.end_time + datetime.timedelta(seconds=1)
+    wait_for_condition(
+        lambda: game.phase.value == Phase.POST_GAME.value,
+        timeout=setup_timeout,
+        error_msg="Game not ended.",
+    )
+    runner.stop()
+    local_node.stop()
+    shutil.rmtree(key_dir)
+
+    return [
+        ("negotiations rate(negotiations/second)", nb_negotiations / elapsed),
+        ("agreements rate(agreements/second)", nb_agreements / elapsed),
+        ("settlements rate(transactions/second)", len(latencies) / elapsed),
+        ("settlement latency(ms)", 1000 * mean(latencies) if latencies else -1,),
+        ("controller cpu(%)", 100 * cpu[0]),
+        ("trader cpu(%)", 100 * mean(cpu[1:])),
+        ("max trader cpu(%)", 100 * max(cpu[1:])),
+        ("process cpu(%)", 100 * process_cpu),
+    ]
+
+
+@click.command()
+@click.option("--nb_agents", default=10, help="Number of traders.")
+@click.option("--nb_goods", default=9, help="Number of goods.")
+@click.option("--duration", default=10, help="Trading time in seconds.")
+@click.option(
+    "--search_interval",
+    default=5.0,
+    help="Interval between the searches of a trader for counterparties, in seconds.",
+)
+@click.option(
+    "--seed", default=42, help="Seed of the keys, the game and the proposals."
+)
+@click.option("--runner_mode", default="async", help="Runner mode: async or threaded.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(
+    nb_agents, nb_goods, duration, search_interval, seed, runner_mode, number_of_runs
+):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Number of traders: {nb_agents}")
+    click.echo(f"* Number of goods: {nb_goods}")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Search interval: {search_interval} seconds")
+    click.echo(f"* Seed: {seed}")
+    click.echo(f"* Runner mode: {runner_mode}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs),
+            run,
+            (nb_agents, nb_goods, duration, search_interval, seed, runner_mode),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Rate of CosmWasm contract queries through the command line tool and through the REST API of a node, against local stand-ins."""
+import json
+import os
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from typing import Callable, List
+
+import click
+
+from aea.crypto.cosmos import CosmosApi
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+
+CONTRACT_ADDRESS = "contract"
+QUERY_MSG = {"balance": {"address": "address", "id": "1"}}
+QUERY_RESULT = {"balance": "42"}
+
+FAKE_CLI = """#!{executable}
+import json
+print(json.dumps({query_result}))
+"""
+
+
+class WasmLCDStub(BaseHTTPRequestHandler):
+    """Answer every smart query with a constant result."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle a query."""
+        body = json.dumps({"height": "1", "result": QUERY_RESULT}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """Serve every connection in a daemon thread, so kept alive connections do not block shutdown."""
+
+    daemon_threads = True
+
+
+def _rate(fn: Callable, duration: float) -> float:
+    """Get the number of calls of a function per second."""
+    count = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        fn()
+        count += 1
+    return count / duration
+
+
+def run(duration: float) -> List:
+    """Check query rates."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WasmLCDStub)
+    Thread(target=server.serve_forever, daemon=True).start()
+    address = "http://{}:{}".format(*server.server_address)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cli_command = os.path.join(tmpdirname, "wasmcli")
+        with open(cli_command, "w") as f:
+            f.write(
+                FAKE_CLI.format(executable=sys.executable, query_result=QUERY_RESULT)
+            )
+        os.chmod(cli_command, 0o755)  # nosec
+        cli_api = CosmosApi(cli_command=cli_command, wasm_query_mode="cli")
+        rest_api = CosmosApi(address=address, wasm_query_mode="rest")
+        try:
+            return [
+                (
+                    "cli rate(queries/second)",
+                    _rate(
+                        lambda: cli_api.try_execute_wasm_query(
+                            CONTRACT_ADDRESS, QUERY_MSG
+                        ),
+                        duration,
+                    ),
+                ),
+                (
+                    "rest rate(queries/second)",
+                    _rate(
+                        lambda: rest_api.try_execute_wasm_query(
+                            CONTRACT_ADDRESS, QUERY_MSG
+                        ),
+                        duration,
+                    ),
+                ),
+            ]
+        finally:
+            server.shutdown()
+
+
+@click.command()
+@click.option("--duration", default=3, help="Run time in seconds, per case.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(duration, number_of_runs):
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Duration: {duration} seconds")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (duration,)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -60,3 +60,164 @@ do
 	done
 done
 # ~ 10 * 2 * 4 * 100 sec = 133.3 min
+
+chmod +x benchmark/checks/check_gym_vectorized.py
+echo -e "\nGym connection: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "nb_envs             value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_gym_vectorized.py --duration=$DURATION --number_of_runs=$NUM_RUNS`
+rate=`echo "$data"|grep rate|awk '{print $4 "    " $6}'`
+echo -e "none    rate     ${rate}"
+for nb_envs in 1 8 64;
+do
+	data=`./benchmark/checks/check_gym_vectorized.py --duration=$DURATION --number_of_runs=$NUM_RUNS --nb_envs=$nb_envs`
+	rate=`echo "$data"|grep rate|awk '{print $4 "    " $6}'`
+	echo -e "$nb_envs    rate     ${rate}"
+done
+# ~ 10 * 4 * 100 sec = 66.7 min
+
+chmod +x benchmark/checks/check_decision_maker_signing.py
+echo -e "\nDecision maker signing: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "decision maker             value          mean        stdev"
+echo "----------------------------------------------------"
+for mode in threaded async;
+do
+	data=`./benchmark/checks/check_decision_maker_signing.py --duration=$DURATION --number_of_runs=$NUM_RUNS --decision_maker_mode=$mode`
+	rate=`echo "$data"|grep rate|awk '{print $4 "    " $6}'`
+	echo -e "$mode    rate     ${rate}"
+done
+# ~ 10 * 2 * 100 sec = 33.3 min
+
+chmod +x benchmark/checks/check_ledger_apis.py
+echo -e "\nLedger apis: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "ledger apis             value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_ledger_apis.py --duration=$DURATION --number_of_runs=$NUM_RUNS`
+uncached=`echo "$data"|grep "uncached rate"|awk '{print $5 "    " $7}'`
+cached=`echo "$data"|grep " cached rate"|awk '{print $5 "    " $7}'`
+echo -e "uncached    rate     ${uncached}"
+echo -e "cached    rate     ${cached}"
+# ~ 10 * 2 * 100 sec = 33.3 min
+
+chmod +x benchmark/checks/check_wasm_queries.py
+echo -e "\nCosmWasm queries: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "wasm queries            value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_wasm_queries.py --duration=$DURATION --number_of_runs=$NUM_RUNS`
+cli=`echo "$data"|grep "cli rate"|awk '{print $5 "    " $7}'`
+rest=`echo "$data"|grep "rest rate"|awk '{print $5 "    " $7}'`
+echo -e "cli    rate     ${cli}"
+echo -e "rest    rate     ${rest}"
+# ~ 10 * 2 * 100 sec = 33.3 min
+
+chmod +x benchmark/checks/check_signature_verification.py
+echo -e "\nSignature verification: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "signatures              value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_signature_verification.py --number_of_runs=$NUM_RUNS`
+each=`echo "$data"|grep "one by one rate"|awk '{print $7 "    " $9}'`
+batch=`echo "$data"|grep " batch rate"|grep -v cached|awk '{print $5 "    " $7}'`
+cached=`echo "$data"|grep "cached batch rate"|awk '{print $6 "    " $8}'`
+echo -e "one by one    rate     ${each}"
+echo -e "batch    rate     ${batch}"
+echo -e "cached batch    rate     ${cached}"
+# ~ 10 * 3 * 120 sec = 60 min
+
+chmod +x benchmark/checks/check_tac_negotiation_locks.py
+echo -e "\nTAC negotiation locks: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "steps              value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_tac_negotiation_locks.py --number_of_runs=$NUM_RUNS`
+recompute=`echo "$data"|grep "recompute rate"|awk '{print $5 "    " $7}'`
+incremental=`echo "$data"|grep "incremental rate"|awk '{print $5 "    " $7}'`
+echo -e "recompute    rate     ${recompute}"
+echo -e "incremental    rate     ${incremental}"
+# ~ 10 * 2 * 15 sec = 5 min
+
+chmod +x benchmark/checks/check_tac_settlement.py
+echo -e "\nTAC settlement: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "settlement              value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_tac_settlement.py --number_of_runs=$NUM_RUNS`
+each=`echo "$data"|grep "one by one rate"|awk '{print $7 "    " $9}'`
+batch=`echo "$data"|grep "batch rate"|awk '{print $5 "    " $7}'`
+echo -e "one by one    rate     ${each}"
+echo -e "batch    rate     ${batch}"
+# ~ 10 * 15 sec = 3 min
+
+chmod +x benchmark/checks/check_tac_generation.py
+echo -e "\nTAC game generation: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "generation              value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_tac_generation.py --number_of_runs=$NUM_RUNS`
+arrays=`echo "$data"|grep "arrays and equilibrium time"|awk '{print $7 "    " $9}'`
+game=`echo "$data"|grep "game generation time"|awk '{print $6 "    " $8}'`
+mem=`echo "$data"|grep "game generation mem"|awk '{print $7 "    " $9}'`
+echo -e "arrays and equilibrium    time     ${arrays}"
+echo -e "game generation    time     ${game}"
+echo -e "game generation    mem     ${mem}"
+# ~ 10 * 2 sec = 20 sec
+
+chmod +x benchmark/checks/check_tac_simulation.py
+echo -e "\nTAC simulation: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "traders              value          mean        stdev"
+echo "----------------------------------------------------"
+for nb_agents in 10 50;
+do
+	data=`./benchmark/checks/check_tac_simulation.py --nb_agents=$nb_agents --duration=$DURATION --number_of_runs=$NUM_RUNS`
+	negotiations=`echo "$data"|grep "negotiations rate"|awk '{print $5 "    " $7}'`
+	settlements=`echo "$data"|grep "settlements rate"|awk '{print $5 "    " $7}'`
+	latency=`echo "$data"|grep "settlement latency"|awk '{print $5 "    " $7}'`
+	controller_cpu=`echo "$data"|grep "controller cpu"|awk '{print $5 "    " $7}'`
+	trader_cpu=`echo "$data"|grep "^ \* trader cpu"|awk '{print $5 "    " $7}'`
+	echo -e "$nb_agents    negotiations rate     ${negotiations}"
+	echo -e "$nb_agents    settlements rate     ${settlements}"
+	echo -e "$nb_agents    settlement latency     ${latency}"
+	echo -e "$nb_agents    controller cpu     ${controller_cpu}"
+	echo -e "$nb_agents    trader cpu     ${trader_cpu}"
+done
+# ~ 2 * 100 * 30 sec = 100 min
+
+chmod +x benchmark/checks/check_exec_timeout.py
+echo -e "\nExecution control overhead: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "value          mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_exec_timeout.py --number_of_runs=$NUM_RUNS`
+off=`echo "$data"|grep "timeout off overhead"|awk '{print $6 "    " $8}'`
+on=`echo "$data"|grep "timeout on overhead"|awk '{print $6 "    " $8}'`
+echo -e "timeout off overhead(us/call)     ${off}"
+echo -e "timeout on overhead(us/call)     ${on}"
+# ~ 10 * 2 sec = 20 sec
+
+chmod +x benchmark/checks/check_behaviours_scheduler.py
+echo -e "\nBehaviours scheduler: number of runs: $NUM_RUNS, duration: $DURATION"
+echo "----------------------------------------------------"
+echo "behaviours              value          mean        stdev"
+echo "----------------------------------------------------"
+for nb_behaviours in 1000 10000 100000;
+do
+	data=`./benchmark/checks/check_behaviours_scheduler.py --nb_behaviours=$nb_behaviours --duration=$DURATION --number_of_runs=$NUM_RUNS`
+	caller_cpu=`echo "$data"|grep "periodic caller cpu"|awk '{print $6 "    " $8}'`
+	caller_timers=`echo "$data"|grep "periodic caller timers"|awk '{print $6 "    " $8}'`
+	wheel_cpu=`echo "$data"|grep "timer wheel cpu"|awk '{print $6 "    " $8}'`
+	wheel_timers=`echo "$data"|grep "timer wheel timers"|awk '{print $6 "    " $8}'`
+	wheel_drift=`echo "$data"|grep "timer wheel drift"|awk '{print $6 "    " $8}'`
+	wheel_overruns=`echo "$data"|grep "timer wheel overruns"|awk '{print $6 "    " $8}'`
+	echo -e "$nb_behaviours    periodic caller cpu(us/call)     ${caller_cpu}"
+	echo -e "$nb_behaviours    periodic caller timers     ${caller_timers}"
+	echo -e "$nb_behaviours    timer wheel cpu(us/call)     ${wheel_cpu}"
+	echo -e "$nb_behaviours    timer wheel timers     ${wheel_timers}"
+	echo -e "$nb_behaviours    timer wheel drift(ms)     ${wheel_drift}"
+	echo -e "$nb_behaviours    timer wheel overruns     ${wheel_overruns}"
+done
+# ~ 3 * 10 * 2 * 20 sec = 20 min
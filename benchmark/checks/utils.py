@@ -68,7 +68,9 @@ def wait_for_condition(condition_checker, timeout=2, error_msg="Timeout") -> Non
             raise TimeoutError(error_msg)
 
 
-def make_agent(agent_name="my_agent", runtime_mode="threaded") -> AEA:
+def make_agent(
+    agent_name="my_agent", runtime_mode="threaded", decision_maker_mode="threaded"
+) -> AEA:
     """Make AEA instance."""
     wallet = Wallet({DEFAULT_LEDGER: None})
     identity = Identity(agent_name, address=agent_name)
@@ -95,7 +97,13 @@ def make_agent(agent_name="my_agent", runtime_mode="threaded") -> AEA:
             )
         )
     )
-    return AEA(identity, wallet, resources, runtime_mode=runtime_mode)
+    return AEA(
+        identity,
+        wallet,
+        resources,
+        runtime_mode=runtime_mode,
+        decision_maker_mode=decision_maker_mode,
+    )
 
 
 def make_envelope(
@@ -20,13 +20,15 @@
 """Gym connector and gym channel."""
 
 import asyncio
+import copy
 import logging
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Optional, Tuple, Union, cast
+from typing import Any, List, Optional, Sequence, Tuple, Union, cast
 
 import gym
+import numpy as np
 
 from aea.common import Address
 from aea.configurations.base import PublicId
@@ -45,6 +47,8 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.gym")
 
 PUBLIC_ID = PublicId.from_str("fetchai/gym:0.11.0")
 
+VecFeedback = Tuple[np.ndarray, np.ndarray, np.ndarray, List[Any]]
+
 
 class GymDialogues(BaseGymDialogues):
     """The dialogues class keeps track of all gym dialogues."""
@@ -81,10 +85,27 @@ class GymChannel:
 
     THREAD_POOL_SIZE = 3
 
-    def __init__(self, address: Address, gym_env: gym.Env):
-        """Initialize a gym channel."""
+    def __init__(
+        self, address: Address, gym_env: gym.Env, nb_envs: Optional[int] = None
+    ):
+        """
+        Initialize a gym channel.
+
+        :param address: the address of the agent.
+        :param gym_env: the gym environment.
+        :param nb_envs: if set, run this many copies of the environment in vectorized mode.
+        """
+        if nb_envs is not None and nb_envs < 1:
+            raise ValueError("nb_envs must be a positive integer.")
         self.address = address
         self.gym_env = gym_env
+        self.nb_envs = nb_envs
+        self.gym_envs = [gym_env]  # type: List[gym.Env]
+        for _ in range((nb_envs or 1) - 1):
+            env_copy = copy.deepcopy(gym_env)
+            # reseed the copies so they do not replay the same trajectories
+            env_copy.seed()
+            self.gym_envs.append(env_copy)
         self._loop: Optional[AbstractEventLoop] = None
         self._queue: Optional[asyncio.Queue] = None
         self._threaded_pool: ThreadPoolExecutor = ThreadPoolExecutor(
@@ -137,9 +158,55 @@ class GymChannel:
             raise ValueError("This protocol is not valid for gym.")
         await self.handle_gym_message(envelope)
 
+    @property
+    def is_vectorized(self) -> bool:
+        """Check whether the channel runs in vectorized mode."""
+        return self.nb_envs is not None
+
     async def _run_in_executor(self, fn, *args):
         return await self._loop.run_in_executor(self._threaded_pool, fn, *args)
 
+    def _step_all(self, actions: Sequence[Any]) -> VecFeedback:
+        """
+        Step every environment copy with its action.
+
+        Environments which are done are reset straight away; their last observation is
+        reported under the 'terminal_observation' key of their info.
+
+        :param actions: one action per environment copy.
+        :return: the stacked observations, rewards and dones, and the list of infos.
+        """
+        if len(actions) != len(self.gym_envs):
+            raise ValueError(
+                "Expected {} actions, got {}.".format(len(self.gym_envs), len(actions))
+            )
+        observations, rewards, dones, infos = [], [], [], []
+        for gym_env, action in zip(self.gym_envs, actions):
+            observation, reward, done, info = gym_env.step(action)
+            if done:
+                info = dict(info, terminal_observation=observation)
+                observation = gym_env.reset()
+            observations.append(observation)
+            rewards.append(reward)
+            dones.append(done)
+            infos.append(info)
+        return (
+            np.asarray(observations),
+            np.asarray(rewards, dtype=np.float64),
+            np.asarray(dones, dtype=np.bool_),
+            infos,
+        )
+
+    def _reset_all(self) -> None:
+        """Reset every environment copy."""
+        for gym_env in self.gym_envs:
+            gym_env.reset()
+
+    def _close_all(self) -> None:
+        """Close every environment copy."""
+        for gym_env in self.gym_envs:
+            gym_env.close()
+
     async def handle_gym_message(self, envelope: Envelope) -> None:
         """
         Forward a message to gym.
@@ -158,7 +225,25 @@ class GymChannel:
             )
             return
 
-        if gym_message.performative == GymMessage.Performative.ACT:
+        if (
+            self.is_vectorized
+            and gym_message.performative == GymMessage.Performative.ACT
+        ):
+            observations, rewards, dones, infos = await self._run_in_executor(
+                self._step_all, gym_message.action.any
+            )
+            msg = dialogue.reply(
+                performative=GymMessage.Performative.PERCEPT,
+                target_message=gym_message,
+                observation=GymMessage.AnyObject(observations),
+                reward=float(rewards.mean()),
+                done=bool(dones.all()),
+                info=GymMessage.AnyObject(
+                    {"rewards": rewards, "dones": dones, "infos": infos}
+                ),
+                step_id=gym_message.step_id,
+            )
+        elif gym_message.performative == GymMessage.Performative.ACT:
             action = gym_message.action.any
             step_id = gym_message.step_id
 
@@ -176,14 +261,17 @@ class GymChannel:
                 step_id=step_id,
             )
         elif gym_message.performative == GymMessage.Performative.RESET:
-            await self._run_in_executor(self.gym_env.reset)
+            await self._run_in_executor(self._reset_all)
+            content = {"reset": "success"}
+            if self.is_vectorized:
+                content["nb_envs"] = str(self.nb_envs)
             msg = dialogue.reply(
                 performative=GymMessage.Performative.STATUS,
                 target_message=gym_message,
-                content={"reset": "success"},
+                content=content,
             )
         elif gym_message.performative == GymMessage.Performative.CLOSE:
-            await self._run_in_executor(self.gym_env.close)
+            await self._run_in_executor(self._close_all)
             return
         envelope = Envelope(
             to=msg.to, sender=msg.sender, protocol_id=msg.protocol_id, message=msg,
@@ -232,7 +320,8 @@ class GymConnection(Connection):
                 raise ValueError("`env` must be set in configuration!")
             gym_env_class = locate(gym_env_package)
             gym_env = gym_env_class()
-        self.channel = GymChannel(self.address, gym_env)
+        nb_envs = cast(Optional[int], self.configuration.config.get("nb_envs"))
+        self.channel = GymChannel(self.address, gym_env, nb_envs=nb_envs)
         self._connection = None  # type: Optional[asyncio.Queue]
 
     async def connect(self) -> None:
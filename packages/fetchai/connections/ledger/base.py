@@ -22,7 +22,7 @@ from abc import ABC, abstractmethod
 from asyncio import Task
 from concurrent.futures._base import Executor
 from logging import Logger
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from aea.configurations.base import PublicId
 from aea.crypto.base import LedgerApi
@@ -91,6 +91,27 @@ class RequestDispatcher(ABC):
         except Exception as e:  # pylint: disable=broad-except
             return self.get_error_message(e, api, message, dialogue)
 
+    async def run_coroutine(
+        self,
+        func: Callable[[LedgerApi, Message, Dialogue], Awaitable[Message]],
+        api: LedgerApi,
+        message: Message,
+        dialogue: Dialogue,
+    ):
+        """
+        Run a coroutine function on the event loop.
+
+        :param func: the coroutine function to await.
+        :param api: the ledger api.
+        :param message: the request message.
+        :param dialogue: the dialogue.
+        :return: the return value of the function.
+        """
+        try:
+            return await func(api, message, dialogue)
+        except Exception as e:  # pylint: disable=broad-except
+            return self.get_error_message(e, api, message, dialogue)
+
     def dispatch(self, envelope: Envelope) -> Task:
         """
         Dispatch the request to the right sender handler.
@@ -109,6 +130,11 @@ class RequestDispatcher(ABC):
                 "No dialogue created. Message={} not valid.".format(message)
             )
         performative = message.performative
+        async_handler = self.get_async_handler(performative, api)
+        if async_handler is not None:
+            return self.loop.create_task(
+                self.run_coroutine(async_handler, api, message, dialogue)
+            )
         handler = self.get_handler(performative)
         return self.loop.create_task(self.run_async(handler, api, message, dialogue))
 
@@ -124,6 +150,18 @@ class RequestDispatcher(ABC):
             raise Exception("Performative not recognized.")
         return handler
 
+    def get_async_handler(  # pylint: disable=unused-argument,no-self-use
+        self, performative: Any, api: LedgerApi
+    ) -> Optional[Callable[[LedgerApi, Message, Dialogue], Awaitable[Message]]]:
+        """
+        Get a handler which can be awaited on the event loop, if there is one.
+
+        :param performative: the message performative.
+        :param api: the ledger api.
+        :return: the coroutine function, or None to run the handler in the executor.
+        """
+        return None
+
     @abstractmethod
     def get_error_message(
         self, e: Exception, api: LedgerApi, message: Message, dialogue: Dialogue,
@@ -23,6 +23,8 @@ from asyncio import Task
 from collections import deque
 from typing import Deque, Dict, List, Optional, cast
 
+import aiohttp
+
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
@@ -32,12 +34,24 @@ from packages.fetchai.connections.ledger.contract_dispatcher import (
     ContractApiRequestDispatcher,
 )
 from packages.fetchai.connections.ledger.ledger_dispatcher import (
+    DEFAULT_NONCE_RELEASE_TIMEOUT,
     LedgerApiRequestDispatcher,
 )
+from packages.fetchai.connections.ledger.settlement_tracker import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLEMENT_TIMEOUT,
+    SettlementTracker,
+)
 from packages.fetchai.protocols.contract_api import ContractApiMessage
 from packages.fetchai.protocols.ledger_api import LedgerApiMessage
 
 
+DEFAULT_ASYNC_HTTP = True
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_TRACK_SETTLEMENTS = True
+
+
 class LedgerConnection(Connection):
     """Proxy to the functionality of the SDK or API."""
 
@@ -50,6 +64,8 @@ class LedgerConnection(Connection):
         self._ledger_dispatcher: Optional[LedgerApiRequestDispatcher] = None
         self._contract_dispatcher: Optional[ContractApiRequestDispatcher] = None
         self._event_new_receiving_task: Optional[asyncio.Event] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._settlement_tracker: Optional[SettlementTracker] = None
 
         self.receiving_tasks: List[asyncio.Future] = []
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
@@ -57,6 +73,37 @@ class LedgerConnection(Connection):
         self.api_configs = self.configuration.config.get(
             "ledger_apis", {}
         )  # type: Dict[str, Dict[str, str]]
+        self.async_http = bool(
+            self.configuration.config.get("async_http", DEFAULT_ASYNC_HTTP)
+        )
+        self.http_pool_size = int(
+            self.configuration.config.get("http_pool_size", DEFAULT_HTTP_POOL_SIZE)
+        )
+        self.track_settlements = bool(
+            self.configuration.config.get(
+                "track_settlements", DEFAULT_TRACK_SETTLEMENTS
+            )
+        )
+        self.settlement_poll_interval = float(
+            self.configuration.config.get(
+                "settlement_poll_interval", DEFAULT_POLL_INTERVAL
+            )
+        )
+        self.settlement_max_poll_interval = float(
+            self.configuration.config.get(
+                "settlement_max_poll_interval", DEFAULT_MAX_POLL_INTERVAL
+            )
+        )
+        self.settlement_timeout = float(
+            self.configuration.config.get(
+                "settlement_timeout", DEFAULT_SETTLEMENT_TIMEOUT
+            )
+        )
+        self.nonce_release_timeout = float(
+            self.configuration.config.get(
+                "nonce_release_timeout", DEFAULT_NONCE_RELEASE_TIMEOUT
+            )
+        )
 
     @property
     def event_new_receiving_task(self) -> asyncio.Event:
@@ -71,11 +118,27 @@ class LedgerConnection(Connection):
 
         self._state.set(ConnectionStates.connecting)
 
+        if self.async_http:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.http_pool_size)
+            )
+        if self.track_settlements:
+            self._settlement_tracker = SettlementTracker(
+                loop=self.loop,
+                http_session=self._http_session,
+                logger=self.logger,
+                poll_interval=self.settlement_poll_interval,
+                max_poll_interval=self.settlement_max_poll_interval,
+                settlement_timeout=self.settlement_timeout,
+            )
         self._ledger_dispatcher = LedgerApiRequestDispatcher(
             self._state,
             loop=self.loop,
             api_configs=self.api_configs,
             logger=self.logger,
+            http_session=self._http_session,
+            settlement_tracker=self._settlement_tracker,
+            nonce_release_timeout=self.nonce_release_timeout,
         )
         self._contract_dispatcher = ContractApiRequestDispatcher(
             self._state,
@@ -94,9 +157,15 @@ class LedgerConnection(Connection):
 
         self._state.set(ConnectionStates.disconnecting)
 
+        if self._settlement_tracker is not None:
+            self._settlement_tracker.stop()
+            self._settlement_tracker = None
         for task in self.receiving_tasks:
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
         self._event_new_receiving_task = None
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains an asynchronous variant of the Cosmos ledger API."""
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+
+import aiohttp
+
+from aea.common import Address
+from aea.crypto.cosmos import RETRY_STATUSES, _CosmosApi
+
+
+_default_logger = logging.getLogger(
+    "aea.packages.fetchai.connections.ledger.cosmos_api"
+)
+
+
+class AsyncCosmosApi:
+    """
+    Interact with the REST API of a Cosmos SDK node using aiohttp.
+
+    It mirrors the HTTP based methods of a (synchronous) Cosmos or Fetch.ai ledger
+    api, from which it takes the node address, the denomination, the chain id and
+    the retry configuration. Requests go through a shared aiohttp session, so they
+    can be awaited on the event loop of the caller without an executor.
+    """
+
+    def __init__(
+        self,
+        api: _CosmosApi,
+        session: aiohttp.ClientSession,
+        logger: logging.Logger = _default_logger,
+    ):
+        """
+        Initialize the asynchronous Cosmos ledger API.
+
+        :param api: the synchronous ledger api.
+        :param session: the aiohttp session.
+        :param logger: the logger.
+        """
+        self.api = api
+        self.session = session
+        self.logger = logger
+
+    async def _request(
+        self, method: str, url: str, json: Optional[Any] = None
+    ) -> Tuple[int, Any]:
+        """
+        Send a request, retrying idempotent requests like the synchronous api does.
+
+        :param method: the HTTP method.
+        :param url: the url.
+        :param json: the body of the request, if any.
+        :return: the status and the decoded body of the response.
+        """
+        retries = self.api.max_retries if method == "GET" else 0
+        attempt = 0
+        while True:
+            try:
+                async with self.session.request(method, url, json=json) as response:
+                    if response.status not in RETRY_STATUSES or attempt >= retries:
+                        return response.status, await response.json(content_type=None)
+            except aiohttp.ClientConnectionError:
+                if attempt >= retries:
+                    raise
+            await asyncio.sleep(self.api.backoff_factor * (2 ** attempt))
+            attempt += 1
+
+    async def get_balance(self, address: Address) -> Optional[int]:
+        """Get the balance of a given account."""
+        balance = None  # type: Optional[int]
+        url = self.api.network_address + f"/bank/balances/{address}"
+        try:
+            status, body = await self._request("GET", url)
+            if status == 200:
+                result = body["result"]
+                balance = 0 if len(result) == 0 else int(result[0]["amount"])
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                "Encountered exception when trying get balance: {}".format(e)
+            )
+        return balance
+
+    async def get_account_number_and_sequence(
+        self, address: Address
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get account number and sequence for an address.
+
+        :param address: the address
+        :return: a tuple of account number and sequence
+        """
+        result: Tuple[Optional[int], Optional[int]] = (None, None)
+        url = self.api.network_address + f"/auth/accounts/{address}"
+        try:
+            status, body = await self._request("GET", url)
+            if status == 200:
+                result = (
+                    int(body["result"]["value"]["account_number"]),
+                    int(body["result"]["value"]["sequence"]),
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                "Encountered exception when trying to get account number and sequence: {}".format(
+                    e
+                )
+            )
+        return result
+
+    async def get_transfer_transaction(
+        self,
+        sender_address: Address,
+        destination_address: Address,
+        amount: int,
+        tx_fee: int,
+        tx_nonce: str,  # pylint: disable=unused-argument
+        denom: Optional[str] = None,
+        gas: int = 80000,
+        memo: str = "",
+        chain_id: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[Any]:
+        """
+        Get a transfer transaction.
+
+        :param sender_address: the sender address of the payer.
+        :param destination_address: the destination address of the payee.
+        :param amount: the amount of wealth to be transferred.
+        :param tx_fee: the transaction fee.
+        :param tx_nonce: verifies the authenticity of the tx
+        :param denom: the denomination of tx fee and amount
+        :param gas: the gas used.
+        :param memo: memo to include in tx.
+        :param chain_id: the chain ID of the transaction.
+        :return: the transfer transaction
+        """
+        denom = denom if denom is not None else self.api.denom
+        chain_id = chain_id if chain_id is not None else self.api.chain_id
+        account_number, sequence = await self.get_account_number_and_sequence(
+            sender_address
+        )
+        if account_number is None or sequence is None:
+            return None
+        transfer_msg = {
+            "type": "cosmos-sdk/MsgSend",
+            "value": {
+                "amount": [{"amount": str(amount), "denom": denom}],
+                "from_address": sender_address,
+                "to_address": destination_address,
+            },
+        }
+        tx = self.api._get_transaction(  # pylint: disable=protected-access
+            account_number,
+            chain_id,
+            tx_fee,
+            denom,
+            gas,
+            memo,
+            sequence,
+            msg=transfer_msg,
+        )
+        return tx
+
+    async def send_signed_transaction(self, tx_signed: Any) -> Optional[str]:
+        """
+        Send a signed transaction.
+
+        CosmWasm transactions are executed through the command line tool of the
+        node, so they are handed to the synchronous api in the default executor.
+
+        :param tx_signed: the signed transaction
+        :return: tx_digest, if present
+        """
+        if not self.api.is_transfer_transaction(tx_signed):
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self.api.send_signed_transaction, tx_signed
+            )
+        tx_digest = None  # type: Optional[str]
+        url = self.api.network_address + "/txs"
+        try:
+            status, body = await self._request("POST", url, json=tx_signed)
+            if status == 200:
+                tx_digest = body["txhash"]
+            else:  # pragma: nocover
+                self.logger.error("Cannot send transaction: {}".format(body))
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                "Encountered exception when trying to send tx: {}".format(e)
+            )
+        return tx_digest
+
+    async def get_transaction_receipt(self, tx_digest: str) -> Optional[Any]:
+        """
+        Get the transaction receipt for a transaction digest.
+
+        :param tx_digest: the digest associated to the transaction.
+        :return: the tx receipt, if present
+        """
+        result = None  # type: Optional[Any]
+        url = self.api.network_address + f"/txs/{tx_digest}"
+        try:
+            status, body = await self._request("GET", url)
+            if status == 200:
+                result = body
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                "Encountered exception when trying to get transaction receipt: {}".format(
+                    e
+                )
+            )
+        return result
+
+    async def get_transaction(self, tx_digest: str) -> Optional[Any]:
+        """
+        Get the transaction for a transaction digest.
+
+        :param tx_digest: the digest associated to the transaction.
+        :return: the tx, if present
+        """
+        # Cosmos does not distinguish between transaction receipt and transaction
+        return await self.get_transaction_receipt(tx_digest)
+
+    async def batch_get_transaction_receipts(
+        self, tx_digests: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[Any]]]:
+        """
+        Get the receipts and the transactions of several transactions.
+
+        The REST server has no batch endpoint, so the requests are sent
+        concurrently over the pooled connections of the session.
+
+        :param tx_digests: the digests associated to the transactions.
+        :return: the tx receipt and the tx of each digest, each None if not present.
+        """
+        receipts = await asyncio.gather(
+            *[self.get_transaction_receipt(tx_digest) for tx_digest in tx_digests]
+        )
+        return [(receipt, receipt) for receipt in receipts]
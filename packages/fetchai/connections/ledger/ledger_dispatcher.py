@@ -17,18 +17,28 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the implementation of the ledger API request dispatcher."""
+import asyncio
 import logging
+import threading
 import time
-from typing import cast
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, cast
+
+import aiohttp
 
 from aea.connections.base import ConnectionStates
 from aea.crypto.base import LedgerApi
+from aea.crypto.cosmos import _CosmosApi
+from aea.crypto.ethereum import EthereumApi
 from aea.helpers.transaction.base import RawTransaction, TransactionDigest
 from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+from aea.protocols.dialogue.base import DialogueLabel
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
 from packages.fetchai.connections.ledger.base import CONNECTION_ID, RequestDispatcher
+from packages.fetchai.connections.ledger.cosmos_api import AsyncCosmosApi
+from packages.fetchai.connections.ledger.settlement_tracker import SettlementTracker
 from packages.fetchai.protocols.ledger_api.custom_types import TransactionReceipt
 from packages.fetchai.protocols.ledger_api.dialogues import LedgerApiDialogue
 from packages.fetchai.protocols.ledger_api.dialogues import (
@@ -41,6 +51,8 @@ _default_logger = logging.getLogger(
     "aea.packages.fetchai.connections.ledger.ledger_dispatcher"
 )
 
+DEFAULT_NONCE_RELEASE_TIMEOUT = 120.0
+
 
 class LedgerApiDialogues(BaseLedgerApiDialogues):
     """The dialogues class keeps track of all dialogues."""
@@ -76,11 +88,35 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
     """Implement ledger API request dispatcher."""
 
     def __init__(self, *args, **kwargs):
-        """Initialize the dispatcher."""
+        """
+        Initialize the dispatcher.
+
+        Requests to Cosmos based ledgers are awaited on the event loop, instead
+        of being run in the executor, when an aiohttp session is passed as
+        'http_session'. Transaction receipts are waited for by the settlement
+        tracker passed as 'settlement_tracker', if any.
+
+        The nonces reserved by the Ethereum raw transactions are released if
+        no signed transaction is sent in the same dialogue within
+        'nonce_release_timeout' seconds, e.g. because the signing failed.
+        """
         logger = kwargs.pop("logger", None)
         logger = logger if logger is not None else _default_logger
+        self.http_session = kwargs.pop(
+            "http_session", None
+        )  # type: Optional[aiohttp.ClientSession]
+        self.settlement_tracker = kwargs.pop(
+            "settlement_tracker", None
+        )  # type: Optional[SettlementTracker]
+        self.nonce_release_timeout = float(
+            kwargs.pop("nonce_release_timeout", DEFAULT_NONCE_RELEASE_TIMEOUT)
+        )
         super().__init__(logger, *args, **kwargs)
         self._ledger_api_dialogues = LedgerApiDialogues()
+        self._unsent_nonces = (
+            OrderedDict()
+        )  # type: OrderedDict[DialogueLabel, Tuple[EthereumApi, Address, int, float]]
+        self._unsent_nonces_lock = threading.Lock()
 
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id from message."""
@@ -108,6 +144,36 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         """Get the dialouges."""
         return self._ledger_api_dialogues
 
+    def get_async_handler(
+        self, performative: Any, api: LedgerApi
+    ) -> Optional[Callable[[LedgerApi, Message, BaseDialogue], Awaitable[Message]]]:
+        """
+        Get the coroutine handler for tracked settlements and requests to Cosmos based ledgers.
+
+        :param performative: the message performative.
+        :param api: the ledger api.
+        :return: the coroutine function, or None.
+        """
+        if (
+            performative is LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT
+            and self.settlement_tracker is not None
+        ):
+            return cast(
+                Callable[[LedgerApi, Message, BaseDialogue], Awaitable[Message]],
+                self.track_transaction_receipt,
+            )
+        if self.http_session is None or not isinstance(api, _CosmosApi):
+            return None
+        return getattr(self, "async_" + performative.value, None)
+
+    def _async_api(self, api: LedgerApi) -> AsyncCosmosApi:
+        """Wrap a Cosmos based ledger api into its asynchronous variant."""
+        return AsyncCosmosApi(
+            cast(_CosmosApi, api),
+            cast(aiohttp.ClientSession, self.http_session),
+            logger=self.logger,
+        )
+
     def get_balance(
         self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
     ) -> LedgerApiMessage:
@@ -119,6 +185,29 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         :return: None
         """
         balance = api.get_balance(message.address)
+        return self._balance_response(balance, api, message, dialogue)
+
+    async def async_get_balance(
+        self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'get_balance' without blocking the event loop.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :return: the response
+        """
+        balance = await self._async_api(api).get_balance(message.address)
+        return self._balance_response(balance, api, message, dialogue)
+
+    def _balance_response(
+        self,
+        balance: Optional[int],
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """Build the response to a 'get_balance' request."""
         if balance is None:
             response = self.get_error_message(
                 ValueError("No balance returned"), api, message, dialogue
@@ -145,6 +234,7 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         :param message: the Ledger API message
         :return: None
         """
+        self._release_unsent_nonces()
         raw_transaction = api.get_transfer_transaction(
             sender_address=message.terms.sender_address,
             destination_address=message.terms.counterparty_address,
@@ -153,6 +243,37 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             tx_nonce=message.terms.nonce,
             **message.terms.kwargs,
         )
+        return self._raw_transaction_response(raw_transaction, api, message, dialogue)
+
+    async def async_get_raw_transaction(
+        self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'get_raw_transaction' without blocking the event loop.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :return: the response
+        """
+        self._release_unsent_nonces()
+        raw_transaction = await self._async_api(api).get_transfer_transaction(
+            sender_address=message.terms.sender_address,
+            destination_address=message.terms.counterparty_address,
+            amount=message.terms.sender_payable_amount,
+            tx_fee=message.terms.fee,
+            tx_nonce=message.terms.nonce,
+            **message.terms.kwargs,
+        )
+        return self._raw_transaction_response(raw_transaction, api, message, dialogue)
+
+    def _raw_transaction_response(
+        self,
+        raw_transaction: Optional[Any],
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """Build the response to a 'get_raw_transaction' request."""
         if raw_transaction is None:
             response = self.get_error_message(
                 ValueError("No raw transaction returned"), api, message, dialogue
@@ -168,8 +289,44 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
                     ),
                 ),
             )
+            nonce = (
+                raw_transaction.get("nonce")
+                if isinstance(raw_transaction, dict)
+                else None
+            )
+            if isinstance(api, EthereumApi) and isinstance(nonce, int):
+                with self._unsent_nonces_lock:
+                    self._unsent_nonces[dialogue.dialogue_label] = (
+                        api,
+                        message.terms.sender_address,
+                        nonce,
+                        time.monotonic() + self.nonce_release_timeout,
+                    )
         return response
 
+    def _release_unsent_nonces(self) -> None:
+        """
+        Release the nonces of the raw transactions not sent before the nonce release timeout.
+
+        :return: None
+        """
+        now = time.monotonic()
+        expired = []  # type: List[Tuple[EthereumApi, Address, int, float]]
+        with self._unsent_nonces_lock:
+            while self._unsent_nonces:
+                dialogue_label, unsent = next(iter(self._unsent_nonces.items()))
+                if unsent[3] > now:
+                    break
+                del self._unsent_nonces[dialogue_label]
+                expired.append(unsent)
+        for api, address, nonce, _ in expired:
+            self.logger.debug(
+                "releasing nonce {} of {}, its transaction was not sent.".format(
+                    nonce, address
+                )
+            )
+            api.release_nonce(address, nonce)
+
     def get_transaction_receipt(
         self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
     ) -> LedgerApiMessage:
@@ -203,6 +360,79 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             time.sleep(self.TIMEOUT)
             transaction = api.get_transaction(message.transaction_digest.body)
             attempts += 1
+        return self._transaction_receipt_response(
+            is_settled, transaction_receipt, transaction, api, message, dialogue
+        )
+
+    async def async_get_transaction_receipt(
+        self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'get_transaction_receipt' without blocking the event loop.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :return: the response
+        """
+        async_api = self._async_api(api)
+        transaction_receipt = None
+        is_settled = False
+        attempts = 0
+        while (
+            not is_settled
+            and attempts < self.MAX_ATTEMPTS
+            and self.connection_state.get() == ConnectionStates.connected
+        ):
+            await asyncio.sleep(self.TIMEOUT)
+            transaction_receipt = await async_api.get_transaction_receipt(
+                message.transaction_digest.body
+            )
+            is_settled = api.is_transaction_settled(transaction_receipt)
+            attempts += 1
+        attempts = 0
+        transaction = await async_api.get_transaction(message.transaction_digest.body)
+        while (
+            transaction is None
+            and attempts < self.MAX_ATTEMPTS
+            and self.connection_state.get() == ConnectionStates.connected
+        ):
+            await asyncio.sleep(self.TIMEOUT)
+            transaction = await async_api.get_transaction(
+                message.transaction_digest.body
+            )
+            attempts += 1
+        return self._transaction_receipt_response(
+            is_settled, transaction_receipt, transaction, api, message, dialogue
+        )
+
+    async def track_transaction_receipt(
+        self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'get_transaction_receipt' through the settlement tracker.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :return: the response
+        """
+        settlement_tracker = cast(SettlementTracker, self.settlement_tracker)
+        is_settled, transaction_receipt, transaction = await settlement_tracker.track(
+            message.transaction_digest.ledger_id, api, message.transaction_digest.body
+        )
+        return self._transaction_receipt_response(
+            is_settled, transaction_receipt, transaction, api, message, dialogue
+        )
+
+    def _transaction_receipt_response(  # pylint: disable=too-many-arguments
+        self,
+        is_settled: bool,
+        transaction_receipt: Optional[Any],
+        transaction: Optional[Any],
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """Build the response to a 'get_transaction_receipt' request."""
         if not is_settled:  # pragma: nocover
             response = self.get_error_message(
                 ValueError("Transaction not settled within timeout"),
@@ -243,9 +473,41 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         :param message: the Ledger API message
         :return: None
         """
+        # a rejected transaction makes the api sync the nonces of the sender again
+        with self._unsent_nonces_lock:
+            self._unsent_nonces.pop(dialogue.dialogue_label, None)
         transaction_digest = api.send_signed_transaction(
             message.signed_transaction.body
         )
+        return self._transaction_digest_response(
+            transaction_digest, api, message, dialogue
+        )
+
+    async def async_send_signed_transaction(
+        self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'send_signed_tx' without blocking the event loop.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :return: the response
+        """
+        transaction_digest = await self._async_api(api).send_signed_transaction(
+            message.signed_transaction.body
+        )
+        return self._transaction_digest_response(
+            transaction_digest, api, message, dialogue
+        )
+
+    def _transaction_digest_response(
+        self,
+        transaction_digest: Optional[str],
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """Build the response to a 'send_signed_transaction' request."""
         if transaction_digest is None:  # pragma: nocover
             response = self.get_error_message(
                 ValueError("No transaction_digest returned"), api, message, dialogue
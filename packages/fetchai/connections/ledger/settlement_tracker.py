@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains a tracker which polls the settlement of many transactions together."""
+import asyncio
+import logging
+from concurrent.futures._base import Executor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from aea.crypto.base import LedgerApi
+from aea.crypto.cosmos import _CosmosApi
+from aea.crypto.ethereum import EthereumApi
+
+from packages.fetchai.connections.ledger.cosmos_api import AsyncCosmosApi
+
+
+_default_logger = logging.getLogger(
+    "aea.packages.fetchai.connections.ledger.settlement_tracker"
+)
+
+DEFAULT_POLL_INTERVAL = 3.0
+DEFAULT_MAX_POLL_INTERVAL = 12.0
+DEFAULT_BACKOFF_FACTOR = 2.0
+DEFAULT_SETTLEMENT_TIMEOUT = 360.0
+
+ReceiptAndTransaction = Tuple[Optional[Any], Optional[Any]]
+BatchFetcher = Callable[[List[str]], Awaitable[List[ReceiptAndTransaction]]]
+
+
+def _get_transaction_receipts(
+    api: LedgerApi, tx_digests: List[str]
+) -> List[ReceiptAndTransaction]:
+    """
+    Get the receipts and the transactions of several transactions, one by one.
+
+    :param api: the ledger api.
+    :param tx_digests: the digests associated to the transactions.
+    :return: the tx receipt and the tx of each digest.
+    """
+    result = []  # type: List[ReceiptAndTransaction]
+    for tx_digest in tx_digests:
+        tx_receipt = api.get_transaction_receipt(tx_digest)
+        tx = (
+            api.get_transaction(tx_digest)
+            if api.is_transaction_settled(tx_receipt)
+            else None
+        )
+        result.append((tx_receipt, tx))
+    return result
+
+
+class _PendingTransaction:
+    """A transaction waiting for settlement, and the futures waiting for it."""
+
+    def __init__(self, deadline: float):
+        """
+        Initialize the pending transaction.
+
+        :param deadline: the loop time after which the transaction is given up.
+        """
+        self.deadline = deadline
+        self.futures = []  # type: List[asyncio.Future]
+
+
+class _LedgerPoller:
+    """Poll the pending transactions of one ledger together."""
+
+    def __init__(self, tracker: "SettlementTracker", api: LedgerApi):
+        """
+        Initialize the poller.
+
+        :param tracker: the settlement tracker.
+        :param api: the ledger api.
+        """
+        self.tracker = tracker
+        self.api = api
+        self.fetch = tracker.get_batch_fetcher(api)
+        self.pending = {}  # type: Dict[str, _PendingTransaction]
+        self.interval = tracker.poll_interval
+        self.next_poll = 0.0
+        self.task = None  # type: Optional[asyncio.Task]
+        self._rescheduled = asyncio.Event()
+
+    def add(self, tx_digest: str) -> asyncio.Future:
+        """
+        Add a transaction to poll, and poll soon.
+
+        :param tx_digest: the transaction digest.
+        :return: a future which resolves to the settlement of the transaction.
+        """
+        loop = self.tracker.loop
+        future = loop.create_future()
+        pending_transaction = self.pending.get(tx_digest)
+        if pending_transaction is None:
+            pending_transaction = _PendingTransaction(
+                loop.time() + self.tracker.settlement_timeout
+            )
+            self.pending[tx_digest] = pending_transaction
+        pending_transaction.futures.append(future)
+
+        self.interval = self.tracker.poll_interval
+        next_poll = loop.time() + self.interval
+        if self.task is None:
+            self.next_poll = next_poll
+            self.task = loop.create_task(self._run())
+        elif next_poll < self.next_poll:
+            self.next_poll = next_poll
+            self._rescheduled.set()
+        return future
+
+    def stop(self) -> None:
+        """Stop polling and cancel the futures waiting for settlements."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        for pending_transaction in self.pending.values():
+            for future in pending_transaction.futures:
+                future.cancel()
+        self.pending = {}
+
+    async def _run(self) -> None:
+        """Poll until no transaction is pending."""
+        while len(self.pending) > 0:
+            await self._wait_next_poll()
+            await self._poll()
+        self.task = None
+
+    async def _wait_next_poll(self) -> None:
+        """Wait for the next poll, which gets earlier when transactions are added."""
+        delay = self.next_poll - self.tracker.loop.time()
+        while delay > 0:
+            self._rescheduled.clear()
+            try:
+                await asyncio.wait_for(self._rescheduled.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = self.next_poll - self.tracker.loop.time()
+
+    async def _poll(self) -> None:
+        """Poll all the pending transactions at once, and resolve the settled ones."""
+        tx_digests = list(self.pending.keys())
+        try:
+            results = await self.fetch(tx_digests)
+        except Exception as e:  # pylint: disable=broad-except
+            self.tracker.logger.warning(
+                "Encountered exception when trying to get transaction receipts: {}".format(
+                    e
+                )
+            )
+            results = [(None, None)] * len(tx_digests)
+
+        now = self.tracker.loop.time()
+        any_settled = False
+        for tx_digest, (tx_receipt, tx) in zip(tx_digests, results):
+            pending_transaction = self.pending[tx_digest]
+            pending_transaction.futures = [
+                future for future in pending_transaction.futures if not future.done()
+            ]
+            is_settled = self.api.is_transaction_settled(tx_receipt) and tx is not None
+            if (
+                is_settled
+                or now >= pending_transaction.deadline
+                or len(pending_transaction.futures) == 0
+            ):
+                self.pending.pop(tx_digest)
+                for future in pending_transaction.futures:
+                    future.set_result((is_settled, tx_receipt, tx))
+                any_settled = any_settled or is_settled
+
+        if any_settled:
+            self.interval = self.tracker.poll_interval
+        else:
+            self.interval = min(
+                self.interval * self.tracker.backoff_factor,
+                self.tracker.max_poll_interval,
+            )
+        self.next_poll = self.tracker.loop.time() + self.interval
+
+
+class SettlementTracker:
+    """
+    Wait for the settlement of many transactions with few requests.
+
+    The pending transactions of a ledger are polled together, in a single batch
+    request when the ledger api supports it. The interval between two polls grows
+    exponentially while no transaction settles, and goes back to the initial
+    interval when a transaction settles or a new one is tracked.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        executor: Optional[Executor] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
+        logger: logging.Logger = _default_logger,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        settlement_timeout: float = DEFAULT_SETTLEMENT_TIMEOUT,
+    ):
+        """
+        Initialize the settlement tracker.
+
+        :param loop: the asyncio loop.
+        :param executor: the executor of the requests of synchronous ledger apis.
+        :param http_session: the aiohttp session for Cosmos based ledgers, if any.
+        :param logger: the logger.
+        :param poll_interval: the initial interval between two polls, in seconds.
+        :param max_poll_interval: the maximum interval between two polls, in seconds.
+        :param backoff_factor: the growth of the interval after a poll without settlements.
+        :param settlement_timeout: the time after which a transaction is reported as not settled, in seconds.
+        """
+        self.loop = loop if loop is not None else asyncio.get_event_loop()
+        self.executor = executor
+        self.http_session = http_session
+        self.logger = logger
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.backoff_factor = backoff_factor
+        self.settlement_timeout = settlement_timeout
+        self._pollers = {}  # type: Dict[str, _LedgerPoller]
+
+    @property
+    def nb_pending(self) -> int:
+        """Get the number of transactions waiting for settlement."""
+        return sum(len(poller.pending) for poller in self._pollers.values())
+
+    def track(self, ledger_id: str, api: LedgerApi, tx_digest: str) -> asyncio.Future:
+        """
+        Track the settlement of a transaction.
+
+        :param ledger_id: the ledger id.
+        :param api: the ledger api, used for the first transaction of the ledger.
+        :param tx_digest: the transaction digest.
+        :return: a future which resolves to whether the transaction is settled, its receipt and the transaction.
+        """
+        poller = self._pollers.get(ledger_id)
+        if poller is None:
+            poller = _LedgerPoller(self, api)
+            self._pollers[ledger_id] = poller
+        return poller.add(tx_digest)
+
+    def stop(self) -> None:
+        """Stop tracking, and cancel the pending settlements."""
+        for poller in self._pollers.values():
+            poller.stop()
+        self._pollers = {}
+
+    def get_batch_fetcher(self, api: LedgerApi) -> BatchFetcher:
+        """
+        Get the coroutine function which fetches the receipts and the transactions of several transactions.
+
+        :param api: the ledger api.
+        :return: the coroutine function.
+        """
+        if isinstance(api, EthereumApi):
+            ethereum_api = api
+
+            async def fetch_batch(
+                tx_digests: List[str],
+            ) -> List[ReceiptAndTransaction]:
+                return await self.loop.run_in_executor(
+                    self.executor,
+                    ethereum_api.batch_get_transaction_receipts,
+                    tx_digests,
+                )
+
+            return fetch_batch
+
+        if isinstance(api, _CosmosApi) and self.http_session is not None:
+            return AsyncCosmosApi(
+                api, self.http_session, logger=self.logger
+            ).batch_get_transaction_receipts
+
+        async def fetch_each(tx_digests: List[str]) -> List[ReceiptAndTransaction]:
+            return await self.loop.run_in_executor(
+                self.executor, _get_transaction_receipts, api, tx_digests
+            )
+
+        return fetch_each
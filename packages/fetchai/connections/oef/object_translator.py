@@ -20,6 +20,8 @@
 """Extension to the OEF Python SDK."""
 
 import logging
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Sequence, Tuple, TypeVar
 
 from oef.query import And as OEFAnd
 from oef.query import Constraint as OEFConstraint
@@ -55,13 +57,173 @@ from aea.helpers.search.models import (
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.oef")
 
+DEFAULT_CACHE_SIZE = 256
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """A mapping bounded in size, which evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        :param maxsize: the maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Get the entry for a key, computing and storing it on a miss.
+
+        :param key: the key.
+        :param compute: the function computing the entry.
+        :return: the entry.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _value_key(value: Any) -> Tuple:
+    """
+    Get a structural key of an attribute or constraint value.
+
+    The type is part of the key, as e.g. 1, 1.0 and True are equal but translate differently.
+
+    :param value: the value.
+    :return: the key.
+    """
+    if isinstance(value, Location):
+        return (Location, value.latitude, value.longitude)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_value_key(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_value_key(item) for item in value))
+    if isinstance(value, (str, int, float, bool)):
+        return (type(value), value)
+    raise TypeError("Value {!r} has no structural key.".format(value))
+
+
+def _data_model_key(data_model: DataModel) -> Tuple:
+    """Get a structural key of a data model."""
+    attributes = tuple(
+        (attribute.name, attribute.type, attribute.is_required, attribute.description)
+        for attribute in data_model.attributes
+    )
+    return (data_model.name, attributes, data_model.description)
+
+
+def _description_key(desc: Description) -> Tuple:
+    """Get a structural key of a description."""
+    values = tuple(
+        sorted((key, _value_key(value)) for key, value in desc.values.items())
+    )
+    data_model = (
+        _data_model_key(desc.data_model) if desc.data_model is not None else None
+    )
+    return (values, data_model)
+
+
+def _constraint_expr_key(constraint_expr: ConstraintExpr) -> Tuple:
+    """Get a structural key of a constraint expression."""
+    if isinstance(constraint_expr, (And, Or)):
+        return (
+            type(constraint_expr),
+            tuple(_constraint_expr_key(c) for c in constraint_expr.constraints),
+        )
+    if isinstance(constraint_expr, Not):
+        return (Not, _constraint_expr_key(constraint_expr.constraint))
+    if isinstance(constraint_expr, Constraint):
+        constraint_type = constraint_expr.constraint_type
+        return (
+            Constraint,
+            constraint_expr.attribute_name,
+            constraint_type.type,
+            _value_key(constraint_type.value),
+        )
+    raise TypeError("Constraint expression has no structural key.")
+
+
+def _query_key(query: Query) -> Tuple:
+    """Get a structural key of a query."""
+    constraints = tuple(_constraint_expr_key(c) for c in query.constraints)
+    model = _data_model_key(query.model) if query.model is not None else None
+    return (constraints, model)
+
 
 class OEFObjectTranslator:
-    """Translate our OEF object to object of OEF SDK classes."""
+    """
+    Translate our OEF object to object of OEF SDK classes.
+
+    Translations of descriptions, data models and queries are memoized in LRU caches,
+    keyed by the structure of the translated object. The cached OEF SDK objects are
+    shared, so they must not be modified.
+    """
+
+    description_cache = LRUCache()
+    data_model_cache = LRUCache()
+    query_cache = LRUCache()
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear the translation caches."""
+        cls.description_cache.clear()
+        cls.data_model_cache.clear()
+        cls.query_cache.clear()
+
+    @staticmethod
+    def _cached(
+        cache: LRUCache,
+        key_fn: Callable[[Any], Hashable],
+        obj: Any,
+        translate: Callable[[Any], T],
+    ) -> T:
+        """Translate an object through a cache, or directly if it has no structural key."""
+        try:
+            key = key_fn(obj)
+        except TypeError:
+            return translate(obj)
+        return cache.get_or_compute(key, lambda: translate(obj))
 
     @classmethod
     def to_oef_description(cls, desc: Description) -> OEFDescription:
         """From our description to OEF description."""
+        return cls._cached(
+            cls.description_cache, _description_key, desc, cls._to_oef_description
+        )
+
+    @classmethod
+    def to_oef_descriptions(cls, descs: Sequence[Description]) -> List[OEFDescription]:
+        """From a batch of our descriptions to OEF descriptions."""
+        return [cls.to_oef_description(desc) for desc in descs]
+
+    @classmethod
+    def _to_oef_description(cls, desc: Description) -> OEFDescription:
+        """From our description to OEF description, without caching."""
         oef_data_model = (
             cls.to_oef_data_model(desc.data_model)
             if desc.data_model is not None
@@ -103,6 +265,13 @@ class OEFObjectTranslator:
     @classmethod
     def to_oef_data_model(cls, data_model: DataModel) -> OEFDataModel:
         """From our data model to OEF data model."""
+        return cls._cached(
+            cls.data_model_cache, _data_model_key, data_model, cls._to_oef_data_model
+        )
+
+    @classmethod
+    def _to_oef_data_model(cls, data_model: DataModel) -> OEFDataModel:
+        """From our data model to OEF data model, without caching."""
         oef_attributes = [
             cls.to_oef_attribute(attribute) for attribute in data_model.attributes
         ]
@@ -120,6 +289,11 @@ class OEFObjectTranslator:
     @classmethod
     def to_oef_query(cls, query: Query) -> OEFQuery:
         """From our query to OEF query."""
+        return cls._cached(cls.query_cache, _query_key, query, cls._to_oef_query)
+
+    @classmethod
+    def _to_oef_query(cls, query: Query) -> OEFQuery:
+        """From our query to OEF query, without caching."""
         oef_data_model = (
             cls.to_oef_data_model(query.model) if query.model is not None else None
         )
@@ -24,8 +24,9 @@ import logging
 import random
 import struct
 from asyncio import CancelledError
+from collections import deque
 from random import randint
-from typing import List, Optional, Union, cast
+from typing import Deque, List, Optional, cast
 
 from aea.configurations.base import PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
@@ -43,6 +44,11 @@ PUBLIC_ID = PublicId.from_str("fetchai/p2p_libp2p_client:0.9.0")
 
 SUPPORTED_LEDGER_IDS = ["fetchai", "cosmos", "ethereum"]
 
+DEFAULT_RECONNECT_BACKOFF_INITIAL = 0.5
+DEFAULT_RECONNECT_BACKOFF_MAX = 30.0
+DEFAULT_SEND_BUFFER_SIZE = 1000
+DEFAULT_DELEGATE_CONNECTIONS = 1
+
 
 class Uri:
     """Holds a node address in format "host:port"."""
@@ -84,12 +90,182 @@ class Uri:
         return self._port
 
 
+class DelegateLink:
+    """A single tcp stream to the delegate service of a libp2p node."""
+
+    def __init__(self, uri: Uri, logger: logging.Logger = _default_logger):
+        """
+        Initialize a delegate link.
+
+        :param uri: the uri of the delegate service.
+        :param logger: the logger.
+        """
+        self.uri = uri
+        self.logger = logger
+        self._reader = None  # type: Optional[asyncio.StreamReader]
+        self._writer = None  # type: Optional[asyncio.StreamWriter]
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether the link is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def open(self, address: str) -> None:
+        """
+        Open the tcp stream and register the agent address with the delegate.
+
+        :param address: the agent address.
+        :return: None
+        """
+        self._reader, self._writer = await asyncio.open_connection(
+            self.uri.host, self.uri.port
+        )
+        await self.send(bytes(address, "utf-8"))
+        ack = await self.receive()
+        if ack is None:
+            await self.close()
+            raise ConnectionError(
+                "Delegate {} closed the link during setup.".format(self.uri)
+            )
+
+    async def send(self, data: bytes) -> None:
+        """
+        Send a length-prefixed frame.
+
+        :param data: the frame payload.
+        :return: None
+        """
+        if self._writer is None:
+            raise ValueError("Writer is not set.")  # pragma: nocover
+        size = struct.pack("!I", len(data))
+        self._writer.write(size)
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def receive(self) -> Optional[bytes]:
+        """
+        Receive a length-prefixed frame.
+
+        :return: the frame payload, or None if the link was closed.
+        """
+        if self._reader is None:
+            raise ValueError("Reader is not set.")  # pragma: nocover
+        try:
+            self.logger.debug("Waiting for messages...")
+            buf = await self._reader.readexactly(4)
+            if not buf:  # pragma: no cover
+                return None
+            size = struct.unpack("!I", buf)[0]
+            data = await self._reader.readexactly(size)
+            if not data:  # pragma: no cover
+                return None
+            return data
+        except asyncio.IncompleteReadError as e:
+            self.logger.info(
+                "Connection disconnected while reading from node {} ({}/{})".format(
+                    self.uri, len(e.partial), e.expected
+                )
+            )
+            return None
+        except ConnectionError as e:
+            self.logger.info(
+                "Connection to node {} lost while reading: {}".format(self.uri, e)
+            )
+            return None
+
+    async def close(self) -> None:
+        """
+        Close the tcp stream.
+
+        :return: None
+        """
+        if self._writer is None:
+            return
+        writer = self._writer
+        self._writer = None
+        try:
+            if writer.can_write_eof() and not writer.is_closing():
+                writer.write_eof()
+                await writer.drain()
+        except (OSError, RuntimeError):  # pragma: nocover
+            pass
+        writer.close()
+
+
+class SendBuffer:
+    """
+    Bounded FIFO of outgoing frames, shared by all the delegate links.
+
+    Frames that could not be written because a link dropped are put back at
+    the head of the buffer, so they survive reconnections.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SEND_BUFFER_SIZE):
+        """
+        Initialize the buffer.
+
+        :param maxsize: the maximum number of frames buffered by `put`.
+        """
+        enforce(maxsize > 0, "Send buffer size must be positive.")
+        self._maxsize = maxsize
+        self._items = deque()  # type: Deque[bytes]
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        """Get the number of buffered frames."""
+        return len(self._items)
+
+    async def put(self, data: bytes) -> None:
+        """
+        Append a frame, waiting while the buffer is full.
+
+        :param data: the frame.
+        :return: None
+        """
+        while len(self._items) >= self._maxsize:
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._items.append(data)
+        self._not_empty.set()
+
+    def put_back(self, data: bytes) -> None:
+        """
+        Put a frame back at the head of the buffer, regardless of the bound.
+
+        :param data: the frame.
+        :return: None
+        """
+        self._items.appendleft(data)
+        self._not_empty.set()
+
+    async def get(self) -> bytes:
+        """
+        Pop the next frame, waiting while the buffer is empty.
+
+        :return: the frame.
+        """
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        data = self._items.popleft()
+        if len(self._items) < self._maxsize:
+            self._not_full.set()
+        return data
+
+
 class P2PLibp2pClientConnection(Connection):
     """
     A libp2p client connection.
 
     Send and receive envelopes to and from agents on the p2p network without deploying a libp2p node.
     Connect to the libp2p node using traffic delegation service.
+
+    Each of the `delegate_connections` links is supervised: when a delegate drops,
+    the link is reopened in the background with exponential backoff, failing over
+    to the other configured delegates. Outgoing envelopes are buffered while no
+    link is available and are striped over all the open links.
     """
 
     connection_id = PUBLIC_ID
@@ -141,21 +317,56 @@ class P2PLibp2pClientConnection(Connection):
         self.delegate_certs = []
 
         # select a delegate
-        index = random.randint(0, len(self.delegate_uris) - 1)  # nosec
-        self.node_uri = self.delegate_uris[index]
+        self._delegate_index = random.randint(0, len(self.delegate_uris) - 1)  # nosec
+        self.node_uri = self.delegate_uris[self._delegate_index]
         self.logger.debug("Node to use as delegate: {}".format(self.node_uri))
 
-        # tcp connection
-        self._reader = None  # type: Optional[asyncio.StreamReader]
-        self._writer = None  # type: Optional[asyncio.StreamWriter]
+        # reconnection, buffering and striping
+        self._reconnect_backoff_initial = float(
+            self.configuration.config.get(
+                "reconnect_backoff_initial", DEFAULT_RECONNECT_BACKOFF_INITIAL
+            )
+        )
+        self._reconnect_backoff_max = float(
+            self.configuration.config.get(
+                "reconnect_backoff_max", DEFAULT_RECONNECT_BACKOFF_MAX
+            )
+        )
+        self._send_buffer_size = int(
+            self.configuration.config.get("send_buffer_size", DEFAULT_SEND_BUFFER_SIZE)
+        )
+        self._nb_delegate_connections = int(
+            self.configuration.config.get(
+                "delegate_connections", DEFAULT_DELEGATE_CONNECTIONS
+            )
+        )
+        enforce(
+            self._nb_delegate_connections > 0,
+            "At least one delegate connection is required.",
+        )
+        enforce(
+            0 < self._reconnect_backoff_initial <= self._reconnect_backoff_max,
+            "Reconnect backoff must satisfy 0 < initial <= max.",
+        )
 
+        self._links = []  # type: List[Optional[DelegateLink]]
+        self._link_tasks = []  # type: List[asyncio.Future]
+        self._send_buffer = None  # type: Optional[SendBuffer]
         self._in_queue = None  # type: Optional[asyncio.Queue]
-        self._process_messages_task = None  # type: Union[asyncio.Future, None]
+        self.nb_reconnections = 0
+
+    @property
+    def nb_open_links(self) -> int:
+        """Get the number of delegate links currently open."""
+        return len([link for link in self._links if link is not None and link.is_open])
 
     async def connect(self) -> None:
         """
         Set up the connection.
 
+        Each delegate link must be opened once, possibly failing over to other
+        delegates, for the connection to be considered connected.
+
         :return: None
         """
         if self.is_connected:  # pragma: nocover
@@ -163,36 +374,145 @@ class P2PLibp2pClientConnection(Connection):
 
         self._state.set(ConnectionStates.connecting)
 
+        links = []  # type: List[DelegateLink]
         try:
-            # connect libp2p client
-
-            # connect the tcp socket
-            self._reader, self._writer = await asyncio.open_connection(
-                self.node_uri.host,
-                self.node_uri._port,  # pylint: disable=protected-access
-                loop=self.loop,
-            )
+            for slot in range(self._nb_delegate_connections):
+                links.append(await self._open_link(slot))
 
-            # send agent address to node
-            await self._setup_connection()
-
-            self.logger.info(
-                "Successfully connected to libp2p node {}".format(str(self.node_uri))
-            )
-
-            # start receiving msgs
             self._in_queue = asyncio.Queue()
-            self._process_messages_task = asyncio.ensure_future(
-                self._process_messages(), loop=self.loop
-            )
+            self._send_buffer = SendBuffer(self._send_buffer_size)
+            self._links = list(links)
+            self._link_tasks = [
+                asyncio.ensure_future(self._supervise_link(slot))
+                for slot in range(len(self._links))
+            ]
             self._state.set(ConnectionStates.connected)
         except (CancelledError, Exception) as e:
+            for link in links:
+                await link.close()
             self._state.set(ConnectionStates.disconnected)
             raise e
 
-    async def _setup_connection(self):
-        await self._send(bytes(self.address, "utf-8"))
-        await self._receive()
+    async def _open_link(self, slot: int) -> DelegateLink:
+        """
+        Open a link for a slot, trying every delegate once.
+
+        Slots start from different delegates so that striped links are spread
+        over the configured nodes.
+
+        :param slot: the link slot.
+        :return: the open link.
+        """
+        last_error = None  # type: Optional[Exception]
+        nb_delegates = len(self.delegate_uris)
+        for offset in range(nb_delegates):
+            uri = self.delegate_uris[
+                (self._delegate_index + slot + offset) % nb_delegates
+            ]
+            link = DelegateLink(uri, self.logger)
+            try:
+                await link.open(self.address)
+            except (OSError, asyncio.IncompleteReadError) as e:
+                self.logger.debug(
+                    "Could not connect to libp2p node {}: {}".format(uri, e)
+                )
+                await link.close()
+                last_error = e
+                continue
+            if slot == 0:
+                self.node_uri = uri
+            self.logger.info("Successfully connected to libp2p node {}".format(uri))
+            return link
+        raise ConnectionError(
+            "Could not connect to any of the delegates {}: {}".format(
+                self.delegate_uris, last_error
+            )
+        )
+
+    async def _supervise_link(self, slot: int) -> None:
+        """
+        Serve a link slot and reopen it with exponential backoff when it drops.
+
+        :param slot: the link slot.
+        :return: None
+        """
+        backoff = self._reconnect_backoff_initial
+        while True:
+            link = self._links[slot]
+            if link is None:
+                # jitter avoids every client of a failed delegate reconnecting in lockstep
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))  # nosec
+                backoff = min(backoff * 2, self._reconnect_backoff_max)
+                try:
+                    link = await self._open_link(slot)
+                except ConnectionError as e:
+                    self.logger.debug(str(e))
+                    continue
+                self._links[slot] = link
+                self.nb_reconnections += 1
+                backoff = self._reconnect_backoff_initial
+
+            await self._serve_link(link)
+            self._links[slot] = None
+            await link.close()
+            self.logger.warning(
+                "Lost connection to libp2p node {}, reconnecting...".format(link.uri)
+            )
+
+    async def _serve_link(self, link: DelegateLink) -> None:
+        """
+        Pump frames in both directions until the link breaks.
+
+        :param link: the open link.
+        :return: None
+        """
+        tasks = [
+            asyncio.ensure_future(self._receive_from_link(link)),
+            asyncio.ensure_future(self._send_to_link(link)),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _receive_from_link(self, link: DelegateLink) -> None:
+        """
+        Forward received frames to the input queue until the link is closed.
+
+        :param link: the open link.
+        :return: None
+        """
+        while True:
+            data = await link.receive()
+            if data is None:
+                return
+            if self._in_queue is None:
+                raise ValueError("Input queue not initialized.")  # pragma: nocover
+            self._in_queue.put_nowait(data)
+
+    async def _send_to_link(self, link: DelegateLink) -> None:
+        """
+        Write buffered frames to the link until a write fails.
+
+        :param link: the open link.
+        :return: None
+        """
+        if self._send_buffer is None:
+            raise ValueError("Send buffer not initialized.")  # pragma: nocover
+        while True:
+            data = await self._send_buffer.get()
+            try:
+                await link.send(data)
+            except (CancelledError, Exception) as e:  # pylint: disable=broad-except
+                self._send_buffer.put_back(data)
+                if isinstance(e, CancelledError):
+                    raise
+                self.logger.debug(
+                    "Failed to write to libp2p node {}: {}".format(link.uri, e)
+                )
+                return
 
     async def disconnect(self) -> None:
         """
@@ -202,20 +522,25 @@ class P2PLibp2pClientConnection(Connection):
         """
         if self.is_disconnected:  # pragma: nocover
             return
-        if self._process_messages_task is None:
-            raise ValueError("Message task is not set.")  # pragma: nocover
-        if self._writer is None:
-            raise ValueError("Writer is not set.")  # pragma: nocover
         self._state.set(ConnectionStates.disconnecting)
-        if self._process_messages_task is not None:
-            self._process_messages_task.cancel()
-            # TOFIX(LR) mypy issue https://github.com/python/mypy/issues/8546
-            # self._process_messages_task = None # noqa: E800
 
         self.logger.debug("disconnecting libp2p client connection...")
-        self._writer.write_eof()
-        await self._writer.drain()
-        self._writer.close()
+        for task in self._link_tasks:
+            task.cancel()
+        await asyncio.gather(*self._link_tasks, return_exceptions=True)
+        self._link_tasks = []
+        for link in self._links:
+            if link is not None:
+                await link.close()
+        self._links = []
+
+        if self._send_buffer is not None and len(self._send_buffer) > 0:
+            self.logger.warning(
+                "Dropping {} buffered envelopes on disconnect.".format(
+                    len(self._send_buffer)
+                )
+            )
+        self._send_buffer = None
 
         if self._in_queue is not None:
             self._in_queue.put_nowait(None)
@@ -238,7 +563,6 @@ class P2PLibp2pClientConnection(Connection):
                 if not self.is_disconnected:
                     await self.disconnect()
                 return None
-                # TOFIX(LR) attempt restarting the node?
             self.logger.debug("Received data: {}".format(data))
             return Envelope.decode(data)
         except CancelledError:  # pragma: no cover
@@ -252,50 +576,12 @@ class P2PLibp2pClientConnection(Connection):
         """
         Send messages.
 
-        :return: None
-        """
-        self._ensure_valid_envelope_for_external_comms(envelope)
-        await self._send(envelope.encode())
-
-    async def _process_messages(self) -> None:
-        """
-        Receive data from node.
+        The envelope is buffered until one of the delegate links can write it;
+        this only waits when the send buffer is full.
 
         :return: None
         """
-        while True:
-            data = await self._receive()
-            if self._in_queue is None:
-                raise ValueError("Input queue not initialized.")  # pragma: nocover
-            self._in_queue.put_nowait(data)
-            if data is None:
-                break  # pragma: no cover
-
-    async def _send(self, data: bytes) -> None:
-        if self._writer is None:
-            raise ValueError("Writer is not set.")  # pragma: nocover
-        size = struct.pack("!I", len(data))
-        self._writer.write(size)
-        self._writer.write(data)
-        await self._writer.drain()
-
-    async def _receive(self) -> Optional[bytes]:
-        if self._reader is None:
-            raise ValueError("Reader is not set.")  # pragma: nocover
-        try:
-            self.logger.debug("Waiting for messages...")
-            buf = await self._reader.readexactly(4)
-            if not buf:  # pragma: no cover
-                return None
-            size = struct.unpack("!I", buf)[0]
-            data = await self._reader.readexactly(size)
-            if not data:  # pragma: no cover
-                return None
-            return data
-        except asyncio.streams.IncompleteReadError as e:  # pragma: no cover
-            self.logger.info(
-                "Connection disconnected while reading from node ({}/{})".format(
-                    len(e.partial), e.expected
-                )
-            )
-            return None
+        self._ensure_valid_envelope_for_external_comms(envelope)
+        if self._send_buffer is None:
+            raise ValueError("Send buffer not initialized.")  # pragma: nocover
+        await self._send_buffer.put(envelope.encode())
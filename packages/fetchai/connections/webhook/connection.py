@@ -22,7 +22,7 @@ import asyncio
 import json
 import logging
 from asyncio import CancelledError
-from typing import Optional, Union, cast
+from typing import Dict, Optional, Union, cast
 
 from aiohttp import web  # type: ignore
 
@@ -41,7 +41,14 @@ from packages.fetchai.protocols.http.message import HttpMessage
 SUCCESS = 200
 NOT_FOUND = 404
 REQUEST_TIMEOUT = 408
+PAYLOAD_TOO_LARGE = 413
+TOO_MANY_REQUESTS = 429
 SERVER_ERROR = 500
+SERVICE_UNAVAILABLE = 503
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_BODY_SIZE = 1024 ** 2
+DEFAULT_OFFLOAD_BODY_SIZE = 64 * 1024
+DEFAULT_RETRY_AFTER = 1
 PUBLIC_ID = PublicId.from_str("fetchai/webhook:0.10.0")
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.webhook")
@@ -90,6 +97,9 @@ class WebhookChannel:
         webhook_url_path: str,
         connection_id: PublicId,
         logger: logging.Logger = _default_logger,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        offload_body_size: int = DEFAULT_OFFLOAD_BODY_SIZE,
+        retry_after: int = DEFAULT_RETRY_AFTER,
     ):
         """
         Initialize a webhook channel.
@@ -99,6 +109,9 @@ class WebhookChannel:
         :param webhook_port: webhook port number
         :param webhook_url_path: the url path to receive webhooks from
         :param connection_id: the connection id
+        :param max_body_size: the maximum size in bytes of a request body
+        :param offload_body_size: the body size in bytes above which requests are converted off the event loop
+        :param retry_after: the seconds clients are asked to wait when a request is shed
         """
         self.agent_address = agent_address
 
@@ -112,6 +125,12 @@ class WebhookChannel:
 
         self.is_stopped = True
 
+        self.max_body_size = max_body_size
+        self.offload_body_size = offload_body_size
+        self.retry_after = retry_after
+        self.nb_accepted = 0
+        self.nb_rejected = 0
+
         self.connection_id = connection_id
         self.in_queue = None  # type: Optional[asyncio.Queue]  # pragma: no cover
         self.logger = logger
@@ -126,7 +145,7 @@ class WebhookChannel:
         :return: None
         """
         if self.is_stopped:
-            self.app = web.Application()
+            self.app = web.Application(client_max_size=self.max_body_size)
             self.app.add_routes(
                 [web.post(self.webhook_url_path, self._receive_webhook)]
             )
@@ -160,18 +179,57 @@ class WebhookChannel:
             self.logger.info("Webhook app is shutdown.")
             self.is_stopped = True
 
+    @property
+    def nb_queued(self) -> int:
+        """Get the number of webhooks waiting to be picked up by the agent."""
+        return self.in_queue.qsize() if self.in_queue is not None else 0
+
+    def _reject(self, status: int, reason: str) -> web.Response:
+        """
+        Reject a webhook request.
+
+        :param status: the http status code
+        :param reason: the reason of the rejection
+        :return: the http response
+        """
+        self.nb_rejected += 1
+        self.logger.debug("Rejecting webhook request: {}".format(reason))
+        headers = (
+            {"Retry-After": str(self.retry_after)}
+            if status in (TOO_MANY_REQUESTS, SERVICE_UNAVAILABLE)
+            else None
+        )
+        return web.Response(status=status, text=reason, headers=headers)
+
     async def _receive_webhook(self, request: web.Request) -> web.Response:
         """
         Receive a webhook request.
 
         Get webhook request, turn it to envelop and send it to the agent to be picked up.
+        Requests are shed before their body is read when the agent is not keeping up.
 
         :param request: the webhook request
-        :return: Http response with a 200 code
+        :return: Http response with a 200 code, or an error code if the request is rejected
         """
-        webhook_envelop = await self.to_envelope(request)
-        self.in_queue.put_nowait(webhook_envelop)  # type: ignore
-        return web.Response(status=200)
+        if self.is_stopped or self.in_queue is None:
+            return self._reject(SERVICE_UNAVAILABLE, "Webhook is not connected.")
+        if self.in_queue.full():
+            return self._reject(TOO_MANY_REQUESTS, "Webhook queue is full.")
+        if (
+            request.content_length is not None
+            and request.content_length > self.max_body_size
+        ):
+            return self._reject(PAYLOAD_TOO_LARGE, "Request body is too large.")
+        try:
+            webhook_envelop = await self.to_envelope(request)
+        except web.HTTPRequestEntityTooLarge:
+            return self._reject(PAYLOAD_TOO_LARGE, "Request body is too large.")
+        try:
+            self.in_queue.put_nowait(webhook_envelop)
+        except asyncio.QueueFull:
+            return self._reject(TOO_MANY_REQUESTS, "Webhook queue is full.")
+        self.nb_accepted += 1
+        return web.Response(status=SUCCESS)
 
     async def send(self, envelope: Envelope) -> None:
         """
@@ -197,16 +255,22 @@ class WebhookChannel:
         payload_bytes = await request.read()
         version = str(request.version[0]) + "." + str(request.version[1])
 
-        context = EnvelopeContext(connection_id=WebhookConnection.connection_id)
-        http_message, _ = self._dialogues.create(
-            counterparty=self.agent_address,
-            performative=HttpMessage.Performative.REQUEST,
-            method=request.method,
-            url=str(request.url),
-            version=version,
-            headers=json.dumps(dict(request.headers)),
-            body=payload_bytes if payload_bytes is not None else b"",
+        args = (
+            request.method,
+            str(request.url),
+            version,
+            dict(request.headers),
+            payload_bytes if payload_bytes is not None else b"",
         )
+        if len(args[-1]) > self.offload_body_size:
+            http_message = await asyncio.get_event_loop().run_in_executor(
+                None, self._to_http_message, *args
+            )
+        else:
+            http_message = self._to_http_message(*args)
+        self._dialogues.create_with_message(self.agent_address, http_message)
+
+        context = EnvelopeContext(connection_id=WebhookConnection.connection_id)
         envelope = Envelope(
             to=http_message.to,
             sender=http_message.sender,
@@ -216,6 +280,27 @@ class WebhookChannel:
         )
         return envelope
 
+    @staticmethod
+    def _to_http_message(
+        method: str, url: str, version: str, headers: Dict[str, str], body: bytes
+    ) -> HttpMessage:
+        """
+        Build the initial http request message of a webhook.
+
+        This does not touch the dialogues, so it can run off the event loop.
+
+        :return: the http message, without sender and receiver
+        """
+        return HttpMessage(
+            dialogue_reference=HttpDialogues.new_self_initiated_dialogue_reference(),
+            performative=HttpMessage.Performative.REQUEST,
+            method=method,
+            url=url,
+            version=version,
+            headers=json.dumps(headers),
+            body=body,
+        )
+
 
 class WebhookConnection(Connection):
     """Proxy to the functionality of a webhook."""
@@ -239,6 +324,18 @@ class WebhookConnection(Connection):
             webhook_url_path=webhook_url_path,
             connection_id=self.connection_id,
             logger=self.logger,
+            max_body_size=self.configuration.config.get(
+                "max_body_size", DEFAULT_MAX_BODY_SIZE
+            ),
+            offload_body_size=self.configuration.config.get(
+                "offload_body_size", DEFAULT_OFFLOAD_BODY_SIZE
+            ),
+            retry_after=self.configuration.config.get(
+                "retry_after", DEFAULT_RETRY_AFTER
+            ),
+        )
+        self._max_queue_size = cast(
+            int, self.configuration.config.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE)
         )
 
     async def connect(self) -> None:
@@ -252,7 +349,7 @@ class WebhookConnection(Connection):
 
         with self._connect_context():
             self.channel.logger = self.logger
-            self.channel.in_queue = asyncio.Queue()
+            self.channel.in_queue = asyncio.Queue(maxsize=self._max_queue_size)
             await self.channel.connect()
 
     async def disconnect(self) -> None:
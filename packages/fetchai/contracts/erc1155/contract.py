@@ -99,7 +99,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(deployer_address)
             instance = cls.get_instance(ledger_api, contract_address)
             tx = instance.functions.createBatch(
                 deployer_address, token_ids
@@ -149,7 +149,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(deployer_address)
             instance = cls.get_instance(ledger_api, contract_address)
             tx = instance.functions.createSingle(
                 deployer_address, token_id, data
@@ -204,7 +204,7 @@ class ERC1155Contract(Contract):
         """
         cls.validate_mint_quantities(token_ids, mint_quantities)
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(deployer_address)
             instance = cls.get_instance(ledger_api, contract_address)
             tx = instance.functions.mintBatch(
                 recipient_address, token_ids, mint_quantities, data
@@ -297,7 +297,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(deployer_address)
             instance = cls.get_instance(ledger_api, contract_address)
             tx = instance.functions.mint(
                 recipient_address, token_id, mint_quantity, data
@@ -392,7 +392,7 @@ class ERC1155Contract(Contract):
         :return: a ledger transaction object
         """
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(from_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(from_address)
             instance = cls.get_instance(ledger_api, contract_address)
             value_eth_wei = ledger_api.api.toWei(value, "ether")
             tx = instance.functions.trade(
@@ -494,7 +494,7 @@ class ERC1155Contract(Contract):
         :return: a ledger transaction object
         """
         if ledger_api.identifier == EthereumApi.identifier:
-            nonce = ledger_api.api.eth.getTransactionCount(from_address)
+            nonce = cast(EthereumApi, ledger_api).reserve_nonce(from_address)
             instance = cls.get_instance(ledger_api, contract_address)
             value_eth_wei = ledger_api.api.toWei(value, "ether")
             tx = instance.functions.tradeBatch(
@@ -43,8 +43,9 @@ class GymHandler(Handler):
     def __init__(self, **kwargs):
         """Initialize the handler."""
         nb_steps = kwargs.pop("nb_steps", DEFAULT_NB_STEPS)
+        nb_envs = kwargs.pop("nb_envs", None)
         super().__init__(**kwargs)
-        self.task = GymTask(self.context, nb_steps)
+        self.task = GymTask(self.context, nb_steps, nb_envs)
 
     def setup(self) -> None:
         """Set up the handler."""
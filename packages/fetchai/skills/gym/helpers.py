@@ -22,9 +22,10 @@
 
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Any, Optional, Tuple, cast
+from typing import Any, List, Optional, Sequence, Tuple, cast
 
 import gym
+import numpy as np
 
 from aea.protocols.base import Message
 from aea.skills.base import SkillContext
@@ -42,6 +43,7 @@ Reward = float
 Done = bool
 Info = dict
 Feedback = Tuple[Observation, Reward, Done, Info]
+VecFeedback = Tuple[np.ndarray, np.ndarray, np.ndarray, List[Info]]
 
 NB_STEPS = 500
 
@@ -105,8 +107,18 @@ class ProxyEnv(gym.Env):
         step_id = self._step_count
 
         self._encode_and_send_action(action, step_id)
+        gym_msg = self._wait_for_percept(step_id)
+        observation, reward, done, info = self._message_to_percept(gym_msg)
 
-        # Wait (blocking!) for the response envelope from the environment
+        return observation, reward, done, info
+
+    def _wait_for_percept(self, step_id: int) -> GymMessage:
+        """
+        Wait (blocking!) for the percept of the given step from the environment.
+
+        :param step_id: the step id
+        :return: the percept message
+        """
         gym_msg = self._queue.get(block=True, timeout=None)  # type: GymMessage
 
         if gym_msg.performative != GymMessage.Performative.PERCEPT:
@@ -116,16 +128,14 @@ class ProxyEnv(gym.Env):
                 )
             )
 
-        if gym_msg.step_id == step_id:
-            observation, reward, done, info = self._message_to_percept(gym_msg)
-        else:
+        if gym_msg.step_id != step_id:
             raise ValueError(
                 "Unexpected step id! expected={}, actual={}".format(
                     step_id, gym_msg.step_id
                 )
             )
 
-        return observation, reward, done, info
+        return gym_msg
 
     def render(self, mode="human") -> None:
         """
@@ -141,6 +151,14 @@ class ProxyEnv(gym.Env):
 
         :return: None
         """
+        self._send_reset_and_wait()
+
+    def _send_reset_and_wait(self) -> GymMessage:
+        """
+        Send a reset message and wait for the status reply.
+
+        :return: the status message
+        """
         self._step_count = 0
         self._is_rl_agent_trained = False
         gym_msg, gym_dialogue = self.gym_dialogues.create(
@@ -159,6 +177,7 @@ class ProxyEnv(gym.Env):
                     GymMessage.Performative.PERCEPT, response_msg.performative
                 )
             )
+        return response_msg
 
     def close(self) -> None:
         """
@@ -212,6 +231,85 @@ class ProxyEnv(gym.Env):
         return observation, reward, done, info
 
 
+class ProxyVecEnv(ProxyEnv):
+    """
+    A proxy to a gym connection running in vectorized mode.
+
+    Mirrors the interface of a vectorized environment: one step sends an action per
+    environment copy and returns the stacked feedback of all the copies, so a single
+    envelope round trip covers num_envs environment steps.
+    """
+
+    def __init__(self, skill_context: SkillContext, num_envs: int) -> None:
+        """
+        Instantiate the proxy environment.
+
+        :param skill_context: the skill context
+        :param num_envs: the number of environment copies run by the connection
+        :return: None
+        """
+        super().__init__(skill_context)
+        self.num_envs = num_envs
+        self._pending_step_id = None  # type: Optional[int]
+
+    def reset(self) -> None:
+        """
+        Reset all the environment copies.
+
+        :return: None
+        """
+        self._pending_step_id = None
+        response_msg = self._send_reset_and_wait()
+        nb_envs = response_msg.content.get("nb_envs")
+        if nb_envs is None or int(nb_envs) != self.num_envs:
+            raise ValueError(
+                "Connection runs {} environments, expected {}.".format(
+                    nb_envs, self.num_envs
+                )
+            )
+
+    def step_async(self, actions: Sequence[Action]) -> None:
+        """
+        Send one action per environment copy, without waiting for the feedback.
+
+        :param actions: the actions, one per environment copy
+        :return: None
+        """
+        if self._pending_step_id is not None:
+            raise ValueError("A step is already pending.")
+        if len(actions) != self.num_envs:
+            raise ValueError(
+                "Expected {} actions, got {}.".format(self.num_envs, len(actions))
+            )
+        self._step_count += 1
+        self._pending_step_id = self._step_count
+        self._encode_and_send_action(actions, self._pending_step_id)
+
+    def step_wait(self) -> VecFeedback:
+        """
+        Wait for the feedback of the pending step.
+
+        :return: the stacked observations, rewards and dones, and the list of infos
+        """
+        if self._pending_step_id is None:
+            raise ValueError("No step is pending.")
+        step_id, self._pending_step_id = self._pending_step_id, None
+        gym_msg = self._wait_for_percept(step_id)
+        observations = gym_msg.observation.any
+        info = gym_msg.info.any
+        return observations, info["rewards"], info["dones"], info["infos"]
+
+    def step(self, action: Sequence[Action]) -> VecFeedback:  # type: ignore
+        """
+        Run one time-step of all the environment copies.
+
+        :param action: the actions, one per environment copy
+        :return: the stacked observations, rewards and dones, and the list of infos
+        """
+        self.step_async(action)
+        return self.step_wait()
+
+
 class RLAgent(ABC):
     """Abstract RL Agent."""
 
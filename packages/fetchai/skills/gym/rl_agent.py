@@ -25,7 +25,7 @@ from typing import Any, Dict
 
 import numpy as np
 
-from packages.fetchai.skills.gym.helpers import ProxyEnv, RLAgent
+from packages.fetchai.skills.gym.helpers import ProxyEnv, ProxyVecEnv, RLAgent
 
 
 DEFAULT_NB_STEPS = 4000
@@ -175,14 +175,24 @@ class MyRLAgent(RLAgent):
         :return: None
         """
         action_counter = 0
+        next_log_counter = 10
 
         proxy_env.reset()
         while action_counter < nb_steps:
-            action = self._pick_an_action()
-            obs, reward, done, info = proxy_env.step(action)
-            self._update_model(obs, reward, done, info, action)
-            action_counter += 1
-            if action_counter % 10 == 0:
+            if isinstance(proxy_env, ProxyVecEnv):
+                action = [self._pick_an_action() for _ in range(proxy_env.num_envs)]
+                observations, rewards, dones, infos = proxy_env.step(action)
+                for env_feedback in zip(observations, rewards, dones, infos, action):
+                    self._update_model(*env_feedback)
+                reward = float(np.mean(rewards))
+                action_counter += proxy_env.num_envs
+            else:
+                action = self._pick_an_action()
+                obs, reward, done, info = proxy_env.step(action)
+                self._update_model(obs, reward, done, info, action)
+                action_counter += 1
+            if action_counter >= next_log_counter:
+                next_log_counter = action_counter - action_counter % 10 + 10
                 self.logger.info(
                     "Action: step_id='{}' action='{}' reward='{}'".format(
                         action_counter, action, reward
@@ -21,23 +21,37 @@
 
 from queue import Queue
 from threading import Thread
+from typing import Optional
 
 from aea.skills.base import SkillContext
 from aea.skills.tasks import Task
 
-from packages.fetchai.skills.gym.helpers import ProxyEnv
+from packages.fetchai.skills.gym.helpers import ProxyEnv, ProxyVecEnv
 from packages.fetchai.skills.gym.rl_agent import DEFAULT_NB_STEPS, MyRLAgent, NB_GOODS
 
 
 class GymTask(Task):
     """Gym task."""
 
-    def __init__(self, skill_context: SkillContext, nb_steps: int = DEFAULT_NB_STEPS):
+    def __init__(
+        self,
+        skill_context: SkillContext,
+        nb_steps: int = DEFAULT_NB_STEPS,
+        nb_envs: Optional[int] = None,
+    ):
         """Initialize the task."""
         super().__init__(logger=skill_context.logger)
-        self.logger.debug("GymTask.__init__: arguments: nb_steps={}".format(nb_steps))
+        self.logger.debug(
+            "GymTask.__init__: arguments: nb_steps={}, nb_envs={}".format(
+                nb_steps, nb_envs
+            )
+        )
         self._rl_agent = MyRLAgent(NB_GOODS, self.logger)
-        self._proxy_env = ProxyEnv(skill_context)
+        self._proxy_env = (
+            ProxyEnv(skill_context)
+            if nb_envs is None
+            else ProxyVecEnv(skill_context, nb_envs)
+        )
         self.nb_steps = nb_steps
         self._rl_agent_training_thread = Thread(
             target=self._fit, args=[self._proxy_env, self.nb_steps]
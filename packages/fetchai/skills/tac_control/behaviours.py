@@ -83,9 +83,13 @@ class TacBehaviour(Behaviour):
                 self._start_tac(game)
                 self._unregister_tac()
                 game.phase = Phase.GAME
-        elif game.phase.value == Phase.GAME.value and now > parameters.end_time:
-            self._cancel_tac(game)
-            game.phase = Phase.POST_GAME
+        elif game.phase.value == Phase.GAME.value:
+            if parameters.batch_settlement:
+                # also on the last tick, before the agents are notified that the game ended
+                self.context.handlers.tac.settle_pending_transactions()
+            if now > parameters.end_time:
+                self._cancel_tac(game)
+                game.phase = Phase.POST_GAME
 
     def teardown(self) -> None:
         """
@@ -175,12 +179,8 @@ class TacBehaviour(Behaviour):
 
     def _start_tac(self, game: Game):
         """Create a game and send the game configuration to every registered agent."""
-        self.context.logger.info(
-            "started competition:\n{}".format(game.holdings_summary)
-        )
-        self.context.logger.info(
-            "computed equilibrium:\n{}".format(game.equilibrium_summary)
-        )
+        game.log_holdings_summary("started competition:\n{}")
+        game.log_equilibrium_summary("computed equilibrium:\n{}")
         tac_dialogues = cast(TacDialogues, self.context.tac_dialogues)
         for agent_address in game.conf.agent_addr_to_name.keys():
             _tac_dialogues = tac_dialogues.get_dialogues_with_counterparty(
@@ -236,10 +236,6 @@ class TacBehaviour(Behaviour):
             )
             self.context.outbox.put_message(message=tac_msg)
         if game.phase == Phase.GAME:
-            self.context.logger.info(
-                "finished competition:\n{}".format(game.holdings_summary)
-            )
-            self.context.logger.info(
-                "computed equilibrium:\n{}".format(game.equilibrium_summary)
-            )
+            game.log_holdings_summary("finished competition:\n{}")
+            game.log_equilibrium_summary("computed equilibrium:\n{}")
             self.context.is_active = False
@@ -20,10 +20,15 @@
 """This package contains a class representing the game."""
 
 import copy
-import datetime
+import json
 import pprint
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
+
+import numpy as np
 
 from aea.common import Address
 from aea.crypto.ledger_apis import LedgerApis
@@ -43,12 +48,14 @@ from aea.skills.base import Model
 
 from packages.fetchai.protocols.tac.message import TacMessage
 from packages.fetchai.skills.tac_control.helpers import (
+    QUANTITY_SHIFT,
+    array_to_dict,
+    compute_equilibrium,
     determine_scaling_factor,
     generate_currency_endowments,
-    generate_equilibrium_prices_and_holdings,
     generate_exchange_params,
-    generate_good_endowments,
-    generate_utility_params,
+    generate_good_endowments_array,
+    generate_utility_params_array,
 )
 from packages.fetchai.skills.tac_control.parameters import Parameters
 
@@ -65,6 +72,11 @@ GoodEndowment = Dict[GoodId, Quantity]
 UtilityParams = Dict[GoodId, Parameter]
 EquilibriumCurrencyHoldings = Dict[CurrencyId, EquilibriumQuantity]
 EquilibriumGoodHoldings = Dict[GoodId, EquilibriumQuantity]
+AgentHoldings = Tuple[str, Dict[GoodId, Quantity], Dict[CurrencyId, Quantity], float]
+
+TRANSACTIONS_COMMIT_INTERVAL = 1000
+SQLITE_MAX_VARIABLES = 500
+HOLDINGS_SUMMARY_INTERVAL = 10.0  # seconds
 
 
 class Phase(Enum):
@@ -448,7 +460,13 @@ class Transaction(Terms):
 
 
 class AgentState:
-    """Represent the state of an agent during the game."""
+    """
+    Represent the state of an agent during the game.
+
+    Holdings are kept in lists against a fixed index of the currency and good ids, so that
+    transactions are applied in place, without copying the holdings. The score is updated
+    with the utility of the holdings a transaction changes, instead of being recomputed.
+    """
 
     def __init__(
         self,
@@ -477,10 +495,25 @@ class AgentState:
             "Different number of elements in quantities_by_good_id and utility_params_by_good_id",
         )
         self._agent_address = agent_address
-        self._amount_by_currency_id = copy.copy(amount_by_currency_id)
+        self._currency_ids = tuple(amount_by_currency_id.keys())
+        self._currency_index = {
+            currency_id: index for index, currency_id in enumerate(self._currency_ids)
+        }  # type: Dict[CurrencyId, int]
+        self._amounts = list(amount_by_currency_id.values())
         self._exchange_params_by_currency_id = copy.copy(exchange_params_by_currency_id)
-        self._quantities_by_good_id = quantities_by_good_id
+        self._good_ids = tuple(quantities_by_good_id.keys())
+        self._good_index = {
+            good_id: index for index, good_id in enumerate(self._good_ids)
+        }  # type: Dict[GoodId, int]
+        self._quantities = list(quantities_by_good_id.values())
         self._utility_params_by_good_id = copy.copy(utility_params_by_good_id)
+        self._exchange_params = [
+            exchange_params_by_currency_id[currency_id]
+            for currency_id in self._currency_ids
+        ]
+        self._score = logarithmic_utility(
+            self._utility_params_by_good_id, quantities_by_good_id, QUANTITY_SHIFT
+        ) + linear_utility(self._exchange_params_by_currency_id, amount_by_currency_id)
 
     @property
     def agent_address(self) -> str:
@@ -490,7 +523,7 @@ class AgentState:
     @property
     def amount_by_currency_id(self) -> Dict[CurrencyId, Quantity]:
         """Get the amount for each currency."""
-        return copy.copy(self._amount_by_currency_id)
+        return dict(zip(self._currency_ids, self._amounts))
 
     @property
     def exchange_params_by_currency_id(self) -> Dict[CurrencyId, Parameter]:
@@ -500,7 +533,7 @@ class AgentState:
     @property
     def quantities_by_good_id(self) -> Dict[GoodId, Quantity]:
         """Get holding of each good."""
-        return copy.copy(self._quantities_by_good_id)
+        return dict(zip(self._good_ids, self._quantities))
 
     @property
     def utility_params_by_good_id(self) -> Dict[GoodId, Parameter]:
@@ -509,20 +542,13 @@ class AgentState:
 
     def get_score(self) -> float:
         """
-        Compute the score of the current state.
+        Get the score of the current state.
 
         The score is computed as the sum of all the utilities for the good holdings
         with positive quantity plus the money left.
         :return: the score.
         """
-        goods_score = logarithmic_utility(
-            self.utility_params_by_good_id, self.quantities_by_good_id
-        )
-        money_score = linear_utility(
-            self.exchange_params_by_currency_id, self.amount_by_currency_id
-        )
-        score = goods_score + money_score
-        return score
+        return self._score
 
     def is_consistent_transaction(self, tx: Transaction) -> bool:
         """
@@ -548,13 +574,13 @@ class AgentState:
             if self.agent_address == tx.sender_address:
                 # check this sender state has enough money
                 result = result and (
-                    self.amount_by_currency_id[tx.currency_id]
+                    self._amounts[self._currency_index[tx.currency_id]]
                     >= tx.sender_payable_amount
                 )
             elif self.agent_address == tx.counterparty_address:
                 # check this counterparty state has enough goods
                 result = result and all(
-                    self.quantities_by_good_id[good_id] >= quantity
+                    self._quantities[self._good_index[good_id]] >= quantity
                     for good_id, quantity in tx.quantities_by_good_id.items()
                 )
         elif all(amount >= 0 for amount in tx.amount_by_currency_id.values()) and all(
@@ -565,13 +591,13 @@ class AgentState:
             if self.agent_address == tx.sender_address:
                 # check this sender state has enough goods
                 result = result and all(
-                    self.quantities_by_good_id[good_id] >= -quantity
+                    self._quantities[self._good_index[good_id]] >= -quantity
                     for good_id, quantity in tx.quantities_by_good_id.items()
                 )
             elif self.agent_address == tx.counterparty_address:
                 # check this counterparty state has enough money
                 result = result and (
-                    self.amount_by_currency_id[tx.currency_id]
+                    self._amounts[self._currency_index[tx.currency_id]]
                     >= tx.counterparty_payable_amount
                 )
         else:
@@ -599,26 +625,38 @@ class AgentState:
         :return: None
         """
         enforce(self.is_consistent_transaction(tx), "Inconsistent transaction.")
+        self.update_unchecked(tx)
 
-        new_amount_by_currency_id = self.amount_by_currency_id
+    def update_unchecked(self, tx: Transaction) -> None:
+        """
+        Apply the changes of holdings of a transaction in place, without checking its consistency.
+
+        :param tx: the transaction.
+        :return: None
+        """
         if self.agent_address == tx.sender_address:
             # settling the transaction for the sender
-            for currency_id, amount in tx.amount_by_currency_id.items():
-                new_amount_by_currency_id[currency_id] += amount
+            sign = 1
         elif self.agent_address == tx.counterparty_address:
             # settling the transaction for the counterparty
-            for currency_id, amount in tx.amount_by_currency_id.items():
-                new_amount_by_currency_id[currency_id] -= amount
-
-        self._amount_by_currency_id = new_amount_by_currency_id
-
-        new_quantities_by_good_id = self.quantities_by_good_id
+            sign = -1
+        else:
+            return  # pragma: nocover
+        for currency_id, amount in tx.amount_by_currency_id.items():
+            index = self._currency_index[currency_id]
+            self._amounts[index] += sign * amount
+            self._score += self._exchange_params[index] * sign * amount
         for good_id, quantity in tx.quantities_by_good_id.items():
-            if self.agent_address == tx.sender_address:
-                new_quantities_by_good_id[good_id] += quantity
-            elif self.agent_address == tx.counterparty_address:
-                new_quantities_by_good_id[good_id] -= quantity
-        self._quantities_by_good_id = new_quantities_by_good_id
+            index = self._good_index[good_id]
+            old_quantity = self._quantities[index]
+            self._quantities[index] = old_quantity + sign * quantity
+            self._score += logarithmic_utility(
+                self._utility_params_by_good_id,
+                {good_id: self._quantities[index]},
+                QUANTITY_SHIFT,
+            ) - logarithmic_utility(
+                self._utility_params_by_good_id, {good_id: old_quantity}, QUANTITY_SHIFT
+            )
 
     def __copy__(self):
         """Copy the object."""
@@ -658,42 +696,165 @@ class AgentState:
 
 
 class Transactions:
-    """Class managing the transactions."""
+    """
+    Class managing the transactions.
 
-    def __init__(self):
-        """Instantiate the transaction class."""
-        self._confirmed = {}  # type: Dict[datetime.datetime, Transaction]
-        self._confirmed_per_agent = (
-            {}
-        )  # type: Dict[Address, Dict[datetime.datetime, Transaction]]
+    Confirmed transactions are kept in an append-only log, in which the sequence number of
+    a transaction is its position, together with indexes of the sequence numbers by agent
+    and by good. The log is kept in memory, or in a SQLite database when a path is given.
+    """
+
+    def __init__(self, database_path: Optional[str] = None):
+        """
+        Instantiate the transaction class.
+
+        :param database_path: the path of the SQLite database of the log, if any. The log of a previous game in the database is dropped.
+        """
+        self._log = []  # type: List[Transaction]
+        self._nb_confirmed = 0
+        self._sequences_per_agent = {}  # type: Dict[Address, List[int]]
+        self._sequences_per_good = {}  # type: Dict[GoodId, List[int]]
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        if database_path is not None:
+            self._connection = sqlite3.connect(database_path)
+            self._connection.execute("DROP TABLE IF EXISTS transactions")
+            self._connection.execute(
+                "CREATE TABLE transactions (sequence INTEGER PRIMARY KEY, body TEXT NOT NULL)"
+            )
+            self._connection.commit()
 
     @property
-    def confirmed(self) -> Dict[datetime.datetime, Transaction]:
-        """Get the confirmed transactions."""
-        return self._confirmed
+    def nb_confirmed(self) -> int:
+        """Get the number of confirmed transactions."""
+        return self._nb_confirmed
 
     @property
-    def confirmed_per_agent(
-        self,
-    ) -> Dict[Address, Dict[datetime.datetime, Transaction]]:
-        """Get the confirmed transactions by agent."""
-        return self._confirmed_per_agent
+    def confirmed(self) -> Dict[int, Transaction]:
+        """Get the confirmed transactions, by sequence number."""
+        return self._get_many(range(self._nb_confirmed))
 
-    def add(self, transaction: Transaction) -> None:
+    @property
+    def confirmed_per_agent(self,) -> Dict[Address, Dict[int, Transaction]]:
+        """Get the confirmed transactions by agent, by sequence number."""
+        return {
+            agent_addr: self._get_many(sequences)
+            for agent_addr, sequences in self._sequences_per_agent.items()
+        }
+
+    def add(self, transaction: Transaction) -> int:
         """
         Add a confirmed transaction.
 
         :param transaction: the transaction
+        :return: the sequence number of the transaction
+        """
+        tx_sequence = self._nb_confirmed
+        self._nb_confirmed += 1
+        if self._connection is None:
+            self._log.append(transaction)
+        else:
+            self._connection.execute(
+                "INSERT INTO transactions VALUES (?, ?)",
+                (tx_sequence, self._to_json(transaction)),
+            )
+            if self._nb_confirmed % TRANSACTIONS_COMMIT_INTERVAL == 0:
+                self._connection.commit()
+        for agent_addr in {
+            transaction.sender_address,
+            transaction.counterparty_address,
+        }:
+            self._sequences_per_agent.setdefault(agent_addr, []).append(tx_sequence)
+        for good_id, quantity in transaction.quantities_by_good_id.items():
+            if quantity != 0:
+                self._sequences_per_good.setdefault(good_id, []).append(tx_sequence)
+        return tx_sequence
+
+    def get(self, tx_sequence: int) -> Transaction:
+        """
+        Get a confirmed transaction.
+
+        :param tx_sequence: the sequence number of the transaction.
+        :return: the transaction
+        """
+        enforce(
+            0 <= tx_sequence < self._nb_confirmed,
+            "No confirmed transaction with sequence number {}.".format(tx_sequence),
+        )
+        return self._get_many([tx_sequence])[tx_sequence]
+
+    def get_by_agent(self, agent_addr: Address) -> Dict[int, Transaction]:
+        """
+        Get the confirmed transactions of an agent, as sender or counterparty.
+
+        :param agent_addr: the address of the agent.
+        :return: the transactions, by sequence number.
+        """
+        return self._get_many(self._sequences_per_agent.get(agent_addr, []))
+
+    def get_by_good(self, good_id: GoodId) -> Dict[int, Transaction]:
+        """
+        Get the confirmed transactions which exchange a good.
+
+        :param good_id: the good id.
+        :return: the transactions, by sequence number.
+        """
+        return self._get_many(self._sequences_per_good.get(good_id, []))
+
+    def close(self) -> None:
+        """
+        Commit and close the database of the log, if any.
+
         :return: None
         """
-        now = datetime.datetime.now()
-        self._confirmed[now] = transaction
-        if self._confirmed_per_agent.get(transaction.sender_address) is None:
-            self._confirmed_per_agent[transaction.sender_address] = {}
-        self._confirmed_per_agent[transaction.sender_address][now] = transaction
-        if self._confirmed_per_agent.get(transaction.counterparty_address) is None:
-            self._confirmed_per_agent[transaction.counterparty_address] = {}
-        self._confirmed_per_agent[transaction.counterparty_address][now] = transaction
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    def _get_many(self, tx_sequences: Sequence[int]) -> Dict[int, Transaction]:
+        """
+        Get confirmed transactions from the log.
+
+        :param tx_sequences: the sequence numbers, in increasing order.
+        :return: the transactions, by sequence number.
+        """
+        if self._connection is None:
+            return {tx_sequence: self._log[tx_sequence] for tx_sequence in tx_sequences}
+        result = {}  # type: Dict[int, Transaction]
+        for start in range(0, len(tx_sequences), SQLITE_MAX_VARIABLES):
+            chunk = tx_sequences[start : start + SQLITE_MAX_VARIABLES]
+            rows = self._connection.execute(
+                "SELECT sequence, body FROM transactions WHERE sequence IN ({}) ORDER BY sequence".format(  # nosec
+                    ", ".join("?" * len(chunk))
+                ),
+                list(chunk),
+            )
+            for tx_sequence, body in rows:
+                result[tx_sequence] = self._from_json(body)
+        return result
+
+    @staticmethod
+    def _to_json(transaction: Transaction) -> str:
+        """Serialize a transaction for the database."""
+        return json.dumps(
+            {
+                "ledger_id": transaction.ledger_id,
+                "sender_address": transaction.sender_address,
+                "counterparty_address": transaction.counterparty_address,
+                "amount_by_currency_id": transaction.amount_by_currency_id,
+                "quantities_by_good_id": transaction.quantities_by_good_id,
+                "is_sender_payable_tx_fee": transaction.is_sender_payable_tx_fee,
+                "nonce": transaction.nonce,
+                "fee_by_currency_id": transaction.fee_by_currency_id,
+                "sender_signature": transaction.sender_signature,
+                "counterparty_signature": transaction.counterparty_signature,
+            }
+        )
+
+    @staticmethod
+    def _from_json(body: str) -> Transaction:
+        """Deserialize a transaction from the database."""
+        return Transaction(**json.loads(body))
 
 
 class Registration:
@@ -733,6 +894,33 @@ class Registration:
         self._agent_addr_to_name.pop(agent_addr)
 
 
+def format_holdings_summary(
+    holdings: List[AgentHoldings],
+    good_id_to_name: Dict[GoodId, str],
+    currency_id_to_name: Dict[CurrencyId, str],
+) -> str:
+    """
+    Format the holdings summary of a game.
+
+    :param holdings: the name, the good holdings, the currency holdings and the score of each agent.
+    :param good_id_to_name: the names of the goods.
+    :param currency_id_to_name: the names of the currencies.
+    :return: the summary.
+    """
+    lines = ["\nCurrent good & money allocation & score: \n"]
+    for agent_name, quantities_by_good_id, amount_by_currency_id, score in holdings:
+        lines.append("- {}:\n".format(agent_name))
+        for good_id, quantity in quantities_by_good_id.items():
+            lines.append("    {}: {}\n".format(good_id_to_name[good_id], quantity))
+        for currency_id, amount in amount_by_currency_id.items():
+            lines.append(
+                "    {}: {}\n".format(currency_id_to_name[currency_id], amount)
+            )
+        lines.append("    score: {}\n".format(round(score, 2)))
+    lines.append("\n")
+    return "".join(lines)
+
+
 class Game(Model):
     """A class to manage a TAC instance."""
 
@@ -748,6 +936,24 @@ class Game(Model):
         self._transactions = Transactions()
         self._already_minted_agents = []  # type: List[str]
         self._is_allowed_to_mint = True
+        self._equilibrium_summary = None  # type: Optional[str]
+        self._summary_executor = None  # type: Optional[ThreadPoolExecutor]
+        self._last_holdings_summary_time = None  # type: Optional[float]
+
+    def setup(self) -> None:
+        """Set up the transaction log, and the thread which formats the summaries."""
+        parameters = cast(Parameters, self.context.parameters)
+        self._transactions = Transactions(parameters.transactions_database)
+        self._summary_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tac_control_summaries"
+        )
+
+    def teardown(self) -> None:
+        """Wait for the pending summaries, and close the transaction log."""
+        if self._summary_executor is not None:
+            self._summary_executor.shutdown(wait=True)
+            self._summary_executor = None
+        self._transactions.close()
 
     @property
     def phase(self) -> Phase:
@@ -828,6 +1034,7 @@ class Game(Model):
     def _generate(self):
         """Generate a TAC game."""
         parameters = cast(Parameters, self.context.parameters)
+        self._equilibrium_summary = None
 
         self._conf = Configuration(
             parameters.version_id,
@@ -838,44 +1045,53 @@ class Game(Model):
         )
 
         scaling_factor = determine_scaling_factor(parameters.money_endowment)
+        agent_addresses = list(self.conf.agent_addr_to_name.keys())
+        currency_ids = list(self.conf.currency_id_to_name.keys())
+        good_ids = list(self.conf.good_id_to_name.keys())
+        rng = np.random.default_rng(parameters.seed)
 
         agent_addr_to_currency_endowments = generate_currency_endowments(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.currency_id_to_name.keys()),
-            parameters.money_endowment,
+            agent_addresses, currency_ids, parameters.money_endowment,
         )
 
         agent_addr_to_exchange_params = generate_exchange_params(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.currency_id_to_name.keys()),
+            agent_addresses, currency_ids,
         )
 
-        agent_addr_to_good_endowments = generate_good_endowments(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.good_id_to_name.keys()),
+        good_endowments = generate_good_endowments_array(
+            len(agent_addresses),
+            len(good_ids),
             parameters.base_good_endowment,
             parameters.lower_bound_factor,
             parameters.upper_bound_factor,
+            rng,
         )
 
-        agent_addr_to_utility_params = generate_utility_params(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.good_id_to_name.keys()),
-            scaling_factor,
+        utility_params = generate_utility_params_array(
+            len(agent_addresses), len(good_ids), scaling_factor, rng
         )
 
-        (
-            good_id_to_eq_prices,
-            agent_addr_to_eq_good_holdings,
-            agent_addr_to_eq_currency_holdings,
-        ) = generate_equilibrium_prices_and_holdings(
-            agent_addr_to_good_endowments,
-            agent_addr_to_utility_params,
-            agent_addr_to_currency_endowments,
-            agent_addr_to_exchange_params,
+        eq_prices, eq_good_holdings, eq_currency_holdings = compute_equilibrium(
+            good_endowments,
+            utility_params,
+            np.full(len(agent_addresses), parameters.money_endowment),
             scaling_factor,
         )
 
+        agent_addr_to_good_endowments = array_to_dict(
+            agent_addresses, good_ids, good_endowments
+        )
+        agent_addr_to_utility_params = array_to_dict(
+            agent_addresses, good_ids, utility_params
+        )
+        good_id_to_eq_prices = dict(zip(good_ids, eq_prices.tolist()))
+        agent_addr_to_eq_good_holdings = array_to_dict(
+            agent_addresses, good_ids, eq_good_holdings
+        )
+        agent_addr_to_eq_currency_holdings = dict(
+            zip(agent_addresses, eq_currency_holdings.tolist())
+        )
+
         self._initialization = Initialization(
             agent_addr_to_currency_endowments,
             agent_addr_to_exchange_params,
@@ -917,34 +1133,91 @@ class Game(Model):
     @property
     def holdings_summary(self) -> str:
         """Get holdings summary (a string representing the holdings for every agent)."""
-        result = "\n" + "Current good & money allocation & score: \n"
-        for agent_addr, agent_state in self.current_agent_states.items():
-            result = (
-                result + "- " + self.conf.agent_addr_to_name[agent_addr] + ":" + "\n"
+        return format_holdings_summary(
+            self._get_holdings(),
+            self.conf.good_id_to_name,
+            self.conf.currency_id_to_name,
+        )
+
+    def log_holdings_summary(
+        self, template: str, is_rate_limited: bool = False
+    ) -> None:
+        """
+        Log the holdings summary.
+
+        The holdings are copied on the calling thread, and formatted and logged by the
+        summary thread, so that long summaries do not hold up the agent loop.
+
+        :param template: the template of the log message, formatted with the summary.
+        :param is_rate_limited: whether to skip the summary if one was logged less than HOLDINGS_SUMMARY_INTERVAL seconds ago.
+        :return: None
+        """
+        now = time.monotonic()
+        if (
+            is_rate_limited
+            and self._last_holdings_summary_time is not None
+            and now - self._last_holdings_summary_time < HOLDINGS_SUMMARY_INTERVAL
+        ):
+            return
+        self._last_holdings_summary_time = now
+        self._log_summary(
+            template,
+            format_holdings_summary,
+            self._get_holdings(),
+            self.conf.good_id_to_name,
+            self.conf.currency_id_to_name,
+        )
+
+    def log_equilibrium_summary(self, template: str) -> None:
+        """
+        Log the equilibrium summary, after the summaries logged before.
+
+        :param template: the template of the log message, formatted with the summary.
+        :return: None
+        """
+        self._log_summary(template, lambda: self.equilibrium_summary)
+
+    def _log_summary(
+        self, template: str, make_summary: Callable[..., str], *args: Any
+    ) -> None:
+        """
+        Log a summary from the summary thread, or from the calling thread before the game is set up.
+
+        :param template: the template of the log message, formatted with the summary.
+        :param make_summary: the function which makes the summary.
+        :param args: the arguments of the function.
+        :return: None
+        """
+
+        def log() -> None:
+            self.context.logger.info(template.format(make_summary(*args)))
+
+        if self._summary_executor is None:
+            log()
+        else:
+            self._summary_executor.submit(log)
+
+    def _get_holdings(self) -> List[AgentHoldings]:
+        """Get a copy of the holdings and score of every agent."""
+        return [
+            (
+                self.conf.agent_addr_to_name[agent_addr],
+                agent_state.quantities_by_good_id,
+                agent_state.amount_by_currency_id,
+                agent_state.get_score(),
             )
-            for good_id, quantity in agent_state.quantities_by_good_id.items():
-                result += (
-                    "    "
-                    + self.conf.good_id_to_name[good_id]
-                    + ": "
-                    + str(quantity)
-                    + "\n"
-                )
-            for currency_id, amount in agent_state.amount_by_currency_id.items():
-                result += (
-                    "    "
-                    + self.conf.currency_id_to_name[currency_id]
-                    + ": "
-                    + str(amount)
-                    + "\n"
-                )
-            result += "    score: " + str(round(agent_state.get_score(), 2)) + "\n"
-        result = result + "\n"
-        return result
+            for agent_addr, agent_state in self.current_agent_states.items()
+        ]
 
     @property
     def equilibrium_summary(self) -> str:
-        """Get equilibrium summary."""
+        """Get equilibrium summary, computed once per game."""
+        if self._equilibrium_summary is None:
+            self._equilibrium_summary = self._make_equilibrium_summary()
+        return self._equilibrium_summary
+
+    def _make_equilibrium_summary(self) -> str:
+        """Make the equilibrium summary."""
         result = "\n" + "Equilibrium prices: \n"
         for good_id, eq_price in self.initialization.good_id_to_eq_prices.items():
             result = (
@@ -1008,17 +1281,92 @@ class Game(Model):
         if self._current_agent_states is None:
             raise AEAEnforceError("Call create before calling current_agent_states.")
         enforce(self.is_transaction_valid(tx), "Transaction is not valid.")
-        sender_state = self.current_agent_states[tx.sender_address]
-        counterparty_state = self.current_agent_states[tx.counterparty_address]
+        self._settle(tx)
 
-        new_sender_state = sender_state.apply([tx])
-        new_counterparty_state = counterparty_state.apply([tx])
+    def settle_transactions(self, transactions: Sequence[Transaction]) -> List[bool]:
+        """
+        Settle the valid transactions of a batch, and reject the others.
+
+        The signatures of the whole batch are verified at once, in parallel for large batches.
+        The transactions with matching signatures are then checked against the current
+        state of the game and settled one after the other, in the order of their ids, so that
+        the outcome of conflicting transactions does not depend on the order of arrival.
+
+        :param transactions: the game transactions.
+        :return: whether each transaction is settled, in the order of the transactions.
+        """
+        if self._current_agent_states is None:
+            raise AEAEnforceError("Call create before calling current_agent_states.")
+        has_matching_signatures = self._verify_signatures(transactions)
+        is_settled = [False] * len(transactions)
+        for index in sorted(
+            range(len(transactions)), key=lambda index: transactions[index].id
+        ):
+            tx = transactions[index]
+            if not has_matching_signatures[index]:
+                continue
+            sender_state = self._current_agent_states.get(tx.sender_address)
+            counterparty_state = self._current_agent_states.get(tx.counterparty_address)
+            if (
+                sender_state is None
+                or counterparty_state is None
+                or not sender_state.is_consistent_transaction(tx)
+                or not counterparty_state.is_consistent_transaction(tx)
+            ):
+                continue
+            self._settle(tx)
+            is_settled[index] = True
+        return is_settled
 
+    @staticmethod
+    def _verify_signatures(transactions: Sequence[Transaction]) -> List[bool]:
+        """
+        Check the signatures of many transactions match their terms, with a batch verification per ledger.
+
+        :param transactions: the game transactions.
+        :return: whether the signatures of each transaction match, in the order of the transactions.
+        """
+        signed_messages_by_ledger_id = (
+            {}
+        )  # type: Dict[str, List[Tuple[bytes, str, Address]]]
+        for tx in transactions:
+            signed_messages = signed_messages_by_ledger_id.setdefault(tx.ledger_id, [])
+            signed_messages.append(
+                (
+                    tx.sender_hash.encode("utf-8"),
+                    tx.sender_signature,
+                    tx.sender_address,
+                )
+            )
+            signed_messages.append(
+                (
+                    tx.counterparty_hash.encode("utf-8"),
+                    tx.counterparty_signature,
+                    tx.counterparty_address,
+                )
+            )
+        results_by_ledger_id = {
+            ledger_id: iter(LedgerApis.verify_batch(ledger_id, signed_messages))
+            for ledger_id, signed_messages in signed_messages_by_ledger_id.items()
+        }
+        has_matching_signatures = []
+        for tx in transactions:
+            results = results_by_ledger_id[tx.ledger_id]
+            is_sender_valid = next(results)
+            is_counterparty_valid = next(results)
+            has_matching_signatures.append(is_sender_valid and is_counterparty_valid)
+        return has_matching_signatures
+
+    def _settle(self, tx: Transaction) -> None:
+        """
+        Apply a valid transaction in place on the states of the two agents, and record it.
+
+        :param tx: the game transaction.
+        :return: None
+        """
+        self.current_agent_states[tx.sender_address].update_unchecked(tx)
+        self.current_agent_states[tx.counterparty_address].update_unchecked(tx)
         self.transactions.add(tx)
-        self._current_agent_states.update({tx.sender_address: new_sender_state})
-        self._current_agent_states.update(
-            {tx.counterparty_address: new_counterparty_state}
-        )
 
     def get_location_description(self) -> Description:
         """
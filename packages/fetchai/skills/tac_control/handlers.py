@@ -19,7 +19,7 @@
 
 """This package contains the handlers."""
 
-from typing import Optional, cast
+from typing import List, Optional, Tuple, cast
 
 from aea.protocols.base import Message
 from aea.skills.base import Handler
@@ -43,6 +43,18 @@ class TacHandler(Handler):
 
     SUPPORTED_PROTOCOL = TacMessage.protocol_id
 
+    def __init__(self, **kwargs):
+        """Initialize the handler."""
+        super().__init__(**kwargs)
+        self._pending_transactions = (
+            []
+        )  # type: List[Tuple[TacMessage, TacDialogue, Transaction]]
+
+    @property
+    def nb_pending_transactions(self) -> int:
+        """Get the number of transactions waiting for a batch settlement."""
+        return len(self._pending_transactions)
+
     def setup(self) -> None:
         """
         Implement the handler setup.
@@ -89,9 +101,12 @@ class TacHandler(Handler):
         """
         Implement the handler teardown.
 
+        Transactions still waiting for a batch settlement are settled, so that no counterparty
+        waits for a reply forever. They are only queued while the game is running.
+
         :return: None
         """
-        pass
+        self.settle_pending_transactions()
 
     def _handle_unidentified_dialogue(self, tac_msg: TacMessage) -> None:
         """
@@ -232,12 +247,45 @@ class TacHandler(Handler):
         transaction = Transaction.from_message(tac_msg)
         self.context.logger.debug("handling transaction: {}".format(transaction))
 
+        parameters = cast(Parameters, self.context.parameters)
+        if parameters.batch_settlement:
+            self._pending_transactions.append((tac_msg, tac_dialogue, transaction))
+            return
+
         game = cast(Game, self.context.game)
         if game.is_transaction_valid(transaction):
             self._handle_valid_transaction(tac_msg, tac_dialogue, transaction)
         else:
             self._handle_invalid_transaction(tac_msg, tac_dialogue)
 
+    def settle_pending_transactions(self) -> None:
+        """
+        Settle the transactions received since the last call in a batch, and reply to each of them.
+
+        :return: None
+        """
+        if len(self._pending_transactions) == 0:
+            return
+        pending_transactions = self._pending_transactions
+        self._pending_transactions = []
+        game = cast(Game, self.context.game)
+        is_settled = game.settle_transactions(
+            [transaction for _, _, transaction in pending_transactions]
+        )
+        for (tac_msg, tac_dialogue, transaction), is_valid in zip(
+            pending_transactions, is_settled
+        ):
+            if is_valid:
+                self._confirm_transaction(tac_msg, tac_dialogue, transaction)
+            else:
+                self._handle_invalid_transaction(tac_msg, tac_dialogue)
+        self.context.logger.info(
+            "settled {} of {} transactions.".format(
+                sum(is_settled), len(pending_transactions)
+            )
+        )
+        game.log_holdings_summary("current state:\n{}", is_rate_limited=True)
+
     def _handle_valid_transaction(
         self, tac_msg: TacMessage, tac_dialogue: TacDialogue, transaction: Transaction
     ) -> None:
@@ -256,7 +304,25 @@ class TacHandler(Handler):
             "handling valid transaction: {}".format(transaction.id[-10:])
         )
         game.settle_transaction(transaction)
+        self._confirm_transaction(tac_msg, tac_dialogue, transaction)
 
+        # log messages
+        self.context.logger.info(
+            "transaction '{}' settled successfully.".format(transaction.id[-10:])
+        )
+        game.log_holdings_summary("current state:\n{}", is_rate_limited=True)
+
+    def _confirm_transaction(
+        self, tac_msg: TacMessage, tac_dialogue: TacDialogue, transaction: Transaction
+    ) -> None:
+        """
+        Send a transaction confirmation both to the buyer and the seller of a settled transaction.
+
+        :param tac_msg: the tac message of the transaction.
+        :param tac_dialogue: the tac dialogue of the sender.
+        :param transaction: the transaction.
+        :return: None
+        """
         # send the transaction confirmation.
         sender_tac_msg = tac_dialogue.reply(
             performative=TacMessage.Performative.TRANSACTION_CONFIRMATION,
@@ -286,12 +352,6 @@ class TacHandler(Handler):
         )
         self.context.outbox.put_message(message=counterparty_tac_msg)
 
-        # log messages
-        self.context.logger.info(
-            "transaction '{}' settled successfully.".format(transaction.id[-10:])
-        )
-        self.context.logger.info("current state:\n{}".format(game.holdings_summary))
-
     def _handle_invalid_transaction(
         self, tac_msg: TacMessage, tac_dialogue: TacDialogue
     ) -> None:
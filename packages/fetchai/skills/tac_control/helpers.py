@@ -20,8 +20,7 @@
 
 """This module contains the helpers methods for the controller agent."""
 
-import random
-from typing import Dict, List, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import numpy as np
 
@@ -129,6 +128,7 @@ def generate_good_endowments(
     base_amount: int,
     uniform_lower_bound_factor: int,
     uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, Dict[str, int]]:
     """
     Compute good endowments per agent. That is, a matrix of shape (nb_agents, nb_goods).
@@ -138,31 +138,62 @@ def generate_good_endowments(
     :param base_amount: the base amount of instances per good
     :param uniform_lower_bound_factor: the lower bound of the uniform distribution for the sampling of the good instance number.
     :param uniform_upper_bound_factor: the upper bound of the uniform distribution for the sampling of the good instance number.
+    :param rng: the random number generator.
     :return: the endowments matrix.
     """
-    # sample good instances
-    nb_agents = len(agent_addresses)
-    instances_per_good = _sample_good_instances(
+    endowments = generate_good_endowments_array(
+        len(agent_addresses),
+        len(good_ids),
+        base_amount,
+        uniform_lower_bound_factor,
+        uniform_upper_bound_factor,
+        rng,
+    )
+    return array_to_dict(agent_addresses, good_ids, endowments)
+
+
+def generate_good_endowments_array(
+    nb_agents: int,
+    nb_goods: int,
+    base_amount: int,
+    uniform_lower_bound_factor: int,
+    uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Compute the good endowments, as an integer array of shape (nb_agents, nb_goods).
+
+    Each agent receives the base amount of each good, and the remaining instances
+    of a good are assigned to the agents uniformly at random.
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param base_amount: the base amount of instances per good
+    :param uniform_lower_bound_factor: the lower bound of the uniform distribution for the sampling of the good instance number.
+    :param uniform_upper_bound_factor: the upper bound of the uniform distribution for the sampling of the good instance number.
+    :param rng: the random number generator.
+    :return: the endowments array.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    instances_per_good = _sample_good_instances_array(
         nb_agents,
-        good_ids,
+        nb_goods,
         base_amount,
         uniform_lower_bound_factor,
         uniform_upper_bound_factor,
+        rng,
     )
-    # each agent receives at least base amount of each good
-    base_assignment = {good_id: base_amount for good_id in good_ids}
-    endowments = {agent_addr: base_assignment for agent_addr in agent_addresses}
-    # randomly assign additional goods to create differences
-    for good_id in good_ids:
-        for _ in range(instances_per_good[good_id] - (base_amount * nb_agents)):
-            idx = random.randint(0, nb_agents - 1)  # nosec
-            agent_addr = agent_addresses[idx]
-            endowments[agent_addr][good_id] += 1
-    return endowments
+    additional_instances = rng.multinomial(
+        instances_per_good - base_amount * nb_agents, [1.0 / nb_agents] * nb_agents
+    )
+    return np.transpose(additional_instances) + base_amount
 
 
 def generate_utility_params(
-    agent_addresses: List[str], good_ids: List[str], scaling_factor: float
+    agent_addresses: List[str],
+    good_ids: List[str],
+    scaling_factor: float,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute the preference matrix. That is, a generic element e_ij is the utility of good j for agent i.
@@ -170,30 +201,42 @@ def generate_utility_params(
     :param agent_addresses: the agent addresses
     :param good_ids: the list of good ids
     :param scaling_factor: a scaling factor for all the utility params generated.
+    :param rng: the random number generator.
     :return: the preference matrix.
     """
-    decimals = 4 if len(good_ids) < 100 else 8
-    utility_function_params = {}  # type: Dict[str, Dict[str, float]]
-    for agent_addr in agent_addresses:
-        random_integers = [
-            random.randint(1, 101) for _ in range(len(good_ids))  # nosec
-        ]
-        total = sum(random_integers)
-        normalized_fractions = [
-            round(i / float(total), decimals) for i in random_integers
-        ]
-        if not sum(normalized_fractions) == 1.0:  # pragma: no cover
-            normalized_fractions[-1] = round(
-                1.0 - sum(normalized_fractions[0:-1]), decimals
-            )
-        # scale the utility params
-        params = {
-            good_id: param * scaling_factor
-            for good_id, param in zip(good_ids, normalized_fractions)
-        }
-        utility_function_params[agent_addr] = params
+    utility_params = generate_utility_params_array(
+        len(agent_addresses), len(good_ids), scaling_factor, rng
+    )
+    return array_to_dict(agent_addresses, good_ids, utility_params)
 
-    return utility_function_params
+
+def generate_utility_params_array(
+    nb_agents: int,
+    nb_goods: int,
+    scaling_factor: float,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Compute the utility params, as an array of shape (nb_agents, nb_goods).
+
+    The params of an agent are random fractions which sum to one, scaled by the scaling factor.
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param scaling_factor: a scaling factor for all the utility params generated.
+    :param rng: the random number generator.
+    :return: the utility params array.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    decimals = 4 if nb_goods < 100 else 8
+    random_integers = rng.integers(1, 102, size=(nb_agents, nb_goods))
+    normalized_fractions = np.round(
+        random_integers / np.sum(random_integers, axis=1, keepdims=True), decimals
+    )
+    normalized_fractions[:, -1] = np.round(
+        1.0 - np.sum(normalized_fractions[:, :-1], axis=1), decimals
+    )
+    return normalized_fractions * scaling_factor
 
 
 def _sample_good_instances(
@@ -202,6 +245,7 @@ def _sample_good_instances(
     base_amount: int,
     uniform_lower_bound_factor: int,
     uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, int]:
     """
     Sample the number of instances for a good.
@@ -211,13 +255,43 @@ def _sample_good_instances(
     :param base_amount: the base amount of instances per good
     :param uniform_lower_bound_factor: the lower bound factor of a uniform distribution
     :param uniform_upper_bound_factor: the upper bound factor of a uniform distribution
+    :param rng: the random number generator.
     :return: the number of instances I sampled.
     """
+    nb_instances = _sample_good_instances_array(
+        nb_agents,
+        len(good_ids),
+        base_amount,
+        uniform_lower_bound_factor,
+        uniform_upper_bound_factor,
+        rng if rng is not None else np.random.default_rng(),
+    )
+    return dict(zip(good_ids, nb_instances.tolist()))
+
+
+def _sample_good_instances_array(
+    nb_agents: int,
+    nb_goods: int,
+    base_amount: int,
+    uniform_lower_bound_factor: int,
+    uniform_upper_bound_factor: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Sample the number of instances of each good, as an integer array of shape (nb_goods,).
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param base_amount: the base amount of instances per good
+    :param uniform_lower_bound_factor: the lower bound factor of a uniform distribution
+    :param uniform_upper_bound_factor: the upper bound factor of a uniform distribution
+    :param rng: the random number generator.
+    :return: the number of instances sampled.
+    """
     a = base_amount * nb_agents + nb_agents * uniform_lower_bound_factor
     b = base_amount * nb_agents + nb_agents * uniform_upper_bound_factor
     # Return random integer in range [a, b]
-    nb_instances = {good_id: round(np.random.uniform(a, b)) for good_id in good_ids}
-    return nb_instances
+    return np.rint(rng.uniform(a, b, size=nb_goods)).astype(np.int64)
 
 
 def generate_currency_endowments(
@@ -268,75 +342,105 @@ def generate_equilibrium_prices_and_holdings(  # pylint: disable=unused-argument
     :param quantity_shift: a factor to shift the quantities in the utility function (to ensure the natural logarithm can be used on the entire range of quantities)
     :return: the lists of equilibrium prices, equilibrium good holdings and equilibrium money holdings
     """
-    # create ordered lists
-    agent_addresses = []  # type: List[str]
-    good_ids = []  # type: List[str]
-    good_ids_to_idx = {}  # type: Dict[str, int]
-    good_endowments_l = []  # type: List[List[int]]
-    utility_params_l = []  # type: List[List[float]]
-    currency_endowment_l = []  # type: List[int]
-    count = 0
-    for agent_addr, good_endowment in agent_addr_to_good_endowments.items():
-        agent_addresses.append(agent_addr)
+    agent_addresses = list(agent_addr_to_good_endowments.keys())
+    good_ids = list(agent_addr_to_good_endowments[agent_addresses[0]].keys())
+    for agent_addr in agent_addresses:
         enforce(
             len(agent_addr_to_currency_endowments[agent_addr].values()) == 1,
             "Cannot have more than one currency.",
         )
-        currency_endowment_l.append(
-            list(agent_addr_to_currency_endowments[agent_addr].values())[0]
-        )
         enforce(
-            len(good_endowment.keys())
+            len(agent_addr_to_good_endowments[agent_addr].keys())
             == len(agent_addr_to_utility_params[agent_addr].keys()),
             "Good endowments and utility params inconsistent.",
         )
-        temp_g_e = [0] * len(good_endowment.keys())
-        temp_u_p = [0.0] * len(agent_addr_to_utility_params[agent_addr].keys())
-        idx = 0
-        for good_id, quantity in good_endowment.items():
-            if count == 0:
-                good_ids.append(good_id)
-                good_ids_to_idx[good_id] = idx
-                idx += 1
-            temp_g_e[good_ids_to_idx[good_id]] = quantity
-            temp_u_p[good_ids_to_idx[good_id]] = agent_addr_to_utility_params[
-                agent_addr
-            ][good_id]
-        count += 1
-        good_endowments_l.append(temp_g_e)
-        utility_params_l.append(temp_u_p)
-
-    # maths
-    endowments_a = np.array(good_endowments_l, dtype=np.int)
-    scaled_utility_params_a = np.array(
-        utility_params_l, dtype=np.float
-    )  # note, they are already scaled
-    endowments_by_good = np.sum(endowments_a, axis=0)
-    scaled_params_by_good = np.sum(scaled_utility_params_a, axis=0)
-    eq_prices = np.divide(
-        scaled_params_by_good,
-        quantity_shift * len(agent_addresses) + endowments_by_good,
+    endowments = dict_to_array(agent_addresses, good_ids, agent_addr_to_good_endowments)
+    utility_params = dict_to_array(
+        agent_addresses, good_ids, agent_addr_to_utility_params
+    )
+    currency_endowments = np.array(
+        [
+            next(iter(agent_addr_to_currency_endowments[agent_addr].values()))
+            for agent_addr in agent_addresses
+        ]
+    )
+
+    eq_prices, eq_good_holdings, eq_currency_holdings = compute_equilibrium(
+        endowments, utility_params, currency_endowments, scaling_factor, quantity_shift
+    )
+
+    eq_prices_dict = dict(zip(good_ids, cast(List[float], eq_prices.tolist())))
+    eq_good_holdings_dict = array_to_dict(agent_addresses, good_ids, eq_good_holdings)
+    eq_currency_holdings_dict = dict(
+        zip(agent_addresses, cast(List[float], eq_currency_holdings.tolist()))
+    )
+    return eq_prices_dict, eq_good_holdings_dict, eq_currency_holdings_dict
+
+
+def compute_equilibrium(
+    endowments: np.ndarray,
+    utility_params: np.ndarray,
+    currency_endowments: np.ndarray,
+    scaling_factor: float,
+    quantity_shift: int = QUANTITY_SHIFT,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the competitive equilibrium prices and allocation, in closed form.
+
+    The utility of agent i is sum_j a_ij * log(x_ij + s) + m_i, so its demand for good j
+    at price p_j is a_ij / p_j - s. Clearing the market of good j gives
+    p_j = sum_i a_ij / (n * s + sum_i e_ij), and the money holdings follow from the
+    budget constraints, given the params of every agent sum to the scaling factor.
+    This takes O(nb_agents * nb_goods) time and memory, without iterations.
+
+    :param endowments: the good endowments, an array of shape (nb_agents, nb_goods).
+    :param utility_params: the utility params (already scaled), an array of shape (nb_agents, nb_goods).
+    :param currency_endowments: the money endowments, an array of shape (nb_agents,).
+    :param scaling_factor: a scaling factor for all the utility params generated.
+    :param quantity_shift: a factor to shift the quantities in the utility function (to ensure the natural logarithm can be used on the entire range of quantities)
+    :return: the equilibrium prices, of shape (nb_goods,), good holdings, of shape (nb_agents, nb_goods), and money holdings, of shape (nb_agents,).
+    """
+    nb_agents = endowments.shape[0]
+    eq_prices = np.sum(utility_params, axis=0) / (
+        quantity_shift * nb_agents + np.sum(endowments, axis=0)
     )
-    eq_good_holdings = np.divide(scaled_utility_params_a, eq_prices) - quantity_shift
+    eq_good_holdings = utility_params / eq_prices - quantity_shift
     eq_currency_holdings = (
-        np.transpose(np.dot(eq_prices, np.transpose(endowments_a + quantity_shift)))
-        + currency_endowment_l
+        np.dot(endowments + quantity_shift, eq_prices)
+        + currency_endowments
         - scaling_factor
     )
+    return eq_prices, eq_good_holdings, eq_currency_holdings
 
-    # back to dicts
-    eq_prices_dict = {
-        good_id: cast(float, eq_price)
-        for good_id, eq_price in zip(good_ids, eq_prices.tolist())
-    }
-    eq_good_holdings_dict = {
-        agent_addr: {good_id: cast(float, v) for good_id, v in zip(good_ids, egh)}
-        for agent_addr, egh in zip(agent_addresses, eq_good_holdings.tolist())
-    }
-    eq_currency_holdings_dict = {
-        agent_addr: cast(float, eq_currency_holding)
-        for agent_addr, eq_currency_holding in zip(
-            agent_addresses, eq_currency_holdings.tolist()
-        )
+
+def dict_to_array(
+    agent_addresses: List[str], ids: List[str], values: Dict[str, Dict[str, Any]]
+) -> np.ndarray:
+    """
+    Convert a nested dict, by agent address and by id, to an array of shape (nb_agents, nb_ids).
+
+    :param agent_addresses: the agent addresses, in the order of the rows.
+    :param ids: the ids, in the order of the columns.
+    :param values: the nested dict.
+    :return: the array.
+    """
+    return np.array(
+        [[values[agent_addr][id_] for id_ in ids] for agent_addr in agent_addresses]
+    )
+
+
+def array_to_dict(
+    agent_addresses: List[str], ids: List[str], values: np.ndarray
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Convert an array of shape (nb_agents, nb_ids) to a nested dict, by agent address and by id.
+
+    :param agent_addresses: the agent addresses, in the order of the rows.
+    :param ids: the ids, in the order of the columns.
+    :param values: the array.
+    :return: the nested dict.
+    """
+    return {
+        agent_addr: dict(zip(ids, row))
+        for agent_addr, row in zip(agent_addresses, values.tolist())
     }
-    return eq_prices_dict, eq_good_holdings_dict, eq_currency_holdings_dict
@@ -41,11 +41,14 @@ DEFAULT_TX_FEE = 1
 DEFAULT_BASE_GOOD_ENDOWMENT = 2
 DEFAULT_LOWER_BOUND_FACTOR = 1
 DEFAULT_UPPER_BOUND_FACTOR = 1
+DEFAULT_SEED = None
 DEFAULT_REGISTRATION_START_TIME = "01 01 2020  00:01"
 DEFAULT_REGISTRATION_TIMEOUT = 60
 DEFAULT_ITEM_SETUP_TIMEOUT = 60
 DEFAULT_COMPETITION_TIMEOUT = 300
 DEFAULT_INACTIVITY_TIMEOUT = 30
+DEFAULT_BATCH_SETTLEMENT = False
+DEFAULT_TRANSACTIONS_DATABASE = None
 DEFAULT_LOCATION = {"longitude": 0.1270, "latitude": 51.5194}
 DEFAULT_SERVICE_DATA = {"key": "tac", "value": "v1"}
 
@@ -81,6 +84,7 @@ class Parameters(Model):
         self._upper_bound_factor = kwargs.pop(
             "upper_bound_factor", DEFAULT_UPPER_BOUND_FACTOR
         )  # type: int
+        self._seed = kwargs.pop("seed", DEFAULT_SEED)  # type: Optional[int]
         registration_start_time = kwargs.pop(
             "registration_start_time", DEFAULT_REGISTRATION_START_TIME
         )  # type: str
@@ -99,6 +103,12 @@ class Parameters(Model):
         self._inactivity_timeout = kwargs.pop(
             "inactivity_timeout", DEFAULT_INACTIVITY_TIMEOUT
         )  # type: int
+        self._batch_settlement = kwargs.pop(
+            "batch_settlement", DEFAULT_BATCH_SETTLEMENT
+        )  # type: bool
+        self._transactions_database = kwargs.pop(
+            "transactions_database", DEFAULT_TRANSACTIONS_DATABASE
+        )  # type: Optional[str]
         self._whitelist = set(kwargs.pop("whitelist", []))  # type: Set[str]
         self._location = kwargs.pop("location", DEFAULT_LOCATION)
         self._service_data = kwargs.pop("service_data", DEFAULT_SERVICE_DATA)
@@ -251,6 +261,11 @@ class Parameters(Model):
         """Upper bound of a uniform distribution."""
         return self._upper_bound_factor
 
+    @property
+    def seed(self) -> Optional[int]:
+        """Seed of the random generation of the game, if any."""
+        return self._seed
+
     @property
     def registration_start_time(self) -> datetime.datetime:
         """TAC registration start time."""
@@ -276,6 +291,16 @@ class Parameters(Model):
         """Timeout of agent inactivity from controller perspective (no received transactions)."""
         return self._inactivity_timeout
 
+    @property
+    def batch_settlement(self) -> bool:
+        """Check whether transactions are settled in batches, once per tick of the behaviour."""
+        return self._batch_settlement
+
+    @property
+    def transactions_database(self) -> Optional[str]:
+        """Path of the SQLite database of the transaction log, if any."""
+        return self._transactions_database
+
     @property
     def whitelist(self) -> Set[str]:
         """Whitelist of agent addresses allowed into the TAC instance."""
@@ -203,7 +203,9 @@ class FipaNegotiationHandler(Handler):
                 performative=FipaMessage.Performative.ACCEPT, target_message=propose,
             )
             transactions.add_locked_tx(
-                fipa_dialogue.terms, role=cast(FipaDialogue.Role, fipa_dialogue.role)
+                fipa_dialogue.terms,
+                role=cast(FipaDialogue.Role, fipa_dialogue.role),
+                dialogue_label=fipa_dialogue.dialogue_label,
             )
             transactions.add_pending_initial_acceptance(
                 fipa_dialogue.dialogue_label, fipa_msg.message_id, fipa_dialogue.terms
@@ -241,19 +243,13 @@ class FipaNegotiationHandler(Handler):
             fipa_dialogues.dialogue_stats.add_dialogue_endstate(
                 FipaDialogue.EndState.DECLINED_PROPOSE, fipa_dialogue.is_self_initiated
             )
-            transactions = cast(Transactions, self.context.transactions)
-            terms = transactions.pop_pending_proposal(
-                fipa_dialogue.dialogue_label, decline.target
-            )
         elif decline.target == 3:
             fipa_dialogues.dialogue_stats.add_dialogue_endstate(
                 FipaDialogue.EndState.DECLINED_ACCEPT, fipa_dialogue.is_self_initiated
             )
-            transactions = cast(Transactions, self.context.transactions)
-            terms = transactions.pop_pending_initial_acceptance(
-                fipa_dialogue.dialogue_label, decline.target
-            )
-            transactions.pop_locked_tx(terms)
+        # the dialogue is over: drop its pending proposals and acceptances, and release its locks
+        transactions = cast(Transactions, self.context.transactions)
+        transactions.remove_dialogue(fipa_dialogue.dialogue_label)
 
     def _on_accept(self, accept: FipaMessage, fipa_dialogue: FipaDialogue) -> None:
         """
@@ -264,6 +260,14 @@ class FipaNegotiationHandler(Handler):
         :return: None
         """
         transactions = cast(Transactions, self.context.transactions)
+        if not transactions.has_pending_proposal(
+            fipa_dialogue.dialogue_label, accept.target
+        ):
+            self.context.logger.info(
+                "proposal {} expired before it was accepted.".format(accept.target)
+            )
+            self._decline_accept(accept, fipa_dialogue)
+            return
         terms = transactions.pop_pending_proposal(
             fipa_dialogue.dialogue_label, accept.target
         )
@@ -321,22 +325,29 @@ class FipaNegotiationHandler(Handler):
                 )
                 self.context.decision_maker_message_queue.put(signing_msg)
         else:
-            fipa_msg = fipa_dialogue.reply(
-                performative=FipaMessage.Performative.DECLINE, target_message=accept,
-            )
-            dialogues = cast(FipaDialogues, self.context.fipa_dialogues)
-            dialogues.dialogue_stats.add_dialogue_endstate(
-                FipaDialogue.EndState.DECLINED_ACCEPT, fipa_dialogue.is_self_initiated
-            )
-            self.context.logger.info(
-                "sending {} to {} (as {}), message={}".format(
-                    fipa_msg.performative,
-                    fipa_msg.to[-5:],
-                    fipa_dialogue.role,
-                    fipa_msg,
-                )
+            self._decline_accept(accept, fipa_dialogue)
+
+    def _decline_accept(self, accept: FipaMessage, fipa_dialogue: FipaDialogue) -> None:
+        """
+        Decline an Accept.
+
+        :param accept: the Accept message
+        :param fipa_dialogue: the fipa_dialogue
+        :return: None
+        """
+        fipa_msg = fipa_dialogue.reply(
+            performative=FipaMessage.Performative.DECLINE, target_message=accept,
+        )
+        dialogues = cast(FipaDialogues, self.context.fipa_dialogues)
+        dialogues.dialogue_stats.add_dialogue_endstate(
+            FipaDialogue.EndState.DECLINED_ACCEPT, fipa_dialogue.is_self_initiated
+        )
+        self.context.logger.info(
+            "sending {} to {} (as {}), message={}".format(
+                fipa_msg.performative, fipa_msg.to[-5:], fipa_dialogue.role, fipa_msg,
             )
-            self.context.outbox.put_message(message=fipa_msg)
+        )
+        self.context.outbox.put_message(message=fipa_msg)
 
     def _on_match_accept(
         self, match_accept: FipaMessage, fipa_dialogue: FipaDialogue
@@ -385,6 +396,22 @@ class FipaNegotiationHandler(Handler):
             self.context.outbox.put_message(message=contract_api_msg)
         else:
             transactions = cast(Transactions, self.context.transactions)
+            if not transactions.has_pending_initial_acceptance(
+                fipa_dialogue.dialogue_label, match_accept.target
+            ):
+                # a match accept cannot be declined, so the dialogue is ended without a reply
+                self.context.logger.info(
+                    "acceptance {} expired before it was matched, ending the dialogue on {}.".format(
+                        match_accept.target, match_accept.performative
+                    )
+                )
+                dialogues = cast(FipaDialogues, self.context.fipa_dialogues)
+                dialogues.dialogue_stats.add_dialogue_endstate(
+                    FipaDialogue.EndState.DECLINED_ACCEPT,
+                    fipa_dialogue.is_self_initiated,
+                )
+                transactions.remove_dialogue(fipa_dialogue.dialogue_label)
+                return
             terms = transactions.pop_pending_initial_acceptance(
                 fipa_dialogue.dialogue_label, match_accept.target
             )
@@ -22,7 +22,7 @@
 import copy
 import random
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 from aea.common import Address
 from aea.decision_maker.default import OwnershipState, Preferences
@@ -111,6 +111,9 @@ class Strategy(Model):
         self._radius = kwargs.pop("search_radius", DEFAULT_SEARCH_RADIUS)
 
         self._contract_id = str(CONTRACT_ID)
+        self._candidate_prices = (
+            {}
+        )  # type: Dict[bool, Tuple[Tuple[int, int], Tuple[List[str], List[Tuple[str, int]]]]]
 
         super().__init__(**kwargs)
         self._ledger_id = (
@@ -354,39 +357,45 @@ class Strategy(Model):
             )
         return proposal_description
 
-    def _generate_candidate_proposals(self, is_seller: bool):  # pragma: no cover
+    def _generate_candidate_proposals(self, is_seller: bool) -> Iterator[Description]:
         """
         Generate proposals from the agent in the role of seller/buyer.
 
+        The prices of single units of all the goods are computed at once, and kept until
+        the ownership state after the locks of the role (or the fee) changes. The descriptions
+        are only built, as the proposals are iterated, for the goods with a positive price.
+
         :param is_seller: the bool indicating whether the agent is a seller.
 
-        :return: a list of proposals in Description form
+        :return: the proposals in Description form
         """
         transactions = cast(Transactions, self.context.transactions)
         ownership_state_after_locks = transactions.ownership_state_after_locks(
             is_seller=is_seller
         )
-        good_id_to_quantities = (
-            self._supplied_goods(ownership_state_after_locks.quantities_by_good_id)
-            if is_seller
-            else self._demanded_goods(ownership_state_after_locks.quantities_by_good_id)
-        )
-        nil_proposal_dict = {
-            good_id: 0 for good_id in good_id_to_quantities.keys()
-        }  # type: Dict[str, int]
-        proposals = []
         fee_by_currency_id = self.context.shared_state.get("tx_fee", {"FET": 0})
         buyer_tx_fee = next(iter(fee_by_currency_id.values()))
+        version = (
+            transactions.ownership_state_after_locks_version(is_seller),
+            buyer_tx_fee,
+        )
+        cached = self._candidate_prices.get(is_seller)
+        if cached is None or cached[0] != version:
+            cached = (
+                version,
+                self._get_candidate_prices(
+                    ownership_state_after_locks, is_seller, buyer_tx_fee
+                ),
+            )
+            self._candidate_prices[is_seller] = cached
+        good_ids, prices = cached[1]
+
         ownership_state = cast(
             OwnershipState, self.context.decision_maker_handler_context.ownership_state
         )
         currency_id = list(ownership_state.amount_by_currency_id.keys())[0]
-        preferences = cast(
-            Preferences, self.context.decision_maker_handler_context.preferences
-        )
-        for good_id, quantity in good_id_to_quantities.items():
-            if is_seller and quantity == 0:
-                continue
+        nil_proposal_dict = {good_id: 0 for good_id in good_ids}  # type: Dict[str, int]
+        for good_id, price in prices:
             proposal_dict = copy.copy(nil_proposal_dict)
             proposal_dict[good_id] = 1
             proposal = build_goods_description(
@@ -395,34 +404,47 @@ class Strategy(Model):
                 ledger_id=self.ledger_id,
                 is_supply=is_seller,
             )
+            proposal.values["price"] = price
+            proposal.values["fee"] = buyer_tx_fee
+            proposal.values["nonce"] = transactions.get_next_nonce()
+            yield proposal
+
+    def _get_candidate_prices(
+        self,
+        ownership_state_after_locks: OwnershipState,
+        is_seller: bool,
+        buyer_tx_fee: int,
+    ) -> Tuple[List[str], List[Tuple[str, int]]]:
+        """
+        Compute the prices of a single unit of every good, from the marginal utilities of all the goods.
+
+        :param ownership_state_after_locks: the ownership state after the locks of the role.
+        :param is_seller: the bool indicating whether the agent is a seller.
+        :param buyer_tx_fee: the transaction fee payable by the buyer.
+
+        :return: the good ids, and the goods with a positive price together with the price.
+        """
+        preferences = cast(
+            Preferences, self.context.decision_maker_handler_context.preferences
+        )
+        quantities_by_good_id = ownership_state_after_locks.quantities_by_good_id
+        good_ids = list(quantities_by_good_id.keys())
+        marginal_utilities_by_good_id = preferences.marginal_utilities_of_goods(
+            quantities_by_good_id, -1 if is_seller else 1
+        )
+        candidate_prices = []  # type: List[Tuple[str, int]]
+        for good_id in good_ids:
+            breakeven_price = round(marginal_utilities_by_good_id[good_id])
             if is_seller:
-                delta_quantities_by_good_id = {
-                    good_id: quantity * -1
-                    for good_id, quantity in proposal_dict.items()
-                }  # type: Dict[str, int]
-            else:
-                delta_quantities_by_good_id = proposal_dict
-            marginal_utility_from_delta_good_holdings = preferences.marginal_utility(
-                ownership_state=ownership_state_after_locks,
-                delta_quantities_by_good_id=delta_quantities_by_good_id,
-            )
-            switch = -1 if is_seller else 1
-            breakeven_price_rounded = (
-                round(marginal_utility_from_delta_good_holdings) * switch
-            )
-            if is_seller:
-                proposal.values["price"] = breakeven_price_rounded + ROUNDING_ADJUSTMENT
+                price = -breakeven_price + ROUNDING_ADJUSTMENT
+                # a seller keeps one unit of each good
+                is_candidate = price > 0 and quantities_by_good_id[good_id] > 1
             else:
-                proposal.values["price"] = (
-                    breakeven_price_rounded - buyer_tx_fee - ROUNDING_ADJUSTMENT
-                )
-            proposal.values["fee"] = buyer_tx_fee
-            if not proposal.values["price"] > 0:
-                continue
-            nonce = transactions.get_next_nonce()
-            proposal.values["nonce"] = nonce
-            proposals.append(proposal)
-        return proposals
+                price = breakeven_price - buyer_tx_fee - ROUNDING_ADJUSTMENT
+                is_candidate = price > 0
+            if is_candidate:
+                candidate_prices.append((good_id, price))
+        return good_ids, candidate_prices
 
     def is_profitable_transaction(
         self, terms: Terms, role: FipaDialogue.Role
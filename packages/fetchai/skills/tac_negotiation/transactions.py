@@ -19,11 +19,14 @@
 
 """This module contains a class to manage transactions."""
 
-import datetime
+import heapq
+import itertools
+import time
 from collections import defaultdict, deque
-from typing import Deque, Dict, List, Tuple, cast
+from functools import partial
+from typing import Any, Deque, Dict, Hashable, List, Optional, Set, Tuple, cast
 
-from aea.decision_maker.default import OwnershipState
+from aea.decision_maker.default import HoldingsCallback, OwnershipState
 from aea.exceptions import enforce
 from aea.helpers.transaction.base import Terms
 from aea.protocols.dialogue.base import DialogueLabel
@@ -33,16 +36,37 @@ from packages.fetchai.skills.tac_negotiation.dialogues import FipaDialogue
 
 
 MessageId = int
+Holdings = Tuple[Dict[str, int], Dict[str, int]]
+ExpiryKey = Tuple[str, Hashable]
+
+PROPOSAL = "proposal"
+INITIAL_ACCEPTANCE = "initial_acceptance"
+LOCKED_TX = "locked_tx"
 
 
 class Transactions(Model):
-    """Class to handle pending transaction proposals/acceptances and locked transactions."""
+    """
+    Class to handle pending transaction proposals/acceptances and locked transactions.
+
+    The ownership states after the locks, one for the seller side and one for the buyer side,
+    are maintained incrementally: a lock is applied when it is added, reverted when it is removed,
+    and the changes of the decision maker ownership state, to which this model subscribes, are
+    applied as deltas.
+
+    Pending proposals, pending initial acceptances and locks expire after the pending transaction
+    timeout. Their deadlines are kept in a heap; an entry whose item was removed in the meantime
+    is discarded when it reaches the top. All the items of a dialogue are indexed by its label,
+    so they can be removed together when the dialogue ends.
+    """
 
     def __init__(self, **kwargs) -> None:
         """Initialize the transactions."""
         self._pending_transaction_timeout = kwargs.pop(
             "pending_transaction_timeout", 30
         )
+        self._check_state_consistency = kwargs.pop(
+            "check_state_consistency", False
+        )  # type: bool
         super().__init__(**kwargs)
         self._pending_proposals = defaultdict(
             lambda: {}
@@ -55,10 +79,21 @@ class Transactions(Model):
         self._locked_txs_as_buyer = {}  # type: Dict[str, Terms]
         self._locked_txs_as_seller = {}  # type: Dict[str, Terms]
 
-        self._last_update_for_transactions = (
-            deque()
-        )  # type: Deque[Tuple[datetime.datetime, str]]
-        self._nonce = 0
+        self._ownership_states_after_locks = {}  # type: Dict[bool, OwnershipState]
+        self._subscribed_ownership_state = None  # type: Optional[OwnershipState]
+        self._holdings_deltas = deque()  # type: Deque[Holdings]
+        self._holdings_callback = None  # type: Optional[HoldingsCallback]
+        self._ownership_state_versions = {True: 0, False: 0}  # type: Dict[bool, int]
+
+        self._locked_tx_ids_per_dialogue = defaultdict(
+            set
+        )  # type: Dict[DialogueLabel, Set[str]]
+        self._dialogue_per_locked_tx = {}  # type: Dict[str, DialogueLabel]
+
+        self._expiry_heap = []  # type: List[Tuple[float, int, ExpiryKey]]
+        self._expiry_seq_per_key = {}  # type: Dict[ExpiryKey, int]
+        self._expiry_seqs = itertools.count()
+        self._nonces = itertools.count(1)
 
     @property
     def pending_proposals(self,) -> Dict[DialogueLabel, Dict[MessageId, Terms]]:
@@ -74,8 +109,7 @@ class Transactions(Model):
 
     def get_next_nonce(self) -> str:
         """Get the next nonce."""
-        self._nonce += 1
-        return str(self._nonce)
+        return str(next(self._nonces))
 
     def update_confirmed_transactions(self) -> None:
         """
@@ -88,44 +122,110 @@ class Transactions(Model):
         )  # type: List[str]
         for transaction_id in confirmed_tx_ids:
             # remove (safely) the associated pending proposal (if present)
-            self._locked_txs.pop(transaction_id, None)
-            self._locked_txs_as_buyer.pop(transaction_id, None)
-            self._locked_txs_as_seller.pop(transaction_id, None)
+            self._remove_locked_tx(transaction_id)
 
-    def cleanup_pending_transactions(self) -> None:
+    def cleanup_pending_transactions(self) -> int:
         """
-        Remove all the pending messages (i.e. either proposals or acceptances) that have been stored for an amount of time longer than the timeout.
+        Remove all the pending proposals, pending initial acceptances and locks that have been stored for an amount of time longer than the timeout.
 
-        :return: None
+        :return: the number of expired items
         """
-        queue = self._last_update_for_transactions
-        timeout = datetime.timedelta(0, self._pending_transaction_timeout)
+        now = time.monotonic()
+        nb_expired = 0
+        heap = self._expiry_heap
+        while len(heap) > 0 and heap[0][0] <= now:
+            _, seq, expiry_key = heapq.heappop(heap)
+            if self._expiry_seq_per_key.get(expiry_key) != seq:
+                # the item was removed, or registered again, in the meantime
+                continue
+            kind, key = expiry_key
+            self.context.logger.debug(
+                "removing {} from pending list: {}".format(kind, key)
+            )
+            if kind == LOCKED_TX:
+                self._remove_locked_tx(cast(str, key))
+            else:
+                dialogue_label, message_id = cast(Tuple[DialogueLabel, MessageId], key)
+                self._remove_pending(kind, dialogue_label, message_id)
+            nb_expired += 1
+        if nb_expired > 0:
+            self.context.logger.info(
+                "expired {} pending items, {} left.".format(
+                    nb_expired, len(self._expiry_seq_per_key)
+                )
+            )
+        return nb_expired
 
-        if len(queue) == 0:
-            return
+    def remove_dialogue(self, dialogue_label: DialogueLabel) -> int:
+        """
+        Remove all the pending proposals, pending initial acceptances and locks of a dialogue.
 
-        next_date, next_item = queue[0]
+        :param dialogue_label: the dialogue label
+        :return: the number of removed items
+        """
+        nb_removed = 0
+        for kind, pending in (
+            (PROPOSAL, self._pending_proposals),
+            (INITIAL_ACCEPTANCE, self._pending_initial_acceptances),
+        ):
+            for message_id in list(pending.get(dialogue_label, {}).keys()):
+                self._remove_pending(kind, dialogue_label, message_id)
+                nb_removed += 1
+        for transaction_id in list(
+            self._locked_tx_ids_per_dialogue.get(dialogue_label, ())
+        ):
+            self._remove_locked_tx(transaction_id)
+            nb_removed += 1
+        return nb_removed
+
+    def _schedule_expiry(self, expiry_key: ExpiryKey) -> None:
+        """
+        Schedule the expiry of an item after the pending transaction timeout.
 
-        while datetime.datetime.now() - next_date > timeout:
+        :param expiry_key: the kind of the item and its key
 
-            # remove the element from the queue
-            queue.popleft()
+        :return: None
+        """
+        seq = next(self._expiry_seqs)
+        self._expiry_seq_per_key[expiry_key] = seq
+        if len(self._expiry_heap) > 2 * len(self._expiry_seq_per_key) + 64:
+            # most entries belong to removed items: drop them, in amortized constant time
+            self._expiry_heap = [
+                entry
+                for entry in self._expiry_heap
+                if self._expiry_seq_per_key.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._expiry_heap)
+        heapq.heappush(
+            self._expiry_heap,
+            (time.monotonic() + self._pending_transaction_timeout, seq, expiry_key),
+        )
 
-            # extract dialogue label and message id
-            transaction_id = next_item
-            self.context.logger.debug(
-                "removing transaction from pending list: {}".format(transaction_id)
-            )
+    def _remove_pending(
+        self, kind: str, dialogue_label: DialogueLabel, message_id: MessageId
+    ) -> Optional[Terms]:
+        """
+        Remove a pending proposal or initial acceptance, if present.
 
-            # remove (safely) the associated pending proposal (if present)
-            self._locked_txs.pop(transaction_id, None)
-            self._locked_txs_as_buyer.pop(transaction_id, None)
-            self._locked_txs_as_seller.pop(transaction_id, None)
+        :param kind: the kind of the item, PROPOSAL or INITIAL_ACCEPTANCE
+        :param dialogue_label: the dialogue label
+        :param message_id: the message id
 
-            # check the next transaction, if present
-            if len(queue) == 0:
-                break  # pragma: no cover
-            next_date, next_item = queue[0]  # pragma: no cover
+        :return: the terms, if present
+        """
+        pending = (
+            self._pending_proposals
+            if kind == PROPOSAL
+            else self._pending_initial_acceptances
+        )  # type: Dict[DialogueLabel, Dict[MessageId, Any]]
+        pending_of_dialogue = pending.get(dialogue_label)
+        if pending_of_dialogue is None:
+            return None
+        terms = pending_of_dialogue.pop(message_id, None)
+        if len(pending_of_dialogue) == 0:
+            pending.pop(dialogue_label)
+        self._expiry_seq_per_key.pop((kind, (dialogue_label, message_id)), None)
+        return terms
 
     def add_pending_proposal(
         self, dialogue_label: DialogueLabel, proposal_id: int, terms: Terms,
@@ -146,6 +246,20 @@ class Transactions(Model):
             "Proposal is already in the list of pending proposals.",
         )
         self._pending_proposals[dialogue_label][proposal_id] = terms
+        self._schedule_expiry((PROPOSAL, (dialogue_label, proposal_id)))
+
+    def has_pending_proposal(
+        self, dialogue_label: DialogueLabel, proposal_id: int
+    ) -> bool:
+        """
+        Check whether a proposal is in the pending list, i.e. it was added and has neither been removed nor expired.
+
+        :param dialogue_label: the dialogue label associated with the proposal
+        :param proposal_id: the message id of the proposal
+
+        :return: whether the proposal is pending
+        """
+        return proposal_id in self._pending_proposals.get(dialogue_label, {})
 
     def pop_pending_proposal(
         self, dialogue_label: DialogueLabel, proposal_id: int
@@ -164,8 +278,7 @@ class Transactions(Model):
             and proposal_id in self._pending_proposals[dialogue_label],
             "Cannot find the proposal in the list of pending proposals.",
         )
-        terms = self._pending_proposals[dialogue_label].pop(proposal_id)
-        return terms
+        return cast(Terms, self._remove_pending(PROPOSAL, dialogue_label, proposal_id))
 
     def add_pending_initial_acceptance(
         self, dialogue_label: DialogueLabel, proposal_id: int, terms: Terms,
@@ -186,6 +299,20 @@ class Transactions(Model):
             "Initial acceptance is already in the list of pending initial acceptances.",
         )
         self._pending_initial_acceptances[dialogue_label][proposal_id] = terms
+        self._schedule_expiry((INITIAL_ACCEPTANCE, (dialogue_label, proposal_id)))
+
+    def has_pending_initial_acceptance(
+        self, dialogue_label: DialogueLabel, proposal_id: int
+    ) -> bool:
+        """
+        Check whether an acceptance is in the pending list, i.e. it was added and has neither been removed nor expired.
+
+        :param dialogue_label: the dialogue label associated with the proposal
+        :param proposal_id: the message id of the proposal
+
+        :return: whether the acceptance is pending
+        """
+        return proposal_id in self._pending_initial_acceptances.get(dialogue_label, {})
 
     def pop_pending_initial_acceptance(
         self, dialogue_label: DialogueLabel, proposal_id: int
@@ -204,26 +331,23 @@ class Transactions(Model):
             and proposal_id in self._pending_initial_acceptances[dialogue_label],
             "Cannot find the initial acceptance in the list of pending initial acceptances.",
         )
-        terms = self._pending_initial_acceptances[dialogue_label].pop(proposal_id)
-        return terms
-
-    def _register_transaction_with_time(self, transaction_id: str) -> None:
-        """
-        Register a transaction with a creation datetime.
-
-        :param transaction_id: the transaction id
-
-        :return: None
-        """
-        now = datetime.datetime.now()
-        self._last_update_for_transactions.append((now, transaction_id))
+        return cast(
+            Terms,
+            self._remove_pending(INITIAL_ACCEPTANCE, dialogue_label, proposal_id),
+        )
 
-    def add_locked_tx(self, terms: Terms, role: FipaDialogue.Role) -> None:
+    def add_locked_tx(
+        self,
+        terms: Terms,
+        role: FipaDialogue.Role,
+        dialogue_label: Optional[DialogueLabel] = None,
+    ) -> None:
         """
         Add a lock (in the form of a transaction).
 
         :param terms: the terms
         :param role: the role of the agent (seller or buyer)
+        :param dialogue_label: the label of the dialogue of the lock, if any
         :raise AEAEnforceError: if the transaction is already present.
 
         :return: None
@@ -235,12 +359,19 @@ class Transactions(Model):
             transaction_id not in self._locked_txs,
             "This transaction is already a locked transaction.",
         )
-        self._register_transaction_with_time(transaction_id)
+        self._schedule_expiry((LOCKED_TX, transaction_id))
         self._locked_txs[transaction_id] = terms
+        if dialogue_label is not None:
+            self._locked_tx_ids_per_dialogue[dialogue_label].add(transaction_id)
+            self._dialogue_per_locked_tx[transaction_id] = dialogue_label
         if as_seller:
             self._locked_txs_as_seller[transaction_id] = terms
         else:
             self._locked_txs_as_buyer[transaction_id] = terms
+        self._ownership_state_versions[as_seller] += 1
+        ownership_state = self._ownership_states_after_locks.get(as_seller)
+        if ownership_state is not None:
+            ownership_state.update(terms)
 
     def pop_locked_tx(self, terms: Terms) -> Terms:
         """
@@ -256,30 +387,185 @@ class Transactions(Model):
             transaction_id in self._locked_txs,
             "Cannot find this transaction in the list of locked transactions.",
         )
-        terms = self._locked_txs.pop(transaction_id)
+        return cast(Terms, self._remove_locked_tx(transaction_id))
+
+    def _remove_locked_tx(self, transaction_id: str) -> Optional[Terms]:
+        """
+        Remove a lock, if present, and revert it on the ownership state after the locks.
+
+        :param transaction_id: the transaction id
+
+        :return: the terms of the lock, if present
+        """
+        terms = self._locked_txs.pop(transaction_id, None)
+        if terms is None:
+            return None
+        as_seller = transaction_id in self._locked_txs_as_seller
         self._locked_txs_as_buyer.pop(transaction_id, None)
         self._locked_txs_as_seller.pop(transaction_id, None)
+        self._expiry_seq_per_key.pop((LOCKED_TX, transaction_id), None)
+        dialogue_label = self._dialogue_per_locked_tx.pop(transaction_id, None)
+        if dialogue_label is not None:
+            locked_tx_ids = self._locked_tx_ids_per_dialogue[dialogue_label]
+            locked_tx_ids.discard(transaction_id)
+            if len(locked_tx_ids) == 0:
+                self._locked_tx_ids_per_dialogue.pop(dialogue_label)
+        self._ownership_state_versions[as_seller] += 1
+        ownership_state = self._ownership_states_after_locks.get(as_seller)
+        if ownership_state is not None:
+            ownership_state.apply_delta(
+                delta_amount_by_currency_id={
+                    currency_id: -amount
+                    for currency_id, amount in terms.amount_by_currency_id.items()
+                },
+                delta_quantities_by_good_id={
+                    good_id: -quantity
+                    for good_id, quantity in terms.quantities_by_good_id.items()
+                },
+            )
         return terms
 
-    def ownership_state_after_locks(
-        self, is_seller: bool
-    ) -> OwnershipState:  # pragma: no cover
+    def teardown(self) -> None:
         """
-        Apply all the locks to the current ownership state of the agent.
+        Unsubscribe from the decision maker ownership state.
 
-        This assumes, that all the locked transactions will be successful.
+        :return: None
+        """
+        if self._subscribed_ownership_state is not None:
+            self._subscribed_ownership_state.unsubscribe(
+                cast(HoldingsCallback, self._holdings_callback)
+            )
+            self._subscribed_ownership_state = None
+            self._holdings_callback = None
+
+    @staticmethod
+    def _on_holdings_changed(
+        holdings_deltas: Deque[Holdings],
+        delta_amount_by_currency_id: Dict[str, int],
+        delta_quantities_by_good_id: Dict[str, int],
+    ) -> None:
+        """
+        Record a change of the decision maker ownership state.
+
+        It is called in the thread of the decision maker, so the change is only queued here.
+
+        :param holdings_deltas: the queue of the changes of the subscription.
+        :param delta_amount_by_currency_id: the non-zero changes of the currency amounts.
+        :param delta_quantities_by_good_id: the non-zero changes of the good quantities.
+
+        :return: None
+        """
+        holdings_deltas.append(
+            (delta_amount_by_currency_id, delta_quantities_by_good_id)
+        )
+
+    def _sync_ownership_states(self, ownership_state: OwnershipState) -> None:
+        """
+        Bring the ownership states after the locks in line with the decision maker ownership state.
+
+        The states are built on first use, or if the last snapshot was taken before the state was
+        initialized, from the snapshot taken on subscription. Afterwards, the changes notified since
+        the last call are applied to both of them as deltas. Every subscription has its own queue,
+        so a change notified late to a former subscription is not applied to the new snapshot.
+
+        :param ownership_state: the ownership state of the decision maker.
+
+        :return: None
+        """
+        if (
+            ownership_state is not self._subscribed_ownership_state
+            or not self._ownership_states_after_locks[True].is_initialized
+        ):
+            self.teardown()
+            self._holdings_deltas = deque()
+            self._holdings_callback = partial(
+                self._on_holdings_changed, self._holdings_deltas
+            )
+            snapshot = ownership_state.subscribe(self._holdings_callback)
+            self._subscribed_ownership_state = ownership_state
+            self._ownership_states_after_locks = {
+                True: snapshot.apply_transactions(
+                    list(self._locked_txs_as_seller.values())
+                ),
+                False: snapshot.apply_transactions(
+                    list(self._locked_txs_as_buyer.values())
+                ),
+            }
+        elif len(self._holdings_deltas) == 0:
+            return
+        else:
+            while len(self._holdings_deltas) > 0:
+                (
+                    delta_amount_by_currency_id,
+                    delta_quantities_by_good_id,
+                ) = self._holdings_deltas.popleft()
+                for state_after_locks in self._ownership_states_after_locks.values():
+                    state_after_locks.apply_delta(
+                        delta_amount_by_currency_id=delta_amount_by_currency_id,
+                        delta_quantities_by_good_id=delta_quantities_by_good_id,
+                    )
+        self._ownership_state_versions[True] += 1
+        self._ownership_state_versions[False] += 1
+
+    def _check_ownership_state(
+        self, is_seller: bool, ownership_state: OwnershipState
+    ) -> None:
+        """
+        Check the ownership state after the locks against a state recomputed from scratch.
 
         :param is_seller: Boolean indicating the role of the agent.
+        :param ownership_state: the ownership state of the decision maker.
+        :raise AEAEnforceError: if the states differ.
 
-        :return: the agent state with the locks applied to current state
+        :return: None
         """
         all_terms = (
             list(self._locked_txs_as_seller.values())
             if is_seller
             else list(self._locked_txs_as_buyer.values())
         )
+        expected = ownership_state.apply_transactions(all_terms)
+        actual = self._ownership_states_after_locks[is_seller]
+        enforce(
+            actual.amount_by_currency_id == expected.amount_by_currency_id
+            and actual.quantities_by_good_id == expected.quantities_by_good_id,
+            "Inconsistent ownership state after locks.",
+        )
+
+    def ownership_state_after_locks(self, is_seller: bool) -> OwnershipState:
+        """
+        Apply all the locks to the current ownership state of the agent.
+
+        This assumes, that all the locked transactions will be successful.
+        The returned state is maintained by this model and must not be modified.
+
+        :param is_seller: Boolean indicating the role of the agent.
+
+        :return: the agent state with the locks applied to current state
+        """
         ownership_state = cast(
             OwnershipState, self.context.decision_maker_handler_context.ownership_state
         )
-        ownership_state_after_locks = ownership_state.apply_transactions(all_terms)
-        return ownership_state_after_locks
+        if not ownership_state.is_initialized:
+            all_terms = (
+                list(self._locked_txs_as_seller.values())
+                if is_seller
+                else list(self._locked_txs_as_buyer.values())
+            )
+            return ownership_state.apply_transactions(all_terms)
+        self._sync_ownership_states(ownership_state)
+        if self._check_state_consistency:
+            self._check_ownership_state(is_seller, ownership_state)
+        return self._ownership_states_after_locks[is_seller]
+
+    def ownership_state_after_locks_version(self, is_seller: bool) -> int:
+        """
+        Get the version of the ownership state after the locks, which changes whenever the state changes.
+
+        It is up to date after a call to ownership_state_after_locks.
+
+        :param is_seller: Boolean indicating the role of the agent.
+
+        :return: the version
+        """
+        return self._ownership_state_versions[is_seller]
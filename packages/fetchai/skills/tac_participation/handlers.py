@@ -406,11 +406,20 @@ class TacHandler(Handler):
         last_msg = state_update_dialogue.last_message
         if last_msg is None:
             raise ValueError("Could not retrieve last message.")
+        # the update is a delta: only the holdings the transaction changes are sent
         state_update_msg = state_update_dialogue.reply(
             performative=StateUpdateMessage.Performative.APPLY,
             target_message=last_msg,
-            amount_by_currency_id=tac_msg.amount_by_currency_id,
-            quantities_by_good_id=tac_msg.quantities_by_good_id,
+            amount_by_currency_id={
+                currency_id: amount
+                for currency_id, amount in tac_msg.amount_by_currency_id.items()
+                if amount != 0
+            },
+            quantities_by_good_id={
+                good_id: quantity
+                for good_id, quantity in tac_msg.quantities_by_good_id.items()
+                if quantity != 0
+            },
         )
         self.context.decision_maker_message_queue.put_nowait(state_update_msg)
         if "confirmed_tx_ids" not in self.context.shared_state.keys():
@@ -159,6 +159,28 @@ class TestConnectionConfig:
         actual_json = actual_config.json
         assert expected_json == actual_json
 
+    def test_connect_ordering_and_timeout(self):
+        """Test the optional 'connect_after' and 'connect_timeout' fields."""
+        config = ConnectionConfig(connection_id=PublicId("fetchai", "soef", "0.1.0"))
+        assert config.connect_after == set()
+        assert config.connect_timeout is None
+        assert "connect_after" not in config.json
+        assert "connect_timeout" not in config.json
+
+        config = ConnectionConfig.from_json(
+            dict(
+                config.json,
+                connect_after=["fetchai/p2p_libp2p:0.11.0"],
+                connect_timeout=10.0,
+            )
+        )
+        assert config.connect_after == {PublicId("fetchai", "p2p_libp2p", "0.11.0")}
+        assert config.connect_timeout == 10.0
+        assert ConnectionConfig.from_json(config.json).json == config.json
+
+        config.update({"connect_timeout": 20.0})
+        assert config.connect_timeout == 20.0
+
 
 class TestProtocolConfig:
     """Test the protocol configuration class."""
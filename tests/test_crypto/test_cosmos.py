@@ -18,14 +18,102 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the tests of the ethereum module."""
+import json
+import subprocess  # nosec
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
+from threading import Thread
+from typing import cast
 from unittest.mock import MagicMock
 
-from aea.crypto.cosmos import CosmosApi, CosmosCrypto
+import pytest
+
+from aea.configurations.base import ComponentType, ContractConfig
+from aea.configurations.loader import load_component_configuration
+from aea.contracts.base import Contract, contract_registry
+from aea.crypto.cosmos import CliRunner, CosmosApi, CosmosCrypto
 
 from tests.conftest import COSMOS_PRIVATE_KEY_PATH, COSMOS_TESTNET_CONFIG, ROOT_DIR
 
 
+CODES = [{"id": 1, "creator": "creator"}, {"id": 2, "creator": "creator"}]
+CONTRACTS = [{"address": "contract_1", "code_id": 2}, {"address": "contract_2"}]
+QUERY_RESULT = {"balance": "42"}
+
+FAKE_CLI = """#!{executable}
+import json, sys, time
+args = sys.argv[1:]
+if args[:3] == ["query", "wasm", "list-code"]:
+    print(json.dumps({codes}))
+elif args[:3] == ["query", "wasm", "list-contract-by-code"]:
+    print(json.dumps({contracts}))
+elif args[:4] == ["query", "wasm", "contract-state", "smart"]:
+    time.sleep(json.loads(args[5]).get("sleep", 0))
+    print(json.dumps({query_result}))
+else:
+    sys.exit(1)
+"""
+
+
+class FakeWasmLCD(BaseHTTPRequestHandler):
+    """Answer the wasm queries to the REST server (LCD) of a node."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle a query."""
+        path, _, query_string = self.path.partition("?")
+        if path == "/wasm/code":
+            result = CODES  # type: object
+        elif path == "/wasm/code/2/contracts":
+            result = CONTRACTS
+        elif path.startswith("/wasm/contract/contract_2/smart/"):
+            assert query_string == "encoding=hex"
+            query_msg = json.loads(bytes.fromhex(path.rsplit("/", 1)[1]))
+            assert query_msg == {"balance": {"address": "address", "id": "1"}}
+            result = QUERY_RESULT
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps({"height": "1", "result": result}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+@pytest.fixture
+def fake_lcd_address():
+    """Run a fake LCD server with wasm queries."""
+    server = HTTPServer(("127.0.0.1", 0), FakeWasmLCD)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://{}:{}".format(*server.server_address)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    """Write a fake wasm command line tool."""
+    path = tmp_path / "fake_wasmcli"
+    path.write_text(
+        FAKE_CLI.format(
+            executable=sys.executable,
+            codes=CODES,
+            contracts=CONTRACTS,
+            query_result=QUERY_RESULT,
+        )
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
 def test_creation():
     """Test the creation of the crypto_objects."""
     assert CosmosCrypto(), "Did not manage to initialise the crypto module"
@@ -106,3 +194,85 @@ def test_load_contract_interface():
     path = Path(ROOT_DIR, "tests", "data", "dummy_contract", "build", "some.wasm")
     result = CosmosApi.load_contract_interface(path)
     assert "wasm_byte_code" in result
+    assert CosmosApi.load_contract_interface(path) is result
+    with pytest.raises(TypeError):
+        result["wasm_byte_code"] = ""  # type: ignore
+
+
+def test_wasm_queries_rest(fake_lcd_address):
+    """Test the wasm queries go to the REST server of the node."""
+    cosmos_api = CosmosApi(
+        address=fake_lcd_address, cli_command="not_a_command", wasm_query_mode="rest"
+    )
+    assert cosmos_api.get_last_code_id() == 2
+    assert cosmos_api.get_contract_address(2) == "contract_2"
+    result = cosmos_api.try_execute_wasm_query(
+        "contract_2", {"balance": {"address": "address", "id": "1"}}
+    )
+    assert json.loads(result) == QUERY_RESULT
+    assert cosmos_api.try_execute_wasm_query("contract_1", {}) is None
+
+
+def test_wasm_queries_cli(fake_cli):
+    """Test the wasm queries run the command line tool in cli mode."""
+    cosmos_api = CosmosApi(cli_command=fake_cli)
+    assert cosmos_api.wasm_query_mode == "cli"
+    assert cosmos_api.get_last_code_id() == 2
+    assert cosmos_api.get_contract_address(2) == "contract_2"
+    result = cosmos_api.try_execute_wasm_query("contract_2", {})
+    assert json.loads(result) == QUERY_RESULT
+
+
+def test_wasm_queries_rest_match_cli(fake_lcd_address, fake_cli):
+    """Test the erc1155 contract parses the results of the REST queries like the CLI output."""
+    directory = Path(ROOT_DIR, "packages", "fetchai", "contracts", "erc1155")
+    configuration = cast(
+        ContractConfig, load_component_configuration(ComponentType.CONTRACT, directory),
+    )
+    configuration._directory = directory  # pylint: disable=protected-access
+    if str(configuration.public_id) not in contract_registry.specs:
+        Contract.from_config(configuration)
+    contract = contract_registry.make(str(configuration.public_id))
+    rest_api = CosmosApi(address=fake_lcd_address, wasm_query_mode="rest")
+    cli_api = CosmosApi(cli_command=fake_cli, wasm_query_mode="cli")
+
+    results = [
+        (
+            contract.get_balance(api, "contract_2", "address", 1),
+            contract.get_last_code_id(api),
+            contract.get_contract_address(api, 2),
+        )
+        for api in (rest_api, cli_api)
+    ]
+    assert results[0] == results[1] == ({"balance": {1: 42}}, 2, "contract_2")
+
+
+def test_wasm_query_mode_unknown():
+    """Test an unknown wasm query mode is rejected."""
+    with pytest.raises(ValueError, match="Unknown wasm query mode"):
+        CosmosApi(wasm_query_mode="grpc")
+
+
+def test_cli_runner_timeout(fake_cli):
+    """Test the command line runner kills commands which time out."""
+    runner = CliRunner(max_processes=1, timeout=0.2)
+    command = [fake_cli, "query", "wasm", "contract-state", "smart", "contract"]
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run(command + [json.dumps({"sleep": 5})])
+    assert json.loads(runner.run(command + ["{}"])) == QUERY_RESULT
+
+
+def test_cli_runner_bounded(fake_cli):
+    """Test the command line runner bounds the number of running commands."""
+    sleep = 0.3
+    runner = CliRunner(max_processes=2, timeout=10)
+    command = [fake_cli, "query", "wasm", "contract-state", "smart", "contract"]
+    command.append(json.dumps({"sleep": sleep}))
+    start_time = time.time()
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: runner.run(command), range(4)))
+    assert time.time() - start_time >= 2 * sleep
+    assert all(json.loads(result) == QUERY_RESULT for result in results)
+
+    with pytest.raises(ValueError):
+        CliRunner(max_processes=0)
@@ -20,15 +20,31 @@
 """This module contains the tests of the ethereum module."""
 
 import hashlib
+import json
 import logging
+import os
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Dict, List, Set
+from unittest.mock import MagicMock, patch
 
 import eth_account
 import pytest
-
-from aea.crypto.ethereum import EthereumApi, EthereumCrypto, EthereumFaucetApi
+import rlp
+from eth_account import Account
+from web3 import Web3
+
+from aea.crypto.ethereum import (
+    EthereumApi,
+    EthereumCrypto,
+    EthereumFaucetApi,
+    NonceManager,
+    _contract_instances,
+)
 
 from tests.conftest import ETHEREUM_PRIVATE_KEY_PATH, MAX_FLAKY_RERUNS, ROOT_DIR
 
@@ -247,3 +263,314 @@ def test_load_contract_interface():
     result = EthereumApi.load_contract_interface(path)
     assert "abi" in result
     assert "bytecode" in result
+
+
+def test_load_contract_interface_cached(tmp_path):
+    """Test contract interfaces are cached until their file changes, and are read-only."""
+    path = Path(tmp_path, "some.json")
+    shutil.copy(
+        Path(ROOT_DIR, "tests", "data", "dummy_contract", "build", "some.json"), path
+    )
+    result = EthereumApi.load_contract_interface(path)
+    assert EthereumApi.load_contract_interface(path) is result
+    with pytest.raises(TypeError):
+        result["abi"] = []  # type: ignore
+    assert isinstance(result["abi"], tuple)
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    reloaded = EthereumApi.load_contract_interface(path)
+    assert reloaded is not result
+    assert reloaded == result
+
+
+def test_get_contract_instance_cached():
+    """Test contract instances are cached per node and contract address."""
+    path = Path(ROOT_DIR, "tests", "data", "dummy_contract", "build", "some.json")
+    interface = EthereumApi.load_contract_interface(path)
+    contract_address = EthereumCrypto().address
+    api = EthereumApi(address="http://127.0.0.1:8546")
+
+    instance = api.get_contract_instance(interface, contract_address)
+    assert instance.address == contract_address
+    assert (
+        EthereumApi(address="http://127.0.0.1:8546").get_contract_instance(
+            interface, contract_address.lower()
+        )
+        is instance
+    )
+    assert api.get_contract_instance(interface) is api.get_contract_instance(interface)
+    assert api.get_contract_instance(interface) is not instance
+    assert (
+        EthereumApi(address="http://127.0.0.1:8547").get_contract_instance(
+            interface, contract_address
+        )
+        is not instance
+    )
+    other_interface = dict(interface)
+    assert api.get_contract_instance(other_interface, contract_address) is not instance
+    # the previous interface is still cached alongside the other one
+    assert api.get_contract_instance(interface, contract_address) is instance
+
+
+def test_get_contract_instance_cache_bounded():
+    """Test the least recently used contract instances are evicted from the cache."""
+    path = Path(ROOT_DIR, "tests", "data", "dummy_contract", "build", "some.json")
+    interface = EthereumApi.load_contract_interface(path)
+    api = EthereumApi(address="http://127.0.0.1:8548")
+    instance = api.get_contract_instance(interface)
+    with patch("aea.crypto.ethereum.CONTRACT_INSTANCES_CACHE_SIZE", 2):
+        other_interfaces = [dict(interface), dict(interface)]
+        other_instance = api.get_contract_instance(other_interfaces[0])
+        assert api.get_contract_instance(interface) is instance
+        api.get_contract_instance(other_interfaces[1])
+        assert len(_contract_instances) == 2
+        assert api.get_contract_instance(interface) is instance
+        assert api.get_contract_instance(other_interfaces[0]) is not other_instance
+
+
+class EVMNodeStandIn(BaseHTTPRequestHandler):
+    """
+    Answer the JSON-RPC requests of an ethereum node, single or batched.
+
+    Sent transactions are only checked for nonce reuse.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    lock = threading.Lock()
+    nb_http_requests = 0
+    methods = []  # type: List[str]
+    used_nonces = {}  # type: Dict[str, Set[int]]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the state of the node."""
+        cls.nb_http_requests = 0
+        cls.methods = []
+        cls.used_nonces = {}
+
+    def _answer(self, request: Dict) -> Dict:
+        method, params = request["method"], request["params"]
+        self.methods.append(method)
+        response = {"jsonrpc": "2.0", "id": request["id"]}
+        if method in ("eth_chainId", "net_version"):
+            response["result"] = hex(1337)
+        elif method == "eth_getTransactionCount":
+            used = self.used_nonces.get(params[0].lower(), set())
+            response["result"] = hex(max(used) + 1 if used else 0)
+        elif method == "eth_estimateGas":
+            response["result"] = hex(21000)
+        elif method == "eth_sendRawTransaction":
+            raw = bytes.fromhex(params[0][2:])
+            sender = Account.recover_transaction(raw).lower()
+            nonce = int.from_bytes(rlp.decode(raw)[0], "big")
+            used = self.used_nonces.setdefault(sender, set())
+            if nonce in used:
+                response["error"] = {"code": -32000, "message": "nonce too low"}
+            else:
+                used.add(nonce)
+                response["result"] = "0x" + hashlib.sha256(raw).hexdigest()
+        else:
+            response["error"] = {"code": -32601, "message": "method not found"}
+        return response
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Handle a request."""
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            EVMNodeStandIn.nb_http_requests += 1
+            if isinstance(request, list):
+                response = [self._answer(item) for item in request]  # type: object
+            else:
+                response = self._answer(request)
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+class _ThreadingHTTPServer(HTTPServer):
+    """Serve every connection in its own thread."""
+
+    def process_request(self, request, client_address) -> None:
+        """Start a thread to handle the request."""
+        threading.Thread(
+            target=self._handle, args=(request, client_address), daemon=True
+        ).start()
+
+    def _handle(self, request, client_address) -> None:
+        self.finish_request(request, client_address)
+        self.shutdown_request(request)
+
+
+@pytest.fixture
+def evm_node_address():
+    """Run a local stand-in for an ethereum node."""
+    EVMNodeStandIn.reset()
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), EVMNodeStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://{}:{}".format(*server.server_address)
+    server.shutdown()
+    server.server_close()
+
+
+def _get_transfer_transaction(api: EthereumApi, sender: str, receiver: str) -> Dict:
+    return api.get_transfer_transaction(
+        sender_address=sender,
+        destination_address=receiver,
+        amount=1,
+        tx_fee=30000,
+        tx_nonce=api.generate_tx_nonce(receiver, sender),
+    )
+
+
+ADDRESS = "0x" + "ab" * 20
+
+
+def test_nonce_manager():
+    """Test the nonce manager reserves, releases and syncs nonces."""
+    manager = NonceManager()
+    assert not manager.is_synced(ADDRESS)
+    with pytest.raises(ValueError, match="not synced"):
+        manager.reserve(ADDRESS)
+
+    manager.sync(ADDRESS, 5)
+    assert manager.is_synced(ADDRESS)
+    assert [manager.reserve(ADDRESS) for _ in range(4)] == [5, 6, 7, 8]
+
+    manager.release(ADDRESS, 8)
+    manager.release(ADDRESS, 6)
+    manager.release(ADDRESS, 5)
+    manager.release(ADDRESS, 10)
+    assert [manager.reserve(ADDRESS) for _ in range(4)] == [5, 6, 8, 9]
+
+    manager.release(ADDRESS, 7)
+    manager.sync(ADDRESS, 8)
+    assert manager.reserve(ADDRESS) == 10
+    manager.sync(ADDRESS, 20)
+    assert manager.reserve(ADDRESS) == 20
+
+    manager.reset(ADDRESS)
+    assert not manager.is_synced(ADDRESS)
+    manager.sync(ADDRESS, 1)
+    manager.reset()
+    assert not manager.is_synced(ADDRESS)
+
+
+def test_nonce_manager_address_case():
+    """Test the nonces of an address are shared by all the spellings of the address."""
+    manager = NonceManager()
+    checksum_address = Web3.toChecksumAddress(ADDRESS)
+    manager.sync(ADDRESS, 3)
+    assert manager.is_synced(checksum_address)
+    assert manager.reserve(checksum_address) == 3
+    manager.release(ADDRESS.upper().replace("0X", "0x"), 3)
+    assert manager.reserve(ADDRESS) == 3
+    manager.reset(checksum_address)
+    assert not manager.is_synced(ADDRESS)
+
+
+def test_nonce_manager_concurrent_reservations():
+    """Test concurrent reservations get distinct nonces."""
+    manager = NonceManager()
+    manager.sync(ADDRESS, 0)
+    with ThreadPoolExecutor(8) as executor:
+        nonces = list(executor.map(lambda _: manager.reserve(ADDRESS), range(400)))
+    assert sorted(nonces) == list(range(400))
+
+
+def test_transfer_transactions_without_local_nonces(evm_node_address):
+    """Test every transfer transaction gets its nonce and gas estimate from the node."""
+    sender = EthereumCrypto()
+    api = EthereumApi(address=evm_node_address)
+    for _ in range(3):
+        transaction = _get_transfer_transaction(api, sender.address, sender.address)
+        assert transaction["nonce"] == 0
+    assert EVMNodeStandIn.methods.count("eth_getTransactionCount") == 3
+    assert EVMNodeStandIn.methods.count("eth_estimateGas") == 3
+
+
+def test_transfer_transactions_with_local_nonces(evm_node_address):
+    """Test transfer transactions get distinct nonces, with one batched request to the node."""
+    sender, receiver = EthereumCrypto(), EthereumCrypto()
+    config = dict(address=evm_node_address, local_nonces=True, cache_gas_estimates=True)
+    transactions = [
+        _get_transfer_transaction(EthereumApi(**config), sender.address, addr)
+        for addr in [receiver.address] * 10
+    ]
+    assert [transaction["nonce"] for transaction in transactions] == list(range(10))
+    assert all(transaction["gas"] == 30000 for transaction in transactions)
+    assert EVMNodeStandIn.nb_http_requests == 1
+    assert sorted(EVMNodeStandIn.methods) == [
+        "eth_estimateGas",
+        "eth_getTransactionCount",
+    ]
+
+    api = EthereumApi(**config)
+    for transaction in transactions:
+        tx_digest = api.send_signed_transaction(sender.sign_transaction(transaction))
+        assert tx_digest is not None
+    assert EVMNodeStandIn.used_nonces[sender.address.lower()] == set(range(10))
+
+
+def test_local_nonces_concurrent_senders(evm_node_address):
+    """Test concurrent transfer transactions from one address do not collide."""
+    sender, receiver = EthereumCrypto(), EthereumCrypto()
+    api = EthereumApi(address=evm_node_address, local_nonces=True)
+
+    def build_and_send(_) -> str:
+        transaction = _get_transfer_transaction(api, sender.address, receiver.address)
+        return api.send_signed_transaction(sender.sign_transaction(transaction))
+
+    with ThreadPoolExecutor(8) as executor:
+        tx_digests = list(executor.map(build_and_send, range(40)))
+    assert all(tx_digest is not None for tx_digest in tx_digests)
+    assert EVMNodeStandIn.used_nonces[sender.address.lower()] == set(range(40))
+
+
+def test_local_nonces_reconcile(evm_node_address):
+    """Test released nonces are reused and failed sends resync the nonces with the node."""
+    sender = EthereumCrypto()
+    api = EthereumApi(address=evm_node_address, local_nonces=True)
+    assert api.reserve_nonce(sender.address) == 0
+    assert api.reserve_nonce(sender.address) == 1
+    api.release_nonce(sender.address, 0)
+    transaction = _get_transfer_transaction(api, sender.address, sender.address)
+    assert transaction["nonce"] == 0
+    assert api.send_signed_transaction(sender.sign_transaction(transaction))
+
+    # nonce 1 is still reserved; another client sends a transaction with nonce 2
+    EVMNodeStandIn.used_nonces[sender.address.lower()].add(2)
+    transaction = _get_transfer_transaction(api, sender.address, sender.address)
+    assert transaction["nonce"] == 2
+    assert api.send_signed_transaction(sender.sign_transaction(transaction)) is None
+    assert not api.nonce_manager.is_synced(sender.address)
+
+    transaction = _get_transfer_transaction(api, sender.address, sender.address)
+    assert transaction["nonce"] == 3
+    assert api.send_signed_transaction(sender.sign_transaction(transaction))
+
+    with pytest.raises(ValueError, match="not enabled"):
+        EthereumApi(address=evm_node_address).nonce_manager
+
+
+def test_local_nonces_reconcile_lowercase_address(evm_node_address):
+    """Test a failed send resyncs the nonces reserved under a lowercase sender address."""
+    sender = EthereumCrypto()
+    address = sender.address.lower()
+    api = EthereumApi(address=evm_node_address, local_nonces=True)
+    transaction = _get_transfer_transaction(api, address, sender.address)
+    assert transaction["nonce"] == 0
+    EVMNodeStandIn.used_nonces.setdefault(address, set()).add(0)
+    assert api.send_signed_transaction(sender.sign_transaction(transaction)) is None
+    assert not api.nonce_manager.is_synced(address)
+
+    transaction = _get_transfer_transaction(api, address, sender.address)
+    assert transaction["nonce"] == 1
+    assert api.send_signed_transaction(sender.sign_transaction(transaction))
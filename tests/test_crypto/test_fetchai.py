@@ -532,7 +532,7 @@ def test_get_handle_transaction_cosmwasm():
 @pytest.mark.ledger
 def test_try_execute_wasm_query():
     """Test the execute wasm query method."""
-    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG)
+    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG, wasm_query_mode="cli")
     process_mock = mock.Mock()
     output = "output".encode("ascii")
     attrs = {"communicate.return_value": (output, "error")}
@@ -600,7 +600,7 @@ def test_get_contract_address(mock_api_call):
 
     mock_api_call.return_value = mock_res
 
-    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG)
+    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG, wasm_query_mode="cli")
 
     res = cosmos_api.get_contract_address(code_id=999)
     assert res == mock_res[-1]["address"]
@@ -625,7 +625,7 @@ def test_get_last_code_id(mock_api_call):
 
     mock_api_call.return_value = mock_res
 
-    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG)
+    cosmos_api = FetchAIApi(**FETCHAI_TESTNET_CONFIG, wasm_query_mode="cli")
 
     res = cosmos_api.get_last_code_id()
     assert res == mock_res[-1]["id"]
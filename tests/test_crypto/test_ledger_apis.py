@@ -19,12 +19,17 @@
 
 """This module contains the tests for the crypto/helpers module."""
 
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from unittest import mock
 
 import pytest
 
 from aea.configurations.constants import DEFAULT_LEDGER
+from aea.crypto import base
 from aea.crypto.cosmos import CosmosApi, CosmosCrypto
 from aea.crypto.ethereum import EthereumApi, EthereumCrypto
 from aea.crypto.fetchai import FetchAIApi
@@ -180,3 +185,179 @@ def test_is_valid_address():
     assert LedgerApis.is_valid_address(DEFAULT_LEDGER, FETCHAI_ADDRESS_ONE)
     assert LedgerApis.is_valid_address(EthereumCrypto.identifier, ETHEREUM_ADDRESS_ONE)
     assert LedgerApis.is_valid_address(CosmosCrypto.identifier, COSMOS_ADDRESS_ONE)
+
+
+class TestLedgerApisCache:
+    """Test the caching of ledger api instances and classes."""
+
+    def setup(self):
+        """Set up the test case."""
+        self.old_configs = deepcopy(LedgerApis.ledger_api_configs)
+        LedgerApis.clear_caches()
+
+    def test_instance_is_reused(self):
+        """Test the ledger api instance is made once per configuration."""
+        with mock.patch(
+            "aea.crypto.ledger_apis.make_ledger_api",
+            side_effect=lambda *args, **kwargs: mock.MagicMock(),
+        ) as mocked_make:
+            api = LedgerApis.get_api(EthereumApi.identifier)
+            LedgerApis.get_balance(EthereumApi.identifier, ETHEREUM_ADDRESS_ONE)
+            assert LedgerApis.get_api(EthereumApi.identifier) is api
+        assert mocked_make.call_count == 1
+
+    def test_instance_is_remade_when_config_changes(self):
+        """Test the ledger api instance is remade when its configuration changes."""
+        with mock.patch(
+            "aea.crypto.ledger_apis.make_ledger_api",
+            side_effect=lambda *args, **kwargs: mock.MagicMock(),
+        ) as mocked_make:
+            api = LedgerApis.get_api(EthereumApi.identifier)
+            LedgerApis.ledger_api_configs[EthereumApi.identifier]["chain_id"] = 42
+            new_api = LedgerApis.get_api(EthereumApi.identifier)
+            assert new_api is not api
+            LedgerApis.ledger_api_configs = deepcopy(self.old_configs)
+            assert LedgerApis.get_api(EthereumApi.identifier) is not new_api
+        assert mocked_make.call_count == 3
+        assert mocked_make.call_args_list[1][1]["chain_id"] == 42
+
+    def test_instance_is_remade_after_clear_caches(self):
+        """Test the ledger api instance is remade after the caches are cleared."""
+        with mock.patch(
+            "aea.crypto.ledger_apis.make_ledger_api",
+            side_effect=lambda *args, **kwargs: mock.MagicMock(),
+        ) as mocked_make:
+            api = LedgerApis.get_api(EthereumApi.identifier)
+            LedgerApis.clear_caches()
+            assert LedgerApis.get_api(EthereumApi.identifier) is not api
+        assert mocked_make.call_count == 2
+
+    def test_class_is_resolved_once(self):
+        """Test the ledger api class is resolved from the registry once."""
+        with mock.patch(
+            "aea.crypto.ledger_apis.make_ledger_api_cls", return_value=CosmosApi
+        ) as mocked_make_cls:
+            LedgerApis.generate_tx_nonce(CosmosApi.identifier, "seller", "client")
+            LedgerApis.get_hash(CosmosApi.identifier, b"message")
+            assert LedgerApis.is_valid_address(CosmosApi.identifier, COSMOS_ADDRESS_ONE)
+        assert mocked_make_cls.call_count == 1
+
+    def test_concurrent_calls_make_one_instance(self):
+        """Test concurrent calls from several threads share a single instance."""
+
+        def _make(*args, **kwargs):
+            time.sleep(0.01)
+            return mock.MagicMock()
+
+        with mock.patch(
+            "aea.crypto.ledger_apis.make_ledger_api", side_effect=_make
+        ) as mocked_make:
+            with ThreadPoolExecutor(8) as executor:
+                apis = list(
+                    executor.map(
+                        lambda _: LedgerApis.get_api(FetchAIApi.identifier), range(16)
+                    )
+                )
+        assert mocked_make.call_count == 1
+        assert all(api is apis[0] for api in apis)
+
+    def teardown(self):
+        """Tear down the test case."""
+        LedgerApis.ledger_api_configs = self.old_configs
+        LedgerApis.clear_caches()
+
+
+class TestBatchRecovery:
+    """Test the batch recovery and verification of signed messages."""
+
+    @pytest.mark.parametrize("crypto_class", [CosmosCrypto, EthereumCrypto])
+    def test_verify_batch(self, crypto_class):
+        """Test a batch of signatures is verified, and invalid signatures do not fail the batch."""
+        crypto = crypto_class()
+        other_crypto = crypto_class()
+        messages = [str(i).encode("utf-8") for i in range(4)]
+        signed_messages = [
+            (message, crypto.sign_message(message), crypto.address)
+            for message in messages
+        ]
+        signed_messages.append(
+            (b"other", other_crypto.sign_message(b"other"), crypto.address)
+        )
+        signed_messages.append((b"invalid", "invalid", crypto.address))
+
+        results = LedgerApis.verify_batch(crypto.identifier, signed_messages)
+        assert results == [True] * 4 + [False, False]
+        recovered_addresses = LedgerApis.recover_messages(
+            crypto.identifier,
+            [(message, signature) for message, signature, _ in signed_messages],
+        )
+        assert crypto.address in recovered_addresses[0]
+        assert other_crypto.address in recovered_addresses[4]
+        assert recovered_addresses[5] == ()
+
+    def test_recovered_addresses_are_cached(self):
+        """Test a signature is recovered once per message and signature."""
+        crypto = EthereumCrypto()
+        message = b"message"
+        signature = crypto.sign_message(message)
+        with mock.patch.object(
+            EthereumApi, "recover_message", wraps=EthereumApi.recover_message
+        ) as mocked_recover:
+            assert (
+                LedgerApis.verify_batch(
+                    crypto.identifier, [(message, signature, crypto.address)] * 3
+                )
+                == [True] * 3
+            )
+            assert LedgerApis.verify_batch(
+                crypto.identifier, [(message, signature, crypto.address)]
+            ) == [True]
+            assert LedgerApis.verify_batch(
+                crypto.identifier, [(b"other", signature, crypto.address)]
+            ) == [False]
+        assert mocked_recover.call_count == 2
+
+    def test_recovered_addresses_cache_bounded(self):
+        """Test the least recently recovered addresses are evicted from the cache."""
+        crypto = EthereumCrypto()
+        signed_messages = [
+            (message, crypto.sign_message(message), crypto.address)
+            for message in (b"first", b"second", b"third")
+        ]
+        base._recovered_addresses.clear()
+        with mock.patch.object(base, "RECOVERED_ADDRESSES_CACHE_SIZE", 2):
+            for signed_message in signed_messages:
+                assert LedgerApis.verify_batch(crypto.identifier, [signed_message]) == [
+                    True
+                ]
+            assert len(base._recovered_addresses) == 2
+        assert [key[1] for key in base._recovered_addresses] == [
+            hashlib.sha256(message).digest() for message in (b"second", b"third")
+        ]
+
+    def test_large_batch_in_process_pool(self):
+        """Test large batches of signatures are recovered in the process pool."""
+        crypto = EthereumCrypto()
+        messages = [
+            "pool {}".format(i).encode("utf-8")
+            for i in range(base.PROCESS_POOL_MIN_BATCH_SIZE)
+        ]
+        signed_messages = [
+            (message, crypto.sign_message(message), crypto.address)
+            for message in messages
+        ]
+        with mock.patch("aea.crypto.base.os.cpu_count", return_value=2):
+            results = LedgerApis.verify_batch(crypto.identifier, signed_messages)
+            process_pool = base._process_pool
+            assert process_pool is not None
+        assert (
+            process_pool._mp_context.get_start_method()
+            == base.PROCESS_POOL_START_METHOD
+            == "spawn"
+        )
+        assert results == [True] * len(messages)
+
+        LedgerApis.clear_caches()
+        assert base._process_pool is None
+        with pytest.raises(RuntimeError):
+            process_pool.submit(len, [])
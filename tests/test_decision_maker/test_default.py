@@ -19,6 +19,8 @@
 
 """This module contains tests for decision_maker."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 from typing import Optional, cast
 from unittest import mock
@@ -31,7 +33,7 @@ import aea.decision_maker.default
 from aea.configurations.base import PublicId
 from aea.crypto.fetchai import FetchAIApi, FetchAICrypto
 from aea.crypto.wallet import Wallet
-from aea.decision_maker.base import DecisionMaker
+from aea.decision_maker.base import AsyncDecisionMaker, DecisionMaker
 from aea.decision_maker.default import DecisionMakerHandler
 from aea.helpers.transaction.base import (
     RawMessage,
@@ -637,3 +639,297 @@ class TestDecisionMaker2:
         """Tear the tests down."""
         cls._unpatch_logger()
         cls.decision_maker.stop()
+
+
+class TestAsyncDecisionMaker:
+    """Test the asynchronous decision maker."""
+
+    def setup(self):
+        """Initialise the decision maker."""
+        self.wallet = Wallet({FETCHAI: FETCHAI_PRIVATE_KEY_PATH})
+        self.identity = Identity(
+            "test", addresses=self.wallet.addresses, default_address_key=FETCHAI,
+        )
+        self.decision_maker_handler = DecisionMakerHandler(
+            identity=self.identity, wallet=self.wallet
+        )
+        self.decision_maker = AsyncDecisionMaker(self.decision_maker_handler)
+        self.signing_dialogues = SigningDialogues(
+            str(PublicId("author", "a_skill", "0.1.0"))
+        )
+
+    def _make_signing_message(self) -> SigningMessage:
+        message = b"0x11f3f9487724404e3a1fb7252a322656b90ba0455a2ca5fcdcbe6eeee5f8126d"
+        signing_msg = SigningMessage(
+            performative=SigningMessage.Performative.SIGN_MESSAGE,
+            dialogue_reference=self.signing_dialogues.new_self_initiated_dialogue_reference(),
+            terms=Terms(
+                ledger_id=FETCHAI,
+                sender_address="pk1",
+                counterparty_address="pk2",
+                amount_by_currency_id={"FET": -1},
+                is_sender_payable_tx_fee=True,
+                quantities_by_good_id={"good_id": 10},
+                nonce="transaction nonce",
+            ),
+            raw_message=RawMessage(FETCHAI, message),
+        )
+        signing_dialogue = self.signing_dialogues.create_with_message(
+            "decision_maker", signing_msg
+        )
+        assert signing_dialogue is not None
+        return signing_msg
+
+    def test_signing_is_cpu_bound(self):
+        """Test the default handler reports signing messages as CPU-bound."""
+        signing_msg = self._make_signing_message()
+        assert self.decision_maker_handler.is_cpu_bound(signing_msg)
+        state_update_msg = StateUpdateMessage(
+            performative=StateUpdateMessage.Performative.APPLY,
+            amount_by_currency_id={"FET": -1},
+            quantities_by_good_id={"good_id": 10},
+        )
+        assert not self.decision_maker_handler.is_cpu_bound(state_update_msg)
+
+    @pytest.mark.asyncio
+    async def test_handle_signing_in_executor(self):
+        """Test signing requests are handled in the executor, in order."""
+        executor = ThreadPoolExecutor(1)
+        self.decision_maker.executor = executor
+        signing_msgs = [self._make_signing_message() for _ in range(3)]
+        try:
+            with mock.patch.object(
+                executor, "submit", wraps=executor.submit
+            ) as mocked_submit:
+                self.decision_maker.start()
+                for signing_msg in signing_msgs:
+                    self.decision_maker.message_in_queue.put_nowait(signing_msg)
+                responses = []
+                for _ in signing_msgs:
+                    response = await asyncio.wait_for(
+                        self.decision_maker.message_out_queue.async_get(), timeout=2
+                    )
+                    responses.append(response)
+            assert 1 <= mocked_submit.call_count <= len(signing_msgs)
+            for signing_msg, response in zip(signing_msgs, responses):
+                assert response.target == signing_msg.message_id
+                assert (
+                    response.performative == SigningMessage.Performative.SIGNED_MESSAGE
+                )
+                assert (
+                    response.dialogue_reference[0] == signing_msg.dialogue_reference[0]
+                )
+        finally:
+            self.decision_maker.stop()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_handle_error_does_not_stop_decision_maker(self):
+        """Test an exception while handling a message is logged and processing continues."""
+        signing_msg = self._make_signing_message()
+        self.decision_maker.start()
+        try:
+            with mock.patch.object(
+                self.decision_maker_handler,
+                "handle_batch",
+                side_effect=[ValueError, None],
+            ) as mocked_handle_batch, mock.patch.object(
+                self.decision_maker.logger, "exception"
+            ) as mocked_exception:
+                for call_count in (1, 2):
+                    self.decision_maker.message_in_queue.put_nowait(signing_msg)
+                    for _ in range(100):
+                        if mocked_handle_batch.call_count == call_count:
+                            break
+                        await asyncio.sleep(0.01)
+            assert mocked_handle_batch.call_count == 2
+            mocked_exception.assert_called_once()
+        finally:
+            self.decision_maker.stop()
+
+    def test_executor_cannot_be_set_while_running(self):
+        """Test the executor is fixed while the decision maker runs."""
+        loop = asyncio.new_event_loop()
+        try:
+
+            async def _start_and_set():
+                self.decision_maker.start()
+                with pytest.raises(ValueError, match="running decision maker"):
+                    self.decision_maker.executor = ThreadPoolExecutor(1)
+                self.decision_maker.stop()
+
+            loop.run_until_complete(_start_and_set())
+        finally:
+            loop.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_access_not_permitted(self):
+        """Test the in queue of the decision maker can not be accessed asynchronously."""
+        with pytest.raises(ValueError):
+            await self.decision_maker.message_in_queue.async_protected_get(
+                access_code="some_invalid_code"
+            )
+
+
+class TestBatchSigning:
+    """Test batches of signing requests."""
+
+    def setup(self):
+        """Initialise the decision maker handler."""
+        self.wallet = Wallet(
+            {FETCHAI: FETCHAI_PRIVATE_KEY_PATH, ETHEREUM: ETHEREUM_PRIVATE_KEY_PATH}
+        )
+        self.identity = Identity(
+            "test", addresses=self.wallet.addresses, default_address_key=FETCHAI,
+        )
+        self.executor = ThreadPoolExecutor(4)
+        self.decision_maker_handler = DecisionMakerHandler(
+            identity=self.identity, wallet=self.wallet, signing_executor=self.executor,
+        )
+        self.signing_dialogues = SigningDialogues(
+            str(PublicId("author", "a_skill", "0.1.0"))
+        )
+
+    def _make_signing_message(self, ledger_id: str, body: bytes) -> SigningMessage:
+        signing_msg = SigningMessage(
+            performative=SigningMessage.Performative.SIGN_MESSAGE,
+            dialogue_reference=self.signing_dialogues.new_self_initiated_dialogue_reference(),
+            terms=Terms(
+                ledger_id=ledger_id,
+                sender_address="pk1",
+                counterparty_address="pk2",
+                amount_by_currency_id={"FET": -1},
+                is_sender_payable_tx_fee=True,
+                quantities_by_good_id={"good_id": 10},
+                nonce="transaction nonce",
+            ),
+            raw_message=RawMessage(ledger_id, body),
+        )
+        signing_dialogue = self.signing_dialogues.create_with_message(
+            "decision_maker", signing_msg
+        )
+        assert signing_dialogue is not None
+        return signing_msg
+
+    def _get_responses(self, nb_responses: int):
+        return [
+            self.decision_maker_handler.message_out_queue.get(timeout=2)
+            for _ in range(nb_responses)
+        ]
+
+    def test_handle_batch_signs_in_parallel(self):
+        """Test a batch is signed on the executor and each reply goes to its dialogue."""
+        signing_msgs = [
+            self._make_signing_message(
+                FETCHAI if i % 2 == 0 else ETHEREUM, str(i).encode("utf-8")
+            )
+            for i in range(6)
+        ]
+        with mock.patch.object(
+            self.executor, "map", wraps=self.executor.map
+        ) as mocked_map:
+            self.decision_maker_handler.handle_batch(signing_msgs)
+        mocked_map.assert_called_once()
+
+        responses = self._get_responses(len(signing_msgs))
+        for signing_msg, response in zip(signing_msgs, responses):
+            recovered_dialogue = self.signing_dialogues.update(response)
+            assert recovered_dialogue is not None
+            assert recovered_dialogue.dialogue_label.dialogue_reference[0] == (
+                signing_msg.dialogue_reference[0]
+            )
+            assert response.performative == SigningMessage.Performative.SIGNED_MESSAGE
+            assert response.signed_message.body == self.wallet.sign_message(
+                signing_msg.raw_message.ledger_id, signing_msg.raw_message.body
+            )
+
+    def test_handle_batch_unacceptable_requests_are_not_signed(self):
+        """Test requests not acceptable against the ownership state get an error reply."""
+        signing_msgs = [
+            self._make_signing_message(FETCHAI, str(i).encode("utf-8"))
+            for i in range(3)
+        ]
+        with mock.patch.object(
+            self.decision_maker_handler,
+            "_is_acceptable_for_signing",
+            side_effect=[True, False, True],
+        ), mock.patch.object(
+            self.decision_maker_handler,
+            "_sign",
+            wraps=self.decision_maker_handler._sign,
+        ) as mocked_sign:
+            self.decision_maker_handler.handle_batch(signing_msgs)
+        assert mocked_sign.call_count == 2
+
+        responses = self._get_responses(len(signing_msgs))
+        assert [response.target for response in responses] == [
+            signing_msg.message_id for signing_msg in signing_msgs
+        ]
+        assert [response.performative for response in responses] == [
+            SigningMessage.Performative.SIGNED_MESSAGE,
+            SigningMessage.Performative.ERROR,
+            SigningMessage.Performative.SIGNED_MESSAGE,
+        ]
+
+    def test_handle_batch_state_update_ends_signing_run(self):
+        """Test a state update splits the signing requests around it."""
+        signing_msgs = [
+            self._make_signing_message(FETCHAI, str(i).encode("utf-8"))
+            for i in range(3)
+        ]
+        state_update_msg = StateUpdateMessage(
+            performative=StateUpdateMessage.Performative.APPLY,
+            amount_by_currency_id={"FET": -1},
+            quantities_by_good_id={"good_id": 10},
+        )
+        calls = []
+        with mock.patch.object(
+            self.decision_maker_handler,
+            "_handle_signing_messages",
+            side_effect=lambda msgs: calls.append(list(msgs)),
+        ), mock.patch.object(
+            self.decision_maker_handler,
+            "handle",
+            side_effect=lambda msg: calls.append(msg),
+        ):
+            self.decision_maker_handler.handle_batch(
+                signing_msgs[:2] + [state_update_msg] + signing_msgs[2:]
+            )
+        assert calls == [signing_msgs[:2], state_update_msg, signing_msgs[2:]]
+
+    def test_decision_maker_drains_pending_messages(self):
+        """Test the decision maker hands pending messages to the handler in batches."""
+        signing_msgs = [
+            self._make_signing_message(FETCHAI, str(i).encode("utf-8"))
+            for i in range(5)
+        ]
+        decision_maker = DecisionMaker(self.decision_maker_handler, max_batch_size=2)
+        for signing_msg in signing_msgs:
+            decision_maker.message_in_queue.put(signing_msg)
+        with mock.patch.object(
+            self.decision_maker_handler,
+            "handle_batch",
+            wraps=self.decision_maker_handler.handle_batch,
+        ) as mocked_handle_batch:
+            decision_maker.start()
+            try:
+                responses = self._get_responses(len(signing_msgs))
+            finally:
+                decision_maker.stop()
+        assert [len(call[0][0]) for call in mocked_handle_batch.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert [response.target for response in responses] == [
+            signing_msg.message_id for signing_msg in signing_msgs
+        ]
+
+    def test_max_batch_size_must_be_positive(self):
+        """Test the maximum batch size is validated."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            DecisionMaker(self.decision_maker_handler, max_batch_size=0)
+
+    def teardown(self):
+        """Tear the tests down."""
+        self.executor.shutdown()
@@ -19,9 +19,11 @@
 
 """This module contains tests for decision_maker."""
 
+from unittest import mock
+
 import pytest
 
-from aea.decision_maker.default import OwnershipState
+from aea.decision_maker.default import OwnershipState, _default_logger
 from aea.helpers.transaction.base import Terms
 
 from tests.conftest import ETHEREUM
@@ -226,3 +228,99 @@ class TestOwnershipState:
         expected_quantities_by_good_id = {"good_id": 10}
         assert ownership_state.amount_by_currency_id == expected_amount_by_currency_id
         assert ownership_state.quantities_by_good_id == expected_quantities_by_good_id
+
+
+def test_copy_is_independent():
+    """Test updating a copy of the ownership state leaves the original unchanged."""
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 100}, quantities_by_good_id={"good_id": 2}
+    )
+    terms = Terms(
+        ledger_id=ETHEREUM,
+        sender_address="agent_1",
+        counterparty_address="pk",
+        amount_by_currency_id={"FET": -20},
+        is_sender_payable_tx_fee=True,
+        quantities_by_good_id={"good_id": 10},
+        nonce="transaction nonce",
+    )
+    new_state = ownership_state.apply_transactions([terms, terms])
+    assert new_state.amount_by_currency_id == {"FET": 60}
+    assert new_state.quantities_by_good_id == {"good_id": 22}
+    assert ownership_state.amount_by_currency_id == {"FET": 100}
+    assert ownership_state.quantities_by_good_id == {"good_id": 2}
+
+    holdings = ownership_state.quantities_by_good_id
+    holdings["good_id"] = 0
+    assert ownership_state.quantities_by_good_id == {"good_id": 2}
+
+
+def test_version_and_subscription():
+    """Test the version of the ownership state and the notification of its changes."""
+    ownership_state = OwnershipState()
+    assert ownership_state.version == 0
+    ownership_state.set(
+        amount_by_currency_id={"FET": 100},
+        quantities_by_good_id={"good_1": 2, "good_2": 3},
+    )
+    assert ownership_state.version == 1
+
+    changes = []
+
+    def callback(amounts, quantities):
+        changes.append((amounts, quantities))
+
+    snapshot = ownership_state.subscribe(callback)
+    assert snapshot is not ownership_state
+    assert snapshot.version == 1
+    assert snapshot.quantities_by_good_id == {"good_1": 2, "good_2": 3}
+
+    ownership_state.apply_delta(
+        delta_amount_by_currency_id={"FET": -10},
+        delta_quantities_by_good_id={"good_1": 1, "good_2": 0},
+    )
+    ownership_state.apply_delta(
+        delta_amount_by_currency_id={"FET": 0},
+        delta_quantities_by_good_id={"good_1": 0},
+    )
+    assert ownership_state.version == 3
+    assert changes == [({"FET": -10}, {"good_1": 1})]
+    assert snapshot.version == 1
+
+    ownership_state.unsubscribe(callback)
+    ownership_state.apply_delta(
+        delta_amount_by_currency_id={"FET": 5}, delta_quantities_by_good_id={},
+    )
+    assert len(changes) == 1
+    assert ownership_state.amount_by_currency_id == {"FET": 95}
+
+
+def test_subscribers_called_outside_of_lock():
+    """Test the subscribers are called after the update, outside of the lock of the ownership state, and each on its own."""
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 100}, quantities_by_good_id={"good_1": 2},
+    )
+    changes = []
+
+    def failing_callback(amounts, quantities):
+        raise ValueError("expected")
+
+    def unsubscribing_callback(amounts, quantities):
+        changes.append((ownership_state.amount_by_currency_id, amounts, quantities))
+        ownership_state.unsubscribe(unsubscribing_callback)
+
+    ownership_state.subscribe(failing_callback)
+    ownership_state.subscribe(unsubscribing_callback)
+    with mock.patch.object(_default_logger, "exception") as mock_logger:
+        ownership_state.apply_delta(
+            delta_amount_by_currency_id={"FET": -10}, delta_quantities_by_good_id={},
+        )
+        ownership_state.apply_delta(
+            delta_amount_by_currency_id={"FET": -10}, delta_quantities_by_good_id={},
+        )
+
+    assert changes == [({"FET": 90}, {"FET": -10}, {})]
+    assert mock_logger.call_count == 2
+    assert ownership_state.amount_by_currency_id == {"FET": 80}
@@ -171,8 +171,8 @@ def test_score_diff_from_transaction():
     score_difference = preferences.utility_diff_from_transaction(
         ownership_state=ownership_state, terms=terms
     )
-    assert (
-        score_difference == diff_scores
+    assert score_difference == pytest.approx(
+        diff_scores
     ), "The calculated difference must be equal to the return difference from the function."
     assert not preferences.is_utility_enhancing(
         ownership_state=ownership_state, terms=terms
@@ -195,3 +195,119 @@ def test_is_utility_enhancing_uninitialized():
     assert preferences.is_utility_enhancing(
         ownership_state=ownership_state, terms=terms
     ), "Should enhance utility."
+
+
+def _make_many_goods_setup(nb_goods: int = 100):
+    """Make an ownership state and preferences over many goods."""
+    good_holdings = {"good_{}".format(i): i % 7 for i in range(nb_goods)}
+    utility_params = {"good_{}".format(i): 1.0 + i / 10 for i in range(nb_goods)}
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 1000}, quantities_by_good_id=good_holdings
+    )
+    preferences = Preferences()
+    preferences.set(
+        utility_params_by_good_id=utility_params,
+        exchange_params_by_currency_id={"FET": 1.5},
+    )
+    return ownership_state, preferences
+
+
+def _make_terms(amount: int, quantities_by_good_id) -> Terms:
+    """Make transaction terms."""
+    return Terms(
+        ledger_id=ETHEREUM,
+        sender_address="agent_1",
+        counterparty_address="pk",
+        amount_by_currency_id={"FET": amount},
+        is_sender_payable_tx_fee=True,
+        quantities_by_good_id=quantities_by_good_id,
+        nonce="transaction nonce",
+    )
+
+
+def test_utility_diffs_match_full_utility():
+    """Test the incremental utility differences match recomputing the full utility."""
+    ownership_state, preferences = _make_many_goods_setup()
+    list_of_terms = [
+        _make_terms(-10, {"good_3": 2, "good_50": 1}),
+        _make_terms(25, {"good_0": -0, "good_99": -5}),
+        _make_terms(-1, {"good_7": 1}),
+    ]
+    current_score = preferences.utility(
+        ownership_state.quantities_by_good_id, ownership_state.amount_by_currency_id
+    )
+    expected = []
+    for terms in list_of_terms:
+        new_state = ownership_state.apply_transactions([terms])
+        expected.append(
+            preferences.utility(
+                new_state.quantities_by_good_id, new_state.amount_by_currency_id
+            )
+            - current_score
+        )
+
+    diffs = preferences.utility_diffs_from_transactions(ownership_state, list_of_terms)
+    assert diffs == pytest.approx(expected)
+    assert [
+        preferences.utility_diff_from_transaction(ownership_state, terms)
+        for terms in list_of_terms
+    ] == diffs
+
+
+def test_utility_diff_below_shift():
+    """Test the utility difference when the shifted quantity is not positive."""
+    ownership_state, preferences = _make_many_goods_setup(nb_goods=2)
+    terms = _make_terms(0, {"good_1": -101})
+    new_state = ownership_state.apply_transactions([terms])
+    expected = preferences.logarithmic_utility(
+        new_state.quantities_by_good_id
+    ) - preferences.logarithmic_utility(ownership_state.quantities_by_good_id)
+    assert preferences.utility_diff_from_transaction(
+        ownership_state, terms
+    ) == pytest.approx(expected)
+
+
+def test_utility_diff_unknown_good_raises():
+    """Test the utility difference of a transaction with a good not held raises."""
+    ownership_state, preferences = _make_many_goods_setup(nb_goods=2)
+    with pytest.raises(KeyError):
+        preferences.utility_diff_from_transaction(
+            ownership_state, _make_terms(-1, {"unknown": 1})
+        )
+
+
+def test_marginal_utility_partial_delta():
+    """Test the marginal utility of a delta on some goods only."""
+    ownership_state, preferences = _make_many_goods_setup()
+    full_delta = {
+        good_id: 1 if good_id == "good_10" else 0
+        for good_id in ownership_state.quantities_by_good_id
+    }
+    marginal_utility = preferences.marginal_utility(
+        ownership_state=ownership_state, delta_quantities_by_good_id={"good_10": 1}
+    )
+    assert marginal_utility == preferences.marginal_utility(
+        ownership_state=ownership_state, delta_quantities_by_good_id=full_delta
+    )
+    assert marginal_utility == pytest.approx(
+        preferences.logarithmic_utility({"good_10": 4})
+        - preferences.logarithmic_utility({"good_10": 3})
+    )
+
+
+@pytest.mark.parametrize("quantity_delta", [-1, 1])
+def test_marginal_utilities_of_goods(quantity_delta):
+    """Test the marginal utilities of every good match the marginal utility of each good on its own."""
+    ownership_state, preferences = _make_many_goods_setup()
+    marginal_utilities = preferences.marginal_utilities_of_goods(
+        ownership_state.quantities_by_good_id, quantity_delta
+    )
+    assert set(marginal_utilities) == set(ownership_state.quantities_by_good_id)
+    for good_id, marginal_utility in marginal_utilities.items():
+        assert marginal_utility == pytest.approx(
+            preferences.marginal_utility(
+                ownership_state=ownership_state,
+                delta_quantities_by_good_id={good_id: quantity_delta},
+            )
+        )
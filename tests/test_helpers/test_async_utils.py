@@ -18,9 +18,13 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests for AsyncFriendlyQueue."""
 import asyncio
+import collections
+import time
 from concurrent.futures._base import CancelledError
 from contextlib import suppress
 from threading import Thread
+from typing import Dict
+from unittest.mock import patch
 
 import pytest
 
@@ -31,6 +35,7 @@ from aea.helpers.async_utils import (
     PeriodicCaller,
     Runnable,
     ThreadedAsyncRunner,
+    TimerWheelScheduler,
     ensure_list,
 )
 
@@ -168,6 +173,118 @@ async def test_periodic_caller_exception():
     periodic_caller.stop()
 
 
+@pytest.mark.asyncio
+async def test_timer_wheel_scheduler_start_stop():
+    """Test add and remove calls for TimerWheelScheduler."""
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    scheduler = TimerWheelScheduler(resolution=0.01)
+    scheduler.add(callback, period=0.1)
+    assert callback in scheduler
+
+    await asyncio.sleep(0.15)
+    assert called >= 1
+
+    scheduler.remove(callback)
+    assert callback not in scheduler
+    old_called = called
+    await asyncio.sleep(0.15)
+    assert old_called == called
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_scheduler_exception():
+    """Test exception raises for TimerWheelScheduler."""
+    exception_called = False
+
+    def exception_callback(*args, **kwargs):
+        nonlocal exception_called
+        exception_called = True
+
+    def callback():
+        raise Exception("expected")
+
+    scheduler = TimerWheelScheduler(exception_callback=exception_callback)
+    scheduler.add(callback, period=0.1)
+
+    await asyncio.sleep(0.05)
+    assert exception_called
+    assert len(scheduler) == 0
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_scheduler_coalesces_calls():
+    """Test the calls due in the same tick share one wake-up, across the levels of the wheel."""
+    calls = collections.defaultdict(int)  # type: Dict[int, int]
+
+    def make_callback(i):
+        def callback():
+            calls[i] += 1
+
+        return callback
+
+    # with 4 slots per level, a period of 0.09 spans two levels of the wheel
+    scheduler = TimerWheelScheduler(resolution=0.01, slot_bits=2, nb_levels=2)
+    callbacks = [make_callback(i) for i in range(100)]
+    for callback in callbacks:
+        scheduler.add(callback, period=0.09)
+
+    loop = asyncio.get_event_loop()
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        await asyncio.sleep(0.35)
+    scheduler.stop()
+
+    assert all(3 <= calls[i] <= 4 for i in range(100))
+    assert call_at.call_count < 20
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_scheduler_drift():
+    """Test the drift of the calls stays within the resolution of an idle scheduler."""
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    scheduler = TimerWheelScheduler(resolution=0.01)
+    scheduler.add(callback, period=0.05)
+    await asyncio.sleep(0.12)
+    stats = scheduler.get_stats(callback)
+    scheduler.stop()
+
+    assert stats.nb_calls == called >= 2
+    assert 0 <= stats.mean_drift <= stats.max_drift < 0.05
+    assert stats.nb_overruns == 0
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_scheduler_overruns():
+    """Test the calls missed while the previous one was running are skipped and counted."""
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+        time.sleep(0.05)
+
+    scheduler = TimerWheelScheduler(resolution=0.01)
+    scheduler.add(callback, period=0.02)
+    await asyncio.sleep(0.2)
+    stats = scheduler.get_stats(callback)
+    scheduler.stop()
+
+    assert called <= 5
+    assert stats.nb_calls == called
+    assert stats.nb_overruns >= called
+
+
 @pytest.mark.asyncio
 async def test_threaded_async_run():
     """Test threaded async runner."""
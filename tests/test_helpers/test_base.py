@@ -27,7 +27,7 @@ from copy import copy
 from pathlib import Path
 from subprocess import Popen  # nosec
 from typing import Dict, Set
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -37,7 +37,9 @@ from aea.helpers.base import (
     RegexConstrainedString,
     exception_log_and_reraise,
     find_topological_order,
+    freeze,
     load_env_file,
+    load_file_cached,
     load_module,
     locate,
     reachable_nodes,
@@ -271,6 +273,36 @@ def test_recursive_update_negative_unknown_field():
         recursive_update(to_update, new_values)
 
 
+def test_freeze():
+    """Test the 'freeze' utility returns a read-only copy."""
+    obj = dict(a_list=[1, dict(a=2)], a_tuple=(3,), an_integer=4)
+    frozen = freeze(obj)
+    assert frozen == dict(a_list=(1, dict(a=2)), a_tuple=(3,), an_integer=4)
+    with pytest.raises(TypeError):
+        frozen["an_integer"] = 5
+    with pytest.raises(TypeError):
+        frozen["a_list"][1]["a"] = 5
+    obj["an_integer"] = 5
+    assert frozen["an_integer"] == 4
+
+
+def test_load_file_cached(tmp_path):
+    """Test the 'load_file_cached' utility reloads a file only when it changes."""
+    file_path = Path(tmp_path, "file.txt")
+    file_path.write_text("first")
+    loader = MagicMock(side_effect=lambda path: path.read_text())
+
+    assert load_file_cached(file_path, loader) == "first"
+    assert load_file_cached(Path(tmp_path, ".", "file.txt"), loader) == "first"
+    assert loader.call_count == 1
+
+    file_path.write_text("second")
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_file_cached(file_path, loader) == "second"
+    assert loader.call_count == 2
+
+
 class TestTopologicalOrder:
     """Test the computation of topological order."""
 
@@ -23,6 +23,7 @@ import unittest
 from functools import partial
 from threading import Thread
 from unittest.case import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -176,7 +177,63 @@ def test_supervisor_not_started():
     exec_limiter = ExecTimeoutThreadGuard(timeout)
 
     with exec_limiter as exec_limit:
-        assert not exec_limiter._future_guard_task
+        assert exec_limiter._token is None
         TestThreadGuard.slow_function(sleep_time)
 
     assert not exec_limit.is_cancelled_by_timeout()
+
+
+class TestThreadGuardTimerWheel(TestCase):
+    """Test the timer wheel of the thread guard supervisor."""
+
+    def tearDown(self):
+        """Tear down."""
+        ExecTimeoutThreadGuard.stop(force=True)
+
+    def test_timeout_longer_than_wheel(self):
+        """Test a timeout spanning several turns of the wheel is not fired early."""
+        with patch.object(ExecTimeoutThreadGuard, "wheel_size", 4):
+            ExecTimeoutThreadGuard.start()
+            timeout = 0.2
+            with timeit_context() as timeit_result:
+                with pytest.raises(TimeoutException):
+                    with ExecTimeoutThreadGuard(timeout) as exec_limit:
+                        TestThreadGuard.slow_function(0.5)
+
+        assert exec_limit.is_cancelled_by_timeout()
+        assert timeout <= timeit_result.time_passed < 0.5
+
+    def test_disarmed_guards_dropped(self):
+        """Test the supervisor drops the guards disarmed before their deadline."""
+        ExecTimeoutThreadGuard.start()
+        for _ in range(100):
+            with ExecTimeoutThreadGuard(0.05) as exec_limit:
+                pass
+            assert not exec_limit.is_cancelled_by_timeout()
+
+        time.sleep(0.2)
+        assert sum(len(slot) for slot in ExecTimeoutThreadGuard._wheel) == 0
+
+    def test_disarmed_guard_not_interrupted(self):
+        """Test the supervisor does not interrupt a guard disarmed after its slot was read."""
+        ExecTimeoutThreadGuard.start()
+        exec_limiter = ExecTimeoutThreadGuard(0.05)
+        with exec_limiter:
+            token = exec_limiter._token
+        with patch.object(
+            ExecTimeoutThreadGuard, "_set_thread_exception"
+        ) as mock_set_exception:
+            exec_limiter._expire(token)
+        mock_set_exception.assert_not_called()
+
+    def test_pending_timeout_discarded_on_disarm(self):
+        """Test a timeout fired but not raised yet is discarded when the guard is disarmed."""
+        ExecTimeoutThreadGuard.start()
+        exec_limiter = ExecTimeoutThreadGuard(0.05)
+        with patch.object(ExecTimeoutThreadGuard, "_set_thread_exception"):
+            with patch("ctypes.pythonapi") as mock_pythonapi:
+                with exec_limiter as exec_limit:
+                    exec_limiter._expire(exec_limiter._token)
+        assert not exec_limit.is_cancelled_by_timeout()
+        mock_pythonapi.PyThreadState_SetAsyncExc.assert_called_once()
+        assert mock_pythonapi.PyThreadState_SetAsyncExc.call_args[0][1] is None
@@ -36,7 +36,7 @@ from pexpect.exceptions import EOF  # type: ignore
 
 import aea
 from aea.cli.core import cli
-from aea.configurations.base import PublicId
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.connections.base import ConnectionStates
 from aea.exceptions import AEAEnforceError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
@@ -64,6 +64,7 @@ from .conftest import (
 )
 from tests.common.pexpect_popen import PexpectWrapper
 from tests.common.utils import wait_for_condition
+from tests.data.dummy_connection.connection import DummyConnection  # type: ignore
 
 
 @pytest.mark.asyncio
@@ -820,3 +821,112 @@ def test_multiplexer_setup_replaces_connections():
     m.setup([MagicMock()], MagicMock())
     assert len(m._id_to_connection) == 1
     assert len(m._connections) == 1
+
+
+def _make_slow_dummy_connection(
+    name: str,
+    connect_delay: float,
+    events: list,
+    connect_after=None,
+    connect_timeout=None,
+) -> DummyConnection:
+    """Make a dummy connection, with its own id, which takes some time to connect."""
+
+    class SlowDummyConnection(DummyConnection):
+        connection_id = PublicId("fetchai", name, "0.1.0")
+
+        async def connect(self, *args, **kwargs):
+            events.append(("start", name))
+            await asyncio.sleep(connect_delay)
+            await super().connect(*args, **kwargs)
+            events.append(("end", name))
+
+    configuration = ConnectionConfig(
+        connection_id=SlowDummyConnection.connection_id,
+        connect_after=connect_after,
+        connect_timeout=connect_timeout,
+    )
+    return SlowDummyConnection(
+        configuration=configuration, identity=Identity("name", "address")
+    )
+
+
+@pytest.mark.asyncio
+async def test_connections_connect_concurrently():
+    """Test the connections are connected concurrently and their start-up time is recorded."""
+    events = []
+    connections = [
+        _make_slow_dummy_connection("slow_{}".format(i), 0.5, events) for i in range(4)
+    ]
+    multiplexer = AsyncMultiplexer(connections, loop=asyncio.get_event_loop())
+
+    start_time = time.time()
+    await multiplexer.connect()
+    try:
+        assert time.time() - start_time < 1.5
+        assert all(c.is_connected for c in connections)
+        startup_times = multiplexer.connection_status.connection_startup_times
+        assert set(startup_times.keys()) == {c.connection_id for c in connections}
+        assert all(t >= 0.5 for t in startup_times.values())
+    finally:
+        await multiplexer.disconnect()
+    assert all(c.is_disconnected for c in connections)
+
+
+@pytest.mark.asyncio
+async def test_connect_after_ordering():
+    """Test a connection is only connected after the connections in its connect_after."""
+    events = []
+    p2p = _make_slow_dummy_connection("p2p", 0.2, events)
+    soef = _make_slow_dummy_connection(
+        "soef", 0.0, events, connect_after={PublicId.from_str("fetchai/p2p:latest")},
+    )
+    other = _make_slow_dummy_connection("other", 0.1, events)
+    multiplexer = AsyncMultiplexer([soef, p2p, other], loop=asyncio.get_event_loop())
+
+    assert multiplexer._get_connection_layers() == [
+        [p2p.connection_id, other.connection_id],
+        [soef.connection_id],
+    ]
+    await multiplexer.connect()
+    try:
+        assert events.index(("end", "p2p")) < events.index(("start", "soef"))
+        assert events.index(("start", "other")) < events.index(("end", "p2p"))
+    finally:
+        await multiplexer.disconnect()
+
+
+def test_connect_after_cycle_raises():
+    """Test a cyclic connect_after ordering is rejected."""
+    events = []
+    first = _make_slow_dummy_connection(
+        "first", 0.0, events, connect_after={PublicId.from_str("fetchai/second:0.1.0")}
+    )
+    second = _make_slow_dummy_connection(
+        "second", 0.0, events, connect_after={PublicId.from_str("fetchai/first:0.1.0")}
+    )
+    multiplexer = Multiplexer([first, second])
+    with pytest.raises(AEAEnforceError, match="Cyclic connect_after ordering"):
+        multiplexer.connect()
+
+
+@pytest.mark.asyncio
+async def test_connect_timeout_rolls_back_connected():
+    """Test a connection timing out disconnects the connections already set up."""
+    events = []
+    fast = _make_slow_dummy_connection("fast", 0.0, events)
+    slow = _make_slow_dummy_connection("slow", 5.0, events, connect_timeout=0.1)
+    dependent = _make_slow_dummy_connection(
+        "dependent", 0.0, events, connect_after={slow.connection_id}
+    )
+    multiplexer = AsyncMultiplexer(
+        [fast, slow, dependent], loop=asyncio.get_event_loop()
+    )
+
+    with pytest.raises(AEAConnectionError, match="Failed to connect the multiplexer."):
+        await multiplexer.connect()
+
+    assert fast.is_disconnected
+    assert slow.is_disconnected
+    assert ("start", "dependent") not in events
+    assert multiplexer.connection_status.is_disconnected
@@ -24,6 +24,7 @@ from typing import cast
 from unittest.mock import patch
 
 import gym
+import numpy as np
 import pytest
 
 from aea.common import Address
@@ -32,7 +33,7 @@ from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
-from packages.fetchai.connections.gym.connection import GymConnection
+from packages.fetchai.connections.gym.connection import GymChannel, GymConnection
 from packages.fetchai.protocols.gym.dialogues import GymDialogue
 from packages.fetchai.protocols.gym.dialogues import GymDialogues as BaseGymDialogues
 from packages.fetchai.protocols.gym.message import GymMessage
@@ -252,3 +253,134 @@ class TestGymConnection:
         )
         assert gym_con.channel.gym_env is not None
         os.chdir(curdir)
+
+
+class CountingEnv(gym.Env):
+    """An environment which counts its steps and is done every third step."""
+
+    def __init__(self):
+        """Initialize the environment."""
+        self.count = 0
+        self.nb_seeds = 0
+
+    def seed(self, seed=None):
+        """Seed the environment."""
+        self.nb_seeds += 1
+
+    def step(self, action):
+        """Step the environment."""
+        self.count += 1
+        return self.count, float(action), self.count % 3 == 0, {"action": action}
+
+    def reset(self):
+        """Reset the environment."""
+        self.count = 0
+        return self.count
+
+    def render(self, mode="human"):
+        """Render the environment."""
+
+
+class TestGymConnectionVectorized:
+    """Test the vectorized mode of packages/connection/gym/connection.py."""
+
+    NB_ENVS = 4
+
+    def setup(self):
+        """Initialise the class."""
+        self.env = CountingEnv()
+        configuration = ConnectionConfig(
+            connection_id=GymConnection.connection_id, nb_envs=self.NB_ENVS
+        )
+        self.agent_address = "my_address"
+        identity = Identity("name", address=self.agent_address)
+        self.gym_con = GymConnection(
+            gym_env=self.env, identity=identity, configuration=configuration
+        )
+        self.loop = asyncio.get_event_loop()
+        self.gym_address = str(GymConnection.connection_id)
+        self.dialogues = GymDialogues(self.agent_address)
+
+    def teardown(self):
+        """Clean up after tests."""
+        self.loop.run_until_complete(self.gym_con.disconnect())
+
+    def test_env_copies(self):
+        """Test the channel runs reseeded copies of the environment."""
+        channel = self.gym_con.channel
+        assert channel.is_vectorized
+        assert len(channel.gym_envs) == self.NB_ENVS
+        assert channel.gym_envs[0] is self.env
+        assert len({id(env) for env in channel.gym_envs}) == self.NB_ENVS
+        assert all(env.nb_seeds == 1 for env in channel.gym_envs[1:])
+
+    def test_invalid_nb_envs(self):
+        """Test a non-positive number of environments is rejected."""
+        with pytest.raises(ValueError, match="nb_envs must be a positive integer."):
+            GymChannel(self.agent_address, self.env, nb_envs=0)
+
+    async def _send(self, msg: GymMessage) -> GymMessage:
+        """Send a message and return the response."""
+        envelope = Envelope(
+            to=msg.to, sender=msg.sender, protocol_id=msg.protocol_id, message=msg,
+        )
+        await self.gym_con.send(envelope)
+        response = await asyncio.wait_for(self.gym_con.receive(), timeout=3)
+        response_msg = cast(GymMessage, response.message)
+        self.dialogues.update(response_msg)
+        return response_msg
+
+    @pytest.mark.asyncio
+    async def test_vectorized_reset_and_act(self):
+        """Test reset and batched steps over all the environment copies."""
+        await self.gym_con.connect()
+        msg, dialogue = self.dialogues.create(
+            counterparty=self.gym_address, performative=GymMessage.Performative.RESET,
+        )
+        response_msg = await self._send(msg)
+        assert response_msg.performative == GymMessage.Performative.STATUS
+        assert response_msg.content == {
+            "reset": "success",
+            "nb_envs": str(self.NB_ENVS),
+        }
+
+        actions = np.arange(self.NB_ENVS)
+        for step_id in range(1, 4):
+            msg = dialogue.reply(
+                performative=GymMessage.Performative.ACT,
+                action=GymMessage.AnyObject(actions),
+                step_id=step_id,
+            )
+            response_msg = await self._send(msg)
+            assert response_msg.performative == GymMessage.Performative.PERCEPT
+            assert response_msg.step_id == step_id
+            assert response_msg.reward == actions.mean()
+            info = response_msg.info.any
+            assert np.array_equal(info["rewards"], actions)
+            assert [info_["action"] for info_ in info["infos"]] == list(actions)
+
+        # every copy is done on the third step and has been reset
+        observations = response_msg.observation.any
+        assert np.array_equal(observations, np.zeros(self.NB_ENVS))
+        assert info["dones"].all()
+        assert response_msg.done
+        assert all(info_["terminal_observation"] == 3 for info_ in info["infos"])
+
+    @pytest.mark.asyncio
+    async def test_vectorized_act_wrong_number_of_actions(self):
+        """Test an act with the wrong number of actions is rejected."""
+        await self.gym_con.connect()
+        msg, dialogue = self.dialogues.create(
+            counterparty=self.gym_address, performative=GymMessage.Performative.RESET,
+        )
+        await self._send(msg)
+        msg = dialogue.reply(
+            performative=GymMessage.Performative.ACT,
+            action=GymMessage.AnyObject([1]),
+            step_id=1,
+        )
+        envelope = Envelope(
+            to=msg.to, sender=msg.sender, protocol_id=msg.protocol_id, message=msg,
+        )
+        with pytest.raises(ValueError, match="Expected 4 actions, got 1."):
+            await self.gym_con.send(envelope)
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the asynchronous Cosmos API, against a local fake LCD server."""
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Optional, cast
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from aea.connections.base import Connection
+from aea.crypto.fetchai import FetchAIApi
+from aea.crypto.registries import make_crypto
+from aea.crypto.wallet import CryptoStore
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.ledger.connection import LedgerConnection
+from packages.fetchai.connections.ledger.cosmos_api import AsyncCosmosApi
+from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
+
+from tests.conftest import FETCHAI, FETCHAI_ADDRESS_ONE, ROOT_DIR, get_unused_tcp_port
+from tests.test_packages.test_connections.test_ledger.test_ledger_api import (
+    LedgerApiDialogues,
+)
+
+
+DEFAULT_HOST = "127.0.0.1"
+ACCOUNT_NUMBER = 7
+SEQUENCE = 3
+BALANCE = 100
+TX_HASH = "FAKE_TX_HASH"
+
+
+class FakeLCDServer:
+    """A local stand-in for the REST server (LCD) of a Cosmos SDK node."""
+
+    def __init__(self, port: int):
+        """Initialize the server."""
+        self.port = port
+        self.nb_failures = 0
+        self.requests = []  # type: List[str]
+        self.received_txs = []  # type: List[Any]
+        self._runner = None  # type: Optional[web.AppRunner]
+
+    @property
+    def address(self) -> str:
+        """Get the address of the server."""
+        return "http://{}:{}".format(DEFAULT_HOST, self.port)
+
+    def fail_next(self, nb_failures: int) -> None:
+        """Make the next requests fail with a 503."""
+        self.nb_failures = nb_failures
+
+    async def start(self) -> None:
+        """Start the server."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/bank/balances/{address}", self._balance)
+        app.router.add_get("/auth/accounts/{address}", self._account)
+        app.router.add_post("/txs", self._send_tx)
+        app.router.add_get("/txs/{tx_hash}", self._tx)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, DEFAULT_HOST, self.port).start()
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests.append(request.method)
+        if self.nb_failures > 0:
+            self.nb_failures -= 1
+            return web.json_response({"error": "unavailable"}, status=503)
+        return await handler(request)
+
+    async def _balance(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"result": [{"denom": "atestfet", "amount": str(BALANCE)}]}
+        )
+
+    async def _account(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "result": {
+                    "value": {
+                        "account_number": str(ACCOUNT_NUMBER),
+                        "sequence": str(SEQUENCE),
+                    }
+                }
+            }
+        )
+
+    async def _send_tx(self, request: web.Request) -> web.Response:
+        self.received_txs.append(await request.json())
+        return web.json_response({"txhash": TX_HASH})
+
+    async def _tx(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"txhash": request.match_info["tx_hash"], "logs": [{"success": True}]}
+        )
+
+
+@pytest.fixture
+async def lcd_server():
+    """Run a fake LCD server."""
+    server = FakeLCDServer(get_unused_tcp_port())
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _make_api(server: FakeLCDServer, **kwargs) -> FetchAIApi:
+    return FetchAIApi(
+        address=server.address,
+        denom="atestfet",
+        chain_id="fake-chain",
+        backoff_factor=0.001,
+        **kwargs
+    )
+
+
+def _transfer_tx(sender: str, destination: str) -> Dict[str, Any]:
+    return {
+        "tx": {
+            "msg": [
+                {
+                    "type": "cosmos-sdk/MsgSend",
+                    "value": {
+                        "amount": [{"amount": "1", "denom": "atestfet"}],
+                        "from_address": sender,
+                        "to_address": destination,
+                    },
+                }
+            ]
+        },
+        "mode": "async",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_api(lcd_server: FakeLCDServer):
+    """Test the asynchronous api against the fake LCD server."""
+    async with aiohttp.ClientSession() as session:
+        api = AsyncCosmosApi(_make_api(lcd_server), session)
+        assert await api.get_balance(FETCHAI_ADDRESS_ONE) == BALANCE
+
+        tx = await api.get_transfer_transaction(
+            FETCHAI_ADDRESS_ONE, FETCHAI_ADDRESS_ONE, 1, 10, "nonce"
+        )
+        assert tx["account_number"] == str(ACCOUNT_NUMBER)
+        assert tx["sequence"] == str(SEQUENCE)
+        assert tx["chain_id"] == "fake-chain"
+        assert tx["msgs"][0]["value"]["amount"] == [
+            {"amount": "1", "denom": "atestfet"}
+        ]
+
+        tx_signed = _transfer_tx(FETCHAI_ADDRESS_ONE, FETCHAI_ADDRESS_ONE)
+        assert await api.send_signed_transaction(tx_signed) == TX_HASH
+        assert lcd_server.received_txs == [tx_signed]
+
+        receipt = await api.get_transaction_receipt(TX_HASH)
+        assert receipt["txhash"] == TX_HASH
+        assert api.api.is_transaction_settled(receipt)
+        assert await api.get_transaction(TX_HASH) == receipt
+
+
+@pytest.mark.asyncio
+async def test_async_api_retries_gets_only(lcd_server: FakeLCDServer):
+    """Test the asynchronous api retries failed GET requests, but not POST requests."""
+    async with aiohttp.ClientSession() as session:
+        api = AsyncCosmosApi(_make_api(lcd_server, max_retries=2), session)
+        lcd_server.fail_next(2)
+        assert await api.get_balance(FETCHAI_ADDRESS_ONE) == BALANCE
+        assert lcd_server.requests == ["GET"] * 3
+
+        lcd_server.fail_next(3)
+        assert await api.get_balance(FETCHAI_ADDRESS_ONE) is None
+
+        lcd_server.requests = []
+        lcd_server.fail_next(1)
+        tx_signed = _transfer_tx(FETCHAI_ADDRESS_ONE, FETCHAI_ADDRESS_ONE)
+        assert await api.send_signed_transaction(tx_signed) is None
+        assert lcd_server.requests == ["POST"]
+        assert lcd_server.received_txs == []
+
+
+@pytest.mark.asyncio
+async def test_async_api_connection_error():
+    """Test the asynchronous api returns None when the node is unreachable."""
+    server = FakeLCDServer(get_unused_tcp_port())
+    async with aiohttp.ClientSession() as session:
+        api = AsyncCosmosApi(_make_api(server, max_retries=1), session)
+        assert await api.get_balance(FETCHAI_ADDRESS_ONE) is None
+        assert await api.get_account_number_and_sequence(FETCHAI_ADDRESS_ONE) == (
+            None,
+            None,
+        )
+        assert await api.get_transaction_receipt(TX_HASH) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_api_pooled_session(lcd_server: FakeLCDServer):
+    """Test the synchronous api shares a pooled session and retries failed GET requests."""
+    api = _make_api(lcd_server, max_retries=2)
+    assert api._session is _make_api(lcd_server, max_retries=2)._session
+    assert api._session is not _make_api(lcd_server, max_retries=1)._session
+
+    loop = asyncio.get_event_loop()
+    lcd_server.fail_next(2)
+    balance = await loop.run_in_executor(None, api.get_balance, FETCHAI_ADDRESS_ONE)
+    assert balance == BALANCE
+    assert lcd_server.requests == ["GET"] * 3
+
+    lcd_server.requests = []
+    lcd_server.fail_next(1)
+    tx_signed = _transfer_tx(FETCHAI_ADDRESS_ONE, FETCHAI_ADDRESS_ONE)
+    with patch("aea.crypto.cosmos._default_logger.error"):
+        tx_digest = await loop.run_in_executor(
+            None, api.send_signed_transaction, tx_signed
+        )
+    assert tx_digest is None
+    assert lcd_server.requests == ["POST"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_http", [True, False])
+async def test_connection_get_balance(lcd_server: FakeLCDServer, async_http: bool):
+    """Test the ledger connection serves balance requests, with and without the asynchronous api."""
+    crypto = make_crypto(FETCHAI)
+    directory = Path(ROOT_DIR, "packages", "fetchai", "connections", "ledger")
+    connection = cast(
+        LedgerConnection,
+        Connection.from_dir(
+            directory,
+            identity=Identity("name", crypto.address),
+            crypto_store=CryptoStore(),
+        ),
+    )
+    connection.api_configs = {
+        FETCHAI: {"address": lcd_server.address, "denom": "atestfet"}
+    }
+    connection.async_http = async_http
+    await connection.connect()
+    try:
+        dispatcher = connection._ledger_dispatcher
+        assert dispatcher is not None
+        with patch.object(
+            dispatcher, "run_async", wraps=dispatcher.run_async
+        ) as run_async:
+            ledger_api_dialogues = LedgerApiDialogues(crypto.address)
+            request, ledger_api_dialogue = ledger_api_dialogues.create(
+                counterparty=str(connection.connection_id),
+                performative=LedgerApiMessage.Performative.GET_BALANCE,
+                ledger_id=FETCHAI,
+                address=FETCHAI_ADDRESS_ONE,
+            )
+            await connection.send(
+                Envelope(
+                    to=request.to,
+                    sender=request.sender,
+                    protocol_id=request.protocol_id,
+                    message=request,
+                )
+            )
+            response = await asyncio.wait_for(connection.receive(), timeout=10)
+            assert run_async.called is not async_http
+    finally:
+        await connection.disconnect()
+
+    assert response is not None
+    response_msg = cast(LedgerApiMessage, response.message)
+    assert response_msg.performative == LedgerApiMessage.Performative.BALANCE
+    assert response_msg.balance == BALANCE
+    assert ledger_api_dialogues.update(response_msg) is ledger_api_dialogue
@@ -30,6 +30,7 @@ from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.crypto import EthereumCrypto
+from aea.crypto.ethereum import EthereumApi
 from aea.crypto.ledger_apis import LedgerApis
 from aea.crypto.registries import make_crypto, make_ledger_api
 from aea.helpers.async_utils import AsyncState
@@ -356,6 +357,73 @@ async def test_no_raw_tx():
     assert msg.performative == LedgerApiMessage.Performative.ERROR
 
 
+def _get_raw_transaction(
+    dispatcher: LedgerApiRequestDispatcher, api: Mock
+) -> LedgerApiMessage:
+    """Request a raw transaction from the dispatcher in a new dialogue."""
+    message = LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.GET_RAW_TRANSACTION,
+        dialogue_reference=dispatcher.dialogues.new_self_initiated_dialogue_reference(),
+        terms=Terms(
+            ledger_id=ETHEREUM,
+            sender_address="1111",
+            counterparty_address="22222",
+            amount_by_currency_id={"ETH": -1},
+            quantities_by_good_id={"some_service_id": 1},
+            is_sender_payable_tx_fee=True,
+            nonce="",
+            fee_by_currency_id={"ETH": 10},
+            chain_id=3,
+        ),
+    )
+    message.to = dispatcher.dialogues.self_address
+    message.sender = "test"
+    dialogue = dispatcher.dialogues.update(message)
+    assert dialogue is not None
+    response = dispatcher.get_raw_transaction(api, message, dialogue)
+    assert response.performative == LedgerApiMessage.Performative.RAW_TRANSACTION
+    return response
+
+
+def test_unsent_nonce_released():
+    """Test the nonce of a raw transaction which is not sent is released after the timeout."""
+    dispatcher = LedgerApiRequestDispatcher(AsyncState(), nonce_release_timeout=0.0)
+    mock_api = Mock(spec=EthereumApi)
+    mock_api.get_transfer_transaction.return_value = {"nonce": 7}
+    _get_raw_transaction(dispatcher, mock_api)
+    mock_api.release_nonce.assert_not_called()
+
+    mock_api.get_transfer_transaction.return_value = {"nonce": 8}
+    _get_raw_transaction(dispatcher, mock_api)
+    mock_api.release_nonce.assert_called_once_with("1111", 7)
+
+
+def test_sent_nonce_not_released():
+    """Test the nonce of a raw transaction which is sent is not released."""
+    dispatcher = LedgerApiRequestDispatcher(AsyncState(), nonce_release_timeout=0.0)
+    mock_api = Mock(spec=EthereumApi)
+    mock_api.get_transfer_transaction.return_value = {"nonce": 7}
+    mock_api.send_signed_transaction.return_value = "some_digest"
+    raw_transaction_msg = _get_raw_transaction(dispatcher, mock_api)
+
+    message = LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION,
+        dialogue_reference=raw_transaction_msg.dialogue_reference,
+        message_id=raw_transaction_msg.message_id + 1,
+        target=raw_transaction_msg.message_id,
+        signed_transaction=SignedTransaction(ETHEREUM, "some_signed_transaction"),
+    )
+    message.to = dispatcher.dialogues.self_address
+    message.sender = "test"
+    dialogue = dispatcher.dialogues.update(message)
+    assert dialogue is not None
+    response = dispatcher.send_signed_transaction(mock_api, message, dialogue)
+    assert response.performative == LedgerApiMessage.Performative.TRANSACTION_DIGEST
+
+    _get_raw_transaction(dispatcher, mock_api)
+    mock_api.release_nonce.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_attempts_get_transaction_receipt():
     """Test retry and sleep."""
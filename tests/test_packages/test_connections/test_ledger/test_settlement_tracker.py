@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the settlement tracker, against a local mock chain."""
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Optional, cast
+
+import aiohttp
+import pytest
+from aiohttp import web
+from web3 import Web3
+
+from aea.connections.base import Connection
+from aea.crypto.ethereum import EthereumApi
+from aea.crypto.registries import make_crypto
+from aea.crypto.wallet import CryptoStore
+from aea.helpers.transaction.base import TransactionDigest
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.ledger.connection import LedgerConnection
+from packages.fetchai.connections.ledger.settlement_tracker import SettlementTracker
+from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
+
+from tests.conftest import ETHEREUM, FETCHAI, ROOT_DIR, get_unused_tcp_port
+from tests.test_packages.test_connections.test_ledger.test_cosmos_api import (  # noqa: F401
+    FakeLCDServer,
+    _make_api,
+    lcd_server,
+)
+from tests.test_packages.test_connections.test_ledger.test_ledger_api import (
+    LedgerApiDialogues,
+)
+
+
+DEFAULT_HOST = "127.0.0.1"
+NB_BLOCKS = 5
+CONTRACT_ADDRESS = "0x" + "ab" * 20
+
+
+def _tx_digest(i: int) -> str:
+    return "0x{:064x}".format(i)
+
+
+class MockChain:
+    """
+    A local stand-in for the JSON-RPC server of an Ethereum node.
+
+    A block is mined on every HTTP request. The transaction with digest i is
+    included in block (i % NB_BLOCKS) + 1, unless it is in 'lost_digests'.
+    """
+
+    def __init__(self, port: int):
+        """Initialize the mock chain."""
+        self.port = port
+        self.block_number = 0
+        self.nb_http_requests = 0
+        self.batch_sizes = []  # type: List[int]
+        self.lost_digests = set()  # type: set
+        self._runner = None  # type: Optional[web.AppRunner]
+
+    @property
+    def address(self) -> str:
+        """Get the address of the node."""
+        return "http://{}:{}".format(DEFAULT_HOST, self.port)
+
+    async def start(self) -> None:
+        """Start the node."""
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, DEFAULT_HOST, self.port).start()
+
+    async def stop(self) -> None:
+        """Stop the node."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _inclusion_block(self, tx_digest: str) -> Optional[int]:
+        if tx_digest in self.lost_digests:
+            return None
+        return int(tx_digest, 16) % NB_BLOCKS + 1
+
+    def _call(self, method: str, params: List[Any]) -> Any:
+        tx_digest = params[0]
+        block = self._inclusion_block(tx_digest)
+        if block is None or block > self.block_number:
+            return None
+        if method == "eth_getTransactionReceipt":
+            return {
+                "transactionHash": tx_digest,
+                "blockNumber": hex(block),
+                "status": "0x1",
+                "to": CONTRACT_ADDRESS,
+                "logs": [
+                    {
+                        "address": CONTRACT_ADDRESS,
+                        "topics": [tx_digest],
+                        "logIndex": "0x0",
+                    }
+                ],
+            }
+        if method == "eth_getTransactionByHash":
+            return {"hash": tx_digest, "blockNumber": hex(block), "value": "0x1"}
+        raise ValueError("Unsupported method {}".format(method))
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.nb_http_requests += 1
+        self.block_number += 1
+        payload = await request.json()
+        calls = payload if isinstance(payload, list) else [payload]
+        self.batch_sizes.append(len(calls))
+        results = [
+            {
+                "jsonrpc": "2.0",
+                "id": call["id"],
+                "result": self._call(call["method"], call["params"]),
+            }
+            for call in calls
+        ]
+        return web.json_response(results if isinstance(payload, list) else results[0])
+
+
+@pytest.fixture
+async def mock_chain():
+    """Run a mock chain."""
+    chain = MockChain(get_unused_tcp_port())
+    await chain.start()
+    yield chain
+    await chain.stop()
+
+
+@pytest.mark.asyncio
+async def test_pending_transactions_are_polled_together(mock_chain: MockChain):
+    """Test the requests to the node do not grow with the number of pending transactions."""
+    tracker = SettlementTracker(poll_interval=0.01, max_poll_interval=0.05)
+    api = EthereumApi(address=mock_chain.address)
+    tx_digests = [_tx_digest(i) for i in range(50)]
+    futures = [tracker.track(ETHEREUM, api, tx_digest) for tx_digest in tx_digests]
+    assert tracker.nb_pending == 50
+
+    results = await asyncio.wait_for(asyncio.gather(*futures), timeout=10)
+    assert tracker.nb_pending == 0
+    for tx_digest, (is_settled, receipt, transaction) in zip(tx_digests, results):
+        assert is_settled
+        assert receipt.transactionHash.hex() == tx_digest
+        assert receipt.status == 1
+        assert receipt.to == Web3.toChecksumAddress(CONTRACT_ADDRESS)
+        assert receipt.logs[0].address == receipt.to
+        assert receipt.logs[0].topics[0].hex() == tx_digest
+        assert receipt.logs[0].logIndex == 0
+        assert transaction.value == 1
+    assert mock_chain.nb_http_requests == NB_BLOCKS
+    assert mock_chain.batch_sizes == [100, 80, 60, 40, 20]
+
+
+@pytest.mark.asyncio
+async def test_same_digest_tracked_twice(mock_chain: MockChain):
+    """Test a transaction tracked by two requests is polled once per round."""
+    tracker = SettlementTracker(poll_interval=0.01)
+    api = EthereumApi(address=mock_chain.address)
+    first = tracker.track(ETHEREUM, api, _tx_digest(0))
+    second = tracker.track(ETHEREUM, api, _tx_digest(0))
+    assert tracker.nb_pending == 1
+    first_result, second_result = await asyncio.wait_for(
+        asyncio.gather(first, second), timeout=10
+    )
+    assert first_result[0] and second_result[0]
+    assert set(mock_chain.batch_sizes) == {2}
+
+
+@pytest.mark.asyncio
+async def test_lost_transaction_times_out_with_backoff(mock_chain: MockChain):
+    """Test a transaction which never settles is reported, and is polled less and less often."""
+    tracker = SettlementTracker(
+        poll_interval=0.01, max_poll_interval=0.1, settlement_timeout=0.5
+    )
+    api = EthereumApi(address=mock_chain.address)
+    mock_chain.lost_digests.add(_tx_digest(0))
+    is_settled, receipt, transaction = await asyncio.wait_for(
+        tracker.track(ETHEREUM, api, _tx_digest(0)), timeout=10
+    )
+    assert not is_settled
+    assert receipt is None
+    assert transaction is None
+    # without backoff, it would take about 50 polls
+    assert mock_chain.nb_http_requests < 15
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_pending_settlements(mock_chain: MockChain):
+    """Test stopping the tracker cancels the futures of pending transactions."""
+    tracker = SettlementTracker(poll_interval=10)
+    api = EthereumApi(address=mock_chain.address)
+    future = tracker.track(ETHEREUM, api, _tx_digest(0))
+    tracker.stop()
+    await asyncio.sleep(0)
+    assert future.cancelled()
+    assert tracker.nb_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_cosmos_transactions_tracked_over_http_session(
+    lcd_server: FakeLCDServer,  # noqa: F811
+):
+    """Test transactions of Cosmos based ledgers are polled with the shared aiohttp session."""
+    async with aiohttp.ClientSession() as session:
+        tracker = SettlementTracker(http_session=session, poll_interval=0.01)
+        api = _make_api(lcd_server)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *[tracker.track(FETCHAI, api, "TX_{}".format(i)) for i in range(3)]
+            ),
+            timeout=10,
+        )
+    assert [receipt["txhash"] for _, receipt, _ in results] == ["TX_0", "TX_1", "TX_2"]
+    assert all(is_settled for is_settled, _, _ in results)
+    assert lcd_server.requests == ["GET"] * 3
+
+
+@pytest.mark.asyncio
+async def test_connection_replies_to_each_dialogue(mock_chain: MockChain):
+    """Test the ledger connection answers the receipt requests of many dialogues through the tracker."""
+    crypto = make_crypto(ETHEREUM)
+    directory = Path(ROOT_DIR, "packages", "fetchai", "connections", "ledger")
+    connection = cast(
+        LedgerConnection,
+        Connection.from_dir(
+            directory,
+            identity=Identity("name", crypto.address),
+            crypto_store=CryptoStore(),
+        ),
+    )
+    connection.api_configs = {ETHEREUM: {"address": mock_chain.address}}
+    connection.settlement_poll_interval = 0.01
+    await connection.connect()
+    try:
+        ledger_api_dialogues = LedgerApiDialogues(crypto.address)
+        dialogues = {}  # type: Dict[str, Any]
+        for i in range(10):
+            request, ledger_api_dialogue = ledger_api_dialogues.create(
+                counterparty=str(connection.connection_id),
+                performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+                transaction_digest=TransactionDigest(ETHEREUM, _tx_digest(i)),
+            )
+            dialogues[_tx_digest(i)] = ledger_api_dialogue
+            await connection.send(
+                Envelope(
+                    to=request.to,
+                    sender=request.sender,
+                    protocol_id=request.protocol_id,
+                    message=request,
+                )
+            )
+        for _ in range(10):
+            response = await asyncio.wait_for(connection.receive(), timeout=10)
+            assert response is not None
+            response_msg = cast(LedgerApiMessage, response.message)
+            assert (
+                response_msg.performative
+                == LedgerApiMessage.Performative.TRANSACTION_RECEIPT
+            )
+            tx_digest = response_msg.transaction_receipt.receipt.transactionHash.hex()
+            assert ledger_api_dialogues.update(response_msg) is dialogues[tx_digest]
+    finally:
+        await connection.disconnect()
+    assert mock_chain.nb_http_requests == NB_BLOCKS
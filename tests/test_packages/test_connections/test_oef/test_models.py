@@ -112,6 +112,97 @@ class TestTranslator:
         assert expected_query == actual_query
 
 
+class TestTranslatorCache:
+    """Test the memoization of the translations to the OEF SDK classes."""
+
+    def setup(self):
+        """Set up the test."""
+        OEFObjectTranslator.clear_caches()
+        attribute_foo = Attribute("foo", int, True, "a foo attribute.")
+        attribute_bar = Attribute("bar", str, True, "a bar attribute.")
+        attribute_loc = Attribute("loc", Location, False, "a location attribute.")
+        self.data_model = DataModel(
+            "foobar",
+            [attribute_foo, attribute_bar, attribute_loc],
+            "A foobar data model.",
+        )
+
+    def teardown(self):
+        """Tear down the test."""
+        OEFObjectTranslator.clear_caches()
+
+    def test_equal_descriptions_share_translation(self):
+        """Test structurally equal descriptions are translated once."""
+        oef_description = OEFObjectTranslator.to_oef_description(
+            Description({"foo": 1, "bar": "baz"}, data_model=self.data_model)
+        )
+        other = OEFObjectTranslator.to_oef_description(
+            Description({"bar": "baz", "foo": 1}, data_model=self.data_model)
+        )
+        assert other is oef_description
+        assert OEFObjectTranslator.description_cache.hits == 1
+        assert OEFObjectTranslator.description_cache.misses == 1
+
+    def test_value_types_are_distinguished(self):
+        """Test values which are equal but of different types are not confused."""
+        oef_int = OEFObjectTranslator.to_oef_description(Description({"foo": 1}))
+        oef_bool = OEFObjectTranslator.to_oef_description(Description({"foo": True}))
+        assert oef_int is not oef_bool
+        assert oef_bool.values["foo"] is True
+
+    def test_equal_queries_share_translation(self):
+        """Test structurally equal queries are translated once."""
+
+        def make_query():
+            return Query(
+                [
+                    Or(
+                        [
+                            Not(Constraint("foo", ConstraintType("==", 1))),
+                            Constraint("bar", ConstraintType("in", ["a", "b"])),
+                        ]
+                    ),
+                    Constraint(
+                        "loc", ConstraintType("distance", (Location(1.0, 2.0), 3.0)),
+                    ),
+                ],
+                self.data_model,
+            )
+
+        oef_query = OEFObjectTranslator.to_oef_query(make_query())
+        assert OEFObjectTranslator.to_oef_query(make_query()) is oef_query
+        assert OEFObjectTranslator.from_oef_query(oef_query) == make_query()
+        assert OEFObjectTranslator.query_cache.hits == 1
+
+    def test_cache_is_bounded(self):
+        """Test the least recently used translations are evicted."""
+        cache = OEFObjectTranslator.description_cache
+        with mock.patch.object(cache, "maxsize", 2):
+            descriptions = [Description({"foo": i}) for i in range(3)]
+            OEFObjectTranslator.to_oef_descriptions(descriptions)
+            assert len(cache) == 2
+            OEFObjectTranslator.to_oef_description(descriptions[0])
+            assert cache.hits == 0
+            OEFObjectTranslator.to_oef_description(descriptions[2])
+            assert cache.hits == 1
+
+    def test_batch_translation(self):
+        """Test the translation of a batch of descriptions."""
+        descriptions = [
+            Description({"foo": i, "bar": "baz"}, data_model=self.data_model)
+            for i in range(3)
+        ]
+        oef_descriptions = OEFObjectTranslator.to_oef_descriptions(
+            descriptions + descriptions
+        )
+        assert oef_descriptions[:3] == oef_descriptions[3:]
+        assert [
+            OEFObjectTranslator.from_oef_description(oef_description)
+            for oef_description in oef_descriptions[:3]
+        ] == descriptions
+        assert OEFObjectTranslator.description_cache.misses == 3
+
+
 class TestPickable:
     """Test that the OEF objects can be pickled."""
 
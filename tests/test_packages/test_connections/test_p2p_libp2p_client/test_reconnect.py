@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This test module contains reconnection tests for Libp2p tcp client connection, against local delegate stand-ins."""
+
+import asyncio
+import random
+import struct
+from typing import Dict, List, Optional
+
+import pytest
+
+from aea.configurations.base import ConnectionConfig
+from aea.crypto.registries import make_crypto
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.p2p_libp2p_client.connection import (
+    P2PLibp2pClientConnection,
+)
+from packages.fetchai.protocols.default.message import DefaultMessage
+from packages.fetchai.protocols.default.serialization import DefaultSerializer
+
+from tests.conftest import COSMOS, get_unused_tcp_port
+
+
+DEFAULT_HOST = "127.0.0.1"
+RECEIVE_TIMEOUT = 0.5
+
+
+class DelegateStandIn:
+    """
+    A local stand-in for the delegate service of a libp2p node.
+
+    It speaks the delegate framing protocol, routes envelopes to the link that
+    most recently registered the recipient address, and kills links at random.
+    """
+
+    def __init__(self, port: int, kill_probability: float = 0.0, seed: int = 0):
+        """Initialize the stand-in."""
+        self.port = port
+        self.kill_probability = kill_probability
+        self.nb_kills = 0
+        self.nb_frames = 0
+        self._random = random.Random(seed)  # nosec
+        self._server = None  # type: Optional[asyncio.AbstractServer]
+        self._writers = []  # type: List[asyncio.StreamWriter]
+        self._routes = {}  # type: Dict[str, asyncio.StreamWriter]
+
+    @property
+    def uri(self) -> str:
+        """Get the uri of the stand-in."""
+        return "{}:{}".format(DEFAULT_HOST, self.port)
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, DEFAULT_HOST, self.port)
+
+    async def stop(self) -> None:
+        """Stop listening and kill every link."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._writers):
+            writer.transport.abort()
+        self._writers = []
+        self._routes = {}
+
+    @staticmethod
+    async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+        size = struct.unpack("!I", await reader.readexactly(4))[0]
+        return await reader.readexactly(size)
+
+    @staticmethod
+    def _write_frame(writer: asyncio.StreamWriter, data: bytes) -> None:
+        writer.write(struct.pack("!I", len(data)))
+        writer.write(data)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.append(writer)
+        try:
+            address = (await self._read_frame(reader)).decode("utf-8")
+            self._routes[address] = writer
+            self._write_frame(writer, b"DONE")
+            await writer.drain()
+            while True:
+                data = await self._read_frame(reader)
+                self.nb_frames += 1
+                route = self._routes.get(Envelope.decode(data).to)
+                if route is not None and not route.is_closing():
+                    self._write_frame(route, data)
+                    await route.drain()
+                if self._random.random() < self.kill_probability:
+                    self.nb_kills += 1
+                    writer.transport.abort()
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if writer in self._writers:
+                self._writers.remove(writer)
+
+
+def _make_connection(uris: List[str], **config) -> P2PLibp2pClientConnection:
+    crypto = make_crypto(COSMOS)
+    identity = Identity("", address=crypto.address)
+    configuration = ConnectionConfig(
+        client_key_file=None,
+        nodes=[{"uri": uri} for uri in uris],
+        connection_id=P2PLibp2pClientConnection.connection_id,
+        reconnect_backoff_initial=0.01,
+        reconnect_backoff_max=0.1,
+        **config
+    )
+    return P2PLibp2pClientConnection(configuration=configuration, identity=identity)
+
+
+def _make_envelope(address: str, content: bytes) -> Envelope:
+    msg = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=content,
+    )
+    return Envelope(
+        to=address,
+        sender=address,
+        protocol_id=DefaultMessage.protocol_id,
+        message=DefaultSerializer().encode(msg),
+    )
+
+
+async def _receive(conn: P2PLibp2pClientConnection) -> Optional[Envelope]:
+    try:
+        return await asyncio.wait_for(conn.receive(), RECEIVE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return None
+
+
+def _content(envelope: Envelope) -> bytes:
+    return DefaultSerializer().decode(envelope.message).content
+
+
+@pytest.mark.asyncio
+async def test_connect_fails_when_no_delegate_is_reachable():
+    """Test connect raises when none of the delegates is running."""
+    conn = _make_connection(
+        ["{}:{}".format(DEFAULT_HOST, get_unused_tcp_port()) for _ in range(2)]
+    )
+    with pytest.raises(ConnectionError):
+        await conn.connect()
+    assert conn.is_disconnected
+
+
+@pytest.mark.asyncio
+async def test_connect_fails_over_to_running_delegate():
+    """Test connect skips delegates that are down."""
+    standin = DelegateStandIn(get_unused_tcp_port())
+    await standin.start()
+    dead_uri = "{}:{}".format(DEFAULT_HOST, get_unused_tcp_port())
+    conn = _make_connection([dead_uri, standin.uri])
+    try:
+        await conn.connect()
+        assert conn.is_connected
+        assert str(conn.node_uri) == standin.uri
+        await conn.send(_make_envelope(conn.address, b"hello"))
+        envelope = await _receive(conn)
+        assert envelope is not None
+        assert _content(envelope) == b"hello"
+    finally:
+        await conn.disconnect()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_buffer_survives_delegate_outage():
+    """Test envelopes sent while the delegate is down are delivered after reconnecting."""
+    standin = DelegateStandIn(get_unused_tcp_port())
+    await standin.start()
+    conn = _make_connection([standin.uri])
+    try:
+        await conn.connect()
+        await standin.stop()
+        while conn.nb_open_links > 0:
+            await asyncio.sleep(0.01)
+
+        contents = [str(i).encode("utf-8") for i in range(5)]
+        for content in contents:
+            await conn.send(_make_envelope(conn.address, content))
+
+        await standin.start()
+        received = []
+        for _ in contents:
+            envelope = await _receive(conn)
+            assert envelope is not None
+            received.append(_content(envelope))
+        assert received == contents
+        assert conn.nb_reconnections >= 1
+    finally:
+        await conn.disconnect()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_striped_links_heal_under_random_kills():
+    """Test striped links keep delivering while delegates kill links at random."""
+    standins = [
+        DelegateStandIn(get_unused_tcp_port(), kill_probability=0.1, seed=i)
+        for i in range(3)
+    ]
+    for standin in standins:
+        await standin.start()
+    conn = _make_connection(
+        [standin.uri for standin in standins], delegate_connections=3
+    )
+    try:
+        await conn.connect()
+        assert conn.nb_open_links == 3
+
+        pending = {str(i).encode("utf-8") for i in range(100)}
+        for content in sorted(pending):
+            await conn.send(_make_envelope(conn.address, content))
+
+        # frames written to a link just before it is killed may be lost, resend those
+        for _ in range(20):
+            if not pending:
+                break
+            envelope = await _receive(conn)
+            while envelope is not None:
+                pending.discard(_content(envelope))
+                if not pending:
+                    break
+                envelope = await _receive(conn)
+            for content in sorted(pending):
+                await conn.send(_make_envelope(conn.address, content))
+
+        assert not pending
+        assert sum(standin.nb_kills for standin in standins) > 0
+        assert conn.nb_reconnections > 0
+        assert all(standin.nb_frames > 0 for standin in standins)
+    finally:
+        await conn.disconnect()
+        for standin in standins:
+            await standin.stop()
@@ -197,3 +197,107 @@ class TestWebhookConnection:
         except Exception:
             print_exc()
             raise
+
+
+@pytest.mark.asyncio
+class TestWebhookOverload:
+    """Tests the bounded queueing and load shedding of the webhook connection."""
+
+    MAX_QUEUE_SIZE = 10
+
+    def setup(self):
+        """Initialise the class."""
+        self.host = get_host()
+        self.port = get_unused_tcp_port()
+        self.identity = Identity("", address="some string")
+        self.path = "/webhooks/topic/{topic}/"
+        self.loop = asyncio.get_event_loop()
+
+        configuration = ConnectionConfig(
+            webhook_address=self.host,
+            webhook_port=self.port,
+            webhook_url_path=self.path,
+            max_queue_size=self.MAX_QUEUE_SIZE,
+            max_body_size=1024,
+            offload_body_size=256,
+            retry_after=3,
+            connection_id=WebhookConnection.connection_id,
+        )
+        self.webhook_connection = WebhookConnection(
+            configuration=configuration, identity=self.identity,
+        )
+        self.dialogues = HttpDialogues(self.identity.address)
+
+    def teardown(self):
+        """Close connection after testing."""
+        self.loop.run_until_complete(self.webhook_connection.disconnect())
+
+    async def post(self, session: aiohttp.ClientSession, data: bytes) -> ClientResponse:
+        """Post data to the webhook."""
+        url = f"http://{self.host}:{self.port}{self.path.format(topic='load')}"
+        async with session.post(url, data=data) as resp:
+            await resp.read()
+            return resp
+
+    async def test_load_is_shed_when_queue_is_full(self):
+        """Test a burst larger than the queue is partially rejected with 429."""
+        await self.webhook_connection.connect()
+        channel = self.webhook_connection.channel
+        nb_requests = 100
+        async with aiohttp.ClientSession() as session:
+            responses = await asyncio.gather(
+                *[
+                    self.post(session, str(i).encode("utf-8"))
+                    for i in range(nb_requests)
+                ]
+            )
+        statuses = [response.status for response in responses]
+        assert statuses.count(200) == self.MAX_QUEUE_SIZE
+        assert statuses.count(429) == nb_requests - self.MAX_QUEUE_SIZE
+        assert all(
+            response.headers["Retry-After"] == "3"
+            for response in responses
+            if response.status == 429
+        )
+        assert channel.nb_accepted == self.MAX_QUEUE_SIZE
+        assert channel.nb_rejected == nb_requests - self.MAX_QUEUE_SIZE
+        assert channel.nb_queued == self.MAX_QUEUE_SIZE
+
+        for _ in range(self.MAX_QUEUE_SIZE):
+            envelope = await asyncio.wait_for(
+                self.webhook_connection.receive(), timeout=3
+            )
+            assert self.dialogues.update(cast(HttpMessage, envelope.message))
+        assert channel.nb_queued == 0
+
+        async with aiohttp.ClientSession() as session:
+            assert (await self.post(session, b"again")).status == 200
+
+    async def test_large_bodies(self):
+        """Test bodies above the limit are rejected and large bodies are converted off the loop."""
+        await self.webhook_connection.connect()
+        channel = self.webhook_connection.channel
+        async with aiohttp.ClientSession() as session:
+            response = await self.post(session, b"x" * 2048)
+            assert response.status == 413
+            assert channel.nb_rejected == 1
+
+            with patch.object(
+                channel, "_to_http_message", wraps=channel._to_http_message
+            ) as mock_to_http_message:
+                response = await self.post(session, b"y" * 512)
+            assert response.status == 200
+            mock_to_http_message.assert_called_once()
+
+        envelope = await asyncio.wait_for(self.webhook_connection.receive(), timeout=3)
+        message = cast(HttpMessage, envelope.message)
+        assert message.body == b"y" * 512
+        assert self.dialogues.update(message) is not None
+
+    async def test_unavailable_when_not_connected(self):
+        """Test requests are rejected with 503 when the channel is not connected."""
+        channel = self.webhook_connection.channel
+        response = await channel._receive_webhook(None)
+        assert response.status == 503
+        assert response.headers["Retry-After"] == "3"
+        assert channel.nb_rejected == 1
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests of the rl agent of the gym skill."""
+
+import time
+from pathlib import Path
+from threading import Thread
+from typing import List, cast
+
+import numpy as np
+
+from aea.protocols.base import Message
+from aea.test_tools.test_skill import BaseSkillTestCase
+
+from packages.fetchai.protocols.gym.message import GymMessage
+from packages.fetchai.skills.gym.dialogues import GymDialogues
+from packages.fetchai.skills.gym.handlers import GymHandler
+from packages.fetchai.skills.gym.helpers import ProxyVecEnv
+from packages.fetchai.skills.gym.rl_agent import MyRLAgent, NB_GOODS
+
+from tests.conftest import ROOT_DIR
+
+
+class TestMyRLAgentVectorized(BaseSkillTestCase):
+    """Test the training of the rl agent on a vectorized proxy environment."""
+
+    path_to_skill = Path(ROOT_DIR, "packages", "fetchai", "skills", "gym")
+
+    @classmethod
+    def setup(cls):
+        """Setup the test class."""
+        cls.nb_envs = 2
+        cls.nb_steps = 20
+        super().setup()
+        cls.gym_handler = cast(GymHandler, cls._skill.skill_context.handlers.gym)
+        cls.gym_handler.task._proxy_env = ProxyVecEnv(
+            cls._skill.skill_context, cls.nb_envs
+        )
+        cls.gym_dialogues = cast(GymDialogues, cls._skill.skill_context.gym_dialogues)
+
+    def _reply_as_connection(self, gym_msg: GymMessage) -> None:
+        """Reply to a message of the proxy environment as the gym connection does."""
+        gym_dialogue = self.gym_dialogues.get_dialogue(gym_msg)
+        if gym_msg.performative == GymMessage.Performative.RESET:
+            incoming_message = self.build_incoming_message_for_skill_dialogue(
+                dialogue=gym_dialogue,
+                performative=GymMessage.Performative.STATUS,
+                content={"reset": "success", "nb_envs": str(self.nb_envs)},
+            )
+        else:
+            incoming_message = self.build_incoming_message_for_skill_dialogue(
+                dialogue=gym_dialogue,
+                performative=GymMessage.Performative.PERCEPT,
+                observation=GymMessage.AnyObject(np.zeros(self.nb_envs)),
+                reward=1.0,
+                done=False,
+                info=GymMessage.AnyObject(
+                    {
+                        "rewards": np.ones(self.nb_envs),
+                        "dones": np.zeros(self.nb_envs, dtype=np.bool_),
+                        "infos": [{} for _ in range(self.nb_envs)],
+                    }
+                ),
+                step_id=gym_msg.step_id,
+            )
+        self.gym_handler.handle(incoming_message)
+
+    def test_fit(self):
+        """Test fit trains on all the environment copies and closes the proxy environment."""
+        # setup
+        proxy_env = self.gym_handler.task.proxy_env
+        rl_agent = MyRLAgent(NB_GOODS, self.skill.skill_context.logger)
+        training_thread = Thread(
+            target=rl_agent.fit, args=[proxy_env, self.nb_steps], daemon=True
+        )
+
+        # operation
+        training_thread.start()
+        performatives = []  # type: List[Message.Performative]
+        deadline = time.time() + 10.0
+        while time.time() < deadline:
+            gym_msg = cast(GymMessage, self.get_message_from_outbox())
+            if gym_msg is None:
+                time.sleep(0.01)
+                continue
+            performatives.append(gym_msg.performative)
+            if gym_msg.performative == GymMessage.Performative.CLOSE:
+                break
+            self._reply_as_connection(gym_msg)
+        training_thread.join(timeout=10.0)
+
+        # after
+        assert not training_thread.is_alive()
+        assert proxy_env.is_rl_agent_trained
+        assert performatives == (
+            [GymMessage.Performative.RESET]
+            + [GymMessage.Performative.ACT] * (self.nb_steps // self.nb_envs)
+            + [GymMessage.Performative.CLOSE]
+        )
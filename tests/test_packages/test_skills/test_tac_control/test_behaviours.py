@@ -22,7 +22,7 @@ import datetime
 import logging
 from pathlib import Path
 from typing import cast
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -306,8 +306,6 @@ class TestSkillBehaviour(BaseSkillTestCase):
 
         self.game._registration.register_agent(self.agent_1_address, self.agent_1_name)
         self.game._registration.register_agent(self.agent_2_address, self.agent_2_name)
-        mocked_holdings_summary = "some_holdings_summary"
-        mocked_equilibrium_summary = "some_equilibrium_summary"
 
         self.prepare_skill_dialogue(
             self.tac_dialogues,
@@ -340,17 +338,11 @@ class TestSkillBehaviour(BaseSkillTestCase):
                 return_value=self.mocked_description,
             ):
                 with patch.object(
-                    type(self.game),
-                    "holdings_summary",
-                    new_callable=PropertyMock,
-                    return_value=mocked_holdings_summary,
-                ):
+                    self.game, "log_holdings_summary"
+                ) as mock_log_holdings_summary:
                     with patch.object(
-                        type(self.game),
-                        "equilibrium_summary",
-                        new_callable=PropertyMock,
-                        return_value=mocked_equilibrium_summary,
-                    ):
+                        self.game, "log_equilibrium_summary"
+                    ) as mock_log_equilibrium_summary:
                         with patch.object(
                             self.tac_behaviour.context.logger, "log"
                         ) as mock_logger:
@@ -360,11 +352,9 @@ class TestSkillBehaviour(BaseSkillTestCase):
         self.assert_quantity_in_outbox(3)
 
         # _start_tac
-        mock_logger.assert_any_call(
-            logging.INFO, f"started competition:\n{mocked_holdings_summary}"
-        )
-        mock_logger.assert_any_call(
-            logging.INFO, f"computed equilibrium:\n{mocked_equilibrium_summary}"
+        mock_log_holdings_summary.assert_called_once_with("started competition:\n{}")
+        mock_log_equilibrium_summary.assert_called_once_with(
+            "computed equilibrium:\n{}"
         )
 
         tac_message_1_in_outbox = cast(TacMessage, self.get_message_from_outbox())
@@ -476,9 +466,6 @@ class TestSkillBehaviour(BaseSkillTestCase):
         self.game._registration.register_agent(self.agent_1_address, self.agent_1_name)
         self.game._registration.register_agent(self.agent_2_address, self.agent_2_name)
 
-        mocked_holdings_summary = "some_holdings_summary"
-        mocked_equilibrium_summary = "some_equilibrium_summary"
-
         self.prepare_skill_dialogue(
             self.tac_dialogues,
             (
@@ -510,17 +497,11 @@ class TestSkillBehaviour(BaseSkillTestCase):
                 return_value=self.mocked_description,
             ):
                 with patch.object(
-                    type(self.game),
-                    "holdings_summary",
-                    new_callable=PropertyMock,
-                    return_value=mocked_holdings_summary,
-                ):
+                    self.game, "log_holdings_summary"
+                ) as mock_log_holdings_summary:
                     with patch.object(
-                        type(self.game),
-                        "equilibrium_summary",
-                        new_callable=PropertyMock,
-                        return_value=mocked_equilibrium_summary,
-                    ):
+                        self.game, "log_equilibrium_summary"
+                    ) as mock_log_equilibrium_summary:
                         with patch.object(
                             self.tac_behaviour.context.logger, "log"
                         ) as mock_logger:
@@ -551,17 +532,65 @@ class TestSkillBehaviour(BaseSkillTestCase):
         )
         assert has_attributes, error_str
 
-        mock_logger.assert_any_call(
-            logging.INFO, f"finished competition:\n{mocked_holdings_summary}"
-        )
-        mock_logger.assert_any_call(
-            logging.INFO, f"computed equilibrium:\n{mocked_equilibrium_summary}"
+        mock_log_holdings_summary.assert_called_once_with("finished competition:\n{}")
+        mock_log_equilibrium_summary.assert_called_once_with(
+            "computed equilibrium:\n{}"
         )
 
         # phase is POST_GAME
         assert self.game.phase == Phase.POST_GAME
         assert self.skill.skill_context.is_active is False
 
+    def test_act_batch_settlement(self):
+        """Test the act method of the tac behaviour where phase is GAME and transactions are settled in batches."""
+        # setup
+        self.game._phase = Phase.GAME
+        self.parameters._batch_settlement = True
+
+        mocked_now_time = self._time("00:03")
+        datetime_mock = Mock(wraps=datetime.datetime)
+        datetime_mock.now.return_value = mocked_now_time
+
+        # operation
+        with patch("datetime.datetime", new=datetime_mock):
+            with patch.object(
+                self.skill.skill_context.handlers.tac, "settle_pending_transactions"
+            ) as mock_settle:
+                self.tac_behaviour.act()
+
+        # after
+        mock_settle.assert_called_once()
+        assert self.game.phase == Phase.GAME
+
+    def test_act_batch_settlement_game_end(self):
+        """Test the act method of the tac behaviour settles the queued transactions before the game ends."""
+        # setup
+        self.game._phase = Phase.GAME
+        self.parameters._batch_settlement = True
+
+        mocked_now_time = self._time("00:07")
+        datetime_mock = Mock(wraps=datetime.datetime)
+        datetime_mock.now.return_value = mocked_now_time
+        calls = []
+
+        # operation
+        with patch("datetime.datetime", new=datetime_mock):
+            with patch.object(
+                self.skill.skill_context.handlers.tac,
+                "settle_pending_transactions",
+                side_effect=lambda: calls.append("settle"),
+            ):
+                with patch.object(
+                    self.tac_behaviour,
+                    "_cancel_tac",
+                    side_effect=lambda game: calls.append("cancel"),
+                ):
+                    self.tac_behaviour.act()
+
+        # after
+        assert calls == ["settle", "cancel"]
+        assert self.game.phase == Phase.POST_GAME
+
     def test_teardown(self):
         """Test the teardown method of the service_registration behaviour."""
         # setup
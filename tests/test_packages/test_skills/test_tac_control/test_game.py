@@ -18,15 +18,17 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests of the models of the tac control skill."""
 
-import datetime
 import logging
 import pprint
+import sys
+import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from aea.crypto.ledger_apis import LedgerApis
+from aea.crypto.registries import make_crypto
 from aea.exceptions import AEAEnforceError
 from aea.helpers.preference_representations.base import (
     linear_utility,
@@ -43,6 +45,7 @@ from packages.fetchai.skills.tac_control.game import (
     AgentState,
     Configuration,
     Game,
+    HOLDINGS_SUMMARY_INTERVAL,
     Initialization,
     Phase,
     Registration,
@@ -550,6 +553,20 @@ class TestAgentState:
             self.exchange_params_by_currency_id, self.amount_by_currency_id
         )
 
+    def test_get_score_after_updates(self):
+        """Test the get_score of AgentState class after updates is the score of the new holdings."""
+        self.agent_state.update(self.transaction_1)
+        self.agent_state.update(self.transaction_2)
+        assert self.agent_state.get_score() == pytest.approx(
+            logarithmic_utility(
+                self.utility_params_by_good_id, self.agent_state.quantities_by_good_id,
+            )
+            + linear_utility(
+                self.exchange_params_by_currency_id,
+                self.agent_state.amount_by_currency_id,
+            )
+        )
+
     def test_is_consistent_transaction_succeeds(self):
         """Test the is_consistent_transaction of AgentState class where it returns True."""
         assert self.agent_state.is_consistent_transaction(self.transaction_1) is True
@@ -753,23 +770,94 @@ class TestTransactions:
             counterparty_signature,
         )
 
-        mocked_now = datetime.datetime.strptime("01 01 2020  00:01", "%d %m %Y %H:%M")
+        assert self.transactions.add(transaction) == 0
+        assert self.transactions.add(transaction) == 1
 
-        datetime_mock = Mock(wraps=datetime.datetime)
-        datetime_mock.now.return_value = mocked_now
+        assert self.transactions.confirmed == {0: transaction, 1: transaction}
+        assert self.transactions.confirmed_per_agent[sender_address] == {
+            0: transaction,
+            1: transaction,
+        }
+        assert self.transactions.confirmed_per_agent[counterparty_address] == {
+            0: transaction,
+            1: transaction,
+        }
 
-        with patch("datetime.datetime", new=datetime_mock):
-            self.transactions.add(transaction)
+    def test_get_by_agent_and_good(self):
+        """Test the queries of Transactions class by sequence number, by agent and by good."""
+        transaction_1 = _make_transaction("agent_1", "agent_2", {"G1": -1})
+        transaction_2 = _make_transaction("agent_2", "agent_3", {"G2": 1, "G1": 0})
+        self.transactions.add(transaction_1)
+        self.transactions.add(transaction_2)
+
+        assert self.transactions.nb_confirmed == 2
+        assert self.transactions.get(1) == transaction_2
+        assert self.transactions.get_by_agent("agent_1") == {0: transaction_1}
+        assert self.transactions.get_by_agent("agent_2") == {
+            0: transaction_1,
+            1: transaction_2,
+        }
+        assert self.transactions.get_by_agent("agent_4") == {}
+        assert self.transactions.get_by_good("G1") == {0: transaction_1}
+        assert self.transactions.get_by_good("G2") == {1: transaction_2}
 
-        assert self.transactions.confirmed[mocked_now] == transaction
-        assert (
-            self.transactions.confirmed_per_agent[sender_address][mocked_now]
-            == transaction
-        )
-        assert (
-            self.transactions.confirmed_per_agent[counterparty_address][mocked_now]
-            == transaction
-        )
+    def test_get_fails(self):
+        """Test the get of Transactions class fails for an unknown sequence number."""
+        with pytest.raises(
+            AEAEnforceError, match="No confirmed transaction with sequence number 0."
+        ):
+            self.transactions.get(0)
+
+    def test_sqlite_log(self, tmp_path):
+        """Test the Transactions class backed by a SQLite database."""
+        database_path = str(tmp_path / "transactions.db")
+        transactions = [
+            _make_transaction("agent_{}".format(i % 3), "agent_3", {"G1": i % 2})
+            for i in range(1, 8)
+        ]
+        with patch.object(
+            sys.modules[Transactions.__module__], "SQLITE_MAX_VARIABLES", 2
+        ):
+            sqlite_transactions = Transactions(database_path)
+            for transaction in transactions:
+                self.transactions.add(transaction)
+                sqlite_transactions.add(transaction)
+
+            assert sqlite_transactions.confirmed == self.transactions.confirmed
+            assert (
+                sqlite_transactions.confirmed_per_agent
+                == self.transactions.confirmed_per_agent
+            )
+            assert sqlite_transactions.get(3) == transactions[3]
+            assert sqlite_transactions.get_by_agent(
+                "agent_1"
+            ) == self.transactions.get_by_agent("agent_1")
+            assert sqlite_transactions.get_by_good(
+                "G1"
+            ) == self.transactions.get_by_good("G1")
+            sqlite_transactions.close()
+
+        reopened_transactions = Transactions(database_path)
+        assert reopened_transactions.confirmed == {}
+        reopened_transactions.close()
+
+
+def _make_transaction(
+    sender_address: str, counterparty_address: str, quantities_by_good_id: dict
+) -> Transaction:
+    """Make a transaction between two agents."""
+    return Transaction(
+        "ethereum",
+        sender_address,
+        counterparty_address,
+        {"FET": -1},
+        quantities_by_good_id,
+        True,
+        "some_nonce",
+        {"FET": 1},
+        "some_sender_signature",
+        "some_counterparty_signature",
+    )
 
 
 class TestRegistration:
@@ -977,9 +1065,35 @@ class TestGame(BaseSkillTestCase):
         assert self.game._initial_agent_states is not None
         assert self.game._current_agent_states is not None
 
-    def test_holdings_summary(self):
-        """Test the holdings_summary method of the Game class."""
-        # before
+    def test_create_generate_seeded(self):
+        """Test the _generate method of the Game class is reproducible with a seed."""
+        # setup
+        self.game.registration.register_agent("some_agent_address_1", "agent_1")
+        self.game.registration.register_agent("some_agent_address_2", "agent_2")
+        self.game.context.parameters._seed = 42
+
+        # operation
+        self.game._generate()
+        initialization = self.game.initialization
+        self.game._generate()
+
+        # after
+        assert (
+            self.game.initialization.agent_addr_to_good_endowments
+            == initialization.agent_addr_to_good_endowments
+        )
+        assert (
+            self.game.initialization.agent_addr_to_utility_params
+            == initialization.agent_addr_to_utility_params
+        )
+        assert (
+            self.game.initialization.good_id_to_eq_prices
+            == initialization.good_id_to_eq_prices
+        )
+        self.game.context.parameters._seed = None
+
+    def _setup_holdings(self) -> str:
+        """Set up the states of two agents, and get the expected holdings summary."""
         agent_address_1 = "agent_address_1"
         agent_address_2 = "agent_address_2"
 
@@ -1022,6 +1136,12 @@ class TestGame(BaseSkillTestCase):
             "    currency_1: 10\n"
             "    score: 12.34\n\n"
         )
+        return expected_holding_summary
+
+    def test_holdings_summary(self):
+        """Test the holdings_summary method of the Game class."""
+        # before
+        expected_holding_summary = self._setup_holdings()
 
         # operation
         holding_summary = self.game.holdings_summary
@@ -1029,6 +1149,62 @@ class TestGame(BaseSkillTestCase):
         # after
         assert holding_summary == expected_holding_summary
 
+    def test_log_holdings_summary(self):
+        """Test the log_holdings_summary method of the Game class, once the game is set up."""
+        # before
+        expected_holding_summary = self._setup_holdings()
+        self.game.setup()
+        assert self.game._summary_executor is not None
+
+        # operation
+        with patch.object(self.game.context.logger, "log") as mock_logger:
+            self.game.log_holdings_summary("current state:\n{}")
+            self.game.teardown()
+
+        # after
+        assert self.game._summary_executor is None
+        mock_logger.assert_called_once_with(
+            logging.INFO, "current state:\n" + expected_holding_summary
+        )
+
+    def test_log_holdings_summary_not_set_up(self):
+        """Test the log_holdings_summary method of the Game class, before the game is set up."""
+        # before
+        expected_holding_summary = self._setup_holdings()
+
+        # operation
+        with patch.object(self.game.context.logger, "log") as mock_logger:
+            self.game.log_holdings_summary("current state:\n{}")
+
+        # after
+        mock_logger.assert_called_once_with(
+            logging.INFO, "current state:\n" + expected_holding_summary
+        )
+
+    def test_log_holdings_summary_rate_limited(self):
+        """Test the log_holdings_summary method of the Game class skips rate limited summaries logged too soon after the last one."""
+        # before
+        expected_holding_summary = self._setup_holdings()
+
+        # operation
+        with patch.object(self.game.context.logger, "log") as mock_logger:
+            self.game.log_holdings_summary("current state:\n{}", is_rate_limited=True)
+            self.game.log_holdings_summary("current state:\n{}", is_rate_limited=True)
+            with patch.object(
+                time,
+                "monotonic",
+                return_value=time.monotonic() + HOLDINGS_SUMMARY_INTERVAL,
+            ):
+                self.game.log_holdings_summary(
+                    "current state:\n{}", is_rate_limited=True
+                )
+
+        # after
+        assert mock_logger.call_count == 2
+        mock_logger.assert_called_with(
+            logging.INFO, "current state:\n" + expected_holding_summary
+        )
+
     def test_equilibrium_summary(self):
         """Test the equilibrium_summary method of the Game class."""
         # before
@@ -1336,6 +1512,131 @@ class TestGame(BaseSkillTestCase):
             with pytest.raises(AEAEnforceError, match="Transaction is not valid."):
                 assert self.game.settle_transaction(tx)
 
+    def _setup_agent_states(self, agent_address_1, agent_address_2):
+        """Set the current states of two agents."""
+        self.game._current_agent_states = {
+            agent_address_1: AgentState(
+                agent_address_1,
+                {"1": 10},
+                {"1": 1.0},
+                {"2": 1, "3": 2},
+                {"2": 1.0, "3": 1.5},
+            ),
+            agent_address_2: AgentState(
+                agent_address_2,
+                {"1": 30},
+                {"1": 1.0},
+                {"2": 1, "3": 2},
+                {"2": 1.0, "3": 1.5},
+            ),
+        }
+
+    @staticmethod
+    def _make_signed_transaction(sender, counterparty, amount, quantity, nonce):
+        """Make a transaction of good '2', signed by both parties."""
+        terms = Transaction(
+            "ethereum",
+            sender.address,
+            counterparty.address,
+            {"1": amount},
+            {"2": quantity},
+            True,
+            nonce,
+            {"1": 1},
+            "",
+            "",
+        )
+        return Transaction(
+            "ethereum",
+            sender.address,
+            counterparty.address,
+            {"1": amount},
+            {"2": quantity},
+            True,
+            nonce,
+            {"1": 1},
+            sender.sign_message(terms.sender_hash.encode("utf-8")),
+            counterparty.sign_message(terms.counterparty_hash.encode("utf-8")),
+        )
+
+    def test_settle_transactions(self):
+        """Test the settle_transactions method of the Game class settles the valid transactions and rejects the others."""
+        # setup
+        crypto_1 = make_crypto("ethereum")
+        crypto_2 = make_crypto("ethereum")
+        self._setup_agent_states(crypto_1.address, crypto_2.address)
+        tx_valid = self._make_signed_transaction(crypto_1, crypto_2, 10, -1, "1")
+        tx_wrong_signature = self._make_signed_transaction(
+            crypto_1, crypto_2, -2, 1, "2"
+        )
+        tx_wrong_signature._counterparty_signature = tx_valid.counterparty_signature
+        tx_unaffordable = self._make_signed_transaction(
+            crypto_2, crypto_1, 1000, -2, "3"
+        )
+
+        # operation
+        is_settled = self.game.settle_transactions(
+            [tx_valid, tx_wrong_signature, tx_unaffordable]
+        )
+
+        # after
+        assert is_settled == [True, False, False]
+        agent_state_1 = self.game.current_agent_states[crypto_1.address]
+        agent_state_2 = self.game.current_agent_states[crypto_2.address]
+        assert agent_state_1.amount_by_currency_id == {"1": 20}
+        assert agent_state_1.quantities_by_good_id == {"2": 0, "3": 2}
+        assert agent_state_2.amount_by_currency_id == {"1": 20}
+        assert agent_state_2.quantities_by_good_id == {"2": 2, "3": 2}
+        assert list(self.game.transactions.confirmed.values()) == [tx_valid]
+
+    def test_settle_transactions_conflicting(self):
+        """Test the settle_transactions method of the Game class settles conflicting transactions in the order of their ids."""
+        # setup
+        agent_address_1 = "agent_address_1"
+        agent_address_2 = "agent_address_2"
+        transactions = [
+            Transaction(
+                "ethereum",
+                agent_address_1,
+                agent_address_2,
+                {"1": 10},
+                {"2": -1},
+                True,
+                str(nonce),
+                {"1": 1},
+                "some_sender_signature",
+                "some_counterparty_signature",
+            )
+            for nonce in range(4)
+        ]
+        first_tx = min(transactions, key=lambda tx: tx.id)
+
+        for ordered_transactions in [transactions, list(reversed(transactions))]:
+            self._setup_agent_states(agent_address_1, agent_address_2)
+            self.game._transactions = Transactions()
+
+            # operation
+            with patch.object(
+                LedgerApis,
+                "verify_batch",
+                side_effect=lambda _, signed_messages: [True] * len(signed_messages),
+            ):
+                is_settled = self.game.settle_transactions(ordered_transactions)
+
+            # after
+            assert is_settled == [tx is first_tx for tx in ordered_transactions]
+            assert list(self.game.transactions.confirmed.values()) == [first_tx]
+            assert self.game.current_agent_states[
+                agent_address_1
+            ].quantities_by_good_id == {"2": 0, "3": 2}
+
+    def test_settle_transactions_fails_current_agent_states_is_none(self):
+        """Test the settle_transactions method of the Game class which fails because current_agent_states is None."""
+        with pytest.raises(
+            AEAEnforceError, match="Call create before calling current_agent_states."
+        ):
+            self.game.settle_transactions([])
+
     def test_get_location_description(self):
         """Test the get_location_description method of the Game class."""
         description = self.game.get_location_description()
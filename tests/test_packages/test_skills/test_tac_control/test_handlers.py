@@ -21,7 +21,7 @@
 import logging
 from pathlib import Path
 from typing import cast
-from unittest.mock import PropertyMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -436,15 +436,10 @@ class TestTacHandler(BaseSkillTestCase):
         )
         tx = Transaction.from_message(incoming_message)
 
-        mocked_holdings_summary = "some_holdings_summary"
-
         # operation
         with patch.object(
-            type(self.game),
-            "holdings_summary",
-            new_callable=PropertyMock,
-            return_value=mocked_holdings_summary,
-        ):
+            self.game, "log_holdings_summary"
+        ) as mock_log_holdings_summary:
             with patch.object(self.game, "is_transaction_valid", return_value=True):
                 with patch.object(self.game, "settle_transaction"):
                     with patch.object(
@@ -490,10 +485,106 @@ class TestTacHandler(BaseSkillTestCase):
         mock_logger.assert_any_call(
             logging.INFO, f"transaction '{tx_id[-10:]}' settled successfully."
         )
-        mock_logger.assert_any_call(
-            logging.INFO, f"current state:\n{mocked_holdings_summary}"
+        mock_log_holdings_summary.assert_called_once_with(
+            "current state:\n{}", is_rate_limited=True
         )
 
+    def test_on_transaction_batch_settlement(self):
+        """Test the _on_transaction method of the tac handler where transactions are settled in batches."""
+        # setup
+        self.game._phase = Phase.GAME
+        self.parameters._batch_settlement = True
+
+        tac_participant_1 = COUNTERPARTY_ADDRESS
+        tac_participant_2 = "counterparties_counterparty"
+        tac_participant_3 = "some_other_participant"
+
+        dialogues = {
+            tac_participant_1: self.prepare_skill_dialogue(
+                self.tac_dialogues, self.list_of_messages[:2],
+            ),
+            tac_participant_2: self.prepare_skill_dialogue(
+                self.tac_dialogues, self.list_of_messages[:2], tac_participant_2
+            ),
+            tac_participant_3: self.prepare_skill_dialogue(
+                self.tac_dialogues, self.list_of_messages[:2], tac_participant_3
+            ),
+        }
+        incoming_messages = []
+        for sender, counterparty in [
+            (tac_participant_1, tac_participant_2),
+            (tac_participant_3, tac_participant_1),
+        ]:
+            tx_id = Transaction.get_hash(
+                ledger_id="some_ledger",
+                sender_address=sender,
+                counterparty_address=counterparty,
+                good_ids=["G1"],
+                sender_supplied_quantities=[1],
+                counterparty_supplied_quantities=[0],
+                sender_payable_amount=0,
+                counterparty_payable_amount=1,
+                nonce="some_nonce",
+            )
+            incoming_message = cast(
+                TacMessage,
+                self.build_incoming_message_for_skill_dialogue(
+                    dialogue=dialogues[sender],
+                    performative=TacMessage.Performative.TRANSACTION,
+                    transaction_id=tx_id,
+                    ledger_id="some_ledger",
+                    sender_address=sender,
+                    counterparty_address=counterparty,
+                    amount_by_currency_id={"FET": 1},
+                    fee_by_currency_id={"FET": 2},
+                    quantities_by_good_id={"G1": 1},
+                    nonce="some_nonce",
+                    sender_signature="some_signature",
+                    counterparty_signature="some_other_signature",
+                ),
+            )
+            incoming_messages.append(incoming_message)
+
+        # operation
+        with patch.object(self.game, "settle_transaction") as mock_settle:
+            for incoming_message in incoming_messages:
+                self.tac_handler.handle(incoming_message)
+
+        # after
+        mock_settle.assert_not_called()
+        self.assert_quantity_in_outbox(0)
+        assert self.tac_handler.nb_pending_transactions == 2
+
+        # operation
+        with patch.object(
+            self.game, "log_holdings_summary"
+        ) as mock_log_holdings_summary:
+            with patch.object(
+                self.game, "settle_transactions", return_value=[True, False]
+            ) as mock_settle_transactions:
+                with patch.object(
+                    self.tac_handler.context.logger, "log"
+                ) as mock_logger:
+                    self.tac_handler.settle_pending_transactions()
+
+        # after
+        assert self.tac_handler.nb_pending_transactions == 0
+        assert mock_settle_transactions.call_args[0][0] == [
+            Transaction.from_message(incoming_message)
+            for incoming_message in incoming_messages
+        ]
+        mock_logger.assert_any_call(logging.INFO, "settled 1 of 2 transactions.")
+        mock_log_holdings_summary.assert_called_once_with(
+            "current state:\n{}", is_rate_limited=True
+        )
+        self.assert_quantity_in_outbox(3)
+        replies = [self.get_message_from_outbox() for _ in range(3)]
+        assert [(reply.to, reply.performative) for reply in replies] == [
+            (tac_participant_1, TacMessage.Performative.TRANSACTION_CONFIRMATION),
+            (tac_participant_2, TacMessage.Performative.TRANSACTION_CONFIRMATION),
+            (tac_participant_3, TacMessage.Performative.TAC_ERROR),
+        ]
+
     def test_handle_valid_transaction_recovered_tac_dialogue_not_1(self):
         """Test the _handle_valid_transaction method of the tac handler where the number of recivered tac dialogues is 0."""
         # setup
@@ -541,15 +632,8 @@ class TestTacHandler(BaseSkillTestCase):
         )
         tx = Transaction.from_message(incoming_message)
 
-        mocked_holdings_summary = "some_holdings_summary"
-
         # operation
-        with patch.object(
-            type(self.game),
-            "holdings_summary",
-            new_callable=PropertyMock,
-            return_value=mocked_holdings_summary,
-        ):
+        with patch.object(self.game, "log_holdings_summary"):
             with patch.object(self.game, "is_transaction_valid", return_value=True):
                 with patch.object(self.game, "settle_transaction"):
                     with patch.object(
@@ -635,15 +719,8 @@ class TestTacHandler(BaseSkillTestCase):
         )
         tx = Transaction.from_message(incoming_message)
 
-        mocked_holdings_summary = "some_holdings_summary"
-
         # operation
-        with patch.object(
-            type(self.game),
-            "holdings_summary",
-            new_callable=PropertyMock,
-            return_value=mocked_holdings_summary,
-        ):
+        with patch.object(self.game, "log_holdings_summary"):
             with patch.object(self.game, "is_transaction_valid", return_value=True):
                 with patch.object(self.game, "settle_transaction"):
                     with patch.object(
@@ -778,6 +855,65 @@ class TestTacHandler(BaseSkillTestCase):
         assert self.tac_handler.teardown() is None
         self.assert_quantity_in_outbox(0)
 
+    def test_teardown_settles_pending_transactions(self):
+        """Test the teardown method of the tac handler settles the transactions waiting for a batch settlement."""
+        # setup
+        self.game._phase = Phase.GAME
+        self.parameters._batch_settlement = True
+
+        sender = COUNTERPARTY_ADDRESS
+        counterparty = "counterparties_counterparty"
+        sender_dialogue = self.prepare_skill_dialogue(
+            self.tac_dialogues, self.list_of_messages[:2],
+        )
+        self.prepare_skill_dialogue(
+            self.tac_dialogues, self.list_of_messages[:2], counterparty
+        )
+        tx_id = Transaction.get_hash(
+            ledger_id="some_ledger",
+            sender_address=sender,
+            counterparty_address=counterparty,
+            good_ids=["G1"],
+            sender_supplied_quantities=[1],
+            counterparty_supplied_quantities=[0],
+            sender_payable_amount=0,
+            counterparty_payable_amount=1,
+            nonce="some_nonce",
+        )
+        incoming_message = self.build_incoming_message_for_skill_dialogue(
+            dialogue=sender_dialogue,
+            performative=TacMessage.Performative.TRANSACTION,
+            transaction_id=tx_id,
+            ledger_id="some_ledger",
+            sender_address=sender,
+            counterparty_address=counterparty,
+            amount_by_currency_id={"FET": 1},
+            fee_by_currency_id={"FET": 2},
+            quantities_by_good_id={"G1": 1},
+            nonce="some_nonce",
+            sender_signature="some_signature",
+            counterparty_signature="some_other_signature",
+        )
+        self.tac_handler.handle(incoming_message)
+        assert self.tac_handler.nb_pending_transactions == 1
+
+        # operation
+        with patch.object(self.game, "log_holdings_summary"):
+            with patch.object(
+                self.game, "settle_transactions", return_value=[True]
+            ) as mock_settle_transactions:
+                self.tac_handler.teardown()
+
+        # after
+        mock_settle_transactions.assert_called_once()
+        assert self.tac_handler.nb_pending_transactions == 0
+        self.assert_quantity_in_outbox(2)
+        replies = [self.get_message_from_outbox() for _ in range(2)]
+        assert [(reply.to, reply.performative) for reply in replies] == [
+            (sender, TacMessage.Performative.TRANSACTION_CONFIRMATION),
+            (counterparty, TacMessage.Performative.TRANSACTION_CONFIRMATION),
+        ]
+
 
 class TestOefSearchHandler(BaseSkillTestCase):
     """Test oef search handler of tac control."""
@@ -21,6 +21,7 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from aea.exceptions import AEAEnforceError
@@ -29,6 +30,7 @@ from aea.test_tools.test_skill import BaseSkillTestCase
 from packages.fetchai.skills.tac_control.helpers import (
     ERC1155Contract,
     _sample_good_instances,
+    compute_equilibrium,
     determine_scaling_factor,
     generate_currency_endowments,
     generate_currency_id_to_name,
@@ -36,9 +38,11 @@ from packages.fetchai.skills.tac_control.helpers import (
     generate_equilibrium_prices_and_holdings,
     generate_exchange_params,
     generate_good_endowments,
+    generate_good_endowments_array,
     generate_good_id_to_name,
     generate_good_ids,
     generate_utility_params,
+    generate_utility_params_array,
 )
 
 from tests.conftest import ROOT_DIR
@@ -153,6 +157,22 @@ class TestHelpers(BaseSkillTestCase):
         assert "good_id_1" in endowments["ag_2_add"]
         assert "good_id_2" in endowments["ag_2_add"]
 
+    def test_generate_good_endowments_array(self):
+        """Test the generate_good_endowments_array of Helpers module."""
+        endowments = generate_good_endowments_array(
+            100, 10, 2, 1, 3, np.random.default_rng(42)
+        )
+        assert endowments.shape == (100, 10)
+        assert np.all(endowments >= 2)
+        instances_per_good = np.sum(endowments, axis=0)
+        assert np.all(instances_per_good >= 300)
+        assert np.all(instances_per_good <= 500)
+
+        same_endowments = generate_good_endowments_array(
+            100, 10, 2, 1, 3, np.random.default_rng(42)
+        )
+        assert np.array_equal(endowments, same_endowments)
+
     def test_generate_utility_params(self):
         """Test the generate_utility_params of Helpers module."""
         utility_function_params = generate_utility_params(
@@ -163,6 +183,20 @@ class TestHelpers(BaseSkillTestCase):
         assert "good_id_1" in utility_function_params["ag_2_add"].keys()
         assert "good_id_2" in utility_function_params["ag_2_add"].keys()
 
+    def test_generate_utility_params_array(self):
+        """Test the generate_utility_params_array of Helpers module."""
+        utility_params = generate_utility_params_array(
+            100, 10, 1000.0, np.random.default_rng(42)
+        )
+        assert utility_params.shape == (100, 10)
+        assert np.all(utility_params > 0.0)
+        assert np.allclose(np.sum(utility_params, axis=1), 1000.0)
+
+        same_utility_params = generate_utility_params_array(
+            100, 10, 1000.0, np.random.default_rng(42)
+        )
+        assert np.array_equal(utility_params, same_utility_params)
+
     def test_sample_good_instances(self):
         """Test the _sample_good_instances of Helpers module."""
         nb_instances = _sample_good_instances(2, ["good_id_1", "good_id_2"], 2, 1, 1)
@@ -218,3 +252,24 @@ class TestHelpers(BaseSkillTestCase):
 
         assert len(eq_currency_holdings_dict) == 1
         assert type(eq_currency_holdings_dict["ag_1"]) == float
+
+    def test_compute_equilibrium(self):
+        """Test the compute_equilibrium of Helpers module clears the markets."""
+        rng = np.random.default_rng(42)
+        endowments = generate_good_endowments_array(50, 5, 2, 1, 1, rng)
+        utility_params = generate_utility_params_array(50, 5, 100.0, rng)
+        currency_endowments = np.full(50, 200)
+
+        eq_prices, eq_good_holdings, eq_currency_holdings = compute_equilibrium(
+            endowments, utility_params, currency_endowments, 100.0
+        )
+
+        assert eq_prices.shape == (5,)
+        assert eq_good_holdings.shape == (50, 5)
+        assert eq_currency_holdings.shape == (50,)
+        assert np.allclose(np.sum(eq_good_holdings, axis=0), np.sum(endowments, axis=0))
+        assert np.isclose(np.sum(eq_currency_holdings), np.sum(currency_endowments))
+        assert np.allclose(
+            np.dot(eq_good_holdings, eq_prices) + eq_currency_holdings,
+            np.dot(endowments, eq_prices) + currency_endowments,
+        )
@@ -19,6 +19,7 @@
 """This module contains the tests of the handler classes of the tac negotiation skill."""
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional, cast
 from unittest.mock import PropertyMock, patch
@@ -505,7 +506,7 @@ class TestFipaHandler(BaseSkillTestCase):
         self._assert_stat_state(self.dialogue_stats)
 
         # operation
-        with patch.object(self.transactions, "pop_pending_proposal") as mock_pending:
+        with patch.object(self.transactions, "remove_dialogue") as mock_remove:
             with patch.object(self.logger, "log") as mock_logger:
                 self.fipa_handler.handle(incoming_message)
 
@@ -519,7 +520,7 @@ class TestFipaHandler(BaseSkillTestCase):
             self.dialogue_stats, "other", FipaDialogue.EndState.DECLINED_PROPOSE
         )
 
-        mock_pending.assert_called_once()
+        mock_remove.assert_called_once_with(fipa_dialogue.dialogue_label)
 
     def test_handle_decline_decline_accept(self):
         """Test the _handle_decline method of the fipa handler where the end state is decline_accept."""
@@ -536,12 +537,9 @@ class TestFipaHandler(BaseSkillTestCase):
         self._assert_stat_state(self.dialogue_stats)
 
         # operation
-        with patch.object(
-            self.transactions, "pop_pending_initial_acceptance"
-        ) as mock_pending:
-            with patch.object(self.transactions, "pop_locked_tx") as mock_locked:
-                with patch.object(self.logger, "log") as mock_logger:
-                    self.fipa_handler.handle(incoming_message)
+        with patch.object(self.transactions, "remove_dialogue") as mock_remove:
+            with patch.object(self.logger, "log") as mock_logger:
+                self.fipa_handler.handle(incoming_message)
 
         # after
         mock_logger.assert_any_call(
@@ -553,8 +551,7 @@ class TestFipaHandler(BaseSkillTestCase):
             self.dialogue_stats, "self", FipaDialogue.EndState.DECLINED_ACCEPT
         )
 
-        mock_pending.assert_called_once()
-        mock_locked.assert_called_once()
+        mock_remove.assert_called_once_with(fipa_dialogue.dialogue_label)
 
     def test_handle_accept_i(self):
         """Test the _on_accept method of the fipa handler where the tx IS profitable and strategy's is_contract_tx is True."""
@@ -576,36 +573,39 @@ class TestFipaHandler(BaseSkillTestCase):
         # operation
         with patch.object(self.transactions, "pop_pending_proposal") as mock_pending:
             with patch.object(
-                self.strategy, "is_profitable_transaction", return_value=True
+                self.transactions, "has_pending_proposal", return_value=True
             ):
-                with patch.object(self.transactions, "add_locked_tx") as mock_lock:
-                    with patch.object(
-                        type(self.strategy),
-                        "ledger_id",
-                        new_callable=PropertyMock,
-                        return_value=self.ledger_id,
-                    ):
+                with patch.object(
+                    self.strategy, "is_profitable_transaction", return_value=True
+                ):
+                    with patch.object(self.transactions, "add_locked_tx") as mock_lock:
                         with patch.object(
                             type(self.strategy),
-                            "contract_id",
+                            "ledger_id",
                             new_callable=PropertyMock,
-                            return_value=self.contract_id,
+                            return_value=self.ledger_id,
                         ):
                             with patch.object(
                                 type(self.strategy),
-                                "contract_address",
+                                "contract_id",
                                 new_callable=PropertyMock,
-                                return_value=self.contract_address,
+                                return_value=self.contract_id,
                             ):
                                 with patch.object(
-                                    self.strategy,
-                                    "kwargs_from_terms",
-                                    return_value=self.kwargs,
+                                    type(self.strategy),
+                                    "contract_address",
+                                    new_callable=PropertyMock,
+                                    return_value=self.contract_address,
                                 ):
                                     with patch.object(
-                                        self.logger, "log"
-                                    ) as mock_logger:
-                                        self.fipa_handler.handle(incoming_message)
+                                        self.strategy,
+                                        "kwargs_from_terms",
+                                        return_value=self.kwargs,
+                                    ):
+                                        with patch.object(
+                                            self.logger, "log"
+                                        ) as mock_logger:
+                                            self.fipa_handler.handle(incoming_message)
 
         # after
         self.assert_quantity_in_outbox(1)
@@ -667,10 +667,13 @@ class TestFipaHandler(BaseSkillTestCase):
             self.transactions, "pop_pending_proposal", return_value=self.terms
         ) as mock_pending:
             with patch.object(
-                self.strategy, "is_profitable_transaction", return_value=True
+                self.transactions, "has_pending_proposal", return_value=True
             ):
-                with patch.object(self.logger, "log") as mock_logger:
-                    self.fipa_handler.handle(incoming_message)
+                with patch.object(
+                    self.strategy, "is_profitable_transaction", return_value=True
+                ):
+                    with patch.object(self.logger, "log") as mock_logger:
+                        self.fipa_handler.handle(incoming_message)
 
         # after
         self.assert_quantity_in_decision_making_queue(1)
@@ -729,10 +732,13 @@ class TestFipaHandler(BaseSkillTestCase):
             self.transactions, "pop_pending_proposal", return_value=self.terms
         ) as mock_pending:
             with patch.object(
-                self.strategy, "is_profitable_transaction", return_value=False
+                self.transactions, "has_pending_proposal", return_value=True
             ):
-                with patch.object(self.logger, "log") as mock_logger:
-                    self.fipa_handler.handle(incoming_message)
+                with patch.object(
+                    self.strategy, "is_profitable_transaction", return_value=False
+                ):
+                    with patch.object(self.logger, "log") as mock_logger:
+                        self.fipa_handler.handle(incoming_message)
 
         # after
         self.assert_quantity_in_outbox(1)
@@ -764,6 +770,62 @@ class TestFipaHandler(BaseSkillTestCase):
             f"sending {message.performative} to {message.to[-5:]} (as {self.fipa_dialogues.get_dialogue(message).role}), message={message}",
         )
 
+    def test_handle_accept_expired(self):
+        """Test the _on_accept method of the fipa handler where the proposal has expired."""
+        # setup
+        fipa_dialogue = cast(
+            FipaDialogue,
+            self.prepare_skill_dialogue(
+                dialogues=self.fipa_dialogues,
+                messages=self.list_of_messages_other_initiated[:2],
+            ),
+        )
+        fipa_dialogue._terms = self.terms
+        incoming_message = self.build_incoming_message_for_skill_dialogue(
+            dialogue=fipa_dialogue, performative=FipaMessage.Performative.ACCEPT,
+        )
+        self.transactions.add_pending_proposal(
+            fipa_dialogue.dialogue_label, incoming_message.target, self.terms
+        )
+        with patch.object(
+            time,
+            "monotonic",
+            return_value=time.monotonic()
+            + self.transactions._pending_transaction_timeout,
+        ):
+            self.transactions.cleanup_pending_transactions()
+
+        # before
+        self._assert_stat_state(self.dialogue_stats)
+
+        # operation
+        with patch.object(self.logger, "log") as mock_logger:
+            self.fipa_handler.handle(incoming_message)
+
+        # after
+        self.assert_quantity_in_outbox(1)
+        self.assert_quantity_in_decision_making_queue(0)
+
+        mock_logger.assert_any_call(
+            logging.INFO,
+            f"proposal {incoming_message.target} expired before it was accepted.",
+        )
+
+        message = self.get_message_from_outbox()
+        has_attributes, error_str = self.message_has_attributes(
+            actual_message=message,
+            message_type=FipaMessage,
+            performative=FipaMessage.Performative.DECLINE,
+            to=incoming_message.sender,
+            sender=self.skill.skill_context.agent_address,
+            target=incoming_message.message_id,
+        )
+        assert has_attributes, error_str
+
+        self._assert_stat_state(
+            self.dialogue_stats, "other", FipaDialogue.EndState.DECLINED_ACCEPT
+        )
+
     def test_handle_match_accept_i(self):
         """Test the _handle_match_accept method of the fipa handler where is_contract_tx is True and counterparty signature is None."""
         # setup
@@ -898,8 +960,11 @@ class TestFipaHandler(BaseSkillTestCase):
         with patch.object(
             self.transactions, "pop_pending_initial_acceptance", return_value=self.terms
         ) as mock_pending:
-            with patch.object(self.logger, "log") as mock_logger:
-                self.fipa_handler.handle(incoming_message)
+            with patch.object(
+                self.transactions, "has_pending_initial_acceptance", return_value=True
+            ):
+                with patch.object(self.logger, "log") as mock_logger:
+                    self.fipa_handler.handle(incoming_message)
 
         # after
         self.assert_quantity_in_decision_making_queue(1)
@@ -937,6 +1002,60 @@ class TestFipaHandler(BaseSkillTestCase):
             f"requesting signature, sending {message.performative} to decision_maker, message={message}",
         )
 
+    def test_handle_match_accept_expired(self):
+        """Test the _handle_match_accept method of the fipa handler where is_contract_tx is False and the initial acceptance has expired."""
+        # setup
+        self.strategy._is_contract_tx = False
+
+        fipa_dialogue = cast(
+            FipaDialogue,
+            self.prepare_skill_dialogue(
+                dialogues=self.fipa_dialogues,
+                messages=self.list_of_messages_self_initiated[:3],
+            ),
+        )
+        fipa_dialogue._terms = self.terms
+        incoming_message = self.build_incoming_message_for_skill_dialogue(
+            dialogue=fipa_dialogue,
+            performative=FipaMessage.Performative.MATCH_ACCEPT_W_INFORM,
+            info={"signature": self.counterparty_signature},
+        )
+        self.transactions.add_pending_initial_acceptance(
+            fipa_dialogue.dialogue_label, incoming_message.target, self.terms
+        )
+        with patch.object(
+            time,
+            "monotonic",
+            return_value=time.monotonic()
+            + self.transactions._pending_transaction_timeout,
+        ):
+            self.transactions.cleanup_pending_transactions()
+
+        # before
+        self._assert_stat_state(self.dialogue_stats)
+
+        # operation
+        with patch.object(self.logger, "log") as mock_logger:
+            with patch.object(
+                self.transactions,
+                "remove_dialogue",
+                wraps=self.transactions.remove_dialogue,
+            ) as mock_remove_dialogue:
+                self.fipa_handler.handle(incoming_message)
+
+        # after
+        self.assert_quantity_in_outbox(0)
+        self.assert_quantity_in_decision_making_queue(0)
+
+        mock_logger.assert_any_call(
+            logging.INFO,
+            f"acceptance {incoming_message.target} expired before it was matched, ending the dialogue on {incoming_message.performative}.",
+        )
+        mock_remove_dialogue.assert_called_once_with(fipa_dialogue.dialogue_label)
+        self._assert_stat_state(
+            self.dialogue_stats, "self", FipaDialogue.EndState.DECLINED_ACCEPT
+        )
+
     def test_teardown(self):
         """Test the teardown method of the fipa handler."""
         assert self.fipa_handler.teardown() is None
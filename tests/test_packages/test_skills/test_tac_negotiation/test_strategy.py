@@ -23,7 +23,7 @@ from unittest.mock import patch
 
 import pytest
 
-from aea.decision_maker.default import OwnershipState
+from aea.decision_maker.default import OwnershipState, Preferences
 from aea.exceptions import AEAEnforceError
 from aea.helpers.search.models import (
     Attribute,
@@ -391,9 +391,128 @@ class TestStrategy(BaseSkillTestCase):
         mock_get_proposal.assert_any_call(mocked_query, is_seller=is_seller)
         assert actual_proposal == expected_proposal
 
-    def test_generate_candidate_proposals(self):
+    def _setup_decision_maker_state(self):
+        """Set the ownership state and the preferences of the decision maker."""
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={self.mocked_currency_id: 1000},
+            quantities_by_good_id={"2": 5, "3": 1, "4": 0, "5": 20},
+        )
+        preferences = Preferences()
+        preferences.set(
+            exchange_params_by_currency_id={self.mocked_currency_id: 1.0},
+            utility_params_by_good_id={"2": 2000.0, "3": 3000.0, "4": 50.0, "5": 40.0},
+        )
+        decision_maker_handler_context = (
+            self.skill.skill_context.decision_maker_handler_context
+        )
+        decision_maker_handler_context.ownership_state = ownership_state
+        decision_maker_handler_context.preferences = preferences
+        self.skill.skill_context.shared_state["tx_fee"] = {self.mocked_currency_id: 2}
+        return ownership_state, preferences
+
+    @staticmethod
+    def _expected_prices(ownership_state, preferences, is_seller, buyer_tx_fee):
+        """Compute the prices of the proposals one good at a time."""
+        prices = []
+        for good_id, quantity in ownership_state.quantities_by_good_id.items():
+            if is_seller and quantity <= 1:
+                continue
+            delta_quantities_by_good_id = {
+                good_id_: 0 for good_id_ in ownership_state.quantities_by_good_id
+            }
+            delta_quantities_by_good_id[good_id] = -1 if is_seller else 1
+            marginal_utility = preferences.marginal_utility(
+                ownership_state=ownership_state,
+                delta_quantities_by_good_id=delta_quantities_by_good_id,
+            )
+            if is_seller:
+                price = round(marginal_utility) * -1 + 1
+            else:
+                price = round(marginal_utility) - buyer_tx_fee - 1
+            if price > 0:
+                prices.append((good_id, price))
+        return prices
+
+    @pytest.mark.parametrize("is_seller", [True, False])
+    def test_generate_candidate_proposals(self, is_seller):
         """Test the _generate_candidate_proposals method of the Strategy class."""
-        # ToDo complete
+        # setup
+        ownership_state, preferences = self._setup_decision_maker_state()
+        expected_prices = self._expected_prices(
+            ownership_state, preferences, is_seller, buyer_tx_fee=2
+        )
+        assert len(expected_prices) > 0
+
+        # operation
+        proposals = list(self.strategy._generate_candidate_proposals(is_seller))
+
+        # after
+        actual_prices = []
+        for proposal in proposals:
+            good_ids = [
+                good_id
+                for good_id in ownership_state.quantities_by_good_id
+                if proposal.values[good_id] == 1
+            ]
+            assert len(good_ids) == 1
+            assert proposal.values["fee"] == 2
+            assert proposal.values["currency_id"] == self.mocked_currency_id
+            assert proposal.values["ledger_id"] == self.ledger_id
+            assert proposal.data_model.name == ("supply" if is_seller else "demand")
+            actual_prices.append((good_ids[0], proposal.values["price"]))
+        assert actual_prices == expected_prices
+        assert len({proposal.values["nonce"] for proposal in proposals}) == len(
+            proposals
+        )
+
+    def test_generate_candidate_proposals_cached(self):
+        """Test the prices of the candidate proposals are only computed again when the state after the locks changes."""
+        # setup
+        ownership_state, preferences = self._setup_decision_maker_state()
+        transactions = self.skill.skill_context.transactions
+        terms = Terms(
+            ledger_id=self.ledger_id,
+            sender_address=self.sender,
+            counterparty_address=self.counterparty,
+            amount_by_currency_id={self.mocked_currency_id: 10},
+            quantities_by_good_id={"5": -15},
+            is_sender_payable_tx_fee=True,
+            nonce=self.nonce,
+        )
+
+        # operation
+        with patch.object(
+            self.strategy,
+            "_get_candidate_prices",
+            wraps=self.strategy._get_candidate_prices,
+        ) as mock_prices:
+            list(self.strategy._generate_candidate_proposals(True))
+            list(self.strategy._generate_candidate_proposals(True))
+            list(self.strategy._generate_candidate_proposals(False))
+            assert mock_prices.call_count == 2
+
+            transactions.add_locked_tx(terms, FipaDialogue.Role.SELLER)
+            list(self.strategy._generate_candidate_proposals(False))
+            assert mock_prices.call_count == 2
+            proposals = list(self.strategy._generate_candidate_proposals(True))
+            assert mock_prices.call_count == 3
+
+        # after
+        state_after_locks = transactions.ownership_state_after_locks(is_seller=True)
+        assert self._expected_prices(
+            state_after_locks, preferences, True, buyer_tx_fee=2
+        ) == [
+            (
+                next(
+                    good_id
+                    for good_id in ownership_state.quantities_by_good_id
+                    if proposal.values[good_id] == 1
+                ),
+                proposal.values["price"],
+            )
+            for proposal in proposals
+        ]
 
     def test_is_profitable_transaction(self):
         """Test the is_profitable_transaction method of the Strategy class."""
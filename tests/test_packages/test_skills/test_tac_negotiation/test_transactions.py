@@ -18,14 +18,14 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests of the Transactions class of the tac negotiation skill."""
 
-import datetime
 import logging
+import time
 from pathlib import Path
-from typing import Deque, Tuple, cast
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
+from aea.decision_maker.default import OwnershipState
 from aea.exceptions import AEAEnforceError
 from aea.helpers.transaction.base import Terms
 from aea.protocols.dialogue.base import DialogueLabel
@@ -81,7 +81,7 @@ class TestTransactions(BaseSkillTestCase):
     def test_get_next_nonce(self):
         """Test the get_next_nonce method of the Transactions class."""
         assert self.transactions.get_next_nonce() == "1"
-        assert self.transactions._nonce == 1
+        assert self.transactions.get_next_nonce() == "2"
 
     def test_update_confirmed_transactions(self):
         """Test the update_confirmed_transactions method of the Transactions class."""
@@ -102,51 +102,107 @@ class TestTransactions(BaseSkillTestCase):
         assert self.transactions._locked_txs_as_seller == {}
 
     def test_cleanup_pending_transactions_i(self):
-        """Test the cleanup_pending_transactions method of the Transactions class where _last_update_for_transactions is NOT empty."""
+        """Test the cleanup_pending_transactions method of the Transactions class where the items have expired."""
         # setup
-        datetime_mock = Mock(wraps=datetime.datetime)
-        datetime_mock.now.return_value = datetime.datetime.strptime(
-            "01 01 2020  00:03", "%d %m %Y %H:%M"
-        )
-        with patch("datetime.datetime", new=datetime_mock):
-            self.transactions._register_transaction_with_time(self.transaction_id)
-
-        self.transactions._locked_txs[self.transaction_id] = self.terms
-        self.transactions._locked_txs_as_buyer[self.transaction_id] = self.terms
-        self.transactions._locked_txs_as_seller[self.transaction_id] = self.terms
+        with patch.object(time, "monotonic", return_value=100.0):
+            self.transactions.add_locked_tx(
+                self.terms, FipaDialogue.Role.BUYER, self.dialogue_label
+            )
+            self.transactions.add_pending_initial_acceptance(
+                self.dialogue_label, self.proposal_id, self.terms
+            )
 
         # operation
-        with patch.object(self.skill.skill_context.logger, "log") as mock_logger:
-            self.transactions.cleanup_pending_transactions()
+        with patch.object(
+            time, "monotonic", return_value=100.0 + self.pending_transaction_timeout
+        ):
+            with patch.object(self.skill.skill_context.logger, "log") as mock_logger:
+                nb_expired = self.transactions.cleanup_pending_transactions()
 
         # after
+        assert nb_expired == 2
+        mock_logger.assert_any_call(
+            logging.DEBUG, f"removing locked_tx from pending list: {self.terms.id}",
+        )
         mock_logger.assert_any_call(
-            logging.DEBUG,
-            f"removing transaction from pending list: {self.transaction_id}",
+            logging.INFO, "expired 2 pending items, 0 left.",
         )
         assert self.transactions._locked_txs == {}
         assert self.transactions._locked_txs_as_buyer == {}
         assert self.transactions._locked_txs_as_seller == {}
+        assert self.transactions._locked_tx_ids_per_dialogue == {}
+        assert self.transactions._pending_initial_acceptances == {}
+        assert self.transactions._expiry_heap == []
 
     def test_cleanup_pending_transactions_ii(self):
-        """Test the cleanup_pending_transactions method of the Transactions class where _last_update_for_transactions is empty."""
+        """Test the cleanup_pending_transactions method of the Transactions class where no item has expired."""
         # setup
-        cast(
-            Deque[Tuple[datetime.datetime, str]],
-            self.transactions._last_update_for_transactions,
-        )
+        with patch.object(time, "monotonic", return_value=100.0):
+            self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.BUYER)
 
-        assert self.transactions._locked_txs == {}
-        assert self.transactions._locked_txs_as_buyer == {}
-        assert self.transactions._locked_txs_as_seller == {}
+        # operation
+        with patch.object(time, "monotonic", return_value=101.0):
+            nb_expired = self.transactions.cleanup_pending_transactions()
+
+        # after
+        assert nb_expired == 0
+        assert self.transactions._locked_txs == {self.terms.id: self.terms}
+        assert len(self.transactions._expiry_heap) == 1
+
+    def test_cleanup_pending_transactions_iii(self):
+        """Test the cleanup_pending_transactions method of the Transactions class where the items were removed before they expired."""
+        # setup
+        with patch.object(time, "monotonic", return_value=100.0):
+            self.transactions.add_pending_proposal(
+                self.dialogue_label, self.proposal_id, self.terms
+            )
+            self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.SELLER)
+        self.transactions.pop_pending_proposal(self.dialogue_label, self.proposal_id)
+        self.transactions.pop_locked_tx(self.terms)
+        with patch.object(time, "monotonic", return_value=110.0):
+            self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.SELLER)
 
         # operation
-        self.transactions.cleanup_pending_transactions()
+        with patch.object(
+            time, "monotonic", return_value=100.0 + self.pending_transaction_timeout
+        ):
+            nb_expired = self.transactions.cleanup_pending_transactions()
 
         # after
+        assert nb_expired == 0
+        assert self.transactions._locked_txs == {self.terms.id: self.terms}
+        assert len(self.transactions._expiry_heap) == 1
+
+    def test_remove_dialogue(self):
+        """Test the remove_dialogue method of the Transactions class."""
+        # setup
+        other_dialogue_label = DialogueLabel(
+            ("1", ""), COUNTERPARTY_ADDRESS, self._skill.skill_context.agent_address,
+        )
+        self.transactions.add_pending_proposal(
+            other_dialogue_label, self.proposal_id, self.terms
+        )
+        self.transactions.add_locked_tx(
+            self.terms, FipaDialogue.Role.BUYER, self.dialogue_label
+        )
+        self.transactions.add_pending_initial_acceptance(
+            self.dialogue_label, self.proposal_id, self.terms
+        )
+
+        # operation
+        nb_removed = self.transactions.remove_dialogue(self.dialogue_label)
+
+        # after
+        assert nb_removed == 2
+        assert self.transactions._pending_initial_acceptances == {}
         assert self.transactions._locked_txs == {}
         assert self.transactions._locked_txs_as_buyer == {}
-        assert self.transactions._locked_txs_as_seller == {}
+        assert self.transactions._locked_tx_ids_per_dialogue == {}
+        assert self.transactions._dialogue_per_locked_tx == {}
+        assert self.transactions._pending_proposals == {
+            other_dialogue_label: {self.proposal_id: self.terms}
+        }
+        assert self.transactions.remove_dialogue(self.dialogue_label) == 0
 
     def test_add_pending_proposal_i(self):
         """Test the add_pending_proposal method of the Transactions class."""
@@ -352,56 +408,30 @@ class TestTransactions(BaseSkillTestCase):
                 self.dialogue_label, self.proposal_id
             )
 
-    def test_register_transaction_with_time(self):
-        """Test the _register_transaction_with_time method of the Transactions class."""
-        # setup
-        datetime_mock = Mock(wraps=datetime.datetime)
-        mocked_now = datetime.datetime.strptime("01 01 2020  00:03", "%d %m %Y %H:%M")
-        datetime_mock.now.return_value = mocked_now
-
-        # operation
-        with patch("datetime.datetime", new=datetime_mock):
-            self.transactions._register_transaction_with_time(self.transaction_id)
-
-        # after
-        assert (mocked_now, self.transaction_id,)[
-            1
-        ] == self.transactions._last_update_for_transactions[0][1]
-
     def test_add_locked_tx_seller(self):
         """Test the add_locked_tx method of the Transactions class as Seller."""
-        # setup
-        datetime_mock = Mock(wraps=datetime.datetime)
-        mocked_now = datetime.datetime.strptime("01 01 2020  00:03", "%d %m %Y %H:%M")
-        datetime_mock.now.return_value = mocked_now
-
         # operation
-        with patch("datetime.datetime", new=datetime_mock):
+        with patch.object(time, "monotonic", return_value=100.0):
             self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.SELLER)
 
         # after
-        assert (mocked_now, self.terms.id,)[
-            1
-        ] == self.transactions._last_update_for_transactions[0][1]
+        deadline, _, expiry_key = self.transactions._expiry_heap[0]
+        assert deadline == 100.0 + self.pending_transaction_timeout
+        assert expiry_key == ("locked_tx", self.terms.id)
         assert self.transactions._locked_txs[self.terms.id] == self.terms
         assert self.transactions._locked_txs_as_seller[self.terms.id] == self.terms
         assert self.terms.id not in self.transactions._locked_txs_as_buyer
 
     def test_add_locked_tx_buyer(self):
         """Test the add_locked_tx method of the Transactions class as Seller."""
-        # setup
-        datetime_mock = Mock(wraps=datetime.datetime)
-        mocked_now = datetime.datetime.strptime("01 01 2020  00:03", "%d %m %Y %H:%M")
-        datetime_mock.now.return_value = mocked_now
-
         # operation
-        with patch("datetime.datetime", new=datetime_mock):
+        with patch.object(time, "monotonic", return_value=100.0):
             self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.BUYER)
 
         # after
-        assert (mocked_now, self.terms.id,)[
-            1
-        ] == self.transactions._last_update_for_transactions[0][1]
+        deadline, _, expiry_key = self.transactions._expiry_heap[0]
+        assert deadline == 100.0 + self.pending_transaction_timeout
+        assert expiry_key == ("locked_tx", self.terms.id)
         assert self.transactions._locked_txs[self.terms.id] == self.terms
         assert self.transactions._locked_txs_as_buyer[self.terms.id] == self.terms
         assert self.terms.id not in self.transactions._locked_txs_as_seller
@@ -411,23 +441,14 @@ class TestTransactions(BaseSkillTestCase):
         # setup
         self.transactions._locked_txs[self.terms.id] = self.terms
 
-        datetime_mock = Mock(wraps=datetime.datetime)
-        mocked_now = datetime.datetime.strptime("01 01 2020  00:03", "%d %m %Y %H:%M")
-        datetime_mock.now.return_value = mocked_now
-
         # operation
-        with patch("datetime.datetime", new=datetime_mock):
-            with pytest.raises(
-                AEAEnforceError,
-                match="This transaction is already a locked transaction.",
-            ):
-                self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.BUYER)
+        with pytest.raises(
+            AEAEnforceError, match="This transaction is already a locked transaction.",
+        ):
+            self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.BUYER)
 
         # after
-        assert (
-            mocked_now,
-            self.terms.id,
-        ) not in self.transactions._last_update_for_transactions
+        assert self.transactions._expiry_heap == []
         assert self.terms.id not in self.transactions._locked_txs_as_buyer
         assert self.terms.id not in self.transactions._locked_txs_as_seller
 
@@ -472,4 +493,176 @@ class TestTransactions(BaseSkillTestCase):
 
     def test_ownership_state_after_locks(self):
         """Test the ownership_state_after_locks method of the Transactions class."""
-        # ToDo
+        # setup
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10, "3": 5},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+        transactions = Transactions(
+            check_state_consistency=True,
+            name="transactions",
+            skill_context=self._skill.skill_context,
+        )
+        buyer_terms = Terms(
+            ledger_id=self.ledger_id,
+            sender_address=self.sender,
+            counterparty_address=self.counterparty,
+            amount_by_currency_id={"1": -20},
+            quantities_by_good_id={"3": 2},
+            is_sender_payable_tx_fee=True,
+            nonce="1",
+        )
+        transactions.add_locked_tx(self.terms, FipaDialogue.Role.SELLER)
+
+        # operation
+        seller_state = transactions.ownership_state_after_locks(is_seller=True)
+        buyer_state = transactions.ownership_state_after_locks(is_seller=False)
+        transactions.add_locked_tx(buyer_terms, FipaDialogue.Role.BUYER)
+        ownership_state.apply_delta(
+            delta_amount_by_currency_id={"1": 7}, delta_quantities_by_good_id={"2": -1},
+        )
+
+        # after
+        assert transactions.ownership_state_after_locks(is_seller=True) is seller_state
+        assert seller_state.amount_by_currency_id == {"1": 117}
+        assert seller_state.quantities_by_good_id == {"2": 4, "3": 5}
+        assert transactions.ownership_state_after_locks(is_seller=False) is buyer_state
+        assert buyer_state.amount_by_currency_id == {"1": 87}
+        assert buyer_state.quantities_by_good_id == {"2": 9, "3": 7}
+
+        # operation
+        transactions.pop_locked_tx(buyer_terms)
+        self.skill.skill_context.shared_state["confirmed_tx_ids"] = [self.terms.id]
+        transactions.update_confirmed_transactions()
+
+        # after
+        assert transactions.ownership_state_after_locks(
+            is_seller=True
+        ).amount_by_currency_id == {"1": 107}
+        assert transactions.ownership_state_after_locks(
+            is_seller=False
+        ).quantities_by_good_id == {"2": 9, "3": 5}
+
+    def test_ownership_state_after_locks_subscription(self):
+        """Test the ownership_state_after_locks method of the Transactions class only changes when the ownership state does."""
+        # setup
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+        seller_state = self.transactions.ownership_state_after_locks(is_seller=True)
+        version = self.transactions.ownership_state_after_locks_version(True)
+
+        # operation
+        ownership_state.apply_delta(
+            delta_amount_by_currency_id={"1": 0}, delta_quantities_by_good_id={},
+        )
+        self.transactions.ownership_state_after_locks(is_seller=True)
+
+        # after
+        assert self.transactions.ownership_state_after_locks_version(True) == version
+
+        # operation
+        ownership_state.apply_delta(
+            delta_amount_by_currency_id={}, delta_quantities_by_good_id={"2": 1},
+        )
+        self.transactions.ownership_state_after_locks(is_seller=True)
+
+        # after
+        assert self.transactions.ownership_state_after_locks_version(True) > version
+        assert seller_state.quantities_by_good_id == {"2": 11}
+
+        # operation
+        self.transactions.teardown()
+
+        # after
+        assert ownership_state._subscribers == []
+        assert self.transactions._subscribed_ownership_state is None
+
+    def test_ownership_state_after_locks_subscribed_before_initialization(self):
+        """Test the ownership_state_after_locks method of the Transactions class subscribes again if the snapshot was taken before the state was initialized."""
+        # setup
+        ownership_state = OwnershipState()
+        self.transactions._sync_ownership_states(ownership_state)
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+
+        # operation
+        seller_state = self.transactions.ownership_state_after_locks(is_seller=True)
+
+        # after
+        assert seller_state.quantities_by_good_id == {"2": 10}
+        assert len(ownership_state._subscribers) == 1
+
+        # teardown
+        self.transactions.teardown()
+
+    def test_ownership_state_after_locks_late_notification(self):
+        """Test the ownership_state_after_locks method of the Transactions class ignores changes notified late to a former subscription."""
+        # setup
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+        self.transactions.ownership_state_after_locks(is_seller=True)
+        former_callback = self.transactions._holdings_callback
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+        self.transactions.ownership_state_after_locks(is_seller=True)
+
+        # operation
+        former_callback({}, {"2": 1})
+        seller_state = self.transactions.ownership_state_after_locks(is_seller=True)
+
+        # after
+        assert seller_state.quantities_by_good_id == {"2": 10}
+
+        # teardown
+        self.transactions.teardown()
+
+    def test_ownership_state_after_locks_not_initialized(self):
+        """Test the ownership_state_after_locks method of the Transactions class when the ownership state is not initialized."""
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            OwnershipState()
+        )
+        ownership_state_after_locks = self.transactions.ownership_state_after_locks(
+            is_seller=True
+        )
+        assert not ownership_state_after_locks.is_initialized
+        assert self.transactions._ownership_states_after_locks == {}
+
+    def test_ownership_state_after_locks_inconsistent(self):
+        """Test the consistency check of the ownership_state_after_locks method of the Transactions class."""
+        ownership_state = OwnershipState()
+        ownership_state.set(
+            amount_by_currency_id={"1": 100}, quantities_by_good_id={"2": 10},
+        )
+        self.skill.skill_context.decision_maker_handler_context.ownership_state = (
+            ownership_state
+        )
+        self.transactions._check_state_consistency = True
+        self.transactions.ownership_state_after_locks(is_seller=True)
+        self.transactions._locked_txs_as_seller[self.terms.id] = self.terms
+
+        with pytest.raises(
+            AEAEnforceError, match="Inconsistent ownership state after locks."
+        ):
+            self.transactions.ownership_state_after_locks(is_seller=True)
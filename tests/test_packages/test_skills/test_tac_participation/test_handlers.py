@@ -810,7 +810,7 @@ class TestTacHandler(BaseSkillTestCase):
                 performative=TacMessage.Performative.TRANSACTION_CONFIRMATION,
                 transaction_id=transaction_id,
                 amount_by_currency_id=self.amount_by_currency_id,
-                quantities_by_good_id=self.quantities_by_good_id,
+                quantities_by_good_id={**self.quantities_by_good_id, "3": 0},
             ),
         )
 
@@ -833,8 +833,8 @@ class TestTacHandler(BaseSkillTestCase):
             sender=self.skill.skill_context.agent_address
             + "_"
             + str(self.skill.skill_context.skill_id),
-            amount_by_currency_id=incoming_message.amount_by_currency_id,
-            quantities_by_good_id=incoming_message.quantities_by_good_id,
+            amount_by_currency_id=self.amount_by_currency_id,
+            quantities_by_good_id=self.quantities_by_good_id,
         )
         assert has_attributes, error_str
         assert (